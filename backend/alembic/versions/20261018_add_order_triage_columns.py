@@ -0,0 +1,51 @@
+"""
+Add persisted day-running triage columns to the order table.
+
+Rows start with a NULL triage_as_of and are filled in lazily on the next read
+or by the bakery-midnight rollover job.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261018_add_order_triage_columns"
+down_revision = "20250911b_add_customer_email_to_order"
+branch_labels = None
+depends_on = None
+
+
+INDEXED_COLUMNS = [
+    "triage_as_of",
+    "triage_urgency_rank",
+    "triage_action_class",
+    "triage_readiness_label",
+    "triage_needs_review",
+]
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("order", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("triage_as_of", sa.Date(), nullable=True))
+        batch_op.add_column(sa.Column("triage_urgency_rank", sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column("triage_action_class", sa.String(length=32), nullable=True))
+        batch_op.add_column(sa.Column("triage_readiness_label", sa.String(length=64), nullable=True))
+        batch_op.add_column(sa.Column("triage_needs_review", sa.Boolean(), nullable=True))
+        batch_op.add_column(sa.Column("triage_import_priority_rank", sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column("triage_review_reasons", sa.String(length=255), nullable=True))
+        for column_name in INDEXED_COLUMNS:
+            batch_op.create_index(f"ix_order_{column_name}", [column_name])
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("order", schema=None) as batch_op:
+        for column_name in reversed(INDEXED_COLUMNS):
+            batch_op.drop_index(f"ix_order_{column_name}")
+        batch_op.drop_column("triage_review_reasons")
+        batch_op.drop_column("triage_import_priority_rank")
+        batch_op.drop_column("triage_needs_review")
+        batch_op.drop_column("triage_readiness_label")
+        batch_op.drop_column("triage_action_class")
+        batch_op.drop_column("triage_urgency_rank")
+        batch_op.drop_column("triage_as_of")
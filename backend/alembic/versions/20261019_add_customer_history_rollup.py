@@ -0,0 +1,46 @@
+"""
+Add order.history_key and the customer_history_rollup table.
+
+Existing rows are keyed here and rolled up by
+20261025_add_order_previous_date, which adds the last column the rollup
+rebuild writes; afterwards the ORM flush hooks in app.models.order keep both
+current.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.models.order import backfill_order_history_keys
+
+
+# revision identifiers, used by Alembic.
+revision = "20261019_add_customer_history_rollup"
+down_revision = "20261018_add_order_triage_columns"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("order", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("history_key", sa.String(length=320), nullable=True))
+        batch_op.create_index("ix_order_history_key", ["history_key"])
+
+    op.create_table(
+        "customer_history_rollup",
+        sa.Column("user_id", sa.String(length=36), sa.ForeignKey("user.id"), nullable=False),
+        sa.Column("history_key", sa.String(length=320), nullable=False),
+        sa.Column("total_orders", sa.Integer(), nullable=False),
+        sa.Column("completed_orders", sa.Integer(), nullable=False),
+        sa.Column("active_orders", sa.Integer(), nullable=False),
+        sa.Column("last_order_date", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("user_id", "history_key"),
+    )
+
+    backfill_order_history_keys(op.get_bind())
+
+
+def downgrade() -> None:
+    op.drop_table("customer_history_rollup")
+    with op.batch_alter_table("order", schema=None) as batch_op:
+        batch_op.drop_index("ix_order_history_key")
+        batch_op.drop_column("history_key")
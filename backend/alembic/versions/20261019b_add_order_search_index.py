@@ -0,0 +1,29 @@
+"""
+Add the order_search FTS5 trigram index and its sync triggers (SQLite only).
+
+On other databases, or SQLite builds without FTS5, this is a no-op and order
+search keeps using ILIKE.
+"""
+
+from alembic import op
+
+from app.models.order_search import ORDER_SEARCH_TABLE, create_order_search_index
+
+
+# revision identifiers, used by Alembic.
+revision = "20261019b_add_order_search_index"
+down_revision = "20261019_add_customer_history_rollup"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    create_order_search_index(op.get_bind())
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    for suffix in ("ai", "ad", "au"):
+        op.execute(f"DROP TRIGGER IF EXISTS {ORDER_SEARCH_TABLE}_{suffix}")
+    op.execute(f"DROP TABLE IF EXISTS {ORDER_SEARCH_TABLE}")
@@ -0,0 +1,41 @@
+"""
+Add order.is_imported, order.legacy_status_raw and order.import_source.
+
+Existing imported orders are recognised from their "Legacy ..." internal note
+lines and backfilled here in id-ordered chunks; afterwards the importer writes
+the columns directly and the ORM hooks in app.models.order cover other writers.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.models.order import backfill_order_import_metadata
+
+
+# revision identifiers, used by Alembic.
+revision = "20261020_add_order_import_metadata"
+down_revision = "20261019b_add_order_search_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("order", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column("is_imported", sa.Boolean(), nullable=False, server_default=sa.false())
+        )
+        batch_op.add_column(sa.Column("legacy_status_raw", sa.String(), nullable=True))
+        batch_op.add_column(sa.Column("import_source", sa.String(), nullable=True))
+        batch_op.create_index("ix_order_is_imported", ["is_imported"])
+        batch_op.create_index("ix_order_import_source", ["import_source"])
+
+    backfill_order_import_metadata(op.get_bind())
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("order", schema=None) as batch_op:
+        batch_op.drop_index("ix_order_import_source")
+        batch_op.drop_index("ix_order_is_imported")
+        batch_op.drop_column("import_source")
+        batch_op.drop_column("legacy_status_raw")
+        batch_op.drop_column("is_imported")
@@ -0,0 +1,36 @@
+"""
+Add composite (user_id, <date>) indexes to the tenant-scoped tables.
+
+List, range and report queries filter on the owner and then a date, and none
+of these tables had an index on user_id, so each of them scanned the table.
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261020b_add_tenant_date_indexes"
+down_revision = "20261020_add_order_import_metadata"
+branch_labels = None
+depends_on = None
+
+TENANT_DATE_INDEXES = [
+    ("ix_order_user_id_due_date", "order", ["user_id", "due_date"]),
+    ("ix_order_user_id_order_date", "order", ["user_id", "order_date"]),
+    ("ix_quote_user_id_quote_date", "quote", ["user_id", "quote_date"]),
+    ("ix_expense_user_id_date", "expense", ["user_id", "date"]),
+    ("ix_mileagelog_user_id_date", "mileagelog", ["user_id", "date"]),
+    ("ix_task_user_id_due_date", "task", ["user_id", "due_date"]),
+    ("ix_calendarevent_user_id_start_datetime", "calendarevent", ["user_id", "start_datetime"]),
+    ("ix_calendarevent_user_id_end_datetime", "calendarevent", ["user_id", "end_datetime"]),
+]
+
+
+def upgrade() -> None:
+    for index_name, table_name, columns in TENANT_DATE_INDEXES:
+        op.create_index(index_name, table_name, columns)
+
+
+def downgrade() -> None:
+    for index_name, table_name, _columns in reversed(TENANT_DATE_INDEXES):
+        op.drop_index(index_name, table_name=table_name)
@@ -0,0 +1,28 @@
+"""
+Add the cache_version table.
+
+Each worker keeps an in-process cache of reference data; writes bump the
+namespace's counter here so the other workers drop their stale copies.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261021_add_cache_version"
+down_revision = "20261020b_add_tenant_date_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "cache_version",
+        sa.Column("namespace", sa.String(), primary_key=True),
+        sa.Column("version", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("cache_version")
@@ -0,0 +1,33 @@
+"""
+Add the import_checkpoint table.
+
+The Marvelous Creations importer commits in chunks and records per sheet how
+many rows are committed, so an interrupted import resumes where it stopped.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261022_add_import_checkpoint"
+down_revision = "20261021_add_cache_version"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "import_checkpoint",
+        sa.Column("user_id", sa.String(length=36), sa.ForeignKey("user.id"), nullable=False),
+        sa.Column("source", sa.String(), nullable=False),
+        sa.Column("workbook_digest", sa.String(length=64), nullable=False),
+        sa.Column("sheet", sa.String(), nullable=False),
+        sa.Column("rows_committed", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("user_id", "source", "workbook_digest", "sheet"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("import_checkpoint")
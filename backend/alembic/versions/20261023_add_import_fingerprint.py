@@ -0,0 +1,35 @@
+"""
+Add the import_fingerprint table.
+
+Re-imports of a Marvelous Creations export compare each row's content hash
+with the one recorded for the record it created, and only write rows that
+are new or changed.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261023_add_import_fingerprint"
+down_revision = "20261022_add_import_checkpoint"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "import_fingerprint",
+        sa.Column("user_id", sa.String(length=36), sa.ForeignKey("user.id"), nullable=False),
+        sa.Column("source", sa.String(), nullable=False),
+        sa.Column("sheet", sa.String(), nullable=False),
+        sa.Column("record_key", sa.String(), nullable=False),
+        sa.Column("fingerprint", sa.String(length=64), nullable=False),
+        sa.Column("record_id", sa.String(length=36), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("user_id", "source", "sheet", "record_key"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("import_fingerprint")
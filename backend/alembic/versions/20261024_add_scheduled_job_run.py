@@ -0,0 +1,30 @@
+"""
+Add the scheduled_job_run table.
+
+Each worker runs the midnight order triage rollover loop; the worker that
+claims the day in this table runs it, so the book is refreshed once per
+deployment rather than once per worker.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261024_add_scheduled_job_run"
+down_revision = "20261023_add_import_fingerprint"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "scheduled_job_run",
+        sa.Column("name", sa.String(), primary_key=True),
+        sa.Column("run_on", sa.Date(), nullable=False),
+        sa.Column("claimed_at", sa.DateTime(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("scheduled_job_run")
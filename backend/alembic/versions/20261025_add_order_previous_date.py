@@ -0,0 +1,37 @@
+"""
+Store each order's previous customer order date and drop the unused
+customer_history_rollup.last_order_date.
+
+Order summaries read ``order.previous_order_date`` instead of scanning the
+customer's other orders; the rollup rebuild keeps it current from here on.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+from app.models.order import rebuild_customer_history_rollups
+
+
+# revision identifiers, used by Alembic.
+revision = "20261025_add_order_previous_date"
+down_revision = "20261024_add_scheduled_job_run"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("order", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column("previous_order_date", sa.DateTime(), nullable=True)
+        )
+    with op.batch_alter_table("customer_history_rollup", schema=None) as batch_op:
+        batch_op.drop_column("last_order_date")
+
+    rebuild_customer_history_rollups(op.get_bind())
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("customer_history_rollup", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("last_order_date", sa.DateTime(), nullable=True))
+    with op.batch_alter_table("order", schema=None) as batch_op:
+        batch_op.drop_column("previous_order_date")
@@ -0,0 +1,33 @@
+import inspect
+from functools import wraps
+from typing import Any, Callable
+
+from fastapi.routing import APIRoute
+
+from app.repositories.db_threads import run_db_coroutine
+
+
+def offload_endpoint(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap an ``async def`` endpoint so its body runs on a database thread."""
+    if not inspect.iscoroutinefunction(endpoint) or getattr(
+        endpoint, "runs_on_db_thread", False
+    ):
+        return endpoint
+
+    @wraps(endpoint)
+    async def offloaded(*args, **kwargs):
+        return await run_db_coroutine(endpoint, *args, **kwargs)
+
+    offloaded.runs_on_db_thread = True
+    return offloaded
+
+
+class DatabaseRoute(APIRoute):
+    """Route for endpoints that do synchronous database work.
+
+    Endpoint bodies run through ``run_db_coroutine`` so their queries do not
+    block the event loop. Dependencies still run on the loop.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        super().__init__(path, offload_endpoint(endpoint), **kwargs)
@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, Response
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlmodel import Session
 
+from app.api.routing import DatabaseRoute
 from app.repositories.sqlite_adapter import (
     get_session,
 )  # Assuming SQLite for now, can be made generic
@@ -9,9 +10,8 @@ from app.services.user_service import UserService
 from app.models.user import UserCreate, UserRead
 from app.models.token import Token
 from app.auth.jwt import create_access_token
-from app.auth.security import verify_password
 
-router = APIRouter()
+router = APIRouter(route_class=DatabaseRoute)
 
 
 @router.post("/register", response_model=UserRead, status_code=status.HTTP_201_CREATED)
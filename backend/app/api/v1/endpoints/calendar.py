@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
 
 from sqlmodel import Session
 
+from app.api.routing import DatabaseRoute
+from app.api.v1.pagination import CursorParam, page_items
 from app.repositories.sqlite_adapter import get_session
 from app.services.calendar_service import CalendarService
 from app.models.calendar import (
@@ -17,7 +19,7 @@ from app.models.calendar import (
 from app.models.user import User
 from app.auth.dependencies import get_current_active_user
 
-router = APIRouter()
+router = APIRouter(route_class=DatabaseRoute)
 
 
 @router.post(
@@ -57,12 +59,24 @@ async def read_calendar_events(
     ),
     skip: int = Query(0, ge=0),
     limit: int = Query(1000, ge=1, le=2000),  # Default high limit for calendar views
+    cursor: CursorParam = None,
+    response: Response = None,
     current_user: User = Depends(get_current_active_user)
 ):
     """
     Retrieve calendar events for the authenticated user within a date range.
     """
     calendar_service = CalendarService(session=session)
+    if cursor is not None:
+        page = await calendar_service.get_calendar_event_page_by_user(
+            current_user=current_user,
+            start_date=start_date,
+            end_date=end_date,
+            event_type=event_type,
+            cursor=cursor,
+            limit=limit,
+        )
+        return page_items(page, response)
     events = await calendar_service.get_calendar_events_by_user(
         current_user=current_user,
         start_date=start_date,
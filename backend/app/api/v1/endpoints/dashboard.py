@@ -3,12 +3,13 @@ from typing import List
 from fastapi import APIRouter, Depends
 from sqlmodel import Session
 
+from app.api.routing import DatabaseRoute
 from app.auth.dependencies import get_current_active_user
 from app.models.user import User
 from app.repositories.sqlite_adapter import get_session
 from app.services.dashboard_service import DashboardService
 
-router = APIRouter()
+router = APIRouter(route_class=DatabaseRoute)
 
 
 @router.get("/summary")
@@ -4,6 +4,7 @@ from fastapi import (
     HTTPException,
     status,
     Query,
+    Response,
     UploadFile,
     File,
     Form,
@@ -16,6 +17,8 @@ from pathlib import Path
 from sqlmodel import Session
 from fastapi.responses import FileResponse
 
+from app.api.routing import DatabaseRoute
+from app.api.v1.pagination import CursorParam, page_items
 from app.repositories.sqlite_adapter import get_session
 from app.services.expense_service import ExpenseService, RECEIPT_STORAGE_PATH
 from app.models.expense import (
@@ -28,7 +31,7 @@ from app.models.expense import (
 from app.models.user import User
 from app.auth.dependencies import get_current_active_user
 
-router = APIRouter()
+router = APIRouter(route_class=DatabaseRoute)
 
 
 @router.post("/import", response_model=dict)
@@ -87,7 +90,12 @@ async def import_expenses_from_csv(
     import_dir = resolve_import_dir()
     matches = list(import_dir.glob("*Expenses*.csv"))
     if not matches:
-        return {"imported": 0, "skipped": 0, "errors": ["No Expenses CSV found."], "files": []}
+        return {
+            "imported": 0,
+            "skipped": 0,
+            "errors": ["No Expenses CSV found."],
+            "files": [],
+        }
 
     expense_service = ExpenseService(session=session)
     imported = 0
@@ -103,7 +111,9 @@ async def import_expenses_from_csv(
                 for idx, row in enumerate(reader, start=2):  # header is line 1
                     try:
                         date_val = parse_date(row.get("ExpenseDate", ""))
-                        description = (row.get("Description") or "").strip() or "(no description)"
+                        description = (
+                            row.get("Description") or ""
+                        ).strip() or "(no description)"
                         vendor = (row.get("Vendor") or "").strip() or None
                         amount_raw = (row.get("Amount") or "0").replace(",", "").strip()
                         amount = float(amount_raw or 0)
@@ -111,7 +121,9 @@ async def import_expenses_from_csv(
                         vat_amount = float(vat_raw or 0)
                         category_raw = (row.get("Category") or "").strip().lower()
                         category = category_map.get(category_raw, ExpenseCategory.OTHER)
-                        payment_source = (row.get("PaymentSource") or "").strip() or None
+                        payment_source = (
+                            row.get("PaymentSource") or ""
+                        ).strip() or None
 
                         exp_in = ExpenseCreate(
                             user_id=current_user.id,
@@ -135,6 +147,7 @@ async def import_expenses_from_csv(
 
     return {"imported": imported, "skipped": skipped, "errors": errors, "files": files}
 
+
 @router.post("/import-file", response_model=dict)
 async def import_expenses_file(
     *,
@@ -216,6 +229,7 @@ async def import_expenses_file(
 
     return {"imported": imported, "skipped": skipped, "errors": errors}
 
+
 @router.post("/", response_model=ExpenseRead, status_code=status.HTTP_201_CREATED)
 async def create_expense(
     *,
@@ -232,7 +246,7 @@ async def create_expense(
     receipt_file: Optional[UploadFile] = File(
         None, alias="receipt"
     ),  # Alias to match form field name
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
 ):
     """
     Create a new expense for the authenticated user, optionally with a receipt upload.
@@ -271,12 +285,24 @@ async def read_expenses(
     category: Optional[ExpenseCategory] = Query(None),
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
-    current_user: User = Depends(get_current_active_user)
+    cursor: CursorParam = None,
+    response: Response = None,
+    current_user: User = Depends(get_current_active_user),
 ):
     """
     Retrieve expenses for the authenticated user, with optional filters.
     """
     expense_service = ExpenseService(session=session)
+    if cursor is not None:
+        page = await expense_service.get_expense_page_by_user(
+            current_user=current_user,
+            category=category,
+            start_date=start_date,
+            end_date=end_date,
+            cursor=cursor,
+            limit=limit,
+        )
+        return page_items(page, response)
     expenses = await expense_service.get_expenses_by_user(
         current_user=current_user,
         category=category,
@@ -293,7 +319,7 @@ async def read_expense(
     *,
     session: Session = Depends(get_session),
     expense_id: UUID,
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
 ):
     """
     Retrieve a specific expense by ID for the authenticated user.
@@ -326,7 +352,7 @@ async def update_expense(
         False, alias="remove_receipt"
     ),  # To explicitly remove receipt
     receipt_file: Optional[UploadFile] = File(None, alias="receipt"),
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
 ):
     """
     Update an expense for the authenticated user. Can also update/replace or remove the receipt.
@@ -377,7 +403,7 @@ async def delete_expense(
     *,
     session: Session = Depends(get_session),
     expense_id: UUID,
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
 ):
     """
     Delete an expense for the authenticated user.
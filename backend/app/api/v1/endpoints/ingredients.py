@@ -4,6 +4,7 @@ from uuid import UUID
 
 from sqlmodel import Session
 
+from app.api.routing import DatabaseRoute
 from app.repositories.sqlite_adapter import get_session  # Or your DB session getter
 from app.services.ingredient_service import IngredientService
 from app.models.ingredient import (
@@ -15,7 +16,7 @@ from app.models.ingredient import (
 from app.models.user import User  # For current_user dependency
 from app.auth.dependencies import get_current_active_user
 
-router = APIRouter()
+router = APIRouter(route_class=DatabaseRoute)
 
 
 @router.post("/", response_model=IngredientRead, status_code=status.HTTP_201_CREATED)
@@ -4,13 +4,14 @@ from uuid import UUID
 
 from sqlmodel import Session
 
+from app.api.routing import DatabaseRoute
 from app.repositories.sqlite_adapter import get_session
 from app.services.inventory.inventory_service import InventoryService
 from app.models.ingredient import IngredientRead  # To return updated ingredient
 from app.models.user import User
 from app.auth.dependencies import get_current_active_user
 
-router = APIRouter()
+router = APIRouter(route_class=DatabaseRoute)
 
 
 @router.post("/ingredients/{ingredient_id}/adjust-stock", response_model=IngredientRead)
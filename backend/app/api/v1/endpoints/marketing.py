@@ -4,13 +4,14 @@ from pydantic import BaseModel, EmailStr
 
 from sqlmodel import Session
 
+from app.api.routing import DatabaseRoute
 from app.repositories.sqlite_adapter import get_session
 from app.services.marketing.marketing_service import MarketingService, MarketingSegment
 from app.models.user import User
 from app.models.contact import ContactRead  # To show contacts in a segment
 from app.auth.dependencies import get_current_active_user
 
-router = APIRouter()
+router = APIRouter(route_class=DatabaseRoute)
 
 
 class CampaignBody(BaseModel):
@@ -1,10 +1,21 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    status,
+    Query,
+    Response,
+    UploadFile,
+    File,
+)
 from typing import List, Optional
 from uuid import UUID
 from datetime import date
 
 from sqlmodel import Session
 
+from app.api.routing import DatabaseRoute
+from app.api.v1.pagination import CursorParam, page_items
 from app.repositories.sqlite_adapter import get_session
 from app.services.mileage_service import MileageService
 from app.models.mileage import (
@@ -16,7 +27,7 @@ from app.models.mileage import (
 from app.models.user import User
 from app.auth.dependencies import get_current_active_user
 
-router = APIRouter()
+router = APIRouter(route_class=DatabaseRoute)
 
 
 @router.post("/import", response_model=dict)
@@ -56,7 +67,12 @@ async def import_mileage_from_csv(
     import_dir = resolve_import_dir()
     matches = list(import_dir.glob("*Mileage*.csv"))
     if not matches:
-        return {"imported": 0, "skipped": 0, "errors": ["No Mileage CSV found."], "files": []}
+        return {
+            "imported": 0,
+            "skipped": 0,
+            "errors": ["No Mileage CSV found."],
+            "files": [],
+        }
 
     mileage_service = MileageService(session=session)
     imported = 0
@@ -73,7 +89,11 @@ async def import_mileage_from_csv(
                     try:
                         date_val = parse_date(row.get("Date", ""))
                         purpose = (row.get("Purpose") or "").strip() or None
-                        miles_raw = (row.get("Miles") or row.get("Distance") or "0").replace(",", "").strip()
+                        miles_raw = (
+                            (row.get("Miles") or row.get("Distance") or "0")
+                            .replace(",", "")
+                            .strip()
+                        )
                         distance = float(miles_raw or 0)
                         order_ref = (row.get("OrderRef") or "").strip() or None
                         notes = (row.get("Description") or "").strip() or None
@@ -98,12 +118,13 @@ async def import_mileage_from_csv(
 
     return {"imported": imported, "skipped": skipped, "errors": errors, "files": files}
 
+
 @router.post("/", response_model=MileageLogRead, status_code=status.HTTP_201_CREATED)
 async def create_mileage_log(
     *,
     session: Session = Depends(get_session),
     log_in: MileageLogCreate,
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
 ):
     """
     Create a new mileage log for the authenticated user.
@@ -127,12 +148,24 @@ async def read_mileage_logs(
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
     purpose: Optional[str] = Query(None),
-    current_user: User = Depends(get_current_active_user)
+    cursor: CursorParam = None,
+    response: Response = None,
+    current_user: User = Depends(get_current_active_user),
 ):
     """
     Retrieve mileage logs for the authenticated user, with optional filters.
     """
     mileage_service = MileageService(session=session)
+    if cursor is not None:
+        page = await mileage_service.get_mileage_log_page_by_user(
+            current_user=current_user,
+            start_date=start_date,
+            end_date=end_date,
+            purpose=purpose,
+            cursor=cursor,
+            limit=limit,
+        )
+        return page_items(page, response)
     logs = await mileage_service.get_mileage_logs_by_user(
         current_user=current_user,
         start_date=start_date,
@@ -149,7 +182,7 @@ async def read_mileage_log(
     *,
     session: Session = Depends(get_session),
     log_id: UUID,
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
 ):
     """
     Retrieve a specific mileage log by ID for the authenticated user.
@@ -172,7 +205,7 @@ async def update_mileage_log(
     session: Session = Depends(get_session),
     log_id: UUID,
     log_in: MileageLogUpdate,
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
 ):
     """
     Update a mileage log for the authenticated user.
@@ -194,7 +227,7 @@ async def delete_mileage_log(
     *,
     session: Session = Depends(get_session),
     log_id: UUID,
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
 ):
     """
     Delete a mileage log for the authenticated user.
@@ -244,7 +277,11 @@ async def import_mileage_file(
         try:
             date_val = parse_date(row.get("Date", ""))
             purpose = (row.get("Purpose") or "").strip() or None
-            miles_raw = (row.get("Miles") or row.get("Distance") or "0").replace(",", "").strip()
+            miles_raw = (
+                (row.get("Miles") or row.get("Distance") or "0")
+                .replace(",", "")
+                .strip()
+            )
             distance = float(miles_raw or 0)
             order_ref = (row.get("OrderRef") or "").strip() or None
             notes = (row.get("Description") or "").strip() or None
@@ -16,8 +16,14 @@ from sqlmodel import Session, select, func
 import stripe  # For webhook verification if not done by a library
 from sqlalchemy.exc import OperationalError, ProgrammingError
 
+from app.api.routing import DatabaseRoute
+from app.api.v1.pagination import CursorParam, page_items, projected_response
 from app.repositories.sqlite_adapter import get_session
-from app.services.order_service import OrderService, QuoteService
+from app.services.order_service import (
+    OrderService,
+    QuoteService,
+    resolve_order_list_fields,
+)
 from app.models.order import (
     DayRunningQueueSummary,
     ImportedOrderQueueSummary,
@@ -25,7 +31,9 @@ from app.models.order import (
     Order,
     OrderDayRunningTriageFilter,
     OrderCreate,
+    OrderListView,
     OrderRead,
+    OrderSearchSuggestion,
     OrderUpdate,
     OrderStatus,
     PaymentStatus,
@@ -39,7 +47,7 @@ from app.models.user import User
 from app.auth.dependencies import get_current_active_user
 from app.core.config import settings
 
-router = APIRouter()
+router = APIRouter(route_class=DatabaseRoute)
 
 
 def _raise_local_dev_readiness_error(exc: Exception) -> None:
@@ -102,6 +110,16 @@ async def read_orders(
     day_running: Annotated[Optional[OrderDayRunningTriageFilter], Query()] = None,
     action_class: Annotated[Optional[str], Query()] = None,
     urgency: Annotated[Optional[str], Query()] = None,
+    cursor: CursorParam = None,
+    view: Annotated[
+        OrderListView,
+        Query(description="compact and queue return a subset of the OrderRead fields"),
+    ] = OrderListView.FULL,
+    fields: Annotated[
+        Optional[str],
+        Query(description="Comma-separated OrderRead fields to return; overrides view"),
+    ] = None,
+    response: Response = None,
     current_user: User = Depends(get_current_active_user),
 ):
     order_service = OrderService(session=session)
@@ -111,27 +129,35 @@ async def read_orders(
     if status_value and not is_open_filter:
         status_enum = OrderStatus(status_value.lower())
     try:
-        orders = await order_service.get_orders_by_user(
-            current_user=current_user,
-            skip=skip,
-            limit=limit,
-            status=status_enum,
-            imported_only=imported_only,
-            search=search,
-            needs_review=needs_review,
-            review_reason=review_reason,
-            day_running=day_running,
-            action_class=action_class,
-            urgency=urgency,
-        )
+        projection = resolve_order_list_fields(view, fields)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    list_filters = dict(
+        status=status_enum,
+        open_only=is_open_filter,
+        imported_only=imported_only,
+        search=search,
+        needs_review=needs_review,
+        review_reason=review_reason,
+        day_running=day_running,
+        action_class=action_class,
+        urgency=urgency,
+        fields=projection,
+    )
+    try:
+        if cursor is not None:
+            page = await order_service.get_order_page_by_user(
+                current_user=current_user, cursor=cursor, limit=limit, **list_filters
+            )
+            orders = page_items(page, response)
+        else:
+            orders = await order_service.get_orders_by_user(
+                current_user=current_user, skip=skip, limit=limit, **list_filters
+            )
     except (OperationalError, ProgrammingError) as exc:
         _raise_local_dev_readiness_error(exc)
-    if is_open_filter:
-        orders = [
-            order
-            for order in orders
-            if order.status not in {OrderStatus.COMPLETED, OrderStatus.CANCELLED}
-        ]
+    if projection is not None:
+        return projected_response(orders, response)
     return orders
 
 
@@ -178,6 +204,22 @@ async def read_imported_order_summary(
     )
 
 
+@router.get("/search/suggestions", response_model=List[OrderSearchSuggestion])
+async def read_order_search_suggestions(
+    *,
+    session: Session = Depends(get_session),
+    q: Annotated[str, Query(min_length=1, max_length=100)],
+    limit: int = Query(8, ge=1, le=25),
+    current_user: User = Depends(get_current_active_user),
+):
+    order_service = OrderService(session=session)
+    return await order_service.search_order_suggestions(
+        current_user=current_user,
+        prefix=q,
+        limit=limit,
+    )
+
+
 @router.get("/summary")
 async def orders_summary(
     *,
@@ -291,9 +333,16 @@ async def read_quotes(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=200),
     status_filter: Optional[QuoteStatus] = Query(None, alias="status"),
+    cursor: CursorParam = None,
+    response: Response = None,
     current_user: User = Depends(get_current_active_user),
 ):
     quote_service = QuoteService(session=session)
+    if cursor is not None:
+        page = await quote_service.get_quote_page_by_user(
+            current_user=current_user, cursor=cursor, limit=limit, status=status_filter
+        )
+        return page_items(page, response)
     quotes = await quote_service.get_quotes_by_user(
         current_user=current_user, skip=skip, limit=limit, status=status_filter
     )
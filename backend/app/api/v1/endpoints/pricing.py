@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlmodel import Session
 from uuid import UUID
 
+from app.api.routing import DatabaseRoute
 from app.repositories.sqlite_adapter import get_session
 from app.services.pricing_service import PricingService
 from app.models.pricing_config import (
@@ -12,7 +13,7 @@ from app.models.pricing_config import (
 from app.models.user import User
 from app.auth.dependencies import get_current_active_user
 
-router = APIRouter()
+router = APIRouter(route_class=DatabaseRoute)
 
 
 @router.get("/configuration", response_model=PricingConfigurationRead)
@@ -6,12 +6,13 @@ from uuid import UUID
 from sqlmodel import Session
 from fastapi.responses import StreamingResponse, Response  # For CSV and PDF
 
+from app.api.routing import DatabaseRoute
 from app.repositories.sqlite_adapter import get_session
 from app.services.report_service import ReportService
 from app.models.user import User
 from app.auth.dependencies import get_current_active_user
 
-router = APIRouter()
+router = APIRouter(route_class=DatabaseRoute)
 
 
 @router.get("/profit-and-loss", summary="Profit and Loss Report")
@@ -4,6 +4,7 @@ from uuid import UUID
 
 from sqlmodel import Session
 
+from app.api.routing import DatabaseRoute
 from app.repositories.sqlite_adapter import get_session
 from app.services.shop.shop_service import ShopService
 from app.models.shop.shop_configuration import (
@@ -19,9 +20,9 @@ from app.models.order import OrderRead  # For returning the created order from s
 from app.auth.dependencies import get_current_active_user
 
 # Router for baker-facing shop management
-management_router = APIRouter()
+management_router = APIRouter(route_class=DatabaseRoute)
 # Router for public-facing shop view and ordering
-public_router = APIRouter()
+public_router = APIRouter(route_class=DatabaseRoute)
 
 # --- Management Endpoints (for authenticated bakers) --- #
 
@@ -1,17 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
 
 from sqlmodel import Session
 
+from app.api.routing import DatabaseRoute
+from app.api.v1.pagination import CursorParam, page_items
 from app.repositories.sqlite_adapter import get_session
 from app.services.task_service import TaskService
 from app.models.task import Task, TaskCreate, TaskRead, TaskUpdate, TaskStatus
 from app.models.user import User
 from app.auth.dependencies import get_current_active_user
 
-router = APIRouter()
+router = APIRouter(route_class=DatabaseRoute)
 
 
 @router.post("/", response_model=TaskRead, status_code=status.HTTP_201_CREATED)
@@ -49,12 +51,27 @@ async def read_tasks(
         None, description="Filter tasks due on or before this date (ISO format)"
     ),
     order_id_filter: Optional[UUID] = Query(None, alias="order_id"),
+    cursor: CursorParam = None,
+    response: Response = None,
     current_user: User = Depends(get_current_active_user)
 ):
     """
     Retrieve tasks for the authenticated user, with optional filters.
+    Cursor pages list tasks without a due date last.
     """
     task_service = TaskService(session=session)
+    if cursor is not None:
+        page = await task_service.get_task_page_by_user(
+            current_user=current_user,
+            status=status_filter,
+            priority=priority_filter,
+            due_date_start=due_date_start,
+            due_date_end=due_date_end,
+            order_id=order_id_filter,
+            cursor=cursor,
+            limit=limit,
+        )
+        return page_items(page, response)
     tasks = await task_service.get_tasks_by_user(
         current_user=current_user,
         status=status_filter,
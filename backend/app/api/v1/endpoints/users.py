@@ -3,6 +3,7 @@ from sqlmodel import Session, select
 from uuid import UUID
 from datetime import timedelta
 
+from app.api.routing import DatabaseRoute
 from app.repositories.sqlite_adapter import get_session  # Or your DB session getter
 from app.services.user_service import UserService
 from app.models.user import User, UserRead, UserReadWithRecipes
@@ -15,7 +16,7 @@ from app.core.config import settings
 
 # from app.services.email_service import send_email_async # Placeholder for SendGrid integration
 
-router = APIRouter()
+router = APIRouter(route_class=DatabaseRoute)
 
 
 @router.post("/verify-email-request", status_code=status.HTTP_202_ACCEPTED)
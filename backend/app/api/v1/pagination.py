@@ -0,0 +1,45 @@
+"""Shared plumbing for list endpoints: keyset ``cursor`` paging and projections.
+
+Cursor paging is opt-in so existing ``skip``/``limit`` clients keep working:
+send ``cursor=`` (empty) for the first page, then echo back the value of the
+``X-Next-Cursor`` response header until it is absent.
+"""
+
+from typing import Annotated, Any, List, Optional
+
+from fastapi import Query, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.repositories.cursor import NEXT_CURSOR_HEADER, CursorPage
+
+CursorParam = Annotated[
+    Optional[str],
+    Query(
+        description=(
+            "Opaque keyset cursor. Send an empty value for the first page, then the "
+            f"{NEXT_CURSOR_HEADER} header of the previous response."
+        )
+    ),
+]
+
+
+def page_items(page: CursorPage, response: Optional[Response]) -> List[Any]:
+    """Return the page's items and advertise the next cursor, if any."""
+    if page.next_cursor and response is not None:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
+
+
+def projected_response(rows: List[Any], response: Optional[Response]) -> JSONResponse:
+    """Serialize partial read models directly, keeping headers set on ``response``.
+
+    Only the fields set on each row are emitted; ``response_model`` validation
+    would reject the ones left out.
+    """
+    headers = dict(response.headers) if response is not None else None
+    if headers:
+        headers.pop("content-length", None)
+    return JSONResponse(
+        content=jsonable_encoder(rows, exclude_unset=True), headers=headers
+    )
@@ -12,6 +12,7 @@ from uuid import UUID
 from app.core.config import settings
 from app.models.user import User
 from app.models.token import TokenPayload  # Using the one from models/token.py
+from app.repositories.db_threads import run_db_coroutine
 from app.repositories.sqlite_adapter import get_session  # Or your DB session getter
 from app.services.user_service import UserService
 from app.auth.jwt import decode_access_token  # Using our existing decode function
@@ -34,7 +35,9 @@ async def get_current_user(
         )
 
     user_service = UserService(session=session)
-    user = await user_service.get_user_by_id(user_id=UUID(token_payload.sub))
+    user = await run_db_coroutine(
+        user_service.get_principal, user_id=UUID(token_payload.sub)
+    )
 
     if not user:
         raise HTTPException(
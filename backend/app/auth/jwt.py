@@ -1,5 +1,7 @@
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Any
+from typing import Optional, Any, Tuple
 
 import jwt
 from pydantic import BaseModel, ValidationError
@@ -30,8 +32,42 @@ def create_access_token(subject: Any, expires_delta: Optional[timedelta] = None)
     return encoded_jwt
 
 
+# A client sends the same token with every request until it expires, so
+# verified payloads are kept (keyed by token and signing settings) until their
+# ``exp``. Invalid tokens are never cached.
+DECODED_TOKEN_CACHE_SIZE = 4096
+_decoded_tokens: "OrderedDict[Tuple[str, str, str], TokenPayload]" = OrderedDict()
+_decoded_tokens_lock = threading.Lock()
+
+
+def clear_decoded_token_cache() -> None:
+    with _decoded_tokens_lock:
+        _decoded_tokens.clear()
+
+
 def decode_access_token(token: str) -> Optional[TokenPayload]:
     """Decodes a JWT access token and returns its payload."""
+    key = (token, settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM)
+    now = datetime.now(timezone.utc)
+    with _decoded_tokens_lock:
+        cached = _decoded_tokens.get(key)
+        if cached is not None:
+            if cached.exp > now:
+                _decoded_tokens.move_to_end(key)
+                return cached.model_copy()
+            del _decoded_tokens[key]
+            return None
+
+    token_payload = _decode_access_token(token)
+    if token_payload is not None and token_payload.exp is not None:
+        with _decoded_tokens_lock:
+            _decoded_tokens[key] = token_payload.model_copy()
+            while len(_decoded_tokens) > DECODED_TOKEN_CACHE_SIZE:
+                _decoded_tokens.popitem(last=False)
+    return token_payload
+
+
+def _decode_access_token(token: str) -> Optional[TokenPayload]:
     try:
         payload_dict = jwt.decode(
             token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
@@ -1,8 +1,35 @@
+"""Password hashing.
+
+bcrypt is deliberately slow (about 250ms at the default 12 rounds), so the
+service layer does not call it inline: ``password_hasher`` runs it on a small
+pool of its own, ``PASSWORD_HASH_WORKERS`` threads wide. At most
+``PASSWORD_HASH_MAX_PENDING`` hashes may be running or queued; past that,
+callers get ``PasswordHasherBusy`` straight away (a 503) instead of holding a
+database thread while they wait. bcrypt releases the GIL, so the pool hashes
+in parallel.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Tuple, TypeVar
+
 from passlib.context import CryptContext
 
+from app.core.config import settings
+
+T = TypeVar("T")
+
 # Initialize CryptContext for password hashing
-# Using bcrypt as it's a strong and widely recommended hashing algorithm
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Using bcrypt as it's a strong and widely recommended hashing algorithm.
+# min_rounds makes hashes made with a lower work factor "need update", so
+# raising PASSWORD_HASH_ROUNDS upgrades stored hashes as users log in.
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.PASSWORD_HASH_ROUNDS,
+    bcrypt__min_rounds=settings.PASSWORD_HASH_ROUNDS,
+)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -13,3 +40,76 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 def get_password_hash(password: str) -> str:
     """Hashes a plain password."""
     return pwd_context.hash(password)
+
+
+class PasswordHasherBusy(RuntimeError):
+    """Too many password hashes are already running or queued."""
+
+
+class PasswordHasher:
+    """Runs ``context`` hashing on a bounded pool of worker threads.
+
+    ``workers=0`` hashes in the calling thread, still subject to
+    ``max_pending``.
+    """
+
+    def __init__(self, context: CryptContext, *, workers: int, max_pending: int):
+        if workers < 0 or max_pending < 1:
+            raise ValueError("workers must be >= 0 and max_pending >= 1")
+        self.context = context
+        self.workers = workers
+        self.max_pending = max_pending
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    async def hash(self, password: str) -> str:
+        return await self._run(self.context.hash, password)
+
+    async def verify_and_update(
+        self, password: str, hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        """``(verified, new_hash)``; ``new_hash`` is set when the stored hash
+        uses outdated settings and should be replaced."""
+        return await self._run(
+            self.context.verify_and_update, password, hashed_password
+        )
+
+    def shutdown(self) -> None:
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    async def _run(self, func: Callable[..., T], *args) -> T:
+        if not self._slots.acquire(blocking=False):
+            raise PasswordHasherBusy("Too many password checks in progress")
+        if self.workers == 0:
+            try:
+                return func(*args)
+            finally:
+                self._slots.release()
+        try:
+            future = self._pool().submit(func, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _future: self._slots.release())
+        # wrap_future works from any event loop, including the short-lived
+        # ones run_db_coroutine starts on database threads.
+        return await asyncio.wrap_future(future)
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="password-hash"
+                )
+            return self._executor
+
+
+password_hasher = PasswordHasher(
+    pwd_context,
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
@@ -34,6 +34,46 @@ class Settings(BaseSettings):
         "DATABASE_URL", f"sqlite:///{APP_FILES_DIR}/bakemate_dev.db"
     )
 
+    # SQLite tuning, applied as PRAGMAs on every new connection of the shared
+    # engine (ignored for other databases). WAL lets the shop and the ops UI
+    # read while an order write is in flight; busy_timeout makes a writer wait
+    # for the lock instead of failing with "database is locked".
+    SQLITE_JOURNAL_MODE: str = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+    # NORMAL is durable across application crashes in WAL mode; only a power
+    # loss can drop the last few commits. Use FULL to rule that out too.
+    SQLITE_SYNCHRONOUS: str = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    SQLITE_BUSY_TIMEOUT_MS: int = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+    # Page cache per connection, in KiB.
+    SQLITE_CACHE_SIZE_KIB: int = int(os.getenv("SQLITE_CACHE_SIZE_KIB", "32768"))
+    # Bytes of the database file read through mmap; 0 disables it.
+    SQLITE_MMAP_SIZE_BYTES: int = int(
+        os.getenv("SQLITE_MMAP_SIZE_BYTES", str(256 * 1024 * 1024))
+    )
+    SQLITE_TEMP_STORE: str = os.getenv("SQLITE_TEMP_STORE", "MEMORY")
+    # A statement still busy after busy_timeout is retried this many times,
+    # sleeping SQLITE_BUSY_BACKOFF_MS, then twice that, and so on (with jitter).
+    SQLITE_BUSY_RETRIES: int = int(os.getenv("SQLITE_BUSY_RETRIES", "3"))
+    SQLITE_BUSY_BACKOFF_MS: int = int(os.getenv("SQLITE_BUSY_BACKOFF_MS", "50"))
+
+    # Endpoints run their synchronous database work on at most this many
+    # threads at once; keep it within the engine's connection pool (5 + 10
+    # overflow by default).
+    DB_THREAD_POOL_SIZE: int = int(os.getenv("DB_THREAD_POOL_SIZE", "8"))
+
+    # Read-through cache for reference data (pricing and shop configuration,
+    # ingredients). Writes bump a counter in the cache_version table; other
+    # workers notice within REFERENCE_CACHE_VERSION_CHECK_SECONDS and drop
+    # their copies.
+    REFERENCE_CACHE_ENABLED: bool = (
+        os.getenv("REFERENCE_CACHE_ENABLED", "true").lower() == "true"
+    )
+    REFERENCE_CACHE_VERSION_CHECK_SECONDS: float = float(
+        os.getenv("REFERENCE_CACHE_VERSION_CHECK_SECONDS", "1.0")
+    )
+
+    # Request metrics in Prometheus text format at /metrics (per process).
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+
     # Airtable - ensure these are set in your environment (e.g., .env file or Docker env)
     AIRTABLE_BASE_ID: str = os.getenv("AIRTABLE_BASE_ID", "YOUR_AIRTABLE_BASE_ID_HERE")
     AIRTABLE_API_KEY: str = os.getenv("AIRTABLE_API_KEY", "YOUR_AIRTABLE_API_KEY_HERE")
@@ -55,6 +95,20 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = int(
         os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60")
     )  # e.g., 60 minutes
+    # bcrypt work factor (log2 rounds). Stored hashes below it are rehashed
+    # on the user's next successful login.
+    PASSWORD_HASH_ROUNDS: int = int(os.getenv("PASSWORD_HASH_ROUNDS", "12"))
+    # Password hashing runs on its own threads. Beyond MAX_PENDING hashes in
+    # flight, logins and registrations get 503 + Retry-After; keep it below
+    # DB_THREAD_POOL_SIZE so a login burst cannot occupy every database thread.
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+    PASSWORD_HASH_MAX_PENDING: int = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "4"))
+    # Seconds an authenticated user row is reused across requests. Updates
+    # through UserService invalidate it at once; other workers follow within
+    # REFERENCE_CACHE_VERSION_CHECK_SECONDS.
+    AUTH_PRINCIPAL_CACHE_SECONDS: float = float(
+        os.getenv("AUTH_PRINCIPAL_CACHE_SECONDS", "30")
+    )
     # SECURE_COOKIE_NAME: str = "bakemate_auth"
 
     # CORS (Cross-Origin Resource Sharing)
@@ -75,6 +129,11 @@ class Settings(BaseSettings):
         os.getenv("DEFAULT_MILEAGE_REIMBURSEMENT_RATE", "0")
     )
 
+    # Refresh the persisted order triage columns at bakery midnight.
+    ORDER_TRIAGE_ROLLOVER_ENABLED: bool = (
+        os.getenv("ORDER_TRIAGE_ROLLOVER_ENABLED", "true").lower() == "true"
+    )
+
     model_config = ConfigDict(case_sensitive=True)
     # If you have a .env file in the root of your project (alongside docker-compose.yml)
     # and want pydantic-settings to load it automatically when not in Docker, you can specify:
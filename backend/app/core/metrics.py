@@ -0,0 +1,360 @@
+"""In-process metrics, rendered in the Prometheus text exposition format.
+
+A deliberately small subset of what ``prometheus_client`` offers (counters,
+gauges and cumulative histograms with labels) so the backend does not need
+another dependency. Every worker process keeps its own values; Prometheus
+sums them across scrape targets.
+
+Per-request accounting goes through ``RequestStats``: the metrics middleware
+opens one per HTTP request in a context variable, which follows the request
+onto database threads, and SQL statements and ``OrderService`` builders add
+to it. Code that runs outside a request is not counted.
+"""
+
+import math
+import threading
+import time
+from collections import defaultdict
+from contextvars import ContextVar
+from functools import wraps
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+BUILDER_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {_escape(self.documentation)}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        lines.extend(self._samples())
+        return lines
+
+    def _samples(self) -> Iterable[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = defaultdict(float)
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] += amount
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> Iterable[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+class Gauge(Counter):
+    type_name = "gauge"
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] += amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        *,
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: non-cumulative bucket counts (last one is +Inf), sum.
+        self._values: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = len(self.buckets)
+        for position, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = position
+                break
+        with self._lock:
+            counts, total = self._values.setdefault(
+                key, ([0] * (len(self.buckets) + 1), [0.0])
+            )
+            counts[index] += 1
+            total[0] += value
+
+    def count(self, **labels: str) -> int:
+        with self._lock:
+            entry = self._values.get(self._key(labels))
+            return sum(entry[0]) if entry else 0
+
+    def _samples(self) -> Iterable[str]:
+        with self._lock:
+            items = sorted(
+                (key, (list(counts), total[0]))
+                for key, (counts, total) in self._values.items()
+            )
+        names = self.labelnames + ("le",)
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                labels = _format_labels(names, key + (_format_value(bound),))
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}_sum{labels} {_format_value(total)}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        *,
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self.register(
+            Histogram(name, documentation, labelnames, buckets=buckets)
+        )
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+http_requests_total = registry.counter(
+    "bakemate_http_requests_total",
+    "HTTP requests by route template and status code.",
+    ("method", "route", "status"),
+)
+http_request_duration_seconds = registry.histogram(
+    "bakemate_http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ("method", "route"),
+)
+http_requests_in_progress = registry.gauge(
+    "bakemate_http_requests_in_progress",
+    "HTTP requests currently being served.",
+)
+db_queries_per_request = registry.histogram(
+    "bakemate_db_queries_per_request",
+    "SQL statements executed while serving one request.",
+    ("method", "route"),
+    buckets=QUERY_COUNT_BUCKETS,
+)
+db_seconds_per_request = registry.histogram(
+    "bakemate_db_seconds_per_request",
+    "Time spent executing SQL while serving one request.",
+    ("method", "route"),
+)
+order_builder_calls_total = registry.counter(
+    "bakemate_order_builder_calls_total",
+    "Calls of each OrderService._build_* method during requests.",
+    ("builder",),
+)
+order_builder_seconds = registry.histogram(
+    "bakemate_order_builder_seconds",
+    "Time per request in each OrderService._build_* method, including builders it calls.",
+    ("builder",),
+    buckets=BUILDER_BUCKETS,
+)
+
+
+class RequestStats:
+    """What one request spent on SQL and order builders."""
+
+    def __init__(self):
+        self.queries = 0
+        self.query_seconds = 0.0
+        self.builders: Dict[str, List[float]] = defaultdict(lambda: [0, 0.0])
+        # Database work may run on several threads for the same request.
+        self._lock = threading.Lock()
+
+    def add_query(self, seconds: float) -> None:
+        with self._lock:
+            self.queries += 1
+            self.query_seconds += seconds
+
+    def add_builder(self, name: str, seconds: float) -> None:
+        with self._lock:
+            entry = self.builders[name]
+            entry[0] += 1
+            entry[1] += seconds
+
+
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar(
+    "bakemate_request_stats", default=None
+)
+
+
+def current_request_stats() -> Optional[RequestStats]:
+    return _request_stats.get()
+
+
+def start_request_stats() -> Tuple[RequestStats, object]:
+    stats = RequestStats()
+    return stats, _request_stats.set(stats)
+
+
+def finish_request_stats(
+    stats: RequestStats, token, *, method: str, route: str
+) -> None:
+    _request_stats.reset(token)
+    db_queries_per_request.observe(stats.queries, method=method, route=route)
+    db_seconds_per_request.observe(stats.query_seconds, method=method, route=route)
+    for name, (calls, seconds) in stats.builders.items():
+        order_builder_calls_total.inc(calls, builder=name)
+        order_builder_seconds.observe(seconds, builder=name)
+
+
+_QUERY_STARTED = "bakemate_metrics_query_started"
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _request_stats.get() is not None:
+        conn.info.setdefault(_QUERY_STARTED, []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _request_stats.get()
+    started = conn.info.get(_QUERY_STARTED)
+    if stats is not None and started:
+        stats.add_query(time.perf_counter() - started.pop())
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context):
+    connection = exception_context.connection
+    started = connection.info.get(_QUERY_STARTED) if connection is not None else None
+    if started:
+        started.pop()
+
+
+def _timed_builder(name: str, method: Callable) -> Callable:
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        stats = _request_stats.get()
+        if stats is None:
+            return method(*args, **kwargs)
+        started = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            stats.add_builder(name, time.perf_counter() - started)
+
+    return wrapper
+
+
+def instrument_builders(cls: type, prefix: str = "_build_") -> type:
+    """Time every ``prefix*`` method of ``cls`` in the current ``RequestStats``."""
+    for attribute, value in list(vars(cls).items()):
+        if attribute.startswith(prefix) and callable(value):
+            setattr(cls, attribute, _timed_builder(attribute[len(prefix) :], value))
+    return cls
+
+
+__all__ = [
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "RequestStats",
+    "current_request_stats",
+    "finish_request_stats",
+    "instrument_builders",
+    "registry",
+    "start_request_stats",
+]
@@ -29,11 +29,16 @@ from .order import (
     PaymentStatus,
     Quote,
 )
+from . import order_search  # noqa: F401  # Registers the order search index DDL
 from .contact import Contact, ContactCreate, ContactRead, ContactUpdate, ContactType
 from .task import Task, TaskCreate, TaskRead, TaskUpdate, TaskStatus
 from .expense import Expense, ExpenseCreate, ExpenseRead, ExpenseUpdate, ExpenseCategory
 from .mileage import MileageLog, MileageLogCreate, MileageLogRead, MileageLogUpdate
 from .shop import ShopConfiguration, ShopProduct, PublicShopView, ShopOrderCreate
+from .cache_version import CacheVersion
+from .import_checkpoint import ImportCheckpoint
+from .import_fingerprint import ImportFingerprint
+from .scheduled_job_run import ScheduledJobRun
 
 # Resolve forward references
 UserReadWithRecipes.model_rebuild()
@@ -96,4 +101,8 @@ __all__ = [
     "ShopProduct",
     "PublicShopView",
     "ShopOrderCreate",
+    "CacheVersion",
+    "ImportCheckpoint",
+    "ImportFingerprint",
+    "ScheduledJobRun",
 ]
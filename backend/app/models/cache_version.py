@@ -0,0 +1,15 @@
+from sqlmodel import Field, SQLModel
+
+
+class CacheVersion(SQLModel, table=True):
+    """Invalidation counter for one cached namespace (usually a model).
+
+    Every write through a ``CachedRepository`` bumps its namespace's version;
+    each worker compares the number with the one its cache was filled under
+    and drops its entries when another worker has written since.
+    """
+
+    __tablename__ = "cache_version"
+
+    namespace: str = Field(primary_key=True)
+    version: int = Field(default=0, nullable=False)
@@ -1,3 +1,4 @@
+from sqlalchemy import Index
 from sqlmodel import SQLModel, Field, Relationship
 from typing import Optional, List, TYPE_CHECKING
 from enum import Enum
@@ -20,6 +21,12 @@ class CalendarEventType(str, Enum):
 
 
 class CalendarEvent(TenantBaseModel, table=True):
+    # Range lookups bound the start on one side and the end on the other.
+    __table_args__ = (
+        Index("ix_calendarevent_user_id_start_datetime", "user_id", "start_datetime"),
+        Index("ix_calendarevent_user_id_end_datetime", "user_id", "end_datetime"),
+    )
+
     user_id: uuid.UUID = Field(foreign_key="user.id")
 
     title: str
@@ -1,3 +1,4 @@
+from sqlalchemy import Index
 from sqlmodel import SQLModel, Field, Relationship
 from typing import Optional, List, TYPE_CHECKING
 from enum import Enum
@@ -21,6 +22,8 @@ class ExpenseCategory(str, Enum):
 
 
 class Expense(TenantBaseModel, table=True):
+    __table_args__ = (Index("ix_expense_user_id_date", "user_id", "date"),)
+
     user_id: uuid.UUID = Field(foreign_key="user.id")
 
     date: date
@@ -0,0 +1,24 @@
+import uuid
+from datetime import datetime, timezone
+
+from sqlmodel import Field, SQLModel
+
+
+class ImportCheckpoint(SQLModel, table=True):
+    """How many rows of one workbook sheet an import has committed.
+
+    Written in the same transaction as each chunk of imported rows, so a
+    re-run of the same workbook (same SHA-256) resumes after the last
+    committed chunk instead of importing those rows twice.
+    """
+
+    __tablename__ = "import_checkpoint"
+
+    user_id: uuid.UUID = Field(foreign_key="user.id", primary_key=True)
+    source: str = Field(primary_key=True)
+    workbook_digest: str = Field(primary_key=True, max_length=64)
+    sheet: str = Field(primary_key=True)
+    rows_committed: int = Field(default=0, nullable=False)
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc), nullable=False
+    )
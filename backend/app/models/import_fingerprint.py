@@ -0,0 +1,25 @@
+import uuid
+from datetime import datetime, timezone
+
+from sqlmodel import Field, SQLModel
+
+
+class ImportFingerprint(SQLModel, table=True):
+    """The content hash of the legacy row an imported record was last written from.
+
+    ``record_key`` identifies the row across exports (its order number or
+    legacy id), so a re-import inserts rows it has no key for, updates the
+    record when the hash differs and skips the row when it matches.
+    """
+
+    __tablename__ = "import_fingerprint"
+
+    user_id: uuid.UUID = Field(foreign_key="user.id", primary_key=True)
+    source: str = Field(primary_key=True)
+    sheet: str = Field(primary_key=True)
+    record_key: str = Field(primary_key=True)
+    fingerprint: str = Field(max_length=64, nullable=False)
+    record_id: uuid.UUID = Field(nullable=False)
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc), nullable=False
+    )
@@ -1,3 +1,4 @@
+from sqlalchemy import Index
 from sqlmodel import SQLModel, Field, Relationship
 from typing import Optional, TYPE_CHECKING
 import uuid
@@ -10,6 +11,8 @@ if TYPE_CHECKING:
 
 
 class MileageLog(TenantBaseModel, table=True):
+    __table_args__ = (Index("ix_mileagelog_user_id_date", "user_id", "date"),)
+
     user_id: uuid.UUID = Field(foreign_key="user.id")
 
     date: date
@@ -1,10 +1,29 @@
+from collections import defaultdict
+from itertools import chain
+
+from sqlalchemy import (
+    Index,
+    bindparam,
+    case,
+    column,
+    delete,
+    event,
+    func,
+    insert,
+    inspect,
+    select,
+    table,
+    update,
+)
+from sqlalchemy.orm import Session
 from sqlmodel import SQLModel, Field, Relationship
-from typing import Optional, List, TYPE_CHECKING
+from typing import Iterable, Optional, List, TYPE_CHECKING
 from enum import Enum
 import uuid
 from datetime import date, datetime, timezone
 
 from .base import TenantBaseModel, generate_uuid
+from .contact import Contact
 
 if TYPE_CHECKING:
     from .user import User, UserRead
@@ -60,6 +79,12 @@ class OrderItem(TenantBaseModel, table=True):
 
 
 class Order(TenantBaseModel, table=True):
+    # Order lists and reports filter by owner first, then by a date.
+    __table_args__ = (
+        Index("ix_order_user_id_due_date", "user_id", "due_date"),
+        Index("ix_order_user_id_order_date", "user_id", "order_date"),
+    )
+
     user_id: uuid.UUID = Field(
         foreign_key="user.id"
     )  # The baker/user who owns this order
@@ -93,6 +118,29 @@ class Order(TenantBaseModel, table=True):
     stripe_payment_intent_id: Optional[str] = Field(default=None, index=True)
     stripe_checkout_session_id: Optional[str] = Field(default=None)
 
+    # Day-running triage, derived from the row as of ``triage_as_of``.
+    # NULL or an older date means the values must be recomputed before use.
+    triage_as_of: Optional[date] = Field(default=None, index=True)
+    triage_urgency_rank: Optional[int] = Field(default=None, index=True)
+    triage_action_class: Optional[str] = Field(default=None, index=True)
+    triage_readiness_label: Optional[str] = Field(default=None, index=True)
+    triage_needs_review: Optional[bool] = Field(default=None, index=True)
+    triage_import_priority_rank: Optional[int] = Field(default=None)
+    triage_review_reasons: Optional[str] = None  # comma-separated review reason values
+
+    # Normalized customer identity shared by all of a customer's orders; kept
+    # in sync with the contact/email/phone fields by the mapper events below.
+    history_key: Optional[str] = Field(default=None, index=True)
+    # Latest other order date for the same customer on or before this order's
+    # date; maintained with the rollups so summaries need no sibling scan.
+    previous_order_date: Optional[datetime] = None
+
+    # Legacy import provenance. Importers set these explicitly; for other
+    # writers the mapper events below derive them from ``Legacy`` note lines.
+    is_imported: bool = Field(default=False, index=True)
+    legacy_status_raw: Optional[str] = None
+    import_source: Optional[str] = Field(default=None, index=True)
+
     # Relationships
     # user: "User" = Relationship(back_populates="orders")
     customer: Optional["Contact"] = Relationship()
@@ -102,6 +150,18 @@ class Order(TenantBaseModel, table=True):
     # attached_files: List["OrderAttachment"] = Relationship(back_populates="order")
 
 
+class CustomerHistoryRollup(SQLModel, table=True):
+    """Order counts per customer ``history_key``, refreshed on every flush."""
+
+    __tablename__ = "customer_history_rollup"
+
+    user_id: uuid.UUID = Field(foreign_key="user.id", primary_key=True)
+    history_key: str = Field(primary_key=True)
+    total_orders: int = 0
+    completed_orders: int = 0
+    active_orders: int = 0
+
+
 # --- Pydantic Models for API --- #
 
 
@@ -358,6 +418,49 @@ class OrderRead(OrderBase):
     imported_priority_label: Optional[str] = None
 
 
+class OrderListView(str, Enum):
+    COMPACT = "compact"
+    QUEUE = "queue"
+    FULL = "full"
+
+
+_COMPACT_ORDER_FIELDS = frozenset(
+    {
+        "id",
+        "order_number",
+        "status",
+        "payment_status",
+        "customer_contact_id",
+        "customer_name",
+        "customer_email",
+        "customer_phone",
+        "order_date",
+        "due_date",
+        "delivery_method",
+        "total_amount",
+        "balance_due",
+        "is_imported",
+    }
+)
+
+# Fields each list view returns. Summaries outside the view are never built.
+ORDER_LIST_VIEW_FIELDS: dict[OrderListView, frozenset[str]] = {
+    OrderListView.COMPACT: _COMPACT_ORDER_FIELDS,
+    OrderListView.QUEUE: _COMPACT_ORDER_FIELDS
+    | {
+        "deposit_due_date",
+        "customer_summary",
+        "queue_summary",
+        "risk_summary",
+        "ops_summary",
+        "day_running_focus_summary",
+        "review_reasons",
+        "primary_review_reason",
+    },
+    OrderListView.FULL: frozenset(OrderRead.model_fields),
+}
+
+
 class ImportedOrderQueueSummary(SQLModel):
     all_imported_count: int
     needs_review_count: int
@@ -365,6 +468,17 @@ class ImportedOrderQueueSummary(SQLModel):
     review_reason_counts: dict[ImportedOrderReviewReason, int] = {}
 
 
+class OrderSearchSuggestion(SQLModel):
+    id: uuid.UUID
+    order_number: str
+    customer_name: Optional[str] = None
+    customer_email: Optional[str] = None
+    customer_phone: Optional[str] = None
+    due_date: datetime
+    status: OrderStatus
+    matched_field: str
+
+
 class OrderUpdate(SQLModel):
     customer_contact_id: Optional[uuid.UUID] = None
     customer_name: Optional[str] = None
@@ -408,6 +522,8 @@ class QuoteItem(TenantBaseModel, table=True):
 
 
 class Quote(TenantBaseModel, table=True):
+    __table_args__ = (Index("ix_quote_user_id_quote_date", "user_id", "quote_date"),)
+
     user_id: uuid.UUID = Field(foreign_key="user.id")
     # customer_id: Optional[uuid.UUID] = Field(default=None, foreign_key="contact.id")
 
@@ -478,3 +594,347 @@ class QuoteUpdate(SQLModel):
     notes: Optional[str] = None
     status: Optional[QuoteStatus] = None
     items: Optional[List[QuoteItemCreate]] = None
+
+
+# --- Triage staleness --- #
+
+ORDER_TRIAGE_FIELDS = frozenset(
+    {
+        "triage_as_of",
+        "triage_urgency_rank",
+        "triage_action_class",
+        "triage_readiness_label",
+        "triage_needs_review",
+        "triage_import_priority_rank",
+        "triage_review_reasons",
+    }
+)
+
+
+def derived_order_columns(*names: str):
+    """A bare ``order`` table with just ``names``, for writing derived columns.
+
+    Updates through it skip the mapped table's column defaults, so ``updated_at``
+    keeps recording when the order itself last changed.
+    """
+    order_table = Order.__table__
+    return table(
+        order_table.name, *(column(name, order_table.c[name].type) for name in names)
+    )
+
+
+def write_order_triage(connection, rows: list[dict]) -> None:
+    """Store computed triage; each row maps ``id`` and every triage field."""
+    if not rows:
+        return
+    fields = sorted(ORDER_TRIAGE_FIELDS)
+    orders = derived_order_columns("id", *fields)
+    statement = (
+        update(orders)
+        .where(orders.c.id == bindparam("b_id"))
+        .values({field: bindparam(f"b_{field}") for field in fields})
+    )
+    connection.execute(
+        statement,
+        [{f"b_{key}": value for key, value in row.items()} for row in rows],
+    )
+
+
+def _expire_order_triage(connection, key: str, value) -> None:
+    orders = derived_order_columns(key, "triage_as_of")
+    connection.execute(
+        update(orders).where(orders.c[key] == value).values(triage_as_of=None)
+    )
+
+
+@event.listens_for(Order, "before_update")
+def _expire_triage_on_order_change(mapper, connection, target: Order) -> None:
+    changed = {attr.key for attr in inspect(target).attrs if attr.history.has_changes()}
+    if changed - ORDER_TRIAGE_FIELDS - {"updated_at"}:
+        target.triage_as_of = None
+
+
+@event.listens_for(OrderItem, "after_insert")
+@event.listens_for(OrderItem, "after_update")
+@event.listens_for(OrderItem, "after_delete")
+def _expire_triage_on_item_change(mapper, connection, target: OrderItem) -> None:
+    _expire_order_triage(connection, "id", target.order_id)
+
+
+@event.listens_for(Contact, "after_update")
+def _expire_triage_on_contact_change(mapper, connection, target: Contact) -> None:
+    _expire_order_triage(connection, "customer_contact_id", target.id)
+
+
+# --- Customer history --- #
+
+# Columns that change which rollup an order counts towards, or how.
+CUSTOMER_HISTORY_INPUT_FIELDS = ("user_id", "history_key", "status", "order_date")
+_ROLLUP_KEY_CHUNK_SIZE = 500
+
+
+def order_history_key(order) -> Optional[str]:
+    """Return the customer identity key for an order (or an order row)."""
+    if order.customer_contact_id:
+        return f"contact:{order.customer_contact_id}"
+    if order.customer_email:
+        return f"email:{order.customer_email.strip().lower()}"
+    if order.customer_phone:
+        return f"phone:{order.customer_phone.strip().lower()}"
+    return None
+
+
+def rebuild_customer_history_rollups(
+    connection,
+    *,
+    user_id: Optional[uuid.UUID] = None,
+    history_keys: Optional[Iterable[str]] = None,
+) -> None:
+    """Recompute rollup rows and ``previous_order_date`` from ``order``.
+
+    Without ``history_keys`` every rollup (for ``user_id``, if given) is rebuilt.
+    """
+    rollup_table = CustomerHistoryRollup.__table__
+    order_table = Order.__table__
+    terminal_statuses = [OrderStatus.COMPLETED, OrderStatus.CANCELLED]
+    aggregate = select(
+        order_table.c.user_id,
+        order_table.c.history_key,
+        func.count(),
+        func.sum(case((order_table.c.status == OrderStatus.COMPLETED, 1), else_=0)),
+        func.sum(case((order_table.c.status.notin_(terminal_statuses), 1), else_=0)),
+    ).group_by(order_table.c.user_id, order_table.c.history_key)
+    rollup_columns = [
+        "user_id",
+        "history_key",
+        "total_orders",
+        "completed_orders",
+        "active_orders",
+    ]
+    order_dates = derived_order_columns("id", "previous_order_date")
+    customer = (order_table.c.user_id, order_table.c.history_key)
+    # A same-day sibling counts as the previous order, so ties keep their date.
+    previous_order_date = case(
+        (
+            func.count().over(partition_by=(*customer, order_table.c.order_date)) > 1,
+            order_table.c.order_date,
+        ),
+        else_=func.lag(order_table.c.order_date).over(
+            partition_by=customer, order_by=order_table.c.order_date
+        ),
+    )
+
+    scopes: list[tuple[list, list]] = []
+    if history_keys is None:
+        scopes.append(([], [order_table.c.history_key.is_not(None)]))
+    else:
+        keys = sorted(set(history_keys))
+        for start in range(0, len(keys), _ROLLUP_KEY_CHUNK_SIZE):
+            chunk = keys[start : start + _ROLLUP_KEY_CHUNK_SIZE]
+            scopes.append(
+                (
+                    [rollup_table.c.history_key.in_(chunk)],
+                    [order_table.c.history_key.in_(chunk)],
+                )
+            )
+
+    for rollup_criteria, order_criteria in scopes:
+        if user_id is not None:
+            rollup_criteria = [rollup_table.c.user_id == user_id, *rollup_criteria]
+            order_criteria = [order_table.c.user_id == user_id, *order_criteria]
+        connection.execute(delete(rollup_table).where(*rollup_criteria))
+        connection.execute(
+            insert(rollup_table).from_select(
+                rollup_columns, aggregate.where(*order_criteria)
+            )
+        )
+        previous = (
+            select(
+                order_table.c.id,
+                previous_order_date.label("previous_order_date"),
+            )
+            .where(*order_criteria)
+            .subquery()
+        )
+        connection.execute(
+            update(order_dates)
+            .where(
+                order_dates.c.id == previous.c.id,
+                order_dates.c.previous_order_date.is_distinct_from(
+                    previous.c.previous_order_date
+                ),
+            )
+            .values(previous_order_date=previous.c.previous_order_date)
+        )
+
+
+def backfill_order_history_keys(connection) -> int:
+    """Fill ``history_key`` for rows written before the column existed."""
+    order_table = Order.__table__
+    rows = connection.execute(
+        select(
+            order_table.c.id,
+            order_table.c.customer_contact_id,
+            order_table.c.customer_email,
+            order_table.c.customer_phone,
+        ).where(order_table.c.history_key.is_(None))
+    ).all()
+    updated = 0
+    for row in rows:
+        history_key = order_history_key(row)
+        if history_key is None:
+            continue
+        connection.execute(
+            update(order_table)
+            .where(order_table.c.id == row.id)
+            .values(history_key=history_key)
+        )
+        updated += 1
+    return updated
+
+
+@event.listens_for(Order, "before_insert")
+@event.listens_for(Order, "before_update")
+def _assign_history_key(mapper, connection, target: Order) -> None:
+    history_key = order_history_key(target)
+    if target.history_key != history_key:
+        target.history_key = history_key
+
+
+@event.listens_for(Session, "after_flush")
+def _refresh_customer_history_on_flush(session, flush_context) -> None:
+    keys_by_user: dict[uuid.UUID, set[str]] = defaultdict(set)
+    changed = chain(
+        ((target, False) for target in session.new),
+        ((target, True) for target in session.dirty),
+        ((target, False) for target in session.deleted),
+    )
+    for target, is_update in changed:
+        if not isinstance(target, Order):
+            continue
+        attrs = inspect(target).attrs
+        if is_update and not any(
+            attrs[field].history.has_changes()
+            for field in CUSTOMER_HISTORY_INPUT_FIELDS
+        ):
+            continue
+        history_keys = [key for key in attrs.history_key.history.sum() if key]
+        for user_id in attrs.user_id.history.sum():
+            if user_id is not None:
+                keys_by_user[user_id].update(history_keys)
+
+    if not keys_by_user:
+        return
+    connection = session.connection()
+    for user_id, history_keys in keys_by_user.items():
+        if history_keys:
+            rebuild_customer_history_rollups(
+                connection, user_id=user_id, history_keys=history_keys
+            )
+
+
+# --- Legacy import metadata --- #
+
+LEGACY_IMPORT_SOURCE = "marvelous_creations"
+# Every importer-written note carries at least one ``Legacy <key>: <value>``
+# line, so rows outside this pattern never need parsing.
+LEGACY_NOTES_PATTERN = "%Legacy %:%"
+_IMPORT_METADATA_BACKFILL_CHUNK_SIZE = 1000
+
+
+def extract_legacy_metadata(internal_notes: Optional[str]) -> dict[str, str]:
+    if not internal_notes:
+        return {}
+
+    metadata: dict[str, str] = {}
+    for line in internal_notes.splitlines():
+        text = line.strip()
+        if not text.startswith("Legacy ") or ":" not in text:
+            continue
+        key, value = text[len("Legacy ") :].split(":", 1)
+        key = key.strip()
+        value = value.strip()
+        if key and value:
+            metadata[key] = value
+    return metadata
+
+
+def order_import_metadata(
+    internal_notes: Optional[str],
+) -> tuple[bool, Optional[str], Optional[str]]:
+    """``(is_imported, legacy_status_raw, import_source)`` read from legacy notes."""
+    metadata = extract_legacy_metadata(internal_notes)
+    is_imported = bool(metadata)
+    legacy_status_raw = metadata.get("legacy_status_raw") or metadata.get(
+        "OrderStatusId"
+    )
+    return is_imported, legacy_status_raw, LEGACY_IMPORT_SOURCE if is_imported else None
+
+
+def backfill_order_import_metadata(
+    connection, *, chunk_size: int = _IMPORT_METADATA_BACKFILL_CHUNK_SIZE
+) -> int:
+    """Set the import columns for rows written before they existed.
+
+    Walks candidate rows in ``id`` order, ``chunk_size`` at a time, so large
+    order books are never held in memory at once.
+    """
+    order_table = Order.__table__
+    mark_imported = (
+        update(order_table)
+        .where(order_table.c.id == bindparam("b_id"))
+        .values(
+            is_imported=True,
+            legacy_status_raw=bindparam("b_legacy_status_raw"),
+            import_source=bindparam("b_import_source"),
+        )
+    )
+    updated = 0
+    last_id = None
+    while True:
+        statement = (
+            select(order_table.c.id, order_table.c.internal_notes)
+            .where(
+                order_table.c.import_source.is_(None),
+                order_table.c.internal_notes.like(LEGACY_NOTES_PATTERN),
+            )
+            .order_by(order_table.c.id)
+            .limit(chunk_size)
+        )
+        if last_id is not None:
+            statement = statement.where(order_table.c.id > last_id)
+        rows = connection.execute(statement).all()
+        if not rows:
+            return updated
+        last_id = rows[-1].id
+
+        params = []
+        for row in rows:
+            is_imported, legacy_status_raw, import_source = order_import_metadata(
+                row.internal_notes
+            )
+            if is_imported:
+                params.append(
+                    {
+                        "b_id": row.id,
+                        "b_legacy_status_raw": legacy_status_raw,
+                        "b_import_source": import_source,
+                    }
+                )
+        if params:
+            connection.execute(mark_imported, params)
+            updated += len(params)
+
+
+@event.listens_for(Order, "before_insert")
+@event.listens_for(Order, "before_update")
+def _assign_import_metadata(mapper, connection, target: Order) -> None:
+    attrs = inspect(target).attrs
+    if not attrs.internal_notes.history.has_changes():
+        return
+    # Values an importer writes alongside the notes win over derived ones.
+    if target.import_source is not None and attrs.import_source.history.has_changes():
+        return
+    target.is_imported, target.legacy_status_raw, target.import_source = (
+        order_import_metadata(target.internal_notes)
+    )
@@ -0,0 +1,170 @@
+"""SQLite FTS5 trigram index over the searchable ``order`` columns.
+
+``order_search`` is an external-content FTS5 table keyed by the ``order``
+table's rowid and kept in sync by triggers, so ORM writes, bulk updates and
+raw SQL all stay indexed. The trigram tokenizer answers case-insensitive
+substring matches of three or more characters, which is what the order list
+``search`` filter and the typeahead need. Other databases, or SQLite builds
+without FTS5, keep using the ILIKE scan.
+
+Rowids of a table without an INTEGER PRIMARY KEY may change on VACUUM; run
+``scripts/rebuild_order_search_index.py`` afterwards.
+"""
+
+import logging
+from typing import Optional
+
+from sqlalchemy import ColumnElement, event, literal_column, select, table, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import OperationalError
+
+from .order import Order
+
+logger = logging.getLogger(__name__)
+
+ORDER_SEARCH_TABLE = "order_search"
+ORDER_SEARCH_COLUMNS = (
+    "order_number",
+    "customer_name",
+    "customer_email",
+    "customer_phone",
+    "delivery_method",
+    "notes_to_customer",
+    "internal_notes",
+)
+ORDER_TYPEAHEAD_COLUMNS = (
+    "order_number",
+    "customer_name",
+    "customer_email",
+    "customer_phone",
+)
+# The trigram tokenizer cannot match anything shorter.
+MIN_INDEXED_SEARCH_LENGTH = 3
+
+_AVAILABLE_INFO_KEY = "order_search_index_available"
+
+
+def _column_list(prefix: str = "") -> str:
+    return ", ".join(f"{prefix}{column}" for column in ORDER_SEARCH_COLUMNS)
+
+
+def _trigger_statements() -> list[str]:
+    columns = _column_list()
+    new_values = _column_list("new.")
+    old_values = _column_list("old.")
+    delete_old = (
+        f"INSERT INTO {ORDER_SEARCH_TABLE}({ORDER_SEARCH_TABLE}, rowid, {columns}) "
+        f"VALUES ('delete', old.rowid, {old_values});"
+    )
+    insert_new = f"INSERT INTO {ORDER_SEARCH_TABLE}(rowid, {columns}) VALUES (new.rowid, {new_values});"
+    return [
+        f'CREATE TRIGGER IF NOT EXISTS {ORDER_SEARCH_TABLE}_ai AFTER INSERT ON "order" '
+        f"BEGIN {insert_new} END",
+        f'CREATE TRIGGER IF NOT EXISTS {ORDER_SEARCH_TABLE}_ad AFTER DELETE ON "order" '
+        f"BEGIN {delete_old} END",
+        f"CREATE TRIGGER IF NOT EXISTS {ORDER_SEARCH_TABLE}_au AFTER UPDATE OF {columns} "
+        f'ON "order" BEGIN {delete_old} {insert_new} END',
+    ]
+
+
+def _index_exists(connection: Connection) -> bool:
+    return (
+        connection.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": ORDER_SEARCH_TABLE},
+        ).first()
+        is not None
+    )
+
+
+def create_order_search_index(connection: Connection) -> bool:
+    """Create the index and its triggers if missing; return whether it is usable."""
+    if connection.dialect.name != "sqlite":
+        return False
+    if _index_exists(connection):
+        for statement in _trigger_statements():
+            connection.execute(text(statement))
+        connection.info[_AVAILABLE_INFO_KEY] = True
+        return True
+
+    try:
+        connection.execute(
+            text(
+                f"CREATE VIRTUAL TABLE {ORDER_SEARCH_TABLE} USING fts5("
+                f"{_column_list()}, content='order', tokenize='trigram')"
+            )
+        )
+    except OperationalError as exc:
+        logger.warning("Order search index unavailable, falling back to ILIKE: %s", exc)
+        connection.info[_AVAILABLE_INFO_KEY] = False
+        return False
+
+    for statement in _trigger_statements():
+        connection.execute(text(statement))
+    rebuild_order_search_index(connection)
+    connection.info[_AVAILABLE_INFO_KEY] = True
+    return True
+
+
+def rebuild_order_search_index(connection: Connection) -> None:
+    """Re-read every ``order`` row into the index."""
+    connection.execute(
+        text(
+            f"INSERT INTO {ORDER_SEARCH_TABLE}({ORDER_SEARCH_TABLE}) VALUES ('rebuild')"
+        )
+    )
+
+
+def order_search_index_available(connection: Connection) -> bool:
+    available: Optional[bool] = connection.info.get(_AVAILABLE_INFO_KEY)
+    if available is None:
+        available = connection.dialect.name == "sqlite" and _index_exists(connection)
+        connection.info[_AVAILABLE_INFO_KEY] = available
+    return available
+
+
+def order_search_match_query(
+    search_text: str, columns: Optional[tuple[str, ...]] = None
+) -> str:
+    """Quote ``search_text`` as one FTS5 phrase, optionally limited to ``columns``."""
+    phrase = '"' + search_text.replace('"', '""') + '"'
+    if columns:
+        return "{" + " ".join(columns) + "} : " + phrase
+    return phrase
+
+
+def order_search_predicate(
+    search_text: str, columns: Optional[tuple[str, ...]] = None
+) -> ColumnElement[bool]:
+    """``order`` rows whose indexed ``columns`` contain ``search_text``."""
+    search_table = table(ORDER_SEARCH_TABLE)
+    matching_rowids = (
+        select(literal_column("rowid"))
+        .select_from(search_table)
+        .where(
+            literal_column(ORDER_SEARCH_TABLE).op("MATCH")(
+                order_search_match_query(search_text, columns)
+            )
+        )
+    )
+    return literal_column('"order".rowid').in_(matching_rowids)
+
+
+@event.listens_for(Order.__table__, "after_create")
+def _create_order_search_index(target, connection, **kwargs) -> None:
+    # An index left over from a dropped ``order`` table still holds old rows.
+    if create_order_search_index(connection):
+        rebuild_order_search_index(connection)
+
+
+__all__ = [
+    "MIN_INDEXED_SEARCH_LENGTH",
+    "ORDER_SEARCH_COLUMNS",
+    "ORDER_SEARCH_TABLE",
+    "ORDER_TYPEAHEAD_COLUMNS",
+    "create_order_search_index",
+    "order_search_index_available",
+    "order_search_match_query",
+    "order_search_predicate",
+    "rebuild_order_search_index",
+]
@@ -0,0 +1,19 @@
+from datetime import date, datetime, timezone
+
+from sqlmodel import Field, SQLModel
+
+
+class ScheduledJobRun(SQLModel, table=True):
+    """The last day a once-a-day background job was claimed.
+
+    Every worker process runs the job's loop; the one whose claim moves
+    ``run_on`` forward does the work and the others skip that day.
+    """
+
+    __tablename__ = "scheduled_job_run"
+
+    name: str = Field(primary_key=True)
+    run_on: date = Field(nullable=False)
+    claimed_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc), nullable=False
+    )
@@ -1,3 +1,4 @@
+from sqlalchemy import Index
 from sqlmodel import SQLModel, Field, Relationship
 from typing import Optional, List, TYPE_CHECKING
 from enum import Enum
@@ -21,6 +22,8 @@ class TaskStatus(str, Enum):
 
 
 class Task(TenantBaseModel, table=True):
+    __table_args__ = (Index("ix_task_user_id_due_date", "user_id", "due_date"),)
+
     user_id: uuid.UUID = Field(foreign_key="user.id")
 
     title: str
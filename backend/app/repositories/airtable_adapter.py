@@ -1,5 +1,5 @@
 import asyncio
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from typing import Any, Dict, Generic, List, Optional, Sequence, Type, TypeVar, Union
 from uuid import UUID
 import httpx
 from pydantic import BaseModel, Field
@@ -9,6 +9,7 @@ from sqlmodel import (
 
 from app.core.config import settings  # For AIRTABLE_API_KEY, AIRTABLE_BASE_ID
 from app.repositories.base import IRepository
+from app.repositories.cursor import CursorPage, decode_cursor, encode_cursor
 
 ModelType = TypeVar(
     "ModelType", bound=SQLModel
@@ -29,6 +30,20 @@ class AirtableListResponse(BaseModel):
     offset: Optional[str] = None
 
 
+class AirtableDeletedRecord(BaseModel):
+    id: str
+    deleted: bool
+
+
+# Airtable's create/update/delete endpoints take at most 10 records per call.
+AIRTABLE_BATCH_SIZE = 10
+
+
+def _batches(items: Sequence[Any], size: int = AIRTABLE_BATCH_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
 class AirtableRepository(
     IRepository[ModelType, CreateSchemaType, UpdateSchemaType],
     Generic[ModelType, CreateSchemaType, UpdateSchemaType],
@@ -89,7 +104,8 @@ class AirtableRepository(
         self, obj_in: Union[CreateSchemaType, UpdateSchemaType, Dict[str, Any]]
     ) -> Dict[str, Any]:
         if isinstance(obj_in, dict):
-            data = obj_in
+            # Copy so the pops below never strip the caller's dict.
+            data = dict(obj_in)
         else:
             data = obj_in.model_dump(exclude_unset=True, exclude_none=True)
 
@@ -137,19 +153,9 @@ class AirtableRepository(
         # For simplicity, we'll fetch `limit` records. If `skip` is used, it's harder.
         # A more robust solution would handle Airtable's pagination via `offset`.
 
-        if filters:
-            # Construct filterByFormula. Example: AND({Name} = 'John', {Age} > 30)
-            # This is highly dependent on the filter structure provided.
-            # For a generic solution, this part needs to be very flexible or simplified.
-            # Example: filters = {"Name": "John", "Status": "Active"} -> "AND({Name}='John', {Status}='Active')"
-            formula_parts = []
-            for key, value in filters.items():
-                if isinstance(value, str):
-                    formula_parts.append(f"{{{key}}}='{value}'")
-                else:
-                    formula_parts.append(f"{{{key}}}={value}")
-            if formula_parts:
-                params["filterByFormula"] = "AND(" + ", ".join(formula_parts) + ")"
+        formula = self._filter_formula(filters)
+        if formula:
+            params["filterByFormula"] = formula
 
         all_records: List[ModelType] = []
         current_offset: Optional[str] = kwargs.get(
@@ -170,6 +176,58 @@ class AirtableRepository(
         # This is a simplified get_multi. A full version would handle pagination to fetch more if needed.
         return all_records
 
+    async def get_page(
+        self,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+        sort_by: Optional[str] = None,
+        sort_desc: bool = False,
+        **kwargs,
+    ) -> CursorPage[ModelType]:
+        # Airtable paginates natively with an opaque `offset` token, so the
+        # cursor just carries that token, tagged with the ordering it belongs to.
+        params: Dict[str, Any] = {"pageSize": min(limit, 100)}
+        formula = self._filter_formula(filters)
+        if formula:
+            params["filterByFormula"] = formula
+        if sort_by:
+            params["sort[0][field]"] = sort_by
+            params["sort[0][direction]"] = "desc" if sort_desc else "asc"
+        ordering = f"airtable:{self.table_name}:{sort_by}:{sort_desc}"
+        if cursor:
+            (params["offset"],) = decode_cursor(cursor, ordering=ordering, key_count=1)
+
+        response = await self._request("GET", self.base_url, params=params)
+        response_data = AirtableListResponse(**response.json())
+        items = [
+            self._map_airtable_to_model(record) for record in response_data.records
+        ]
+        next_cursor = (
+            encode_cursor(ordering, [response_data.offset])
+            if response_data.offset
+            else None
+        )
+        return CursorPage(items=items, next_cursor=next_cursor)
+
+    def _filter_formula(self, filters: Optional[Dict[str, Any]]) -> Optional[str]:
+        """``filterByFormula`` matching every field in ``filters``.
+
+        e.g. ``{"Name": "John", "Age": 30}`` -> ``AND({Name}='John', {Age}=30)``;
+        string values are quoted with backslash escapes.
+        """
+        if not filters:
+            return None
+        formula_parts = []
+        for key, value in filters.items():
+            if isinstance(value, str):
+                escaped = value.replace("\\", "\\\\").replace("'", "\\'")
+                formula_parts.append(f"{{{key}}}='{escaped}'")
+            else:
+                formula_parts.append(f"{{{key}}}={value}")
+        return "AND(" + ", ".join(formula_parts) + ")"
+
     async def update(
         self,
         *,
@@ -202,15 +260,74 @@ class AirtableRepository(
                 return None
             raise
 
+    async def bulk_create(
+        self, *, objs_in: Sequence[Union[CreateSchemaType, Dict[str, Any]]], **kwargs
+    ) -> List[ModelType]:
+        created: List[ModelType] = []
+        for batch in _batches(list(objs_in)):
+            payload = {
+                "records": [self._map_model_to_airtable_fields(obj) for obj in batch]
+            }
+            response = await self._request("POST", self.base_url, json=payload)
+            response_data = AirtableListResponse(**response.json())
+            created.extend(
+                self._map_airtable_to_model(r) for r in response_data.records
+            )
+        return created
+
+    async def bulk_update(self, *, updates: Sequence[Dict[str, Any]], **kwargs) -> int:
+        # `id` in each update is the Airtable record ID.
+        updated = 0
+        for batch in _batches(list(updates)):
+            payload = {
+                "records": [
+                    {
+                        "id": update["id"],
+                        **self._map_model_to_airtable_fields(update),
+                    }
+                    for update in batch
+                ]
+            }
+            response = await self._request("PATCH", self.base_url, json=payload)
+            updated += len(AirtableListResponse(**response.json()).records)
+        return updated
+
+    async def bulk_upsert(
+        self,
+        *,
+        objs_in: Sequence[Union[CreateSchemaType, Dict[str, Any]]],
+        key_fields: Sequence[str],
+        **kwargs,
+    ) -> int:
+        written = 0
+        for batch in _batches(list(objs_in)):
+            payload = {
+                "performUpsert": {"fieldsToMergeOn": list(key_fields)},
+                "records": [self._map_model_to_airtable_fields(obj) for obj in batch],
+            }
+            response = await self._request("PATCH", self.base_url, json=payload)
+            written += len(AirtableListResponse(**response.json()).records)
+        return written
+
+    async def bulk_delete(self, *, ids: Sequence[str], **kwargs) -> int:
+        deleted = 0
+        for batch in _batches(list(ids)):
+            response = await self._request(
+                "DELETE",
+                self.base_url,
+                params=[("records[]", record_id) for record_id in batch],
+            )
+            records = [
+                AirtableDeletedRecord(**r) for r in response.json().get("records", [])
+            ]
+            deleted += sum(record.deleted for record in records)
+        return deleted
+
     async def get_by_attribute(
         self, *, attribute_name: str, attribute_value: Any, **kwargs
     ) -> Optional[ModelType]:
         # Use filterByFormula for this
-        formula = (
-            f"{{{attribute_name}}}='{attribute_value}'"
-            if isinstance(attribute_value, str)
-            else f"{{{attribute_name}}}={attribute_value}"
-        )
+        formula = self._filter_formula({attribute_name: attribute_value})
         params = {"filterByFormula": formula, "maxRecords": 1}
         response = await self._request("GET", self.base_url, params=params)
         response_data = AirtableListResponse(**response.json())
@@ -227,11 +344,7 @@ class AirtableRepository(
         limit: int = 100,
         **kwargs,
     ) -> List[ModelType]:
-        formula = (
-            f"{{{attribute_name}}}='{attribute_value}'"
-            if isinstance(attribute_value, str)
-            else f"{{{attribute_name}}}={attribute_value}"
-        )
+        formula = self._filter_formula({attribute_name: attribute_value})
         params = {"filterByFormula": formula, "pageSize": limit}
         # Handle skip/offset if needed, similar to get_multi
         response = await self._request("GET", self.base_url, params=params)
@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, List, Optional, Any, Dict
+from typing import Generic, TypeVar, List, Optional, Any, Dict, Sequence
 from uuid import UUID
 from sqlmodel import SQLModel
 
+from app.repositories.cursor import CursorPage
+
 ModelType = TypeVar("ModelType", bound=SQLModel)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=SQLModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=SQLModel)
@@ -30,6 +32,24 @@ class IRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC):
     ) -> List[ModelType]:
         pass
 
+    @abstractmethod
+    async def get_page(
+        self,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+        sort_by: Optional[str] = None,
+        sort_desc: bool = False,
+        **kwargs
+    ) -> CursorPage[ModelType]:
+        """Return one page in ``sort_by`` order plus the cursor for the next.
+
+        ``cursor`` is the ``next_cursor`` of the previous page; it is None for
+        the first page and on the returned page when no rows remain.
+        """
+        pass
+
     @abstractmethod
     async def update(
         self, *, db_obj: ModelType, obj_in: UpdateSchemaType | Dict[str, Any], **kwargs
@@ -59,3 +79,41 @@ class IRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC):
         **kwargs
     ) -> List[ModelType]:
         pass
+
+    # Bulk operations write many rows per statement or API call instead of
+    # one row (and one commit) per call. They do not run per-object ORM hooks.
+
+    @abstractmethod
+    async def bulk_create(
+        self, *, objs_in: Sequence[CreateSchemaType | Dict[str, Any]], **kwargs
+    ) -> List[ModelType]:
+        pass
+
+    @abstractmethod
+    async def bulk_update(self, *, updates: Sequence[Dict[str, Any]], **kwargs) -> int:
+        """Apply ``updates``, each a dict of the row's ``id`` plus the fields to set.
+
+        Returns the number of rows updated.
+        """
+        pass
+
+    @abstractmethod
+    async def bulk_upsert(
+        self,
+        *,
+        objs_in: Sequence[CreateSchemaType | Dict[str, Any]],
+        key_fields: Sequence[str],
+        **kwargs
+    ) -> int:
+        """Insert ``objs_in``, updating the existing row wherever ``key_fields`` match.
+
+        ``key_fields`` is a natural key backed by a unique index, e.g.
+        ``["user_id"]`` for ``PricingConfiguration`` (one per user). Returns the
+        number of rows written.
+        """
+        pass
+
+    @abstractmethod
+    async def bulk_delete(self, *, ids: Sequence[Any], **kwargs) -> int:
+        """Delete the rows with these ids; returns how many were deleted."""
+        pass
@@ -0,0 +1,363 @@
+"""Read-through caching for repositories of rarely-changing reference data.
+
+``CachedRepository`` wraps any ``IRepository`` and answers ``get`` and
+``get_by_attribute`` from a ``ReferenceCache``: an in-process LRU with a TTL
+per namespace (one namespace per model). Any write through the wrapper drops
+the whole namespace, since a changed row may sit under several keys (id,
+slug, user_id).
+
+With several uvicorn workers each process has its own cache. A
+``CacheVersions`` counter in the shared database keeps them coherent: writes
+bump the namespace's version, and a worker that sees a newer version than the
+one its entries were filled under discards them. The version is read at most
+once per ``check_interval`` seconds, which bounds how stale another worker can
+be.
+
+Cached rows are kept as plain column values, never as ORM instances, so no
+two requests share an object. A hit comes back attached to the wrapped
+repository's session without a query, as if the session had loaded it.
+"""
+
+import copy
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from sqlalchemy import event, inspect as sa_inspect, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.core.config import settings
+from app.models.cache_version import CacheVersion
+from app.repositories.base import IRepository
+from app.repositories.cursor import CursorPage
+from app.repositories.sqlite_adapter import engine
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    ttl_seconds: float = 300.0
+    max_entries: int = 1024
+
+
+class CacheVersions:
+    """Per-namespace version counters in the ``cache_version`` table."""
+
+    def __init__(
+        self, engine: Engine, *, check_interval: float = 1.0, clock=time.monotonic
+    ):
+        self.engine = engine
+        self.check_interval = check_interval
+        self._clock = clock
+        self._checked: Dict[str, Tuple[float, int]] = {}
+        self._lock = threading.Lock()
+        self._table_ready = False
+
+    def current(self, namespace: str) -> Optional[int]:
+        """The namespace's version, or None when the table cannot be read."""
+        now = self._clock()
+        with self._lock:
+            checked = self._checked.get(namespace)
+        if checked and now - checked[0] < self.check_interval:
+            return checked[1]
+        try:
+            self._ensure_table()
+            with self.engine.connect() as connection:
+                version = connection.execute(
+                    select(CacheVersion.version).where(
+                        CacheVersion.namespace == namespace
+                    )
+                ).scalar()
+        except SQLAlchemyError:
+            logger.warning(
+                "Could not read cache version for %s", namespace, exc_info=True
+            )
+            return None
+        version = version or 0
+        with self._lock:
+            self._checked[namespace] = (now, version)
+        return version
+
+    def bump(self, namespace: str) -> Optional[int]:
+        try:
+            self._ensure_table()
+            with self.engine.begin() as connection:
+                connection.execute(
+                    text(
+                        "INSERT INTO cache_version (namespace, version) VALUES (:namespace, 1) "
+                        "ON CONFLICT (namespace) DO UPDATE SET version = cache_version.version + 1"
+                    ),
+                    {"namespace": namespace},
+                )
+                version = connection.execute(
+                    select(CacheVersion.version).where(
+                        CacheVersion.namespace == namespace
+                    )
+                ).scalar_one()
+        except SQLAlchemyError:
+            logger.warning(
+                "Could not bump cache version for %s", namespace, exc_info=True
+            )
+            with self._lock:
+                self._checked.pop(namespace, None)
+            return None
+        with self._lock:
+            self._checked[namespace] = (self._clock(), version)
+        return version
+
+    def _ensure_table(self) -> None:
+        if not self._table_ready:
+            CacheVersion.__table__.create(self.engine, checkfirst=True)
+            self._table_ready = True
+
+
+class ReferenceCache:
+    """Namespaced LRU + TTL store, safe to share between request threads.
+
+    Readers take a ``token`` before loading and hand it back to ``store``; a
+    row loaded while the namespace was invalidated is then not cached.
+    """
+
+    def __init__(
+        self, *, versions: Optional[CacheVersions] = None, clock=time.monotonic
+    ):
+        self.versions = versions
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: Dict[str, "OrderedDict[Hashable, Tuple[float, Any]]"] = {}
+        self._versions: Dict[str, int] = {}
+        self._generations: Dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def token(self, namespace: str) -> Optional[Tuple[int, int]]:
+        """Sync with the shared version; None when it cannot be read."""
+        version = self.versions.current(namespace) if self.versions else 0
+        with self._lock:
+            if version is None:
+                self._drop(namespace)
+                return None
+            if self._versions.get(namespace, version) != version:
+                self._drop(namespace)
+            self._versions[namespace] = version
+            return version, self._generations.get(namespace, 0)
+
+    def lookup(self, namespace: str, key: Hashable) -> Tuple[bool, Any]:
+        with self._lock:
+            entries = self._entries.get(namespace)
+            entry = entries.get(key) if entries is not None else None
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    del entries[key]
+                self.misses += 1
+                return False, None
+            entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[1]
+
+    def store(
+        self,
+        namespace: str,
+        key: Hashable,
+        value: Any,
+        policy: CachePolicy,
+        token: Tuple[int, int],
+    ) -> None:
+        with self._lock:
+            current = (
+                self._versions.get(namespace),
+                self._generations.get(namespace, 0),
+            )
+            if current != token or policy.max_entries <= 0:
+                return
+            entries = self._entries.setdefault(namespace, OrderedDict())
+            entries[key] = (self._clock() + policy.ttl_seconds, value)
+            entries.move_to_end(key)
+            while len(entries) > policy.max_entries:
+                entries.popitem(last=False)
+
+    def invalidate(self, namespace: str) -> None:
+        """Drop ``namespace`` here and, through the version counter, in every worker."""
+        with self._lock:
+            self._drop(namespace)
+        version = self.versions.bump(namespace) if self.versions else 0
+        with self._lock:
+            self._drop(namespace)
+            if version is not None:
+                self._versions[namespace] = version
+
+    def clear(self) -> None:
+        with self._lock:
+            for namespace in list(self._entries):
+                self._drop(namespace)
+
+    def _drop(self, namespace: str) -> None:
+        self._entries.pop(namespace, None)
+        self._generations[namespace] = self._generations.get(namespace, 0) + 1
+
+
+class CachedRepository(IRepository):
+    """Read-through cache in front of another repository.
+
+    Reads other than ``get`` and ``get_by_attribute`` pass straight through.
+    Writes through the wrapper invalidate the model's namespace; code that
+    writes the model some other way must call ``invalidate()`` itself. Misses
+    are not cached, so creating a row never needs an invalidation to show up.
+    """
+
+    def __init__(
+        self,
+        inner: IRepository,
+        *,
+        policy: Optional[CachePolicy] = None,
+        cache: Optional[ReferenceCache] = None,
+        namespace: Optional[str] = None,
+    ):
+        self.inner = inner
+        self.model = inner.model
+        self.policy = policy or CachePolicy()
+        self.cache = cache or reference_cache
+        self.namespace = namespace or self.model.__name__
+        self._mapper = sa_inspect(self.model, raiseerr=False)
+
+    def __getattr__(self, name: str) -> Any:
+        # session, engine, commit(), flush() ... of the wrapped repository.
+        return getattr(self.inner, name)
+
+    async def get(self, *, id: Any, **kwargs) -> Optional[Any]:
+        return await self._read_through(
+            ("id", id), lambda: self.inner.get(id=id, **kwargs)
+        )
+
+    async def get_by_attribute(
+        self, *, attribute_name: str, attribute_value: Any, **kwargs
+    ) -> Optional[Any]:
+        return await self._read_through(
+            (attribute_name, attribute_value),
+            lambda: self.inner.get_by_attribute(
+                attribute_name=attribute_name, attribute_value=attribute_value, **kwargs
+            ),
+        )
+
+    async def get_multi(self, **kwargs) -> List[Any]:
+        return await self.inner.get_multi(**kwargs)
+
+    async def get_page(self, **kwargs) -> CursorPage:
+        return await self.inner.get_page(**kwargs)
+
+    async def get_multi_by_attribute(self, **kwargs) -> List[Any]:
+        return await self.inner.get_multi_by_attribute(**kwargs)
+
+    async def create(self, **kwargs) -> Any:
+        return await self._write(self.inner.create(**kwargs))
+
+    async def update(self, **kwargs) -> Any:
+        return await self._write(self.inner.update(**kwargs))
+
+    async def delete(self, **kwargs) -> Optional[Any]:
+        return await self._write(self.inner.delete(**kwargs))
+
+    async def bulk_create(self, **kwargs) -> List[Any]:
+        return await self._write(self.inner.bulk_create(**kwargs))
+
+    async def bulk_update(self, **kwargs) -> int:
+        return await self._write(self.inner.bulk_update(**kwargs))
+
+    async def bulk_upsert(self, **kwargs) -> int:
+        return await self._write(self.inner.bulk_upsert(**kwargs))
+
+    async def bulk_delete(self, **kwargs) -> int:
+        return await self._write(self.inner.bulk_delete(**kwargs))
+
+    def invalidate(self) -> None:
+        """Drop cached rows of this model, now and again when the session commits."""
+        self.cache.invalidate(self.namespace)
+        session = getattr(self.inner, "session", None)
+        if isinstance(session, Session) and session.in_transaction():
+            # Until the write commits, another request can still read and
+            # cache the old row.
+            event.listen(
+                session,
+                "after_commit",
+                lambda _session: self.cache.invalidate(self.namespace),
+                once=True,
+            )
+
+    async def _read_through(self, key: Hashable, load: Callable) -> Optional[Any]:
+        if not settings.REFERENCE_CACHE_ENABLED:
+            return await load()
+        token = self.cache.token(self.namespace)
+        if token is None:
+            return await load()
+        hit, frozen = self.cache.lookup(self.namespace, key)
+        if hit:
+            return self._thaw(frozen)
+        obj = await load()
+        if obj is not None:
+            self.cache.store(self.namespace, key, self._freeze(obj), self.policy, token)
+        return obj
+
+    async def _write(self, pending):
+        try:
+            return await pending
+        finally:
+            self.invalidate()
+
+    def _freeze(self, obj: Any) -> Any:
+        if self._mapper is None:
+            return obj.model_copy(deep=True)
+        return {
+            attr.key: copy.deepcopy(getattr(obj, attr.key))
+            for attr in self._mapper.column_attrs
+        }
+
+    def _thaw(self, frozen: Any) -> Any:
+        if self._mapper is None:
+            return frozen.model_copy(deep=True)
+        # Rebuild the row the way a query result would: committed values, no
+        # pending changes, with an identity key so the session treats it as
+        # persistent.
+        instance = self._mapper.class_manager.new_instance()
+        for key, value in frozen.items():
+            set_committed_value(instance, key, copy.deepcopy(value))
+        make_transient_to_detached(instance)
+        session = getattr(self.inner, "session", None)
+        if not isinstance(session, Session):
+            return instance
+        existing = session.identity_map.get(sa_inspect(instance).key)
+        if existing is not None:
+            return existing
+        return session.merge(instance, load=False)
+
+
+def cached_repository(
+    inner: IRepository, *, ttl_seconds: float, max_entries: int = 1024
+) -> IRepository:
+    """Wrap ``inner`` in the shared reference cache with the given policy."""
+    return CachedRepository(
+        inner, policy=CachePolicy(ttl_seconds=ttl_seconds, max_entries=max_entries)
+    )
+
+
+reference_cache = ReferenceCache(
+    versions=CacheVersions(
+        engine, check_interval=settings.REFERENCE_CACHE_VERSION_CHECK_SECONDS
+    )
+)
+
+
+__all__ = [
+    "CachePolicy",
+    "CacheVersions",
+    "CachedRepository",
+    "ReferenceCache",
+    "cached_repository",
+    "reference_cache",
+]
@@ -0,0 +1,148 @@
+"""Opaque keyset cursors shared by the repository adapters.
+
+A cursor records the sort-key values of the last row on a page. The next page
+is then a range predicate over those keys rather than an OFFSET, so deep pages
+cost the same as the first and rows inserted earlier in the ordering do not
+shift later pages. Cursors are base64-encoded JSON; clients must treat them as
+opaque.
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Callable, Generic, List, Optional, Sequence, TypeVar
+from uuid import UUID
+
+from sqlalchemy import and_, false, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+ItemType = TypeVar("ItemType")
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class InvalidCursorError(ValueError):
+    """The cursor is malformed or was issued for a different ordering."""
+
+
+@dataclass
+class CursorPage(Generic[ItemType]):
+    items: List[ItemType]
+    next_cursor: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class KeysetColumn:
+    """One sort key of a keyset ordering.
+
+    ``value`` reads the key from a result row; it defaults to the attribute
+    named like the column. Nullable keys sort their NULLs last.
+    """
+
+    expression: Any
+    descending: bool = False
+    nullable: bool = False
+    value: Optional[Callable[[Any], Any]] = field(default=None, compare=False)
+
+    @property
+    def order_by(self) -> ColumnElement:
+        clause = self.expression.desc() if self.descending else self.expression.asc()
+        return clause.nulls_last() if self.nullable else clause
+
+    def read(self, row: Any) -> Any:
+        if self.value is not None:
+            return self.value(row)
+        return getattr(row, self.expression.key)
+
+    def after(self, value: Any) -> ColumnElement[bool]:
+        if value is None:
+            # NULLs sort last, so nothing follows a NULL on this key alone.
+            return false()
+        beyond = self.expression < value if self.descending else self.expression > value
+        if self.nullable:
+            return or_(beyond, self.expression.is_(None))
+        return beyond
+
+    def equals(self, value: Any) -> ColumnElement[bool]:
+        if value is None:
+            return self.expression.is_(None)
+        return self.expression == value
+
+
+def keyset_predicate(
+    keys: Sequence[KeysetColumn], values: Sequence[Any]
+) -> ColumnElement[bool]:
+    """Rows strictly after ``values`` in the lexicographic order of ``keys``."""
+    branches = []
+    for index, key in enumerate(keys):
+        prefix = [keys[position].equals(values[position]) for position in range(index)]
+        branches.append(and_(*prefix, key.after(values[index])))
+    return or_(*branches)
+
+
+def _encode_value(value: Any) -> list:
+    if value is None:
+        return ["n", None]
+    if isinstance(value, datetime):
+        return ["dt", value.isoformat()]
+    if isinstance(value, date):
+        return ["d", value.isoformat()]
+    if isinstance(value, UUID):
+        return ["u", str(value)]
+    if isinstance(value, (bool, int, float, str)):
+        return ["v", value]
+    # Enums and other str-like column values.
+    return ["v", getattr(value, "value", str(value))]
+
+
+def _decode_value(encoded: Any) -> Any:
+    kind, raw = encoded
+    if kind == "n":
+        return None
+    if kind == "dt":
+        return datetime.fromisoformat(raw)
+    if kind == "d":
+        return date.fromisoformat(raw)
+    if kind == "u":
+        return UUID(raw)
+    if kind == "v":
+        return raw
+    raise InvalidCursorError(f"Unknown cursor value type: {kind}")
+
+
+def encode_cursor(ordering: str, values: Sequence[Any]) -> str:
+    payload = {"o": ordering, "k": [_encode_value(value) for value in values]}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, *, ordering: str, key_count: int) -> list:
+    """Return the key values in ``cursor``, checking it belongs to ``ordering``."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if payload["o"] != ordering or len(payload["k"]) != key_count:
+            raise InvalidCursorError("Cursor does not match this list's ordering")
+        return [_decode_value(value) for value in payload["k"]]
+    except InvalidCursorError:
+        raise
+    except (binascii.Error, ValueError, KeyError, TypeError) as exc:
+        raise InvalidCursorError("Malformed cursor") from exc
+
+
+def encode_keyset_cursor(ordering: str, keys: Sequence[KeysetColumn], row: Any) -> str:
+    return encode_cursor(ordering, [key.read(row) for key in keys])
+
+
+__all__ = [
+    "CursorPage",
+    "InvalidCursorError",
+    "KeysetColumn",
+    "NEXT_CURSOR_HEADER",
+    "decode_cursor",
+    "encode_cursor",
+    "encode_keyset_cursor",
+    "keyset_predicate",
+]
@@ -0,0 +1,56 @@
+"""Run synchronous database work off the event loop.
+
+Services and repositories keep ``async def`` signatures but talk to the
+database through a synchronous ``Session``, so awaiting them still blocks the
+event loop for the whole query and one slow report stalls every other request
+in the worker. ``run_db`` and ``run_db_coroutine`` move that work onto worker
+threads, at most ``DB_THREAD_POOL_SIZE`` at a time so the pool never asks the
+engine for more connections than it will hand out.
+"""
+
+import asyncio
+from functools import partial
+from typing import Any, Awaitable, Callable, TypeVar
+
+import anyio.to_thread
+from anyio import CapacityLimiter
+from anyio.lowlevel import RunVar
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+# One limiter per event loop, the way anyio keeps its default thread limiter.
+_db_limiter: RunVar[CapacityLimiter] = RunVar("bakemate_db_limiter")
+
+
+def db_limiter() -> CapacityLimiter:
+    """Return the limiter that bounds database threads for the running loop."""
+    try:
+        return _db_limiter.get()
+    except LookupError:
+        limiter = CapacityLimiter(settings.DB_THREAD_POOL_SIZE)
+        _db_limiter.set(limiter)
+        return limiter
+
+
+async def run_db(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Call the synchronous ``func`` on a database thread and await its result."""
+    return await anyio.to_thread.run_sync(
+        partial(func, *args, **kwargs), limiter=db_limiter()
+    )
+
+
+async def run_db_coroutine(
+    func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any
+) -> T:
+    """Await ``func(*args, **kwargs)`` on a database thread.
+
+    For ``async def`` code whose body is synchronous database work. The
+    coroutine runs on a short-lived event loop of its own, so it must not
+    await anything bound to the caller's loop.
+    """
+    return await run_db(lambda: asyncio.run(func(*args, **kwargs)))
+
+
+__all__ = ["db_limiter", "run_db", "run_db_coroutine"]
@@ -1,15 +1,49 @@
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+)
 from uuid import UUID
 
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
-from sqlalchemy import inspect, text
+from sqlalchemy import delete, insert, inspect, text, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlmodel import SQLModel, Session, create_engine, select
 
 from app.core.config import (
     settings,
 )  # Assuming settings.DATABASE_URL will be configured
+from app.models.calendar import CalendarEvent
+from app.models.expense import Expense
+from app.models.mileage import MileageLog
+from app.models.order import (
+    CustomerHistoryRollup,
+    Order,
+    Quote,
+    backfill_order_history_keys,
+    backfill_order_import_metadata,
+    rebuild_customer_history_rollups,
+)
+from app.models.task import Task
+from app.models.order_search import create_order_search_index
 from app.repositories.base import IRepository
+from app.repositories.cursor import (
+    CursorPage,
+    KeysetColumn,
+    decode_cursor,
+    encode_keyset_cursor,
+    keyset_predicate,
+)
+from app.repositories.sqlite_profile import configure_sqlite_engine
 
 ModelType = TypeVar("ModelType", bound=SQLModel)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
@@ -25,9 +59,32 @@ engine = create_engine(
         {"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {}
     ),
 )
+configure_sqlite_engine(engine)
 
 _schema_ensured = False
 
+# Rows per DELETE ... WHERE id IN (...), well under SQLite's bound-variable limit.
+BULK_DELETE_CHUNK_SIZE = 500
+
+_ORM_WRITE_HOOKS = (
+    "before_insert",
+    "after_insert",
+    "before_update",
+    "after_update",
+    "before_delete",
+    "after_delete",
+)
+
+# Composite (user_id, <date>) indexes declared on the tenant models; dev
+# databases created before them pick them up in ensure_sqlite_order_schema.
+TENANT_DATE_INDEXES = [
+    index
+    for model in (Order, Quote, Expense, MileageLog, Task, CalendarEvent)
+    for index in model.__table__.indexes
+    if len(index.columns) > 1
+    and index.name.startswith(f"ix_{model.__tablename__}_user_id_")
+]
+
 
 def ensure_sqlite_order_schema(target_engine=None) -> None:
     global _schema_ensured
@@ -40,7 +97,8 @@ def ensure_sqlite_order_schema(target_engine=None) -> None:
         return
 
     inspector = inspect(engine_to_use)
-    if "order" not in inspector.get_table_names():
+    table_names = set(inspector.get_table_names())
+    if "order" not in table_names:
         if target_engine is None:
             _schema_ensured = True
         return
@@ -67,7 +125,29 @@ def ensure_sqlite_order_schema(target_engine=None) -> None:
         "internal_notes": "VARCHAR",
         "stripe_payment_intent_id": "VARCHAR",
         "stripe_checkout_session_id": "VARCHAR",
+        "triage_as_of": "DATE",
+        "triage_urgency_rank": "INTEGER",
+        "triage_action_class": "VARCHAR",
+        "triage_readiness_label": "VARCHAR",
+        "triage_needs_review": "BOOLEAN",
+        "triage_import_priority_rank": "INTEGER",
+        "triage_review_reasons": "VARCHAR",
+        "history_key": "VARCHAR",
+        "previous_order_date": "DATETIME",
+        "is_imported": "BOOLEAN NOT NULL DEFAULT 0",
+        "legacy_status_raw": "VARCHAR",
+        "import_source": "VARCHAR",
     }
+    required_indexes = [
+        "triage_as_of",
+        "triage_urgency_rank",
+        "triage_action_class",
+        "triage_readiness_label",
+        "triage_needs_review",
+        "history_key",
+        "is_imported",
+        "import_source",
+    ]
 
     with engine_to_use.begin() as connection:
         for column_name, column_type in required_columns.items():
@@ -75,6 +155,28 @@ def ensure_sqlite_order_schema(target_engine=None) -> None:
                 connection.execute(
                     text(f'ALTER TABLE "order" ADD COLUMN {column_name} {column_type}')
                 )
+        for column_name in required_indexes:
+            connection.execute(
+                text(
+                    f'CREATE INDEX IF NOT EXISTS ix_order_{column_name} ON "order" ({column_name})'
+                )
+            )
+        for index in TENANT_DATE_INDEXES:
+            if index.table.name in table_names:
+                index.create(connection, checkfirst=True)
+
+        # Rows written before history keys existed get them once, along with
+        # the rollup the ORM keeps current from then on.
+        if "history_key" not in existing_columns:
+            CustomerHistoryRollup.__table__.create(connection, checkfirst=True)
+            backfill_order_history_keys(connection)
+        if not {"history_key", "previous_order_date"} <= existing_columns:
+            rebuild_customer_history_rollups(connection)
+
+        if "import_source" not in existing_columns:
+            backfill_order_import_metadata(connection)
+
+        create_order_search_index(connection)
 
     if target_engine is None:
         _schema_ensured = True
@@ -90,37 +192,74 @@ class SQLiteRepository(
     IRepository[ModelType, CreateSchemaType, UpdateSchemaType],
     Generic[ModelType, CreateSchemaType, UpdateSchemaType],
 ):
-    def __init__(self, model: Type[ModelType]):
+    def __init__(
+        self,
+        model: Type[ModelType],
+        session: Optional[Session] = None,
+        *,
+        autocommit: bool = True,
+    ):
         """
         CRUD object with default methods to Create, Read, Update, Delete (CRUD).
 
         **Parameters**
 
         * `model`: A SQLModel class
+        * `session`: The request session to work in. Without one, every call
+          opens and closes a session of its own on the shared engine.
+        * `autocommit`: Commit after each create/update/delete. With a bound
+          session and ``autocommit=False`` writes are only flushed, and the
+          caller commits the whole unit of work with ``commit()``.
         """
         self.model = model
         # self.engine is global for SQLite in this example
         self.engine = engine
+        self.session = session
+        self.autocommit = autocommit
 
-    def _get_session(self) -> Session:
-        # In a real FastAPI app, you would inject the session using Depends
-        # For this structure, we create a new session per operation or manage it externally.
-        return Session(self.engine)
+    @contextmanager
+    def _get_session(self) -> Iterator[Session]:
+        if self.session is not None:
+            yield self.session
+            return
+        with Session(self.engine) as session:
+            yield session
+
+    def _save(self, session: Session, db_obj: Optional[ModelType] = None) -> None:
+        if self.session is not None and not self.autocommit:
+            session.flush()
+            return
+        session.commit()
+        if db_obj is not None:
+            session.refresh(db_obj)
+
+    def flush(self) -> None:
+        """Send pending writes of the bound session to the database."""
+        self._bound_session().flush()
+
+    def commit(self) -> None:
+        """Commit the bound session's unit of work."""
+        self._bound_session().commit()
+
+    def _bound_session(self) -> Session:
+        if self.session is None:
+            raise RuntimeError(
+                f"{type(self).__name__}({self.model.__name__}) is not bound to a session"
+            )
+        return self.session
 
     async def create(self, *, obj_in: CreateSchemaType, **kwargs) -> ModelType:
         obj_in_data = jsonable_encoder(obj_in)
         db_obj = self.model(**obj_in_data)
         with self._get_session() as session:
             session.add(db_obj)
-            session.commit()
-            session.refresh(db_obj)
+            self._save(session, db_obj)
             return db_obj
 
     async def get(self, *, id: UUID, **kwargs) -> Optional[ModelType]:
         with self._get_session() as session:
-            statement = select(self.model).where(self.model.id == id)
-            obj = session.exec(statement).first()
-            return obj
+            # A bound session answers repeat lookups from its identity map.
+            return session.get(self.model, id)
 
     async def get_multi(
         self,
@@ -133,24 +272,7 @@ class SQLiteRepository(
         **kwargs,
     ) -> List[ModelType]:
         with self._get_session() as session:
-            statement = select(self.model)
-            if filters:
-                for key, value in filters.items():
-                    if "__" in key:
-                        attr, op = key.split("__", 1)
-                        column = getattr(self.model, attr, None)
-                        if not column:
-                            continue
-                        if op == "gte":
-                            statement = statement.where(column >= value)
-                        elif op == "lte":
-                            statement = statement.where(column <= value)
-                        elif op == "gt":
-                            statement = statement.where(column > value)
-                        elif op == "lt":
-                            statement = statement.where(column < value)
-                    elif hasattr(self.model, key):
-                        statement = statement.where(getattr(self.model, key) == value)
+            statement = self._apply_filters(select(self.model), filters)
             if sort_by and hasattr(self.model, sort_by):
                 column = getattr(self.model, sort_by)
                 statement = statement.order_by(
@@ -162,6 +284,70 @@ class SQLiteRepository(
             objs = session.exec(statement).all()
             return objs
 
+    async def get_page(
+        self,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+        sort_by: Optional[str] = None,
+        sort_desc: bool = False,
+        **kwargs,
+    ) -> CursorPage[ModelType]:
+        keys = self._keyset(sort_by, sort_desc)
+        ordering = ":".join(
+            [self.model.__name__, *(key.expression.key for key in keys), str(sort_desc)]
+        )
+        statement = self._apply_filters(select(self.model), filters)
+        if cursor:
+            values = decode_cursor(cursor, ordering=ordering, key_count=len(keys))
+            statement = statement.where(keyset_predicate(keys, values))
+        # One extra row tells us whether another page follows.
+        statement = statement.order_by(*(key.order_by for key in keys)).limit(limit + 1)
+        with self._get_session() as session:
+            objs = list(session.exec(statement).all())
+        next_cursor = None
+        if len(objs) > limit:
+            objs = objs[:limit]
+            next_cursor = encode_keyset_cursor(ordering, keys, objs[-1])
+        return CursorPage(items=objs, next_cursor=next_cursor)
+
+    def _keyset(self, sort_by: Optional[str], sort_desc: bool) -> list[KeysetColumn]:
+        keys = []
+        if sort_by and sort_by != "id" and hasattr(self.model, sort_by):
+            column = getattr(self.model, sort_by)
+            keys.append(
+                KeysetColumn(
+                    column,
+                    descending=sort_desc,
+                    nullable=bool(getattr(column, "nullable", False)),
+                )
+            )
+        # The primary key breaks ties so every row has exactly one position.
+        keys.append(KeysetColumn(self.model.id, descending=sort_desc))
+        return keys
+
+    def _apply_filters(self, statement, filters: Optional[Dict[str, Any]]):
+        if not filters:
+            return statement
+        for key, value in filters.items():
+            if "__" in key:
+                attr, op = key.split("__", 1)
+                column = getattr(self.model, attr, None)
+                if not column:
+                    continue
+                if op == "gte":
+                    statement = statement.where(column >= value)
+                elif op == "lte":
+                    statement = statement.where(column <= value)
+                elif op == "gt":
+                    statement = statement.where(column > value)
+                elif op == "lt":
+                    statement = statement.where(column < value)
+            elif hasattr(self.model, key):
+                statement = statement.where(getattr(self.model, key) == value)
+        return statement
+
     async def update(
         self,
         *,
@@ -180,20 +366,130 @@ class SQLiteRepository(
                 setattr(db_obj, field, update_data[field])
         with self._get_session() as session:
             session.add(db_obj)
-            session.commit()
-            session.refresh(db_obj)
+            self._save(session, db_obj)
             return db_obj
 
     async def delete(self, *, id: UUID, **kwargs) -> Optional[ModelType]:
         with self._get_session() as session:
-            statement = select(self.model).where(self.model.id == id)
-            obj = session.exec(statement).first()
+            obj = session.get(self.model, id)
             if obj:
                 session.delete(obj)
-                session.commit()
+                self._save(session)
                 return obj
             return None
 
+    async def bulk_create(
+        self, *, objs_in: Sequence[Union[CreateSchemaType, Dict[str, Any]]], **kwargs
+    ) -> List[ModelType]:
+        db_objs = [self._build(obj_in) for obj_in in objs_in]
+        if not db_objs:
+            return []
+        with self._get_session() as session:
+            # A Core INSERT with a list of rows runs as one executemany.
+            session.execute(
+                insert(self.model.__table__), [self._row(db_obj) for db_obj in db_objs]
+            )
+            self._save(session)
+        return db_objs
+
+    async def bulk_update(self, *, updates: Sequence[Dict[str, Any]], **kwargs) -> int:
+        self._check_bulk_safe()
+        if not updates:
+            return 0
+        with self._get_session() as session:
+            # ORM bulk UPDATE by primary key: one executemany per set of keys.
+            session.execute(update(self.model), list(updates))
+            self._expire_cached(session, {row["id"] for row in updates})
+            self._save(session)
+        return len(updates)
+
+    async def bulk_upsert(
+        self,
+        *,
+        objs_in: Sequence[Union[CreateSchemaType, Dict[str, Any]]],
+        key_fields: Sequence[str],
+        **kwargs,
+    ) -> int:
+        rows = [self._row(self._build(obj_in)) for obj_in in objs_in]
+        if not rows:
+            return 0
+        table = self.model.__table__
+        with self._get_session() as session:
+            dialect = session.get_bind().dialect.name
+            if dialect not in ("sqlite", "postgresql"):
+                raise NotImplementedError(f"bulk_upsert does not support {dialect}")
+            dialect_insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+            statement = dialect_insert(table)
+            # The existing row keeps its id and created_at; everything else
+            # comes from the incoming row.
+            unchanged = {*key_fields, "id", "created_at"}
+            statement = statement.on_conflict_do_update(
+                index_elements=[table.c[name] for name in key_fields],
+                set_={
+                    column.name: statement.excluded[column.name]
+                    for column in table.columns
+                    if column.name not in unchanged
+                },
+            )
+            session.execute(statement, rows)
+            self._expire_cached(session, None)
+            self._save(session)
+        return len(rows)
+
+    async def bulk_delete(self, *, ids: Sequence[UUID], **kwargs) -> int:
+        self._check_bulk_safe()
+        ids = list(ids)
+        deleted = 0
+        with self._get_session() as session:
+            for start in range(0, len(ids), BULK_DELETE_CHUNK_SIZE):
+                chunk = ids[start : start + BULK_DELETE_CHUNK_SIZE]
+                result = session.execute(
+                    delete(self.model)
+                    .where(self.model.id.in_(chunk))
+                    .execution_options(synchronize_session=False)
+                )
+                deleted += result.rowcount
+            self._expire_cached(session, set(ids), deleted=True)
+            self._save(session)
+        return deleted
+
+    def _build(self, obj_in: Union[CreateSchemaType, Dict[str, Any]]) -> ModelType:
+        self._check_bulk_safe()
+        data = obj_in if isinstance(obj_in, dict) else obj_in.model_dump()
+        # Constructing the model fills in defaults such as id and created_at.
+        return self.model(**data)
+
+    def _row(self, db_obj: ModelType) -> Dict[str, Any]:
+        return {
+            column.key: getattr(db_obj, column.key)
+            for column in self.model.__table__.columns
+        }
+
+    def _check_bulk_safe(self) -> None:
+        # Bulk statements skip mapper events, so a model that derives columns
+        # or side tables in them (Order, OrderItem) would be left inconsistent.
+        dispatch = self.model.__mapper__.dispatch
+        hooks = [name for name in _ORM_WRITE_HOOKS if getattr(dispatch, name)]
+        if hooks:
+            raise ValueError(
+                f"{self.model.__name__} has ORM write hooks ({', '.join(hooks)}); "
+                "use the per-object methods instead of bulk operations"
+            )
+
+    def _expire_cached(
+        self, session: Session, ids: Optional[set], *, deleted: bool = False
+    ) -> None:
+        """Keep objects the session already holds from going stale after a bulk write."""
+        for obj in list(session.identity_map.values()):
+            if not isinstance(obj, self.model) or (
+                ids is not None and obj.id not in ids
+            ):
+                continue
+            if deleted:
+                session.expunge(obj)
+            else:
+                session.expire(obj)
+
     async def get_by_attribute(
         self, *, attribute_name: str, attribute_value: Any, **kwargs
     ) -> Optional[ModelType]:
@@ -0,0 +1,161 @@
+"""Connection tuning and busy handling for SQLite engines.
+
+``configure_sqlite_engine`` applies a ``SQLiteProfile`` to an engine: the
+profile's PRAGMAs run on every new DBAPI connection, and statements that fail
+with SQLITE_BUSY after ``busy_timeout`` are retried with exponential backoff.
+
+Retrying a single statement is safe here because pysqlite only opens a
+transaction right before the first write, so a busy write has not taken any
+lock yet, and in WAL mode COMMIT never waits on readers.
+"""
+
+import random
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import Settings, settings
+
+JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+SYNCHRONOUS_MODES = {"OFF", "NORMAL", "FULL", "EXTRA"}
+TEMP_STORES = {"DEFAULT", "FILE", "MEMORY"}
+
+_SQLITE_BUSY_SNAPSHOT = getattr(sqlite3, "SQLITE_BUSY_SNAPSHOT", 517)
+
+
+@dataclass(frozen=True)
+class SQLiteProfile:
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    busy_timeout_ms: int = 5000
+    cache_size_kib: int = 32768
+    mmap_size_bytes: int = 256 * 1024 * 1024
+    temp_store: str = "MEMORY"
+    busy_retries: int = 3
+    busy_backoff_ms: int = 50
+
+    def __post_init__(self):
+        for name, value, allowed in (
+            ("journal_mode", self.journal_mode, JOURNAL_MODES),
+            ("synchronous", self.synchronous, SYNCHRONOUS_MODES),
+            ("temp_store", self.temp_store, TEMP_STORES),
+        ):
+            if value.upper() not in allowed:
+                raise ValueError(f"Unsupported SQLite {name}: {value!r}")
+        for name in (
+            "busy_timeout_ms",
+            "cache_size_kib",
+            "mmap_size_bytes",
+            "busy_retries",
+            "busy_backoff_ms",
+        ):
+            if getattr(self, name) < 0:
+                raise ValueError(f"SQLite {name} must not be negative")
+
+    @classmethod
+    def from_settings(cls, config: Settings = settings) -> "SQLiteProfile":
+        return cls(
+            journal_mode=config.SQLITE_JOURNAL_MODE,
+            synchronous=config.SQLITE_SYNCHRONOUS,
+            busy_timeout_ms=config.SQLITE_BUSY_TIMEOUT_MS,
+            cache_size_kib=config.SQLITE_CACHE_SIZE_KIB,
+            mmap_size_bytes=config.SQLITE_MMAP_SIZE_BYTES,
+            temp_store=config.SQLITE_TEMP_STORE,
+            busy_retries=config.SQLITE_BUSY_RETRIES,
+            busy_backoff_ms=config.SQLITE_BUSY_BACKOFF_MS,
+        )
+
+    @property
+    def pragmas(self) -> list[str]:
+        return [
+            f"PRAGMA journal_mode={self.journal_mode.upper()}",
+            f"PRAGMA synchronous={self.synchronous.upper()}",
+            f"PRAGMA busy_timeout={self.busy_timeout_ms}",
+            # A negative cache_size is a size in KiB rather than in pages.
+            f"PRAGMA cache_size=-{self.cache_size_kib}",
+            f"PRAGMA mmap_size={self.mmap_size_bytes}",
+            f"PRAGMA temp_store={self.temp_store.upper()}",
+        ]
+
+    def backoff_seconds(self, attempt: int) -> float:
+        """Sleep before retry ``attempt`` (0-based): doubling, with jitter."""
+        ceiling = self.busy_backoff_ms * (2**attempt) / 1000
+        return random.uniform(ceiling / 2, ceiling)
+
+
+def is_sqlite_busy_error(exc: BaseException) -> bool:
+    """True for SQLITE_BUSY, the error SQLite reports as "database is locked".
+
+    BUSY_SNAPSHOT is excluded: the transaction's snapshot is stale, so only
+    restarting the whole transaction can succeed.
+    """
+    error = getattr(exc, "orig", None) or exc
+    if not isinstance(error, sqlite3.OperationalError):
+        return False
+    code = getattr(error, "sqlite_errorcode", None)
+    if code is None:
+        return "database is locked" in str(error)
+    return code & 0xFF == sqlite3.SQLITE_BUSY and code != _SQLITE_BUSY_SNAPSHOT
+
+
+def _run_with_busy_retry(profile: SQLiteProfile, execute: Callable[[], object]) -> None:
+    attempt = 0
+    while True:
+        try:
+            execute()
+            return
+        except sqlite3.OperationalError as exc:
+            if attempt >= profile.busy_retries or not is_sqlite_busy_error(exc):
+                raise
+            time.sleep(profile.backoff_seconds(attempt))
+            attempt += 1
+
+
+def configure_sqlite_engine(
+    engine: Engine, profile: Optional[SQLiteProfile] = None
+) -> Engine:
+    """Apply ``profile`` (by default the one in ``Settings``) to a SQLite ``engine``."""
+    if engine.dialect.name != "sqlite":
+        return engine
+    profile = profile or SQLiteProfile.from_settings()
+
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in profile.pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+    if profile.busy_retries:
+
+        @event.listens_for(engine, "do_execute")
+        def _execute(cursor, statement, parameters, context):
+            _run_with_busy_retry(profile, lambda: cursor.execute(statement, parameters))
+            return True
+
+        @event.listens_for(engine, "do_execute_no_params")
+        def _execute_no_params(cursor, statement, context):
+            _run_with_busy_retry(profile, lambda: cursor.execute(statement))
+            return True
+
+        @event.listens_for(engine, "do_executemany")
+        def _executemany(cursor, statement, parameters, context):
+            _run_with_busy_retry(
+                profile, lambda: cursor.executemany(statement, parameters)
+            )
+            return True
+
+    return engine
+
+
+__all__ = [
+    "SQLiteProfile",
+    "configure_sqlite_engine",
+    "is_sqlite_busy_error",
+]
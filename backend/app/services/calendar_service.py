@@ -1,4 +1,4 @@
-from typing import List, Optional, Dict
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 from datetime import datetime, timedelta
 
@@ -12,6 +12,7 @@ from app.models.calendar import (
 )
 from app.models.user import User
 from app.models.order import Order  # For auto-populating order due dates
+from app.repositories.cursor import CursorPage
 from app.repositories.sqlite_adapter import SQLiteRepository
 
 # from app.services.google_calendar_service import GoogleCalendarService # Placeholder for future integration
@@ -19,7 +20,7 @@ from app.repositories.sqlite_adapter import SQLiteRepository
 
 class CalendarService:
     def __init__(self, session: Session):
-        self.calendar_event_repo = SQLiteRepository(model=CalendarEvent)  # type: ignore
+        self.calendar_event_repo = SQLiteRepository(model=CalendarEvent, session=session)  # type: ignore
         self.session = session
         # self.google_calendar_service = GoogleCalendarService() # Placeholder
 
@@ -59,14 +60,7 @@ class CalendarService:
         skip: int = 0,
         limit: int = 1000,  # Higher limit for calendar views
     ) -> List[CalendarEvent]:
-        filters: Dict[str, Any] = {
-            "user_id": current_user.id,
-            "start_datetime__lte": end_date,  # Events that start before or at the end_date
-            "end_datetime__gte": start_date,  # Events that end after or at the start_date
-        }
-        if event_type:
-            filters["event_type"] = event_type
-
+        filters = self._list_filters(current_user, start_date, end_date, event_type)
         events = await self.calendar_event_repo.get_multi(
             filters=filters,
             skip=skip,
@@ -75,6 +69,37 @@ class CalendarService:
         )
         return events
 
+    async def get_calendar_event_page_by_user(
+        self,
+        *,
+        current_user: User,
+        start_date: datetime,
+        end_date: datetime,
+        event_type: Optional[CalendarEventType] = None,
+        cursor: Optional[str] = None,
+        limit: int = 1000,
+    ) -> CursorPage[CalendarEvent]:
+        filters = self._list_filters(current_user, start_date, end_date, event_type)
+        return await self.calendar_event_repo.get_page(
+            filters=filters, cursor=cursor, limit=limit, sort_by="start_datetime"
+        )
+
+    @staticmethod
+    def _list_filters(
+        current_user: User,
+        start_date: datetime,
+        end_date: datetime,
+        event_type: Optional[CalendarEventType],
+    ) -> Dict[str, Any]:
+        filters: Dict[str, Any] = {
+            "user_id": current_user.id,
+            "start_datetime__lte": end_date,  # Events that start before or at the end_date
+            "end_datetime__gte": start_date,  # Events that end after or at the start_date
+        }
+        if event_type:
+            filters["event_type"] = event_type
+        return filters
+
     async def update_calendar_event(
         self, *, event_id: UUID, event_in: CalendarEventUpdate, current_user: User
     ) -> Optional[CalendarEvent]:
@@ -6,6 +6,7 @@ from sqlmodel import Session, select
 
 from app.models.expense import Expense, ExpenseCreate, ExpenseUpdate, ExpenseCategory
 from app.models.user import User
+from app.repositories.cursor import CursorPage
 from app.repositories.sqlite_adapter import SQLiteRepository
 
 # TODO: Implement cloud storage integration (e.g., AWS S3) for receipts
@@ -24,7 +25,7 @@ RECEIPT_STORAGE_PATH.mkdir(parents=True, exist_ok=True)
 
 class ExpenseService:
     def __init__(self, session: Session):
-        self.expense_repo = SQLiteRepository(model=Expense)  # type: ignore
+        self.expense_repo = SQLiteRepository(model=Expense, session=session)  # type: ignore
         self.session = session
 
     async def create_expense(
@@ -100,6 +101,34 @@ class ExpenseService:
         skip: int = 0,
         limit: int = 100,
     ) -> List[Expense]:
+        filters = self._list_filters(current_user, category, start_date, end_date)
+        expenses = await self.expense_repo.get_multi(
+            filters=filters, skip=skip, limit=limit, sort_by="date", sort_desc=True
+        )
+        return expenses
+
+    async def get_expense_page_by_user(
+        self,
+        *,
+        current_user: User,
+        category: Optional[ExpenseCategory] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+    ) -> CursorPage[Expense]:
+        filters = self._list_filters(current_user, category, start_date, end_date)
+        return await self.expense_repo.get_page(
+            filters=filters, cursor=cursor, limit=limit, sort_by="date", sort_desc=True
+        )
+
+    @staticmethod
+    def _list_filters(
+        current_user: User,
+        category: Optional[ExpenseCategory],
+        start_date: Optional[date],
+        end_date: Optional[date],
+    ) -> Dict[str, Any]:
         filters: Dict[str, Any] = {"user_id": current_user.id}
         if category:
             filters["category"] = category
@@ -107,11 +136,7 @@ class ExpenseService:
             filters["date__gte"] = start_date
         if end_date:
             filters["date__lte"] = end_date
-
-        expenses = await self.expense_repo.get_multi(
-            filters=filters, skip=skip, limit=limit, sort_by="date", sort_desc=True
-        )
-        return expenses
+        return filters
 
     async def update_expense(
         self,
@@ -3,6 +3,7 @@ from uuid import UUID
 from sqlmodel import Session, select
 from app.models.ingredient import Ingredient, IngredientCreate, IngredientUpdate
 from app.models.user import User  # For type hinting current_user
+from app.repositories.cached import cached_repository, reference_cache
 from app.repositories.sqlite_adapter import (
     SQLiteRepository,
 )  # Or a generic repository factory
@@ -24,13 +25,17 @@ def update_ingredient_stock(
     ingredient.stock_quantity = current + quantity_change
     session.add(ingredient)
     session.commit()
+    reference_cache.invalidate(Ingredient.__name__)
     session.refresh(ingredient)
     return ingredient
 
 
 class IngredientService:
     def __init__(self, session: Session):
-        self.ingredient_repo = SQLiteRepository(model=Ingredient)  # type: ignore
+        self.ingredient_repo = cached_repository(
+            SQLiteRepository(model=Ingredient, session=session),  # type: ignore
+            ttl_seconds=300,
+        )
         self.session = session
 
     async def create_ingredient(
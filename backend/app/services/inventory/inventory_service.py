@@ -8,6 +8,7 @@ from app.models.ingredient import Ingredient
 from app.models.recipe import Recipe, RecipeIngredientLink
 from app.models.order import Order, OrderItem, OrderStatus
 from app.models.user import User
+from app.repositories.cached import reference_cache
 from app.services.email_service import EmailService  # For low stock alerts
 from app.core.config import settings
 
@@ -34,6 +35,7 @@ class InventoryService:
         ingredient.quantity_on_hand += Decimal(quantity_change)
         self.session.add(ingredient)
         self.session.commit()
+        reference_cache.invalidate(Ingredient.__name__)
         self.session.refresh(ingredient)
 
         # Check for low stock after update
@@ -90,6 +92,7 @@ class InventoryService:
                 await self.check_and_notify_low_stock(ingredient, user_id)
 
         self.session.commit()
+        reference_cache.invalidate(Ingredient.__name__)
         # Refresh related ingredients if needed, but commit handles saving.
         return True
 
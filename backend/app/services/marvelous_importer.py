@@ -1,25 +1,44 @@
 from __future__ import annotations
 
 import ast
+import hashlib
 import json
 import math
+from collections import Counter, defaultdict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import date, datetime, time, timedelta, timezone
 from decimal import Decimal, InvalidOperation
+from itertools import islice
 from pathlib import Path
-from typing import Any, Iterable, Optional
+from typing import Any, Callable, Iterable, Iterator, Optional
 import uuid
 
-from sqlmodel import Session, select
+from sqlalchemy import insert, update
+from sqlmodel import Session, delete, select
 
 from app.models.contact import Contact, ContactType
 from app.models.expense import Expense, ExpenseCategory
+from app.models.import_checkpoint import ImportCheckpoint
+from app.models.import_fingerprint import ImportFingerprint
 from app.models.mileage import MileageLog
-from app.models.order import Order, OrderItem, OrderStatus, PaymentStatus
+from app.models.order import (
+    LEGACY_IMPORT_SOURCE,
+    Order,
+    OrderItem,
+    OrderStatus,
+    PaymentStatus,
+    extract_legacy_metadata,
+)
 from app.models.user import User
+from app.services.order_service import OrderService
 
 
 EXCEL_EPOCH = datetime(1899, 12, 30, tzinfo=timezone.utc)
+DEFAULT_IMPORT_CHUNK_SIZE = 500
+# Rows per task handed to a parse worker.
+PARSE_BATCH_SIZE = 200
 
 
 @dataclass
@@ -27,10 +46,17 @@ class ImportCounts:
     contacts_created: int = 0
     contacts_matched: int = 0
     orders_created: int = 0
+    orders_updated: int = 0
+    orders_unchanged: int = 0
     expenses_created: int = 0
+    expenses_updated: int = 0
+    expenses_unchanged: int = 0
     mileage_created: int = 0
+    mileage_updated: int = 0
+    mileage_unchanged: int = 0
     orders_skipped_as_quotes: int = 0
     skipped_empty_rows: int = 0
+    rows_already_imported: int = 0
 
 
 @dataclass
@@ -48,22 +74,99 @@ class ImportResult:
     warnings: ImportWarnings
 
 
+@dataclass
+class ContactIndex:
+    """The baker's contacts by normalized email, phone and name key.
+
+    The earliest contact wins when several share a key, and a match on email
+    beats one on phone, which beats one on name.
+    """
+
+    by_email: dict[str, Contact] = field(default_factory=dict)
+    by_phone: dict[str, Contact] = field(default_factory=dict)
+    by_name: dict[str, Contact] = field(default_factory=dict)
+
+    def add(self, contact: Contact) -> None:
+        for index, key in (
+            (self.by_email, normalize_email(contact.email)),
+            (self.by_phone, normalize_phone(contact.phone)),
+            (
+                self.by_name,
+                normalized_name_key(
+                    contact.first_name, contact.last_name, contact.company_name
+                ),
+            ),
+        ):
+            if key:
+                index.setdefault(key, contact)
+
+    def find(
+        self, *, email: Optional[str], phone: Optional[str], name_key: Optional[str]
+    ) -> Optional[Contact]:
+        for index, key in (
+            (self.by_email, email),
+            (self.by_phone, phone),
+            (self.by_name, name_key),
+        ):
+            if key and key in index:
+                return index[key]
+        return None
+
+
 class MarvelousCreationsImporter:
-    def __init__(self, session: Session, current_user: User):
+    def __init__(
+        self,
+        session: Session,
+        current_user: User,
+        *,
+        chunk_size: int = DEFAULT_IMPORT_CHUNK_SIZE,
+        workers: int = 0,
+    ):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        if workers < 0:
+            raise ValueError("workers must not be negative")
         self.session = session
         self.current_user = current_user
+        self.chunk_size = chunk_size
+        # Processes that normalize rows; 0 normalizes them in this process.
+        self.workers = workers
         self.counts = ImportCounts()
         self.warnings = ImportWarnings()
-        self._contact_cache: dict[str, Contact] = {}
-
-    def import_workbook(self, workbook_path: str | Path) -> ImportResult:
-        sheets = load_workbook_rows(workbook_path)
-        self.import_sheets(
-            contacts_rows=sheets.get("Contacts", []),
-            orders_rows=sheets.get("Orders", []),
-            expenses_rows=sheets.get("Expenses", []),
-            mileage_rows=sheets.get("Mileage", []),
-        )
+        self._contact_index: Optional[ContactIndex] = None
+        self._order_numbers: Optional[set[str]] = None
+        # Per sheet: record_key -> (fingerprint, record_id).
+        self._fingerprints: dict[str, dict[str, tuple[str, uuid.UUID]]] = {}
+        self._new_fingerprints: list[dict[str, Any]] = []
+        self._changed_fingerprints: list[dict[str, Any]] = []
+        self._adoptable: dict[str, dict[str, list[uuid.UUID]]] = {}
+        self._key_occurrences: dict[str, Counter[str]] = defaultdict(Counter)
+
+    def import_workbook(
+        self, workbook_path: str | Path, *, restart: bool = False
+    ) -> ImportResult:
+        """Import the workbook, resuming after the chunks a previous run committed.
+
+        ``restart`` forgets that progress and imports every row again.
+        """
+        digest = workbook_digest(workbook_path)
+        if restart:
+            self.session.exec(
+                delete(ImportCheckpoint).where(
+                    ImportCheckpoint.user_id == self.current_user.id,
+                    ImportCheckpoint.source == LEGACY_IMPORT_SOURCE,
+                    ImportCheckpoint.workbook_digest == digest,
+                )
+            )
+            self.session.commit()
+        with open_workbook_sheets(workbook_path) as sheets:
+            self.import_sheets(
+                contacts_rows=sheets.get("Contacts", ()),
+                orders_rows=sheets.get("Orders", ()),
+                expenses_rows=sheets.get("Expenses", ()),
+                mileage_rows=sheets.get("Mileage", ()),
+                resume_key=digest,
+            )
         return ImportResult(counts=self.counts, warnings=self.warnings)
 
     def import_sheets(
@@ -73,77 +176,143 @@ class MarvelousCreationsImporter:
         orders_rows: Iterable[dict[str, Any]],
         expenses_rows: Iterable[dict[str, Any]],
         mileage_rows: Iterable[dict[str, Any]],
+        resume_key: Optional[str] = None,
     ) -> ImportResult:
-        for row in contacts_rows:
-            if row_is_empty(row):
-                self.counts.skipped_empty_rows += 1
-                continue
-            self._resolve_contact(row)
+        """Import the rows, committing every ``chunk_size`` rows of a sheet.
+
+        With a ``resume_key`` (the workbook digest) each commit also records
+        the sheet's position, and rows a previous run committed are skipped.
+        A failure rolls back only the chunk in progress.
+
+        Rows are first normalized into plain records (``normalize_*_row``),
+        on ``workers`` processes when set, and written here in sheet order.
+        Orders, expenses and mileage are synced by content hash: rows seen
+        before are updated when they changed and skipped when they did not.
+        """
+        sheets = (
+            ("Contacts", contacts_rows, self._write_contact),
+            ("Orders", orders_rows, self._write_order),
+            ("Expenses", expenses_rows, self._write_expense),
+            ("Mileage", mileage_rows, self._write_mileage),
+        )
+        # Indexed contacts stay loaded across chunk commits; expiring them
+        # would cost a reload per contact per chunk.
+        expire_on_commit = self.session.expire_on_commit
+        self.session.expire_on_commit = False
+        pool = ProcessPoolExecutor(max_workers=self.workers) if self.workers else None
+        try:
+            for sheet, rows, write_record in sheets:
+                self._import_sheet(sheet, rows, write_record, resume_key, pool)
+        except BaseException:
+            self.session.rollback()
+            raise
+        finally:
+            self.session.expire_on_commit = expire_on_commit
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+        # Imported orders arrive without triage; store it here so list reads
+        # never have to evaluate a freshly imported book.
+        OrderService(session=self.session).refresh_order_triage(
+            user_id=self.current_user.id
+        )
+        return ImportResult(counts=self.counts, warnings=self.warnings)
 
-        for row in orders_rows:
-            if row_is_empty(row):
+    def _import_sheet(
+        self,
+        sheet: str,
+        rows: Iterable[dict[str, Any]],
+        write_record: Callable[[dict[str, Any]], Any],
+        resume_key: Optional[str],
+        pool: Optional[ProcessPoolExecutor],
+    ) -> None:
+        checkpoint = self._checkpoint(sheet, resume_key)
+        committed = checkpoint.rows_committed if checkpoint is not None else 0
+        rows = iter(rows)
+        skipped = islice(rows, committed)
+        if sheet == "Contacts":
+            position = sum(1 for _ in skipped)
+        else:
+            # Keys of the committed rows still count, so a duplicate after the
+            # resume point is numbered (or skipped) as in the first run.
+            position = 0
+            for record in self._normalize(sheet, skipped, pool):
+                position += 1
+                if "key" in record:
+                    self._key_occurrences[sheet][record["key"]] += 1
+        self.counts.rows_already_imported += position
+        records = self._normalize(sheet, rows, pool)
+        for position, record in enumerate(records, start=position + 1):
+            if record["kind"] == "empty":
                 self.counts.skipped_empty_rows += 1
-                continue
-            self._import_order(row)
+            elif record["kind"] == "warning":
+                self.warnings.add(record["message"])
+            else:
+                write_record(record)
+            if position % self.chunk_size == 0:
+                self._commit_chunk(checkpoint, position)
+        self._commit_chunk(checkpoint, max(position, committed))
 
-        for row in expenses_rows:
-            if row_is_empty(row):
-                self.counts.skipped_empty_rows += 1
-                continue
-            self._import_expense(row)
+    def _normalize(
+        self,
+        sheet: str,
+        rows: Iterable[dict[str, Any]],
+        pool: Optional[ProcessPoolExecutor],
+    ) -> Iterable[dict[str, Any]]:
+        if pool is None:
+            return map(ROW_NORMALIZERS[sheet], rows)
+        return normalize_rows_in_pool(pool, sheet, rows, window=self.workers * 2)
+
+    def _checkpoint(
+        self, sheet: str, resume_key: Optional[str]
+    ) -> Optional[ImportCheckpoint]:
+        if resume_key is None:
+            return None
+        key = {
+            "user_id": self.current_user.id,
+            "source": LEGACY_IMPORT_SOURCE,
+            "workbook_digest": resume_key,
+            "sheet": sheet,
+        }
+        return self.session.get(ImportCheckpoint, key) or ImportCheckpoint(**key)
+
+    def _commit_chunk(
+        self, checkpoint: Optional[ImportCheckpoint], position: int
+    ) -> None:
+        # Fingerprints have no flush hooks, so they skip the unit of work:
+        # one executemany each for the chunk's new and changed rows.
+        if self._new_fingerprints:
+            self.session.execute(
+                insert(ImportFingerprint.__table__), self._new_fingerprints
+            )
+            self._new_fingerprints = []
+        if self._changed_fingerprints:
+            self.session.execute(update(ImportFingerprint), self._changed_fingerprints)
+            self._changed_fingerprints = []
+        if checkpoint is not None:
+            checkpoint.rows_committed = position
+            checkpoint.updated_at = datetime.now(timezone.utc)
+            self.session.add(checkpoint)
+        self.session.commit()
 
-        for row in mileage_rows:
-            if row_is_empty(row):
-                self.counts.skipped_empty_rows += 1
-                continue
-            self._import_mileage(row)
+    def _write_contact(self, record: dict[str, Any]) -> Contact:
+        return self._resolve_contact(record["contact"])
 
-        self.session.commit()
-        return ImportResult(counts=self.counts, warnings=self.warnings)
+    def _resolve_contact(self, fields: dict[str, Any]) -> Contact:
+        existing = self._contacts().find(
+            email=fields["email"], phone=fields["phone"], name_key=fields["name_key"]
+        )
+        if existing is not None:
+            self.counts.contacts_matched += 1
+            return existing
 
-    def _resolve_contact(self, row: dict[str, Any]) -> Optional[Contact]:
-        email = normalize_email(first_present(row, "EmailAddress", "ContactEmail", "Email"))
-        phone = normalize_phone(first_present(row, "Number", "Phone", "ContactPhone"))
-        contact_name = cleaned_string(first_present(row, "Contact", "FullName", "Name"))
-        first_name = cleaned_string(first_present(row, "FirstName"))
-        last_name = cleaned_string(first_present(row, "LastName"))
-        company_name = cleaned_string(first_present(row, "ContactCompany", "Company", "CompanyName"))
-
-        if not first_name and not last_name and contact_name:
-            first_name, last_name = split_name(contact_name)
-
-        cache_keys = [key for key in [email, phone, normalized_name_key(first_name, last_name, company_name)] if key]
-        for key in cache_keys:
-            cached = self._contact_cache.get(key)
-            if cached is not None:
-                self.counts.contacts_matched += 1
-                return cached
-
-        statement = select(Contact).where(Contact.user_id == self.current_user.id)
-        candidates = self.session.exec(statement).all()
-        for candidate in candidates:
-            if email and normalize_email(candidate.email) == email:
-                self._cache_contact(candidate)
-                self.counts.contacts_matched += 1
-                return candidate
-            if phone and normalize_phone(candidate.phone) == phone:
-                self._cache_contact(candidate)
-                self.counts.contacts_matched += 1
-                return candidate
-            if normalized_name_key(candidate.first_name, candidate.last_name, candidate.company_name) == normalized_name_key(first_name, last_name, company_name):
-                self._cache_contact(candidate)
-                self.counts.contacts_matched += 1
-                return candidate
-
-        address = parse_address(first_present(row, "Address", "StreetAddress"))
-        notes = build_contact_notes(row)
+        address = fields["address"]
         contact = Contact(
             user_id=self.current_user.id,
-            first_name=first_name,
-            last_name=last_name,
-            company_name=company_name,
-            email=email,
-            phone=phone,
+            first_name=fields["first_name"],
+            last_name=fields["last_name"],
+            company_name=fields["company_name"],
+            email=fields["email"],
+            phone=fields["phone"],
             address_line1=address.get("address_line1"),
             address_line2=address.get("address_line2"),
             city=address.get("city"),
@@ -151,210 +320,627 @@ class MarvelousCreationsImporter:
             postal_code=address.get("postal_code"),
             country=address.get("country") or "US",
             contact_type=ContactType.CUSTOMER,
-            notes=notes,
+            notes=fields["notes"],
         )
         self.session.add(contact)
-        self.session.flush()
-        self._cache_contact(contact)
+        self._contacts().add(contact)
         self.counts.contacts_created += 1
         return contact
 
-    def _cache_contact(self, contact: Contact) -> None:
-        for key in [
-            normalize_email(contact.email),
-            normalize_phone(contact.phone),
-            normalized_name_key(contact.first_name, contact.last_name, contact.company_name),
-        ]:
-            if key:
-                self._contact_cache[key] = contact
+    def _contacts(self) -> ContactIndex:
+        if self._contact_index is None:
+            # One query for the whole import; rows then match in O(1).
+            self._contact_index = ContactIndex()
+            statement = select(Contact).where(Contact.user_id == self.current_user.id)
+            for contact in self.session.exec(statement):
+                self._contact_index.add(contact)
+        return self._contact_index
+
+    def _existing_order_numbers(self) -> set[str]:
+        if self._order_numbers is None:
+            statement = select(Order.order_number).where(
+                Order.user_id == self.current_user.id
+            )
+            self._order_numbers = {
+                number for number in self.session.exec(statement) if number
+            }
+        return self._order_numbers
+
+    def _sheet_fingerprints(self, sheet: str) -> dict[str, tuple[str, uuid.UUID]]:
+        if sheet not in self._fingerprints:
+            statement = select(
+                ImportFingerprint.record_key,
+                ImportFingerprint.fingerprint,
+                ImportFingerprint.record_id,
+            ).where(
+                ImportFingerprint.user_id == self.current_user.id,
+                ImportFingerprint.source == LEGACY_IMPORT_SOURCE,
+                ImportFingerprint.sheet == sheet,
+            )
+            self._fingerprints[sheet] = {
+                key: (fingerprint, record_id)
+                for key, fingerprint, record_id in self.session.exec(statement)
+            }
+        return self._fingerprints[sheet]
+
+    def _record_key(self, sheet: str, key: str) -> tuple[str, bool]:
+        """``key`` made unique within this run, and whether it repeats an earlier row's."""
+        occurrences = self._key_occurrences[sheet]
+        occurrences[key] += 1
+        if occurrences[key] == 1:
+            return key, False
+        return f"{key}#{occurrences[key]}", True
+
+    def _previous_record(
+        self, sheet: str, model: type, record_key: str, key: str, fingerprint: str
+    ) -> tuple[str, Any]:
+        """``("unchanged", None)``, ``("changed", record)`` or ``("new", None)``."""
+        previous = self._sheet_fingerprints(sheet).get(record_key)
+        if previous is None:
+            candidates = self._adoptable_records(sheet).get(key)
+            if not candidates:
+                return "new", None
+            # Imported before fingerprints were recorded: the stored record is
+            # the baseline, so the baker's edits since then are kept and only
+            # later changes to the row overwrite it.
+            self._remember(sheet, record_key, fingerprint, candidates.pop(0))
+            return "unchanged", None
+        previous_fingerprint, record_id = previous
+        if previous_fingerprint == fingerprint:
+            return "unchanged", None
+        record = self.session.get(model, record_id)
+        return ("changed", record) if record is not None else ("new", None)
+
+    def _adoptable_records(self, sheet: str) -> dict[str, list[uuid.UUID]]:
+        if sheet not in self._adoptable:
+            claimed = {
+                record_id for _, record_id in self._sheet_fingerprints(sheet).values()
+            }
+            adoptable: dict[str, list[uuid.UUID]] = defaultdict(list)
+            for key, record_id in self._existing_record_keys(sheet):
+                if record_id not in claimed:
+                    adoptable[key].append(record_id)
+            self._adoptable[sheet] = adoptable
+        return self._adoptable[sheet]
+
+    def _existing_record_keys(self, sheet: str) -> Iterator[tuple[str, uuid.UUID]]:
+        user_id = self.current_user.id
+        if sheet == "Orders":
+            statement = select(Order.order_number, Order.id).where(
+                Order.user_id == user_id, Order.import_source == LEGACY_IMPORT_SOURCE
+            )
+            yield from self.session.exec(statement)
+        elif sheet == "Expenses":
+            statement = select(
+                Expense.id,
+                Expense.date,
+                Expense.description,
+                Expense.amount,
+                Expense.notes,
+            ).where(
+                Expense.user_id == user_id,
+                Expense.notes.like("%Legacy ExpenseID:%"),
+            )
+            for (
+                record_id,
+                expense_date,
+                description,
+                amount,
+                notes,
+            ) in self.session.exec(statement):
+                legacy_id = extract_legacy_metadata(notes).get("ExpenseID")
+                if not legacy_id:
+                    continue
+                yield expense_record_key(
+                    legacy_id, expense_date, description, amount
+                ), record_id
+        elif sheet == "Mileage":
+            statement = select(
+                MileageLog.id,
+                MileageLog.date,
+                MileageLog.distance,
+                MileageLog.start_location,
+                MileageLog.end_location,
+                MileageLog.notes,
+            ).where(
+                MileageLog.user_id == user_id,
+                MileageLog.notes.like("%Legacy MileageID:%"),
+            )
+            for (
+                record_id,
+                mileage_date,
+                distance,
+                start,
+                end,
+                notes,
+            ) in self.session.exec(statement):
+                legacy_id = extract_legacy_metadata(notes).get("MileageID")
+                if not legacy_id:
+                    continue
+                yield mileage_record_key(
+                    legacy_id, mileage_date, distance, start, end
+                ), record_id
+
+    def _remember(
+        self, sheet: str, record_key: str, fingerprint: str, record_id: uuid.UUID
+    ) -> None:
+        fingerprints = self._sheet_fingerprints(sheet)
+        pending = (
+            self._changed_fingerprints
+            if record_key in fingerprints
+            else self._new_fingerprints
+        )
+        fingerprints[record_key] = (fingerprint, record_id)
+        pending.append(
+            {
+                "user_id": self.current_user.id,
+                "source": LEGACY_IMPORT_SOURCE,
+                "sheet": sheet,
+                "record_key": record_key,
+                "fingerprint": fingerprint,
+                "record_id": record_id,
+                "updated_at": datetime.now(timezone.utc),
+            }
+        )
 
-    def _import_order(self, row: dict[str, Any]) -> None:
-        is_quote = coerce_bool(first_present(row, "IsQuote"))
-        if is_quote:
+    def _write_order(self, record: dict[str, Any]) -> None:
+        if record["kind"] == "quote":
             self.counts.orders_skipped_as_quotes += 1
             return
 
-        order_number = cleaned_string(first_present(row, "OrderNumber"))
-        if not order_number:
-            self.warnings.add("Skipped order row without OrderNumber.")
+        order_number = record["key"]
+        record_key, repeated = self._record_key("Orders", order_number)
+        if repeated:
+            self.warnings.add(f"Skipped duplicate legacy order_number {order_number}.")
             return
-
-        existing = self.session.exec(
-            select(Order).where(
-                Order.user_id == self.current_user.id,
-                Order.order_number == order_number,
-            )
-        ).first()
-        if existing is not None:
+        state, order = self._previous_record(
+            "Orders", Order, record_key, order_number, record["fingerprint"]
+        )
+        if state == "unchanged":
+            self.counts.orders_unchanged += 1
+            return
+        order_numbers = self._existing_order_numbers()
+        if order is None and order_number in order_numbers:
+            # An order the baker created in BakeMate, not one we imported.
             self.warnings.add(f"Skipped duplicate legacy order_number {order_number}.")
             return
+        order_numbers.add(order_number)
 
-        contact = self._resolve_contact(row)
-        order_dt = coerce_datetime(first_present(row, "OrderDate")) or datetime.now(timezone.utc)
-        due_dt = coerce_datetime(
-            first_present(row, "DueDate", "PickupDate", "DeliveryDate", "EventDate")
-        ) or order_dt
-
-        subtotal = coerce_money(
-            first_present(row, "Subtotal", "SubTotal", "SubTotalAmount", "ProductsTotal")
-        ) or 0.0
-        setup_delivery_amount = coerce_money(first_present(row, "SetupDeliveryAmount")) or 0.0
-        tax = aggregate_tax(row)
-        total_amount = coerce_money(first_present(row, "Total", "TotalAmount", "GrandTotal"))
-        if total_amount is None:
-            total_amount = round(subtotal + setup_delivery_amount + tax, 2)
-        deposit_amount = coerce_money(first_present(row, "DepositAmount", "Deposit"))
-        explicit_amount_paid = coerce_money(first_present(row, "AmountPaid", "PaidAmount", "PaymentsReceived"))
-        amount_paid = explicit_amount_paid or 0.0
-        explicit_balance_due = coerce_money(first_present(row, "BalanceDue", "RemainingBalance"))
-        balance_due = explicit_balance_due
-        if balance_due is None:
-            balance_due = round(total_amount - amount_paid, 2)
-
-        payment_status = infer_payment_status(
-            row=row,
-            total_amount=total_amount,
-            deposit_amount=deposit_amount,
-            amount_paid=amount_paid,
-            balance_due=balance_due,
-            has_explicit_amount_paid=explicit_amount_paid is not None,
-            has_explicit_balance_due=explicit_balance_due is not None,
+        contact = self._resolve_contact(record["contact"])
+        fields = dict(
+            customer_contact_id=contact.id if contact else None,
+            customer_name=compose_contact_name(contact, record["customer_name"]),
+            customer_email=record["customer_email"]
+            or (str(contact.email) if contact and contact.email else None),
+            customer_phone=record["customer_phone"]
+            or (contact.phone if contact else None),
+            **record["order"],
         )
-        status, payment_status = infer_statuses(
-            raw_status=first_present(row, "OrderStatusId"),
-            due_dt=due_dt,
-            total_amount=total_amount,
-            balance_due=balance_due,
-            amount_paid=amount_paid,
-            payment_status=payment_status,
+        if order is None:
+            order = Order(user_id=self.current_user.id, **fields)
+            self.counts.orders_created += 1
+        else:
+            for name, value in fields.items():
+                setattr(order, name, value)
+            self.counts.orders_updated += 1
+        # delete-orphan drops the items an updated order had before.
+        order.items = [
+            OrderItem(
+                user_id=self.current_user.id,
+                name=item["name"],
+                description=item.get("description"),
+                quantity=item["quantity"],
+                unit_price=item["unit_price"],
+                total_price=item["total_price"],
+            )
+            for item in record["items"]
+        ]
+        self.session.add(order)
+        self._remember("Orders", record_key, record["fingerprint"], order.id)
+
+    def _write_expense(self, record: dict[str, Any]) -> None:
+        record_key, _ = self._record_key("Expenses", record["key"])
+        state, expense = self._previous_record(
+            "Expenses", Expense, record_key, record["key"], record["fingerprint"]
         )
+        if state == "unchanged":
+            self.counts.expenses_unchanged += 1
+            return
+        if expense is None:
+            expense = Expense(user_id=self.current_user.id, **record["expense"])
+            self.counts.expenses_created += 1
+        else:
+            for name, value in record["expense"].items():
+                setattr(expense, name, value)
+            self.counts.expenses_updated += 1
+        self.session.add(expense)
+        self._remember("Expenses", record_key, record["fingerprint"], expense.id)
 
-        internal_notes = build_order_internal_notes(
-            row,
-            status_raw=first_present(row, "OrderStatusId"),
-            mapped_status=status,
+    def _write_mileage(self, record: dict[str, Any]) -> None:
+        record_key, _ = self._record_key("Mileage", record["key"])
+        state, log = self._previous_record(
+            "Mileage", MileageLog, record_key, record["key"], record["fingerprint"]
         )
-        notes_to_customer = cleaned_string(first_present(row, "NotesToCustomer"))
-        delivery_method = cleaned_string(first_present(row, "DeliveryMethod"))
-        if not delivery_method:
-            delivery_method = infer_delivery_method(row, setup_delivery_amount=setup_delivery_amount)
+        if state == "unchanged":
+            self.counts.mileage_unchanged += 1
+            return
+        if log is None:
+            log = MileageLog(user_id=self.current_user.id, **record["mileage"])
+            self.counts.mileage_created += 1
+        else:
+            for name, value in record["mileage"].items():
+                setattr(log, name, value)
+            self.counts.mileage_updated += 1
+        self.session.add(log)
+        self._remember("Mileage", record_key, record["fingerprint"], log.id)
 
-        order = Order(
-            user_id=self.current_user.id,
-            customer_contact_id=contact.id if contact else None,
-            customer_name=compose_contact_name(contact, row),
-            customer_email=normalize_email(first_present(row, "ContactEmail", "CustomerEmail")) or (str(contact.email) if contact and contact.email else None),
-            customer_phone=normalize_phone(first_present(row, "ContactPhone", "Number", "Phone")) or (contact.phone if contact else None),
-            order_number=order_number,
-            status=status,
-            payment_status=payment_status,
-            order_date=order_dt,
-            due_date=due_dt,
-            delivery_method=delivery_method,
-            subtotal=subtotal,
-            tax=tax,
-            total_amount=total_amount,
-            deposit_amount=deposit_amount,
-            balance_due=balance_due,
-            deposit_due_date=coerce_date(first_present(row, "DepositDueDate")),
-            balance_due_date=coerce_date(first_present(row, "BalanceDueDate")),
-            notes_to_customer=notes_to_customer,
-            internal_notes=internal_notes,
+
+EMPTY_RECORD = {"kind": "empty"}
+
+
+def normalize_contact_fields(row: dict[str, Any]) -> dict[str, Any]:
+    """The contact a Contacts or Orders row describes, for matching or creating."""
+    email = normalize_email(first_present(row, "EmailAddress", "ContactEmail", "Email"))
+    phone = normalize_phone(first_present(row, "Number", "Phone", "ContactPhone"))
+    contact_name = cleaned_string(first_present(row, "Contact", "FullName", "Name"))
+    first_name = cleaned_string(first_present(row, "FirstName"))
+    last_name = cleaned_string(first_present(row, "LastName"))
+    company_name = cleaned_string(
+        first_present(row, "ContactCompany", "Company", "CompanyName")
+    )
+
+    if not first_name and not last_name and contact_name:
+        first_name, last_name = split_name(contact_name)
+
+    return {
+        "email": email,
+        "phone": phone,
+        "first_name": first_name,
+        "last_name": last_name,
+        "company_name": company_name,
+        "name_key": normalized_name_key(first_name, last_name, company_name),
+        "address": parse_address(first_present(row, "Address", "StreetAddress")),
+        "notes": build_contact_notes(row),
+    }
+
+
+def normalize_contact_row(row: dict[str, Any]) -> dict[str, Any]:
+    if row_is_empty(row):
+        return EMPTY_RECORD
+    return {"kind": "contact", "contact": normalize_contact_fields(row)}
+
+
+def normalize_order_row(row: dict[str, Any]) -> dict[str, Any]:
+    if row_is_empty(row):
+        return EMPTY_RECORD
+    is_quote = coerce_bool(first_present(row, "IsQuote"))
+    if is_quote:
+        return {"kind": "quote"}
+
+    order_number = cleaned_string(first_present(row, "OrderNumber"))
+    if not order_number:
+        return {"kind": "warning", "message": "Skipped order row without OrderNumber."}
+
+    order_dt = coerce_datetime(first_present(row, "OrderDate")) or datetime.now(
+        timezone.utc
+    )
+    due_dt = (
+        coerce_datetime(
+            first_present(row, "DueDate", "PickupDate", "DeliveryDate", "EventDate")
         )
-        self.session.add(order)
-        self.session.flush()
-
-        items = parse_order_items(row, subtotal=subtotal, total_amount=total_amount)
-        for item in items:
-            self.session.add(
-                OrderItem(
-                    user_id=self.current_user.id,
-                    order_id=order.id,
-                    name=item["name"],
-                    description=item.get("description"),
-                    quantity=item["quantity"],
-                    unit_price=item["unit_price"],
-                    total_price=item["total_price"],
-                )
+        or order_dt
+    )
+
+    subtotal = (
+        coerce_money(
+            first_present(
+                row, "Subtotal", "SubTotal", "SubTotalAmount", "ProductsTotal"
             )
+        )
+        or 0.0
+    )
+    setup_delivery_amount = (
+        coerce_money(first_present(row, "SetupDeliveryAmount")) or 0.0
+    )
+    tax = aggregate_tax(row)
+    total_amount = coerce_money(
+        first_present(row, "Total", "TotalAmount", "GrandTotal")
+    )
+    if total_amount is None:
+        total_amount = round(subtotal + setup_delivery_amount + tax, 2)
+    deposit_amount = coerce_money(first_present(row, "DepositAmount", "Deposit"))
+    explicit_amount_paid = coerce_money(
+        first_present(row, "AmountPaid", "PaidAmount", "PaymentsReceived")
+    )
+    amount_paid = explicit_amount_paid or 0.0
+    explicit_balance_due = coerce_money(
+        first_present(row, "BalanceDue", "RemainingBalance")
+    )
+    balance_due = explicit_balance_due
+    if balance_due is None:
+        balance_due = round(total_amount - amount_paid, 2)
+
+    payment_status = infer_payment_status(
+        row=row,
+        total_amount=total_amount,
+        deposit_amount=deposit_amount,
+        amount_paid=amount_paid,
+        balance_due=balance_due,
+        has_explicit_amount_paid=explicit_amount_paid is not None,
+        has_explicit_balance_due=explicit_balance_due is not None,
+    )
+    status, payment_status = infer_statuses(
+        raw_status=first_present(row, "OrderStatusId"),
+        due_dt=due_dt,
+        total_amount=total_amount,
+        balance_due=balance_due,
+        amount_paid=amount_paid,
+        payment_status=payment_status,
+    )
 
-        self.counts.orders_created += 1
+    internal_notes = build_order_internal_notes(
+        row,
+        status_raw=first_present(row, "OrderStatusId"),
+        mapped_status=status,
+    )
+    notes_to_customer = cleaned_string(first_present(row, "NotesToCustomer"))
+    delivery_method = cleaned_string(first_present(row, "DeliveryMethod"))
+    if not delivery_method:
+        delivery_method = infer_delivery_method(
+            row, setup_delivery_amount=setup_delivery_amount
+        )
 
-    def _import_expense(self, row: dict[str, Any]) -> None:
-        description = cleaned_string(first_present(row, "Expense", "Description", "Name"))
-        amount = coerce_money(first_present(row, "Amount", "Cost", "Total"))
-        expense_date = coerce_date(first_present(row, "ExpenseDate", "Date", "TransactionDate"))
-        if not description or amount is None or expense_date is None:
-            self.warnings.add("Skipped expense row missing description, amount, or date.")
-            return
+    return {
+        "kind": "order",
+        "key": order_number,
+        "fingerprint": row_fingerprint(row),
+        "contact": normalize_contact_fields(row),
+        "customer_name": cleaned_string(first_present(row, "Contact", "CustomerName")),
+        "customer_email": normalize_email(
+            first_present(row, "ContactEmail", "CustomerEmail")
+        ),
+        "customer_phone": normalize_phone(
+            first_present(row, "ContactPhone", "Number", "Phone")
+        ),
+        "order": {
+            "order_number": order_number,
+            "status": status,
+            "payment_status": payment_status,
+            "order_date": order_dt,
+            "due_date": due_dt,
+            "delivery_method": delivery_method,
+            "subtotal": subtotal,
+            "tax": tax,
+            "total_amount": total_amount,
+            "deposit_amount": deposit_amount,
+            "balance_due": balance_due,
+            "deposit_due_date": coerce_date(first_present(row, "DepositDueDate")),
+            "balance_due_date": coerce_date(first_present(row, "BalanceDueDate")),
+            "notes_to_customer": notes_to_customer,
+            "internal_notes": internal_notes,
+            "is_imported": True,
+            "legacy_status_raw": cleaned_string(first_present(row, "OrderStatusId")),
+            "import_source": LEGACY_IMPORT_SOURCE,
+        },
+        "items": parse_order_items(row, subtotal=subtotal, total_amount=total_amount),
+    }
 
-        expense = Expense(
-            user_id=self.current_user.id,
-            date=expense_date,
-            description=description,
-            amount=amount,
-            category=map_expense_category(first_present(row, "Category", "ExpenseCategory")),
-            vendor=cleaned_string(first_present(row, "Vendor", "Payee", "Store")),
-            notes=join_note_parts(
+
+def normalize_expense_row(row: dict[str, Any]) -> dict[str, Any]:
+    if row_is_empty(row):
+        return EMPTY_RECORD
+    description = cleaned_string(first_present(row, "Expense", "Description", "Name"))
+    amount = coerce_money(first_present(row, "Amount", "Cost", "Total"))
+    expense_date = coerce_date(
+        first_present(row, "ExpenseDate", "Date", "TransactionDate")
+    )
+    if not description or amount is None or expense_date is None:
+        return {
+            "kind": "warning",
+            "message": "Skipped expense row missing description, amount, or date.",
+        }
+
+    return {
+        "kind": "expense",
+        "key": expense_record_key(
+            cleaned_string(first_present(row, "ExpenseID")),
+            expense_date,
+            description,
+            amount,
+        ),
+        "fingerprint": row_fingerprint(row),
+        "expense": {
+            "date": expense_date,
+            "description": description,
+            "amount": amount,
+            "category": map_expense_category(
+                first_present(row, "Category", "ExpenseCategory")
+            ),
+            "vendor": cleaned_string(first_present(row, "Vendor", "Payee", "Store")),
+            "notes": join_note_parts(
                 cleaned_string(first_present(row, "Notes")),
                 metadata_lines(row, ["ExpenseID", "ReceiptNumber"]),
             ),
-        )
-        self.session.add(expense)
-        self.counts.expenses_created += 1
+        },
+    }
 
-    def _import_mileage(self, row: dict[str, Any]) -> None:
-        mileage_date = coerce_date(first_present(row, "MileageDate", "Date", "TripDate"))
-        distance = coerce_float(first_present(row, "Distance", "Miles", "Mileage"))
-        if mileage_date is None or distance is None:
-            self.warnings.add("Skipped mileage row missing date or distance.")
-            return
 
-        reimbursement_rate = coerce_float(first_present(row, "Rate", "ReimbursementRate"))
-        reimbursement_amount = None
-        if reimbursement_rate is not None:
-            reimbursement_amount = round(distance * reimbursement_rate, 2)
+def normalize_mileage_row(row: dict[str, Any]) -> dict[str, Any]:
+    if row_is_empty(row):
+        return EMPTY_RECORD
+    mileage_date = coerce_date(first_present(row, "MileageDate", "Date", "TripDate"))
+    distance = coerce_float(first_present(row, "Distance", "Miles", "Mileage"))
+    if mileage_date is None or distance is None:
+        return {
+            "kind": "warning",
+            "message": "Skipped mileage row missing date or distance.",
+        }
+
+    reimbursement_rate = coerce_float(first_present(row, "Rate", "ReimbursementRate"))
+    reimbursement_amount = None
+    if reimbursement_rate is not None:
+        reimbursement_amount = round(distance * reimbursement_rate, 2)
 
-        log = MileageLog(
-            user_id=self.current_user.id,
-            date=mileage_date,
-            start_location=cleaned_string(first_present(row, "StartLocation", "From")),
-            end_location=cleaned_string(first_present(row, "EndLocation", "To")),
-            distance=distance,
-            purpose=cleaned_string(first_present(row, "Purpose", "Reason")),
-            vehicle_identifier=cleaned_string(first_present(row, "Vehicle", "VehicleIdentifier")),
-            notes=join_note_parts(
+    start_location = cleaned_string(first_present(row, "StartLocation", "From"))
+    end_location = cleaned_string(first_present(row, "EndLocation", "To"))
+    return {
+        "kind": "mileage",
+        "key": mileage_record_key(
+            cleaned_string(first_present(row, "MileageID")),
+            mileage_date,
+            distance,
+            start_location,
+            end_location,
+        ),
+        "fingerprint": row_fingerprint(row),
+        "mileage": {
+            "date": mileage_date,
+            "start_location": start_location,
+            "end_location": end_location,
+            "distance": distance,
+            "purpose": cleaned_string(first_present(row, "Purpose", "Reason")),
+            "vehicle_identifier": cleaned_string(
+                first_present(row, "Vehicle", "VehicleIdentifier")
+            ),
+            "notes": join_note_parts(
                 cleaned_string(first_present(row, "Notes")),
                 metadata_lines(row, ["MileageID"]),
             ),
-            reimbursement_rate=reimbursement_rate,
-            reimbursement_amount=reimbursement_amount,
-        )
-        self.session.add(log)
-        self.counts.mileage_created += 1
+            "reimbursement_rate": reimbursement_rate,
+            "reimbursement_amount": reimbursement_amount,
+        },
+    }
 
 
-def load_workbook_rows(workbook_path: str | Path) -> dict[str, list[dict[str, Any]]]:
+def row_fingerprint(row: dict[str, Any]) -> str:
+    """SHA-256 of the row's non-blank cells; blank columns added to an export do not change it."""
+    cells = {
+        key: value for key, value in row.items() if cleaned_string(value) is not None
+    }
+    encoded = json.dumps(cells, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def expense_record_key(
+    legacy_id: Optional[str], expense_date: date, description: str, amount: float
+) -> str:
+    """The legacy ExpenseID, or the date, description and amount when the export has none."""
+    if legacy_id:
+        return f"id:{legacy_id}"
+    return f"{expense_date.isoformat()}|{description}|{float(amount):.2f}"
+
+
+def mileage_record_key(
+    legacy_id: Optional[str],
+    mileage_date: date,
+    distance: float,
+    start_location: Optional[str],
+    end_location: Optional[str],
+) -> str:
+    """The legacy MileageID, or the trip's date, distance and endpoints when the export has none."""
+    if legacy_id:
+        return f"id:{legacy_id}"
+    return f"{mileage_date.isoformat()}|{float(distance):g}|{start_location or ''}|{end_location or ''}"
+
+
+ROW_NORMALIZERS: dict[str, Callable[[dict[str, Any]], dict[str, Any]]] = {
+    "Contacts": normalize_contact_row,
+    "Orders": normalize_order_row,
+    "Expenses": normalize_expense_row,
+    "Mileage": normalize_mileage_row,
+}
+
+
+def normalize_rows(sheet: str, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    normalize = ROW_NORMALIZERS[sheet]
+    return [normalize(row) for row in rows]
+
+
+def normalize_rows_in_pool(
+    pool: ProcessPoolExecutor,
+    sheet: str,
+    rows: Iterable[dict[str, Any]],
+    *,
+    window: int,
+    batch_size: int = PARSE_BATCH_SIZE,
+) -> Iterator[dict[str, Any]]:
+    """Yield ``rows`` normalized on ``pool``, in order.
+
+    At most ``window`` batches are in flight, so rows are still read from the
+    workbook only as fast as the writer keeps up.
+    """
+    rows = iter(rows)
+    pending: deque[Future] = deque()
+    while True:
+        while len(pending) < window:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
+            pending.append(pool.submit(normalize_rows, sheet, batch))
+        if not pending:
+            return
+        yield from pending.popleft().result()
+
+
+@contextmanager
+def open_workbook_sheets(
+    workbook_path: str | Path,
+) -> Iterator[dict[str, Iterator[dict[str, Any]]]]:
+    """Open the workbook read-only and yield a lazy row iterator per sheet.
+
+    openpyxl parses each sheet as it is iterated, so only the current row is
+    held in memory. The iterators must be consumed before the block exits,
+    which closes the file.
+    """
     try:
         from openpyxl import load_workbook  # type: ignore
     except ImportError as exc:  # pragma: no cover
-        raise RuntimeError("openpyxl is required to read Marvelous Creations XLSX files.") from exc
-
-    workbook = load_workbook(filename=str(workbook_path), data_only=True)
-    sheets: dict[str, list[dict[str, Any]]] = {}
-    for sheet_name in workbook.sheetnames:
-        sheet = workbook[sheet_name]
-        rows = list(sheet.iter_rows(values_only=True))
-        if not rows:
-            sheets[sheet_name] = []
-            continue
-        headers = [cleaned_string(cell) or "" for cell in rows[0]]
-        sheet_rows: list[dict[str, Any]] = []
-        for raw_row in rows[1:]:
-            row = {headers[index]: value for index, value in enumerate(raw_row) if index < len(headers) and headers[index]}
-            sheet_rows.append(row)
-        sheets[sheet_name] = sheet_rows
-    return sheets
+        raise RuntimeError(
+            "openpyxl is required to read Marvelous Creations XLSX files."
+        ) from exc
+
+    workbook = load_workbook(
+        filename=str(workbook_path), read_only=True, data_only=True
+    )
+    try:
+        yield {
+            sheet_name: iter_sheet_rows(workbook[sheet_name])
+            for sheet_name in workbook.sheetnames
+        }
+    finally:
+        workbook.close()
+
+
+def iter_sheet_rows(sheet: Any) -> Iterator[dict[str, Any]]:
+    """Yield one dict per data row, keyed by the header row's cleaned names."""
+    if hasattr(sheet, "reset_dimensions"):
+        # Exporters often write a wrong <dimension>; read every row instead.
+        sheet.reset_dimensions()
+    rows = sheet.iter_rows(values_only=True)
+    header_row = next(rows, None)
+    if header_row is None:
+        return
+    headers = [cleaned_string(cell) or "" for cell in header_row]
+    for raw_row in rows:
+        yield {
+            headers[index]: value
+            for index, value in enumerate(raw_row)
+            if index < len(headers) and headers[index]
+        }
+
+
+def workbook_digest(workbook_path: str | Path) -> str:
+    digest = hashlib.sha256()
+    with open(workbook_path, "rb") as handle:
+        for block in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_workbook_rows(workbook_path: str | Path) -> dict[str, list[dict[str, Any]]]:
+    """Every sheet's rows as lists; prefer ``open_workbook_sheets`` for large workbooks."""
+    with open_workbook_sheets(workbook_path) as sheets:
+        return {sheet_name: list(rows) for sheet_name, rows in sheets.items()}
 
 
 def row_is_empty(row: dict[str, Any]) -> bool:
@@ -399,7 +985,6 @@ def normalize_legacy_numeric_status(value: Any) -> Optional[str]:
     return text.lower()
 
 
-
 def coerce_bool(value: Any) -> bool:
     if isinstance(value, bool):
         return value
@@ -478,7 +1063,9 @@ def coerce_datetime(value: Any) -> Optional[datetime]:
         except ValueError:
             continue
     try:
-        return datetime.fromisoformat(text.replace("Z", "+00:00")).astimezone(timezone.utc)
+        return datetime.fromisoformat(text.replace("Z", "+00:00")).astimezone(
+            timezone.utc
+        )
     except ValueError:
         return None
 
@@ -519,27 +1106,33 @@ def split_name(value: str | None) -> tuple[Optional[str], Optional[str]]:
     return pieces[0], pieces[1]
 
 
-def normalized_name_key(first_name: Optional[str], last_name: Optional[str], company_name: Optional[str]) -> Optional[str]:
+def normalized_name_key(
+    first_name: Optional[str], last_name: Optional[str], company_name: Optional[str]
+) -> Optional[str]:
     parts = [cleaned_string(part) for part in [first_name, last_name, company_name]]
     joined = "|".join(part.lower() for part in parts if part)
     return joined or None
 
 
-def compose_contact_name(contact: Optional[Contact], row: dict[str, Any]) -> Optional[str]:
+def compose_contact_name(
+    contact: Optional[Contact], row_name: Optional[str]
+) -> Optional[str]:
     if contact:
         parts = [part for part in [contact.first_name, contact.last_name] if part]
         if parts:
             return " ".join(parts)
         if contact.company_name:
             return contact.company_name
-    return cleaned_string(first_present(row, "Contact", "CustomerName"))
+    return row_name
 
 
 def parse_address(value: Any) -> dict[str, Optional[str]]:
     text = cleaned_string(value)
     if not text:
         return {}
-    lines = [part.strip() for part in text.replace("\r", "\n").split("\n") if part.strip()]
+    lines = [
+        part.strip() for part in text.replace("\r", "\n").split("\n") if part.strip()
+    ]
     address_line1 = lines[0] if lines else text
     address_line2 = lines[1] if len(lines) > 2 else None
     city = state_province = postal_code = None
@@ -569,7 +1162,9 @@ def build_contact_notes(row: dict[str, Any]) -> Optional[str]:
     )
 
 
-def build_order_internal_notes(row: dict[str, Any], *, status_raw: Any, mapped_status: OrderStatus | None = None) -> Optional[str]:
+def build_order_internal_notes(
+    row: dict[str, Any], *, status_raw: Any, mapped_status: OrderStatus | None = None
+) -> Optional[str]:
     extra: dict[str, Any] = {"legacy_status_raw": cleaned_string(status_raw)}
     if mapped_status is not None:
         extra["bakemate_status"] = mapped_status.value
@@ -621,7 +1216,9 @@ def join_note_parts(*parts: Optional[str]) -> Optional[str]:
     return "\n\n".join(cleaned) if cleaned else None
 
 
-def infer_delivery_method(row: dict[str, Any], *, setup_delivery_amount: float = 0.0) -> Optional[str]:
+def infer_delivery_method(
+    row: dict[str, Any], *, setup_delivery_amount: float = 0.0
+) -> Optional[str]:
     text = cleaned_string(first_present(row, "Delivery", "PickupOrDelivery"))
     if text:
         lowered = text.lower()
@@ -645,12 +1242,16 @@ def infer_delivery_method(row: dict[str, Any], *, setup_delivery_amount: float =
         filter(
             None,
             [
-                cleaned_string(first_present(row, "DeliveryAddress", "Address", "StreetAddress")),
+                cleaned_string(
+                    first_present(row, "DeliveryAddress", "Address", "StreetAddress")
+                ),
                 cleaned_string(first_present(row, "DeliveryCity", "City")),
             ],
         )
     ).lower()
-    if address_text and any(token in address_text for token in ["deliver", "delivery", "drop off"]):
+    if address_text and any(
+        token in address_text for token in ["deliver", "delivery", "drop off"]
+    ):
         return "delivery"
 
     clue_fields = [
@@ -661,10 +1262,14 @@ def infer_delivery_method(row: dict[str, Any], *, setup_delivery_amount: float =
         "SetupDeliveryNotes",
         "DeliveryInstructions",
     ]
-    clues = " ".join(cleaned_string(row.get(field)) or "" for field in clue_fields).lower()
+    clues = " ".join(
+        cleaned_string(row.get(field)) or "" for field in clue_fields
+    ).lower()
     if any(token in clues for token in ["porch pickup", "pick up", "pickup"]):
         return "pickup"
-    if any(token in clues for token in ["deliver", "delivery", "drop off", "setup on site"]):
+    if any(
+        token in clues for token in ["deliver", "delivery", "drop off", "setup on site"]
+    ):
         return "delivery"
     return None
 
@@ -761,16 +1366,23 @@ def infer_payment_status(
         "PaymentNotes",
         "PaymentStatus",
     ]
-    payment_text = " ".join(cleaned_string(row.get(field)) or "" for field in note_fields).lower()
-    if any(token in payment_text for token in ["paid in full", "pif", "payment complete", "fully paid"]):
+    payment_text = " ".join(
+        cleaned_string(row.get(field)) or "" for field in note_fields
+    ).lower()
+    if any(
+        token in payment_text
+        for token in ["paid in full", "pif", "payment complete", "fully paid"]
+    ):
         return PaymentStatus.PAID_IN_FULL
-    if any(token in payment_text for token in ["deposit paid", "retainer paid", "partial payment received"]):
+    if any(
+        token in payment_text
+        for token in ["deposit paid", "retainer paid", "partial payment received"]
+    ):
         return PaymentStatus.DEPOSIT_PAID
 
     return PaymentStatus.UNPAID
 
 
-
 def infer_statuses(
     *,
     raw_status: Any,
@@ -807,7 +1419,9 @@ def infer_statuses(
             if token in lowered:
                 return status, payment_status
 
-        numeric_status = LEGACY_NUMERIC_ORDER_STATUSES.get(normalized_numeric_status or lowered)
+        numeric_status = LEGACY_NUMERIC_ORDER_STATUSES.get(
+            normalized_numeric_status or lowered
+        )
         if numeric_status is not None:
             status = numeric_status
             historical_status = infer_historical_status_for_ambiguous_legacy_row(
@@ -867,13 +1481,18 @@ def infer_historical_status_for_ambiguous_legacy_row(
     ):
         return OrderStatus.COMPLETED
 
-    if payment_status == PaymentStatus.DEPOSIT_PAID and age_days >= LEGACY_HISTORICAL_STATUS_AGE_DAYS:
+    if (
+        payment_status == PaymentStatus.DEPOSIT_PAID
+        and age_days >= LEGACY_HISTORICAL_STATUS_AGE_DAYS
+    ):
         return OrderStatus.IN_PROGRESS
 
     return None
 
 
-def parse_order_items(row: dict[str, Any], *, subtotal: float, total_amount: float) -> list[dict[str, Any]]:
+def parse_order_items(
+    row: dict[str, Any], *, subtotal: float, total_amount: float
+) -> list[dict[str, Any]]:
     product_items = parse_jsonish(first_present(row, "ProductItems"))
     product_recipes = parse_jsonish(first_present(row, "ProductRecipes"))
     normalized_items: list[dict[str, Any]] = []
@@ -886,7 +1505,9 @@ def parse_order_items(row: dict[str, Any], *, subtotal: float, total_amount: flo
                     normalized_items.append(normalized)
 
     if not normalized_items:
-        fallback_name = cleaned_string(first_present(row, "EventType")) or "Imported order"
+        fallback_name = (
+            cleaned_string(first_present(row, "EventType")) or "Imported order"
+        )
         return [
             {
                 "name": fallback_name,
@@ -897,7 +1518,9 @@ def parse_order_items(row: dict[str, Any], *, subtotal: float, total_amount: flo
             }
         ]
 
-    total_known = sum(item["total_price"] for item in normalized_items if item["total_price"] > 0)
+    total_known = sum(
+        item["total_price"] for item in normalized_items if item["total_price"] > 0
+    )
     target_total = subtotal if subtotal > 0 else total_amount
     if target_total > 0 and total_known <= 0:
         per_item = round(target_total / len(normalized_items), 2)
@@ -932,9 +1555,17 @@ def parse_jsonish(value: Any) -> Any:
         except Exception:
             continue
     if "|" in text:
-        return [{"name": part.strip(), "quantity": 1} for part in text.split("|") if part.strip()]
+        return [
+            {"name": part.strip(), "quantity": 1}
+            for part in text.split("|")
+            if part.strip()
+        ]
     if "," in text:
-        return [{"name": part.strip(), "quantity": 1} for part in text.split(",") if part.strip()]
+        return [
+            {"name": part.strip(), "quantity": 1}
+            for part in text.split(",")
+            if part.strip()
+        ]
     return [{"name": text, "quantity": 1}]
 
 
@@ -942,11 +1573,16 @@ def looks_generic_item_name(value: Optional[str], *, default_kind: str) -> bool:
     text = (cleaned_string(value) or "").strip().lower()
     if not text:
         return True
-    return text in GENERIC_ITEM_NAMES or text == default_kind.lower() or text == default_kind.title().lower()
-
+    return (
+        text in GENERIC_ITEM_NAMES
+        or text == default_kind.lower()
+        or text == default_kind.title().lower()
+    )
 
 
-def choose_best_item_name(entry: dict[str, Any], *, default_kind: str, description: Optional[str]) -> str:
+def choose_best_item_name(
+    entry: dict[str, Any], *, default_kind: str, description: Optional[str]
+) -> str:
     primary_candidates = [
         entry.get("name"),
         entry.get("Name"),
@@ -986,7 +1622,6 @@ def choose_best_item_name(entry: dict[str, Any], *, default_kind: str, descripti
     return default_kind.title()
 
 
-
 def normalize_item_entry(entry: Any, *, default_kind: str) -> Optional[dict[str, Any]]:
     if isinstance(entry, str):
         return {
@@ -999,19 +1634,30 @@ def normalize_item_entry(entry: Any, *, default_kind: str) -> Optional[dict[str,
     if not isinstance(entry, dict):
         return None
     description = cleaned_string(
-        entry.get("description") or entry.get("Description") or entry.get("Details") or entry.get("ProductDescription")
+        entry.get("description")
+        or entry.get("Description")
+        or entry.get("Details")
+        or entry.get("ProductDescription")
+    )
+    name = choose_best_item_name(
+        entry, default_kind=default_kind, description=description
     )
-    name = choose_best_item_name(entry, default_kind=default_kind, description=description)
     quantity = int(
-        coerce_float(entry.get("quantity") or entry.get("Quantity") or entry.get("Qty") or 1) or 1
+        coerce_float(
+            entry.get("quantity") or entry.get("Quantity") or entry.get("Qty") or 1
+        )
+        or 1
+    )
+    unit_price = (
+        coerce_money(
+            entry.get("unit_price")
+            or entry.get("unitPrice")
+            or entry.get("price")
+            or entry.get("Price")
+            or entry.get("SellingPrice")
+        )
+        or 0.0
     )
-    unit_price = coerce_money(
-        entry.get("unit_price")
-        or entry.get("unitPrice")
-        or entry.get("price")
-        or entry.get("Price")
-        or entry.get("SellingPrice")
-    ) or 0.0
     total_price = coerce_money(
         entry.get("total_price")
         or entry.get("totalPrice")
@@ -6,13 +6,14 @@ from sqlmodel import Session, select
 
 from app.models.mileage import MileageLog, MileageLogCreate, MileageLogUpdate
 from app.models.user import User
+from app.repositories.cursor import CursorPage
 from app.repositories.sqlite_adapter import SQLiteRepository
 from app.core.config import settings  # For default reimbursement rate
 
 
 class MileageService:
     def __init__(self, session: Session):
-        self.mileage_repo = SQLiteRepository(model=MileageLog)  # type: ignore
+        self.mileage_repo = SQLiteRepository(model=MileageLog, session=session)  # type: ignore
         self.session = session
 
     async def _calculate_reimbursement(
@@ -28,7 +29,9 @@ class MileageService:
                 settings.__class__, "DEFAULT_MILEAGE_REIMBURSEMENT_RATE", None
             )
             if effective_rate is None:
-                effective_rate = getattr(settings, "DEFAULT_MILEAGE_REIMBURSEMENT_RATE", None)
+                effective_rate = getattr(
+                    settings, "DEFAULT_MILEAGE_REIMBURSEMENT_RATE", None
+                )
 
         if effective_rate is not None:
             return round(distance * float(effective_rate), 2)
@@ -74,6 +77,34 @@ class MileageService:
         skip: int = 0,
         limit: int = 100
     ) -> List[MileageLog]:
+        filters = self._list_filters(current_user, start_date, end_date, purpose)
+        logs = await self.mileage_repo.get_multi(
+            filters=filters, skip=skip, limit=limit, sort_by="date", sort_desc=True
+        )
+        return logs
+
+    async def get_mileage_log_page_by_user(
+        self,
+        *,
+        current_user: User,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        purpose: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: int = 100
+    ) -> CursorPage[MileageLog]:
+        filters = self._list_filters(current_user, start_date, end_date, purpose)
+        return await self.mileage_repo.get_page(
+            filters=filters, cursor=cursor, limit=limit, sort_by="date", sort_desc=True
+        )
+
+    @staticmethod
+    def _list_filters(
+        current_user: User,
+        start_date: Optional[date],
+        end_date: Optional[date],
+        purpose: Optional[str],
+    ) -> Dict[str, Any]:
         filters: Dict[str, Any] = {"user_id": current_user.id}
         if start_date:
             filters["date__gte"] = start_date
@@ -83,11 +114,7 @@ class MileageService:
             # This would require a more flexible filter (e.g., purpose__icontains=purpose)
             # For exact match:
             filters["purpose"] = purpose
-
-        logs = await self.mileage_repo.get_multi(
-            filters=filters, skip=skip, limit=limit, sort_by="date", sort_desc=True
-        )
-        return logs
+        return filters
 
     async def update_mileage_log(
         self, *, log_id: UUID, log_in: MileageLogUpdate, current_user: User
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import case, false, func, literal, or_
+from sqlalchemy.sql.elements import ColumnElement
+from sqlmodel import select
+from sqlmodel.sql.expression import SelectOfScalar
+
+from app.models.order import (
+    ImportedOrderReviewReason,
+    Order,
+    OrderDayRunningTriageFilter,
+    OrderStatus,
+    extract_legacy_metadata,
+)
+from app.models.order_search import MIN_INDEXED_SEARCH_LENGTH, order_search_predicate
+from app.repositories.cursor import (
+    KeysetColumn,
+    decode_cursor,
+    encode_keyset_cursor,
+    keyset_predicate,
+)
+
+
+DAY_RUNNING_READINESS_LABELS = {
+    OrderDayRunningTriageFilter.BLOCKED: "Blocked for today",
+    OrderDayRunningTriageFilter.NEEDS_ATTENTION: "Needs attention today",
+    OrderDayRunningTriageFilter.READY: "Ready for today",
+}
+
+URGENCY_RANKS = {
+    "Urgent": 0,
+    "Today": 1,
+    "Next up": 2,
+    "Watch": 3,
+}
+
+TERMINAL_ORDER_STATUSES = [OrderStatus.COMPLETED, OrderStatus.CANCELLED]
+
+
+@dataclass(frozen=True)
+class OrderListFilters:
+    status: Optional[OrderStatus] = None
+    open_only: bool = False
+    imported_only: bool = False
+    search: Optional[str] = None
+    needs_review: Optional[bool] = None
+    review_reason: Optional[ImportedOrderReviewReason] = None
+    day_running: Optional[OrderDayRunningTriageFilter] = None
+    action_class: Optional[str] = None
+    urgency: Optional[str] = None
+
+
+@dataclass
+class OrderQueryPlan:
+    """SQL statement for an order list; every filter is applied in SQL."""
+
+    statement: SelectOfScalar[Order]
+    ordering: str = "default"
+    keyset: list[KeysetColumn] = field(default_factory=list)
+
+    def paginated(self, *, skip: int, limit: int) -> SelectOfScalar[Order]:
+        return self.statement.offset(skip).limit(limit)
+
+    def after_cursor(self, cursor: Optional[str]) -> SelectOfScalar[Order]:
+        """The plan's statement resumed after the row ``cursor`` points at."""
+        if not cursor:
+            return self.statement
+        values = decode_cursor(
+            cursor, ordering=f"orders:{self.ordering}", key_count=len(self.keyset)
+        )
+        return self.statement.where(keyset_predicate(self.keyset, values))
+
+    def cursor_for(self, order: Order) -> str:
+        return encode_keyset_cursor(f"orders:{self.ordering}", self.keyset, order)
+
+
+class OrderQueryPlanner:
+    """Translate order list filters into SQL predicates and ordering.
+
+    Triage filters and the imported ordering read the persisted ``triage_*``
+    columns, so callers refresh stale triage rows before running a plan.
+    With ``search_index`` set, searches of three or more characters go through
+    the ``order_search`` FTS5 index instead of scanning with ILIKE.
+    """
+
+    def __init__(self, *, user_id: UUID, search_index: bool = False):
+        self.user_id = user_id
+        self.search_index = search_index
+
+    def plan(self, filters: OrderListFilters) -> OrderQueryPlan:
+        statement = select(Order).where(Order.user_id == self.user_id)
+
+        if filters.status is not None:
+            statement = statement.where(Order.status == filters.status)
+        if filters.open_only:
+            statement = statement.where(Order.status.notin_(TERMINAL_ORDER_STATUSES))
+
+        search_text = filters.search.strip() if filters.search else None
+        if search_text:
+            statement = statement.where(self.search_predicate(search_text))
+
+        if filters.imported_only or filters.review_reason is not None:
+            statement = statement.where(Order.is_imported.is_(True))
+
+        if filters.needs_review is not None:
+            statement = statement.where(
+                Order.triage_needs_review == filters.needs_review
+            )
+
+        if filters.review_reason is not None:
+            # Whole comma-separated entries only, with LIKE wildcards escaped.
+            reasons = literal(",") + Order.triage_review_reasons + literal(",")
+            statement = statement.where(
+                reasons.contains(f",{filters.review_reason.value},", autoescape=True)
+            )
+
+        if filters.action_class is not None:
+            statement = statement.where(
+                Order.triage_action_class == filters.action_class
+            )
+
+        if filters.urgency is not None:
+            urgency_rank = URGENCY_RANKS.get(filters.urgency)
+            statement = statement.where(
+                Order.triage_urgency_rank == urgency_rank
+                if urgency_rank is not None
+                else false()
+            )
+
+        if filters.day_running is not None:
+            statement = statement.where(
+                Order.triage_readiness_label
+                == DAY_RUNNING_READINESS_LABELS[filters.day_running]
+            )
+
+        ordering = "imported" if filters.imported_only else "default"
+        keyset = self.imported_keyset if filters.imported_only else self.default_keyset
+        statement = statement.order_by(*(key.order_by for key in keyset))
+
+        return OrderQueryPlan(
+            statement=statement,
+            ordering=ordering,
+            keyset=keyset,
+        )
+
+    # --- Ordering --- #
+    #
+    # Orderings are kept as keysets so cursor pagination can resume after the
+    # last row of a page. Computed keys carry a ``value`` that derives the same
+    # rank from a loaded ``Order``; the triage ranks are always populated once
+    # triage has been refreshed.
+
+    @property
+    def active_ordering(self) -> ColumnElement[int]:
+        return case((Order.status.in_(TERMINAL_ORDER_STATUSES), 1), else_=0)
+
+    @property
+    def default_keyset(self) -> list[KeysetColumn]:
+        return [
+            KeysetColumn(
+                self.active_ordering,
+                value=lambda order: int(order.status in TERMINAL_ORDER_STATUSES),
+            ),
+            KeysetColumn(Order.due_date),
+            KeysetColumn(Order.created_at),
+            KeysetColumn(Order.id),
+        ]
+
+    @property
+    def imported_keyset(self) -> list[KeysetColumn]:
+        needs_review_rank = case(
+            (func.coalesce(Order.triage_review_reasons, "") != "", 0),
+            else_=1,
+        )
+        return [
+            KeysetColumn(
+                needs_review_rank,
+                value=lambda order: 0 if order.triage_review_reasons else 1,
+            ),
+            KeysetColumn(Order.triage_import_priority_rank),
+            KeysetColumn(Order.triage_urgency_rank),
+            KeysetColumn(Order.due_date),
+            KeysetColumn(Order.order_date, descending=True),
+            *self.default_keyset,
+        ]
+
+    @property
+    def default_ordering(self) -> list:
+        return [key.order_by for key in self.default_keyset]
+
+    @property
+    def imported_ordering(self) -> list:
+        return [key.order_by for key in self.imported_keyset]
+
+    # --- Search --- #
+
+    def search_predicate(self, search_text: str) -> ColumnElement[bool]:
+        if self.search_index and len(search_text) >= MIN_INDEXED_SEARCH_LENGTH:
+            return order_search_predicate(search_text)
+        search_pattern = f"%{search_text}%"
+        return or_(
+            Order.order_number.ilike(search_pattern),
+            Order.customer_name.ilike(search_pattern),
+            Order.customer_email.ilike(search_pattern),
+            Order.customer_phone.ilike(search_pattern),
+            Order.delivery_method.ilike(search_pattern),
+            Order.notes_to_customer.ilike(search_pattern),
+            Order.internal_notes.ilike(search_pattern),
+        )
+
+
+__all__ = [
+    "DAY_RUNNING_READINESS_LABELS",
+    "OrderListFilters",
+    "OrderQueryPlan",
+    "OrderQueryPlanner",
+    "URGENCY_RANKS",
+    "extract_legacy_metadata",
+]
@@ -1,18 +1,24 @@
 from __future__ import annotations
 
-from collections import defaultdict
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
 from datetime import date, datetime, timezone
+from functools import cached_property
 from io import BytesIO
-from typing import Iterable, Optional
+from typing import Collection, Iterable, Optional
 from uuid import UUID, uuid4
 from zoneinfo import ZoneInfo
 
 from fastapi import HTTPException, status
-from sqlalchemy import case, or_
+from sqlalchemy import and_, func, inspect as sa_inspect, or_
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlmodel import Session, select
 
+from app.core.metrics import instrument_builders
 from app.models.contact import Contact, ContactType
 from app.models.order import (
+    CustomerHistoryRollup,
     DayRunningQueueSummary,
     ImportedOrderQueueSummary,
     ImportedOrderReviewReason,
@@ -28,6 +34,7 @@ from app.models.order import (
     OrderInvoiceFocusSummary,
     OrderInvoiceSummary,
     OrderItem,
+    OrderListView,
     OrderOpsSummary,
     OrderPaymentFocusSummary,
     OrderPaymentSummary,
@@ -36,6 +43,7 @@ from app.models.order import (
     OrderQueueSummary,
     OrderRead,
     OrderRiskSummary,
+    OrderSearchSuggestion,
     OrderStatus,
     OrderUpdate,
     PaymentStatus,
@@ -45,8 +53,31 @@ from app.models.order import (
     QuoteRead,
     QuoteStatus,
     QuoteUpdate,
+    order_history_key,
+    write_order_triage,
+    ORDER_LIST_VIEW_FIELDS,
+)
+from app.models.order_search import (
+    MIN_INDEXED_SEARCH_LENGTH,
+    ORDER_TYPEAHEAD_COLUMNS,
+    order_search_index_available,
+    order_search_predicate,
 )
 from app.models.user import User
+from app.repositories.cursor import (
+    CursorPage,
+    KeysetColumn,
+    decode_cursor,
+    encode_keyset_cursor,
+    keyset_predicate,
+)
+from app.services.order_query_planner import (
+    DAY_RUNNING_READINESS_LABELS,
+    OrderListFilters,
+    OrderQueryPlan,
+    OrderQueryPlanner,
+    TERMINAL_ORDER_STATUSES,
+)
 from app.services.order_service_functions import (
     apply_discount,
     calculate_delivery_fee,
@@ -61,6 +92,25 @@ from app.services.order_service_functions import (
 )
 
 
+def resolve_order_list_fields(
+    view: OrderListView = OrderListView.FULL, fields: Optional[str] = None
+) -> Optional[frozenset[str]]:
+    """Turn the order list ``view`` and comma-separated ``fields`` into a projection.
+
+    ``fields`` takes precedence over ``view`` and always includes ``id``. Returns
+    None when the full ``OrderRead`` is wanted.
+    """
+    if fields:
+        requested = {field.strip() for field in fields.split(",") if field.strip()}
+        unknown = requested.difference(ORDER_READ_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown order fields: {', '.join(sorted(unknown))}")
+        return frozenset(requested | {"id"})
+    if view == OrderListView.FULL:
+        return None
+    return ORDER_LIST_VIEW_FIELDS[view]
+
+
 def _utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
@@ -81,8 +131,16 @@ def _split_name(full_name: Optional[str]) -> tuple[Optional[str], Optional[str]]
     return parts[0], parts[1]
 
 
-def _date_in_user_timezone(value: datetime) -> date:
-    return _as_bakery_datetime(value).date()
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _starts_word(value: Optional[str], prefix: str) -> bool:
+    if not value:
+        return False
+    text = value.lower()
+    prefix = prefix.lower()
+    return text.startswith(prefix) or f" {prefix}" in text
 
 
 def _humanize_reason(reason: str) -> str:
@@ -114,13 +172,6 @@ def _import_review_next_check(reason: ImportedOrderReviewReason) -> str:
     return guidance[reason]
 
 
-DAY_RUNNING_READINESS_LABELS = {
-    OrderDayRunningTriageFilter.BLOCKED: "Blocked for today",
-    OrderDayRunningTriageFilter.NEEDS_ATTENTION: "Needs attention today",
-    OrderDayRunningTriageFilter.READY: "Ready for today",
-}
-
-
 IMPORT_REVIEW_REASON_PRIORITY = {
     ImportedOrderReviewReason.OVERDUE_PAYMENT_RISK: 0,
     ImportedOrderReviewReason.INVOICE_MISSING_FIELDS: 1,
@@ -136,14 +187,47 @@ IMPORT_PRIORITY_LABELS = {
 }
 
 RECENT_CUSTOMER_HISTORY_LIMIT = 4
+ORDER_READ_BATCH_SIZE = 200
+ORDER_READ_FIELDS = tuple(OrderRead.model_fields)
 BAKERY_TIMEZONE = ZoneInfo("America/New_York")
 BAKERY_TIMEZONE_LABEL = "ET"
 
 
-def _as_bakery_datetime(value: datetime) -> datetime:
-    if value.tzinfo is None:
-        value = value.replace(tzinfo=timezone.utc)
-    return value.astimezone(BAKERY_TIMEZONE)
+@dataclass(frozen=True)
+class OrderClock:
+    """The instant and bakery timezone one order read is evaluated at.
+
+    Capture it once per request and pass it through the summary builders so
+    every order in a list agrees on "today", even across midnight, and each
+    timestamp is converted to bakery time once however many builders show it.
+    """
+
+    now: datetime
+    tz: ZoneInfo = BAKERY_TIMEZONE
+    _local: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    @classmethod
+    def capture(cls, tz: ZoneInfo = BAKERY_TIMEZONE) -> "OrderClock":
+        return cls(now=_utcnow(), tz=tz)
+
+    @cached_property
+    def today(self) -> date:
+        # Bakery-local, like due dates and the midnight triage rollover.
+        return self.local(self.now).date()
+
+    def local(self, value: datetime) -> datetime:
+        local_value = self._local.get(value)
+        if local_value is None:
+            aware = (
+                value
+                if value.tzinfo is not None
+                else value.replace(tzinfo=timezone.utc)
+            )
+            local_value = self._local[value] = aware.astimezone(self.tz)
+        return local_value
+
+    def local_date(self, value: datetime) -> date:
+        return self.local(value).date()
 
 
 def _format_bakery_date(value: date) -> str:
@@ -154,8 +238,8 @@ def _format_bakery_date_only(value: date) -> str:
     return value.strftime("%b") + f" {value.day}, {value.year}"
 
 
-def _format_datetime_label(value: datetime) -> str:
-    local_value = _as_bakery_datetime(value)
+def _format_datetime_label(value: datetime, clock: OrderClock) -> str:
+    local_value = clock.local(value)
     return (
         local_value.strftime("%a %b")
         + f" {local_value.day} at {local_value.strftime('%I:%M %p').lstrip('0')} {BAKERY_TIMEZONE_LABEL}"
@@ -172,7 +256,8 @@ def _compact_contact_address(contact: Optional[Contact]) -> Optional[str]:
     parts = [
         contact.address_line1,
         contact.address_line2,
-        ", ".join(part for part in [contact.city, contact.state_province] if part) or None,
+        ", ".join(part for part in [contact.city, contact.state_province] if part)
+        or None,
         contact.postal_code,
     ]
     address = ", ".join(part for part in parts if part)
@@ -185,7 +270,9 @@ class OrderService:
     def __init__(self, session: Optional[Session] = None):
         self.session = session
 
-    async def create_order(self, *, order_in: OrderCreate, current_user: User) -> OrderRead:
+    async def create_order(
+        self, *, order_in: OrderCreate, current_user: User
+    ) -> OrderRead:
         contact = self._resolve_or_create_contact(
             current_user=current_user,
             customer_contact_id=order_in.customer_contact_id,
@@ -200,8 +287,10 @@ class OrderService:
             user_id=current_user.id,
             customer_contact_id=contact.id if contact else None,
             customer_name=customer_name,
-            customer_email=order_in.customer_email or (contact.email if contact else None),
-            customer_phone=order_in.customer_phone or (contact.phone if contact else None),
+            customer_email=order_in.customer_email
+            or (contact.email if contact else None),
+            customer_phone=order_in.customer_phone
+            or (contact.phone if contact else None),
             order_number=self._generate_order_number(),
             status=order_in.status or OrderStatus.INQUIRY,
             payment_status=PaymentStatus.UNPAID,
@@ -217,7 +306,7 @@ class OrderService:
         self._recalculate_order_financials(order)
         self.session.add(order)
         self.session.commit()
-        self.session.refresh(order)
+        self._store_order_triage(order)
         return self._build_order_reads([order])[0]
 
     async def get_orders_by_user(
@@ -227,6 +316,7 @@ class OrderService:
         skip: int = 0,
         limit: int = 100,
         status: Optional[OrderStatus] = None,
+        open_only: bool = False,
         imported_only: bool = False,
         search: Optional[str] = None,
         needs_review: Optional[bool] = None,
@@ -234,73 +324,81 @@ class OrderService:
         day_running: Optional[OrderDayRunningTriageFilter] = None,
         action_class: Optional[str] = None,
         urgency: Optional[str] = None,
+        fields: Optional[Collection[str]] = None,
+        clock: Optional[OrderClock] = None,
     ) -> list[OrderRead]:
-        statement = select(Order).where(Order.user_id == current_user.id)
-        if status is not None:
-            statement = statement.where(Order.status == status)
-        search_text = search.strip() if search else None
-        if search_text:
-            search_pattern = f"%{search_text}%"
-            statement = statement.where(
-                or_(
-                    Order.order_number.ilike(search_pattern),
-                    Order.customer_name.ilike(search_pattern),
-                    Order.customer_email.ilike(search_pattern),
-                    Order.customer_phone.ilike(search_pattern),
-                    Order.delivery_method.ilike(search_pattern),
-                    Order.notes_to_customer.ilike(search_pattern),
-                    Order.internal_notes.ilike(search_pattern),
-                )
-            )
-        active_ordering = case(
-            (Order.status.in_([OrderStatus.COMPLETED, OrderStatus.CANCELLED]), 1),
-            else_=0,
+        clock = clock or OrderClock.capture()
+        plan = self._plan_order_list(
+            current_user=current_user,
+            clock=clock,
+            filters=OrderListFilters(
+                status=status,
+                open_only=open_only,
+                imported_only=imported_only,
+                search=search,
+                needs_review=needs_review,
+                review_reason=review_reason,
+                day_running=day_running,
+                action_class=action_class,
+                urgency=urgency,
+            ),
         )
-        statement = statement.order_by(
-            active_ordering,
-            Order.due_date.asc(),
-            Order.created_at.asc(),
+        orders = self.session.exec(plan.paginated(skip=skip, limit=limit)).all()
+        return self._build_order_reads(orders, fields=fields, clock=clock)
+
+    async def get_order_page_by_user(
+        self,
+        *,
+        current_user: User,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        status: Optional[OrderStatus] = None,
+        open_only: bool = False,
+        imported_only: bool = False,
+        search: Optional[str] = None,
+        needs_review: Optional[bool] = None,
+        review_reason: Optional[ImportedOrderReviewReason] = None,
+        day_running: Optional[OrderDayRunningTriageFilter] = None,
+        action_class: Optional[str] = None,
+        urgency: Optional[str] = None,
+        fields: Optional[Collection[str]] = None,
+        clock: Optional[OrderClock] = None,
+    ) -> CursorPage[OrderRead]:
+        """Keyset-paginated ``get_orders_by_user``.
+
+        Pages resume after the last row of the previous page, so deep pages
+        cost the same as the first and rows added earlier in the ordering do
+        not shift the rows a client has yet to see.
+        """
+        clock = clock or OrderClock.capture()
+        plan = self._plan_order_list(
+            current_user=current_user,
+            clock=clock,
+            filters=OrderListFilters(
+                status=status,
+                open_only=open_only,
+                imported_only=imported_only,
+                search=search,
+                needs_review=needs_review,
+                review_reason=review_reason,
+                day_running=day_running,
+                action_class=action_class,
+                urgency=urgency,
+            ),
+        )
+        # One extra row tells us whether another page follows.
+        orders = list(
+            self.session.exec(plan.after_cursor(cursor).limit(limit + 1)).all()
+        )
+
+        next_cursor = None
+        if len(orders) > limit:
+            orders = orders[:limit]
+            next_cursor = plan.cursor_for(orders[-1])
+        return CursorPage(
+            items=self._build_order_reads(orders, fields=fields, clock=clock),
+            next_cursor=next_cursor,
         )
-        orders = self.session.exec(statement).all()
-        order_reads = self._build_order_reads(orders)
-        if imported_only:
-            order_reads = [
-                order_read for order_read in order_reads if order_read.is_imported
-            ]
-        if needs_review is not None:
-            order_reads = [
-                order_read
-                for order_read in order_reads
-                if self._order_needs_review(order_read) is needs_review
-            ]
-        if review_reason is not None:
-            order_reads = [
-                order_read
-                for order_read in order_reads
-                if review_reason in order_read.review_reasons
-            ]
-        if day_running is not None:
-            readiness_label = DAY_RUNNING_READINESS_LABELS[day_running]
-            order_reads = [
-                order_read
-                for order_read in order_reads
-                if order_read.day_running_focus_summary.readiness_label == readiness_label
-            ]
-        if action_class is not None:
-            order_reads = [
-                order_read
-                for order_read in order_reads
-                if order_read.ops_summary.action_class == action_class
-            ]
-        if urgency is not None:
-            order_reads = [
-                order_read
-                for order_read in order_reads
-                if order_read.queue_summary.urgency_label == urgency
-            ]
-        if imported_only:
-            order_reads = self._sort_imported_order_reads(order_reads)
-        return order_reads[skip : skip + limit]
 
     async def get_day_running_queue_summary(
         self,
@@ -314,60 +412,53 @@ class OrderService:
         action_class: Optional[str] = None,
         urgency: Optional[str] = None,
     ) -> DayRunningQueueSummary:
-        scoped_orders = await self.get_orders_by_user(
+        plan = self._plan_order_list(
             current_user=current_user,
-            status=status,
-            imported_only=imported_only,
-            search=search,
-            needs_review=needs_review,
-            review_reason=review_reason,
-            action_class=action_class,
-            urgency=urgency,
-            limit=100_000,
-        )
-
-        counts = {
-            "Blocked for today": 0,
-            "Needs attention today": 0,
-            "Ready for today": 0,
-        }
-        for order in scoped_orders:
-            readiness_label = order.day_running_focus_summary.readiness_label
-            if readiness_label in counts:
-                counts[readiness_label] += 1
+            filters=OrderListFilters(
+                status=status,
+                imported_only=imported_only,
+                search=search,
+                needs_review=needs_review,
+                review_reason=review_reason,
+                action_class=action_class,
+                urgency=urgency,
+            ),
+        )
+
+        counts = self._count_scoped_orders_by(plan, Order.triage_readiness_label)
 
         return DayRunningQueueSummary(
-            all_count=len(scoped_orders),
+            all_count=sum(counts.values()),
             blocked_count=counts["Blocked for today"],
             needs_attention_count=counts["Needs attention today"],
             ready_count=counts["Ready for today"],
         )
 
-
     async def get_imported_order_queue_summary(
         self,
         *,
         current_user: User,
         search: Optional[str] = None,
     ) -> ImportedOrderQueueSummary:
-        imported_orders = await self.get_orders_by_user(
+        plan = self._plan_order_list(
             current_user=current_user,
-            imported_only=True,
-            search=search,
-            limit=100_000,
+            filters=OrderListFilters(imported_only=True, search=search),
         )
-        review_reason_counts = {
-            reason: 0 for reason in ImportedOrderReviewReason
-        }
+        review_reason_counts = {reason: 0 for reason in ImportedOrderReviewReason}
+        all_imported_count = 0
         needs_review_count = 0
 
-        for order in imported_orders:
-            if order.review_reasons:
-                needs_review_count += 1
-            for reason in order.review_reasons:
-                review_reason_counts[reason] += 1
+        reason_set_counts = self._count_scoped_orders_by(
+            plan, Order.triage_review_reasons
+        )
+        for reason_values, count in reason_set_counts.items():
+            all_imported_count += count
+            if not reason_values:
+                continue
+            needs_review_count += count
+            for reason_value in reason_values.split(","):
+                review_reason_counts[ImportedOrderReviewReason(reason_value)] += count
 
-        all_imported_count = len(imported_orders)
         return ImportedOrderQueueSummary(
             all_imported_count=all_imported_count,
             needs_review_count=needs_review_count,
@@ -375,6 +466,69 @@ class OrderService:
             review_reason_counts=review_reason_counts,
         )
 
+    async def search_order_suggestions(
+        self,
+        *,
+        current_user: User,
+        prefix: str,
+        limit: int = 8,
+    ) -> list[OrderSearchSuggestion]:
+        prefix_text = prefix.strip()
+        if not prefix_text:
+            return []
+
+        # Match the start of any word, so "riv" finds "Jamie Rivera".
+        escaped = _escape_like(prefix_text.lower())
+        word_start_matches = []
+        for field in ORDER_TYPEAHEAD_COLUMNS:
+            column = func.lower(getattr(Order, field))
+            word_start_matches.append(column.like(f"{escaped}%", escape="\\"))
+            word_start_matches.append(column.like(f"% {escaped}%", escape="\\"))
+
+        statement = select(
+            Order.id,
+            Order.order_number,
+            Order.customer_name,
+            Order.customer_email,
+            Order.customer_phone,
+            Order.due_date,
+            Order.status,
+        ).where(Order.user_id == current_user.id, or_(*word_start_matches))
+        if len(
+            prefix_text
+        ) >= MIN_INDEXED_SEARCH_LENGTH and order_search_index_available(
+            self.session.connection()
+        ):
+            statement = statement.where(
+                order_search_predicate(prefix_text, ORDER_TYPEAHEAD_COLUMNS)
+            )
+        planner = OrderQueryPlanner(user_id=current_user.id)
+        statement = statement.order_by(*planner.default_ordering).limit(limit)
+
+        suggestions = []
+        for row in self.session.exec(statement).all():
+            matched_field = next(
+                (
+                    field
+                    for field in ORDER_TYPEAHEAD_COLUMNS
+                    if _starts_word(getattr(row, field), prefix_text)
+                ),
+                ORDER_TYPEAHEAD_COLUMNS[0],
+            )
+            suggestions.append(
+                OrderSearchSuggestion(
+                    id=row.id,
+                    order_number=row.order_number,
+                    customer_name=row.customer_name,
+                    customer_email=row.customer_email,
+                    customer_phone=row.customer_phone,
+                    due_date=row.due_date,
+                    status=row.status,
+                    matched_field=matched_field,
+                )
+            )
+        return suggestions
+
     async def get_order_by_id(
         self, *, order_id: UUID, current_user: User
     ) -> Optional[OrderRead]:
@@ -394,7 +548,12 @@ class OrderService:
         contact = None
         if any(
             field in update_data
-            for field in ["customer_contact_id", "customer_name", "customer_email", "customer_phone"]
+            for field in [
+                "customer_contact_id",
+                "customer_name",
+                "customer_email",
+                "customer_phone",
+            ]
         ):
             contact = self._resolve_or_create_contact(
                 current_user=current_user,
@@ -404,9 +563,15 @@ class OrderService:
                 customer_phone=update_data.get("customer_phone", order.customer_phone),
             )
             order.customer_contact_id = contact.id if contact else None
-            order.customer_name = update_data.get("customer_name") or (_build_contact_name(contact) if contact else None)
-            order.customer_email = update_data.get("customer_email") or (contact.email if contact else None)
-            order.customer_phone = update_data.get("customer_phone") or (contact.phone if contact else None)
+            order.customer_name = update_data.get("customer_name") or (
+                _build_contact_name(contact) if contact else None
+            )
+            order.customer_email = update_data.get("customer_email") or (
+                contact.email if contact else None
+            )
+            order.customer_phone = update_data.get("customer_phone") or (
+                contact.phone if contact else None
+            )
 
         for field in [
             "due_date",
@@ -431,7 +596,7 @@ class OrderService:
         order.updated_at = _utcnow()
         self.session.add(order)
         self.session.commit()
-        self.session.refresh(order)
+        self._store_order_triage(order)
         return self._build_order_reads([order])[0]
 
     async def delete_order(
@@ -524,9 +689,193 @@ class OrderService:
         quote.converted_to_order_id = order.id
         self.session.add(quote)
         self.session.commit()
-        self.session.refresh(order)
+        self._store_order_triage(order)
         return self._build_order_reads([order])[0]
 
+    def _plan_order_list(
+        self,
+        *,
+        current_user: User,
+        filters: OrderListFilters,
+        clock: Optional[OrderClock] = None,
+    ) -> OrderQueryPlan:
+        # The rollover job and the importer keep stored triage current; rows
+        # expired since (edited items or contacts) are refreshed and kept.
+        self.refresh_order_triage(user_id=current_user.id, clock=clock)
+        search_index = bool(filters.search) and order_search_index_available(
+            self.session.connection()
+        )
+        return OrderQueryPlanner(
+            user_id=current_user.id, search_index=search_index
+        ).plan(filters)
+
+    def _count_scoped_orders_by(self, plan: OrderQueryPlan, column) -> Counter:
+        statement = (
+            select(column, func.count())
+            .where(plan.statement.whereclause)
+            .group_by(column)
+        )
+        return Counter(dict(self.session.exec(statement).all()))
+
+    # --- Persisted triage --- #
+
+    def refresh_order_triage(
+        self,
+        *,
+        user_id: Optional[UUID] = None,
+        batch_size: int = ORDER_READ_BATCH_SIZE,
+        clock: Optional[OrderClock] = None,
+    ) -> int:
+        """Recompute triage for orders whose stored values are missing or from another day.
+
+        Returns the number of refreshed orders. When every row is current this
+        is a single indexed lookup, so list and summary reads call it first
+        and commit whatever the rollover and importer have not reached.
+        """
+        clock = clock or OrderClock.capture()
+        as_of = clock.today
+        statement = (
+            select(Order)
+            .where(
+                or_(
+                    Order.triage_as_of.is_(None),
+                    Order.triage_as_of < as_of,
+                    Order.triage_as_of > as_of,
+                )
+            )
+            .options(selectinload(Order.customer), selectinload(Order.items))
+            .limit(batch_size)
+        )
+        if user_id is not None:
+            statement = statement.where(Order.user_id == user_id)
+
+        refreshed = 0
+        while True:
+            stale_orders = self.session.exec(statement).all()
+            if not stale_orders:
+                break
+            self._write_order_triage(stale_orders, clock=clock)
+            refreshed += len(stale_orders)
+            # One short write transaction per batch, not one for the book.
+            self.session.commit()
+        return refreshed
+
+    def _store_order_triage(self, order: Order) -> None:
+        # Runs after the write commits so relationships reflect the saved row.
+        self.session.refresh(order)
+        self._write_order_triage([order], clock=OrderClock.capture())
+        self.session.commit()
+        self.session.refresh(order)
+
+    def _write_order_triage(
+        self, orders: Iterable[Order], *, clock: OrderClock
+    ) -> None:
+        # Stored beside the ORM so triage never bumps ``updated_at``; the
+        # loaded orders get the same values without becoming dirty.
+        rows = []
+        for order in orders:
+            values = self._compute_order_triage(order, clock=clock)
+            for name, value in values.items():
+                set_committed_value(order, name, value)
+            rows.append({"id": order.id, **values})
+        write_order_triage(self.session.connection(), rows)
+
+    def _compute_order_triage(self, order: Order, *, clock: OrderClock) -> dict:
+        customer_summary = self._build_customer_summary(order)
+        payment_summary = self._build_payment_summary(order)
+        queue_summary = self._build_queue_summary(order, clock=clock)
+        invoice_summary = self._build_invoice_summary(order)
+        risk_summary = self._build_risk_summary(
+            order, payment_summary, queue_summary, clock=clock
+        )
+        ops_summary = self._build_ops_summary(
+            order,
+            payment_summary,
+            queue_summary,
+            invoice_summary,
+            risk_summary,
+            clock=clock,
+        )
+        is_imported, _legacy_status_raw, _import_source = self._derive_import_metadata(
+            order
+        )
+        review_reasons, _primary_reason, _next_check = self._build_import_review_triage(
+            is_imported=is_imported,
+            customer_summary=customer_summary,
+            invoice_summary=invoice_summary,
+            risk_summary=risk_summary,
+        )
+        import_priority_rank, _priority_label = self._build_import_priority(
+            is_imported=is_imported,
+            review_reasons=review_reasons,
+        )
+
+        return {
+            "triage_as_of": clock.today,
+            "triage_urgency_rank": queue_summary.urgency_rank,
+            "triage_action_class": ops_summary.action_class,
+            "triage_readiness_label": self._build_day_running_readiness(
+                order,
+                customer_summary=customer_summary,
+                queue_summary=queue_summary,
+                invoice_summary=invoice_summary,
+                payment_summary=payment_summary,
+                clock=clock,
+            ),
+            "triage_needs_review": self._summaries_need_review(
+                customer_summary=customer_summary,
+                invoice_summary=invoice_summary,
+                risk_summary=risk_summary,
+            ),
+            "triage_import_priority_rank": import_priority_rank,
+            "triage_review_reasons": ",".join(
+                reason.value for reason in review_reasons
+            ),
+        }
+
+    def _build_day_running_readiness(
+        self,
+        order: Order,
+        *,
+        customer_summary: OrderCustomerSummary,
+        queue_summary: OrderQueueSummary,
+        invoice_summary: OrderInvoiceSummary,
+        payment_summary: OrderPaymentSummary,
+        clock: OrderClock,
+    ) -> str:
+        # Only the label is stored, so skip the focus summaries and their copy.
+        method_status, _method_label = self._classify_handoff_method(order)
+        handoff_gaps = self._build_handoff_missing_basics(
+            customer_summary=customer_summary,
+            method_status=method_status,
+            destination_from_contact=(
+                _compact_contact_address(order.customer)
+                if method_status == "delivery"
+                else None
+            ),
+        )
+        _contents, _count_label, item_count, primary_names = (
+            self._build_item_scan_summary(order)
+        )
+        missing_basics, clarification_flags = self._build_production_gaps(
+            order,
+            item_count=item_count,
+            primary_names=primary_names,
+        )
+        return self._classify_day_running_readiness(
+            order=order,
+            queue_summary=queue_summary,
+            invoice_summary=invoice_summary,
+            payment_summary=payment_summary,
+            production_readiness_label=self._classify_production_readiness(
+                missing_basics,
+                clarification_flags,
+            ),
+            has_handoff_gaps=bool(handoff_gaps),
+            contact_readiness_label=self._classify_contact_readiness(customer_summary),
+            clock=clock,
+        )
+
     def _get_owned_order(self, *, order_id: UUID, user_id: UUID) -> Optional[Order]:
         statement = select(Order).where(Order.id == order_id, Order.user_id == user_id)
         return self.session.exec(statement).first()
@@ -619,152 +968,150 @@ class OrderService:
 
         order.balance_due = round(max(order.total_amount - amount_paid, 0.0), 2)
 
-    def _extract_legacy_metadata(self, internal_notes: Optional[str]) -> dict[str, str]:
-        if not internal_notes:
-            return {}
-
-        metadata: dict[str, str] = {}
-        for line in internal_notes.splitlines():
-            text = line.strip()
-            if not text.startswith("Legacy ") or ":" not in text:
-                continue
-            key, value = text[len("Legacy ") :].split(":", 1)
-            key = key.strip()
-            value = value.strip()
-            if key and value:
-                metadata[key] = value
-        return metadata
-
-    def _derive_import_metadata(self, order: Order) -> tuple[bool, Optional[str], Optional[str]]:
-        metadata = self._extract_legacy_metadata(order.internal_notes)
-        is_imported = bool(metadata)
-        legacy_status_raw = metadata.get("legacy_status_raw") or metadata.get("OrderStatusId")
-        import_source = "marvelous_creations" if is_imported else None
-        return is_imported, legacy_status_raw, import_source
+    def _derive_import_metadata(
+        self, order: Order
+    ) -> tuple[bool, Optional[str], Optional[str]]:
+        return order.is_imported, order.legacy_status_raw, order.import_source
 
     def _primary_history_key(self, order: Order) -> Optional[str]:
-        if order.customer_contact_id:
-            return f"contact:{order.customer_contact_id}"
-        if order.customer_email:
-            return f"email:{order.customer_email.strip().lower()}"
-        if order.customer_phone:
-            return f"phone:{order.customer_phone.strip().lower()}"
-        return None
+        return order_history_key(order)
 
-    def _build_related_orders_map(
+    def _build_customer_history_summaries(
         self, orders: Iterable[Order]
-    ) -> dict[str, list[Order]]:
+    ) -> dict[UUID, OrderCustomerHistorySummary]:
         order_list = list(orders)
-        contact_ids = {
-            order.customer_contact_id
-            for order in order_list
-            if order.customer_contact_id is not None
-        }
-        emails = {
-            order.customer_email.strip().lower()
-            for order in order_list
-            if order.customer_email
-        }
-        phones = {
-            order.customer_phone.strip().lower()
-            for order in order_list
-            if order.customer_phone
-        }
+        keyed_ids = [order.id for order in order_list if order.history_key]
+        history_rows = {}
+        if keyed_ids:
+            statement = (
+                select(
+                    Order.id,
+                    CustomerHistoryRollup.total_orders,
+                    CustomerHistoryRollup.completed_orders,
+                    CustomerHistoryRollup.active_orders,
+                    Order.previous_order_date,
+                )
+                .join(
+                    CustomerHistoryRollup,
+                    and_(
+                        CustomerHistoryRollup.user_id == Order.user_id,
+                        CustomerHistoryRollup.history_key == Order.history_key,
+                    ),
+                )
+                .where(Order.id.in_(keyed_ids))
+            )
+            history_rows = {row[0]: row for row in self.session.exec(statement).all()}
+
+        summaries: dict[UUID, OrderCustomerHistorySummary] = {}
+        for order in order_list:
+            row = history_rows.get(order.id)
+            if row is None:
+                summaries[order.id] = OrderCustomerHistorySummary(
+                    total_orders=1,
+                    completed_orders=0,
+                    active_orders=int(order.status not in TERMINAL_ORDER_STATUSES),
+                    last_order_date=None,
+                )
+                continue
+            _, total_orders, completed_orders, active_orders, last_order_date = row
+            summaries[order.id] = OrderCustomerHistorySummary(
+                total_orders=total_orders,
+                completed_orders=completed_orders,
+                active_orders=active_orders,
+                last_order_date=last_order_date,
+            )
+        return summaries
 
-        if not contact_ids and not emails and not phones:
-            return {}
-
-        match_clauses = []
-        if contact_ids:
-            match_clauses.append(Order.customer_contact_id.in_(contact_ids))
-        if emails:
-            match_clauses.append(Order.customer_email.in_(emails))
-        if phones:
-            match_clauses.append(Order.customer_phone.in_(phones))
-
-        user_ids = {order.user_id for order in order_list}
-        statement = select(Order).where(Order.user_id.in_(user_ids), or_(*match_clauses))
-        candidates = self.session.exec(statement).all()
-
-        related_by_key: dict[str, list[Order]] = defaultdict(list)
-        for candidate in candidates:
-            key = self._primary_history_key(candidate)
-            if key:
-                related_by_key[key].append(candidate)
-        return related_by_key
-
-    def _build_customer_history_summary_from_related(
-        self,
-        order: Order,
-        related_orders: list[Order],
-    ) -> OrderCustomerHistorySummary:
-        primary_key = self._primary_history_key(order)
-        if not primary_key:
-            return OrderCustomerHistorySummary(
-                total_orders=1,
-                completed_orders=0,
-                active_orders=1 if order.status not in {OrderStatus.COMPLETED, OrderStatus.CANCELLED} else 0,
-                last_order_date=None,
-            )
-
-        siblings = [candidate for candidate in related_orders if candidate.id != order.id]
-        all_orders = [order, *siblings]
-        prior_orders = [
-            candidate
-            for candidate in siblings
-            if candidate.order_date <= order.order_date
-        ]
-        last_order_date = max(
-            (candidate.order_date for candidate in prior_orders),
-            default=None,
-        )
-        completed_orders = sum(
-            1 for candidate in all_orders if candidate.status == OrderStatus.COMPLETED
-        )
-        active_orders = sum(
-            1
-            for candidate in all_orders
-            if candidate.status not in {OrderStatus.COMPLETED, OrderStatus.CANCELLED}
+    def _build_recent_customer_orders_map(
+        self, orders: Iterable[Order]
+    ) -> dict[UUID, list[OrderRecentCustomerOrder]]:
+        order_list = list(orders)
+        history_keys = {order.history_key for order in order_list if order.history_key}
+        if not history_keys:
+            return {order.id: [] for order in order_list}
+
+        # One extra row per customer leaves room for the order itself.
+        history_rank = (
+            func.row_number()
+            .over(
+                partition_by=(Order.user_id, Order.history_key),
+                order_by=(
+                    Order.order_date.desc(),
+                    Order.created_at.desc(),
+                    Order.id.desc(),
+                ),
+            )
+            .label("history_rank")
         )
-        return OrderCustomerHistorySummary(
-            total_orders=len(all_orders),
-            completed_orders=completed_orders,
-            active_orders=active_orders,
-            last_order_date=last_order_date,
+        ranked = (
+            select(
+                Order.id,
+                Order.user_id,
+                Order.history_key,
+                Order.order_number,
+                Order.order_date,
+                Order.due_date,
+                Order.status,
+                Order.payment_status,
+                Order.total_amount,
+                history_rank,
+            )
+            .where(
+                Order.user_id.in_({order.user_id for order in order_list}),
+                Order.history_key.in_(history_keys),
+            )
+            .subquery()
         )
+        rows = self.session.exec(
+            select(*ranked.c)
+            .where(ranked.c.history_rank <= RECENT_CUSTOMER_HISTORY_LIMIT + 1)
+            .order_by(ranked.c.user_id, ranked.c.history_key, ranked.c.history_rank)
+        ).all()
+
+        rows_by_key: dict[tuple[UUID, str], list] = defaultdict(list)
+        for row in rows:
+            rows_by_key[(row.user_id, row.history_key)].append(row)
+
+        recent_by_order: dict[UUID, list[OrderRecentCustomerOrder]] = {}
+        for order in order_list:
+            siblings = [
+                row
+                for row in rows_by_key.get((order.user_id, order.history_key), [])
+                if row.id != order.id
+            ]
+            recent_by_order[order.id] = [
+                OrderRecentCustomerOrder(
+                    id=row.id,
+                    order_number=row.order_number,
+                    order_date=row.order_date,
+                    due_date=row.due_date,
+                    status=row.status,
+                    payment_status=row.payment_status,
+                    total_amount=row.total_amount,
+                )
+                for row in siblings[:RECENT_CUSTOMER_HISTORY_LIMIT]
+            ]
+        return recent_by_order
 
-    def _build_recent_customer_orders(
-        self,
-        order: Order,
-        related_orders: list[Order],
-    ) -> list[OrderRecentCustomerOrder]:
-        siblings = sorted(
-            (candidate for candidate in related_orders if candidate.id != order.id),
-            key=lambda candidate: (candidate.order_date, candidate.created_at),
-            reverse=True,
+    def _order_needs_review(self, order_read: OrderRead) -> bool:
+        return self._summaries_need_review(
+            customer_summary=order_read.customer_summary,
+            invoice_summary=order_read.invoice_summary,
+            risk_summary=order_read.risk_summary,
         )
-        return [
-            OrderRecentCustomerOrder(
-                id=candidate.id,
-                order_number=candidate.order_number,
-                order_date=candidate.order_date,
-                due_date=candidate.due_date,
-                status=candidate.status,
-                payment_status=candidate.payment_status,
-                total_amount=candidate.total_amount,
-            )
-            for candidate in siblings[:RECENT_CUSTOMER_HISTORY_LIMIT]
-        ]
 
-    def _order_needs_review(self, order_read: OrderRead) -> bool:
+    def _summaries_need_review(
+        self,
+        *,
+        customer_summary: OrderCustomerSummary,
+        invoice_summary: OrderInvoiceSummary,
+        risk_summary: OrderRiskSummary,
+    ) -> bool:
         return (
-            not order_read.customer_summary.is_linked_contact
-            or (
-                not order_read.customer_summary.email
-                and not order_read.customer_summary.phone
-            )
-            or bool(order_read.invoice_summary.missing_fields)
-            or order_read.risk_summary.has_overdue_payment
+            not customer_summary.is_linked_contact
+            or (not customer_summary.email and not customer_summary.phone)
+            or bool(invoice_summary.missing_fields)
+            or risk_summary.has_overdue_payment
         )
 
     def _build_import_review_triage(
@@ -774,7 +1121,11 @@ class OrderService:
         customer_summary: OrderCustomerSummary,
         invoice_summary: OrderInvoiceSummary,
         risk_summary: OrderRiskSummary,
-    ) -> tuple[list[ImportedOrderReviewReason], Optional[ImportedOrderReviewReason], Optional[str]]:
+    ) -> tuple[
+        list[ImportedOrderReviewReason],
+        Optional[ImportedOrderReviewReason],
+        Optional[str],
+    ]:
         if not is_imported:
             return [], None, None
 
@@ -796,6 +1147,18 @@ class OrderService:
         )
         return review_reasons, primary_review_reason, review_next_check
 
+    def _build_customer_summary(self, order: Order) -> OrderCustomerSummary:
+        return OrderCustomerSummary(
+            contact_id=order.customer_contact_id,
+            name=order.customer_name
+            or (_build_contact_name(order.customer) if order.customer else None),
+            email=order.customer_email
+            or (order.customer.email if order.customer else None),
+            phone=order.customer_phone
+            or (order.customer.phone if order.customer else None),
+            is_linked_contact=order.customer_contact_id is not None,
+        )
+
     def _build_payment_summary(self, order: Order) -> OrderPaymentSummary:
         deposit_required = round(order.deposit_amount or 0.0, 2)
         amount_paid = 0.0
@@ -817,44 +1180,29 @@ class OrderService:
 
     def _build_import_priority(
         self,
-        order_read: OrderRead,
+        *,
+        is_imported: bool,
+        review_reasons: list[ImportedOrderReviewReason],
     ) -> tuple[int, Optional[str]]:
-        if not order_read.is_imported:
+        if not is_imported:
             return 999, None
 
-        if order_read.review_reasons:
+        if review_reasons:
             top_reason = min(
-                order_read.review_reasons,
+                review_reasons,
                 key=lambda reason: IMPORT_REVIEW_REASON_PRIORITY[reason],
             )
-            return IMPORT_REVIEW_REASON_PRIORITY[top_reason], IMPORT_PRIORITY_LABELS[top_reason]
-
-        return 50, "Ready after review pile"
-
-    def _sort_imported_order_reads(self, order_reads: list[OrderRead]) -> list[OrderRead]:
-        def due_key(order_read: OrderRead) -> float:
-            return order_read.due_date.timestamp() if order_read.due_date else float("inf")
-
-        def order_key(order_read: OrderRead) -> tuple[int, int, float, float, float]:
-            needs_review_rank = 0 if order_read.review_reasons else 1
-            priority_rank = order_read.imported_priority_rank
-            urgency_rank = order_read.queue_summary.urgency_rank
-            due_timestamp = due_key(order_read)
-            order_timestamp = order_read.order_date.timestamp()
             return (
-                needs_review_rank,
-                priority_rank,
-                urgency_rank,
-                due_timestamp,
-                -order_timestamp,
+                IMPORT_REVIEW_REASON_PRIORITY[top_reason],
+                IMPORT_PRIORITY_LABELS[top_reason],
             )
 
-        return sorted(order_reads, key=order_key)
+        return 50, "Ready after review pile"
 
-    def _build_queue_summary(self, order: Order) -> OrderQueueSummary:
-        today = _utcnow().date()
-        due_date = _date_in_user_timezone(order.due_date)
-        days_until_due = (due_date - today).days
+    def _build_queue_summary(
+        self, order: Order, *, clock: OrderClock
+    ) -> OrderQueueSummary:
+        days_until_due = (clock.local_date(order.due_date) - clock.today).days
         is_due_today = days_until_due == 0
         is_overdue = days_until_due < 0 and order.status not in {
             OrderStatus.COMPLETED,
@@ -887,20 +1235,20 @@ class OrderService:
             urgency_rank=urgency_rank,
         )
 
-    def _build_customer_history_summary(self, order: Order) -> OrderCustomerHistorySummary:
-        related_orders = self._build_related_orders_map([order]).get(
-            self._primary_history_key(order) or "",
-            [],
-        )
-        return self._build_customer_history_summary_from_related(order, related_orders)
+    def _build_customer_history_summary(
+        self, order: Order
+    ) -> OrderCustomerHistorySummary:
+        return self._build_customer_history_summaries([order])[order.id]
 
     def _build_risk_summary(
         self,
         order: Order,
         payment_summary: OrderPaymentSummary,
         queue_summary: OrderQueueSummary,
+        *,
+        clock: OrderClock,
     ) -> OrderRiskSummary:
-        today = _utcnow().date()
+        today = clock.today
         reasons: list[str] = []
         overdue_amount = 0.0
 
@@ -912,7 +1260,10 @@ class OrderService:
             reasons.append("deposit_overdue")
             overdue_amount += payment_summary.deposit_outstanding
 
-        balance_due_amount = round(max(payment_summary.amount_due - payment_summary.deposit_outstanding, 0.0), 2)
+        balance_due_amount = round(
+            max(payment_summary.amount_due - payment_summary.deposit_outstanding, 0.0),
+            2,
+        )
         if (
             balance_due_amount > 0
             and order.balance_due_date is not None
@@ -929,7 +1280,9 @@ class OrderService:
 
         if overdue_amount > 0:
             level = "high"
-        elif "order_overdue_with_balance" in reasons or "large_unpaid_balance" in reasons:
+        elif (
+            "order_overdue_with_balance" in reasons or "large_unpaid_balance" in reasons
+        ):
             level = "medium"
         else:
             level = "low"
@@ -967,8 +1320,10 @@ class OrderService:
         customer_summary: OrderCustomerSummary,
         payment_summary: OrderPaymentSummary,
         invoice_summary: OrderInvoiceSummary,
+        *,
+        clock: OrderClock,
     ) -> OrderInvoiceFocusSummary:
-        due_label = _format_bakery_date(_date_in_user_timezone(order.due_date))
+        due_label = _format_bakery_date(clock.local_date(order.due_date))
         order_identity = f"{order.order_number} due {due_label}"
 
         customer_bits = [
@@ -1002,7 +1357,10 @@ class OrderService:
                 )
         else:
             balance_due_amount = round(
-                max(payment_summary.amount_due - payment_summary.deposit_outstanding, 0.0),
+                max(
+                    payment_summary.amount_due - payment_summary.deposit_outstanding,
+                    0.0,
+                ),
                 2,
             )
             if order.balance_due_date is not None:
@@ -1016,22 +1374,36 @@ class OrderService:
                     f"${payment_summary.amount_due:.2f} still open."
                 )
 
-        blockers = [_humanize_invoice_field(field) for field in invoice_summary.missing_fields]
+        blockers = [
+            _humanize_invoice_field(field) for field in invoice_summary.missing_fields
+        ]
 
         missing_basics: list[str] = []
         if not customer_summary.email and not customer_summary.phone:
-            missing_basics.append("Add at least one customer contact method before sending the invoice.")
-        if payment_summary.amount_due > 0 and not order.deposit_due_date and not order.balance_due_date:
-            missing_basics.append("Add a payment due date so the invoice gives the customer a clear timing cue.")
+            missing_basics.append(
+                "Add at least one customer contact method before sending the invoice."
+            )
+        if (
+            payment_summary.amount_due > 0
+            and not order.deposit_due_date
+            and not order.balance_due_date
+        ):
+            missing_basics.append(
+                "Add a payment due date so the invoice gives the customer a clear timing cue."
+            )
 
         if invoice_summary.is_ready and payment_summary.amount_due <= 0:
             status_label = "ready_and_paid"
-            readiness_note = "Invoice basics are complete and the order is already paid."
+            readiness_note = (
+                "Invoice basics are complete and the order is already paid."
+            )
             next_step = "Share or archive the invoice record"
             next_step_detail = "The invoice is ready from the current order details and no money is still open."
         elif invoice_summary.is_ready:
             status_label = "ready_to_send"
-            readiness_note = "Invoice basics are complete from the current order record."
+            readiness_note = (
+                "Invoice basics are complete from the current order record."
+            )
             if payment_summary.deposit_outstanding > 0:
                 next_step = "Send invoice with deposit guidance"
                 next_step_detail = "Lead with the deposit amount and due date so the customer knows the first payment checkpoint."
@@ -1042,7 +1414,11 @@ class OrderService:
             status_label = "blocked"
             readiness_note = "Invoice is not send-ready yet because key billing basics are still missing."
             next_step = "Complete invoice basics"
-            next_step_detail = blockers[0] if blockers else "Fill the missing invoice basics before sending anything."
+            next_step_detail = (
+                blockers[0]
+                if blockers
+                else "Fill the missing invoice basics before sending anything."
+            )
 
         return OrderInvoiceFocusSummary(
             status_label=status_label,
@@ -1066,9 +1442,13 @@ class OrderService:
         ops_summary: OrderOpsSummary,
         *,
         is_imported: bool,
+        clock: OrderClock,
     ) -> OrderPaymentFocusSummary:
-        today = _utcnow().date()
-        balance_due_amount = round(max(payment_summary.amount_due - payment_summary.deposit_outstanding, 0.0), 2)
+        today = clock.today
+        balance_due_amount = round(
+            max(payment_summary.amount_due - payment_summary.deposit_outstanding, 0.0),
+            2,
+        )
 
         if payment_summary.amount_due <= 0:
             payment_state = "Paid in full"
@@ -1095,9 +1475,7 @@ class OrderService:
                 f"(${payment_summary.deposit_outstanding:.2f} still open)"
             )
         elif order.deposit_due_date == today:
-            deposit_status = (
-                f"Deposit due today (${payment_summary.deposit_outstanding:.2f} still open)"
-            )
+            deposit_status = f"Deposit due today (${payment_summary.deposit_outstanding:.2f} still open)"
         else:
             deposit_status = (
                 f"Deposit due {_format_bakery_date_only(order.deposit_due_date)} "
@@ -1111,14 +1489,18 @@ class OrderService:
         elif balance_due_amount <= 0:
             balance_status = "No balance remaining"
         elif order.balance_due_date is None:
-            balance_status = f"Final balance outstanding: ${balance_due_amount:.2f} with no due date"
+            balance_status = (
+                f"Final balance outstanding: ${balance_due_amount:.2f} with no due date"
+            )
         elif order.balance_due_date < today:
             balance_status = (
                 f"Final balance overdue since {_format_bakery_date_only(order.balance_due_date)} "
                 f"(${balance_due_amount:.2f} still open)"
             )
         elif order.balance_due_date == today:
-            balance_status = f"Final balance due today (${balance_due_amount:.2f} still open)"
+            balance_status = (
+                f"Final balance due today (${balance_due_amount:.2f} still open)"
+            )
         else:
             balance_status = (
                 f"Final balance due {_format_bakery_date_only(order.balance_due_date)} "
@@ -1127,16 +1509,19 @@ class OrderService:
 
         if payment_summary.amount_due <= 0:
             due_timing = "No money is due right now."
-        elif payment_summary.deposit_outstanding > 0 and order.deposit_due_date is not None:
+        elif (
+            payment_summary.deposit_outstanding > 0
+            and order.deposit_due_date is not None
+        ):
             due_timing = f"Next payment checkpoint: deposit on {_format_bakery_date_only(order.deposit_due_date)}."
         elif balance_due_amount > 0 and order.balance_due_date is not None:
             due_timing = f"Next payment checkpoint: final balance on {_format_bakery_date_only(order.balance_due_date)}."
         elif queue_summary.is_overdue:
-            due_timing = f"Order due date passed on {_format_bakery_date(_date_in_user_timezone(order.due_date))}."
+            due_timing = f"Order due date passed on {_format_bakery_date(clock.local_date(order.due_date))}."
         elif queue_summary.is_due_today:
             due_timing = "Order is due today."
         else:
-            due_timing = f"Order due date is {_format_bakery_date(_date_in_user_timezone(order.due_date))}."
+            due_timing = f"Order due date is {_format_bakery_date(clock.local_date(order.due_date))}."
 
         risk_note = (
             " ".join(_humanize_reason(reason) for reason in risk_summary.reasons)
@@ -1144,7 +1529,9 @@ class OrderService:
             else "No payment-specific risk flags right now."
         )
 
-        has_payment_checkpoint = payment_summary.deposit_required > 0 or order.balance_due_date is not None
+        has_payment_checkpoint = (
+            payment_summary.deposit_required > 0 or order.balance_due_date is not None
+        )
         if payment_summary.amount_due <= 0:
             amount_owed_now = 0.0
         elif collection_stage == "deposit":
@@ -1169,9 +1556,7 @@ class OrderService:
                 "instead of a reconstructed payment ledger. Treat historical payment history as unknown unless you have a second source."
             )
             historical_payment_label = "Historical payment: unknown"
-            historical_payment_note = (
-                "Legacy payment history may be incomplete in this import. Use a second source before treating earlier payments as confirmed."
-            )
+            historical_payment_note = "Legacy payment history may be incomplete in this import. Use a second source before treating earlier payments as confirmed."
 
         return OrderPaymentFocusSummary(
             amount_owed_now=round(amount_owed_now, 2),
@@ -1196,27 +1581,26 @@ class OrderService:
         customer_summary: OrderCustomerSummary,
         queue_summary: OrderQueueSummary,
         ops_summary: OrderOpsSummary,
+        *,
+        clock: OrderClock,
     ) -> OrderHandoffFocusSummary:
-        method_raw = (order.delivery_method or "").strip().lower()
-        if "deliver" in method_raw:
-            method_status = "delivery"
-            method_label = "Delivery"
-        elif "pickup" in method_raw or "pick up" in method_raw:
-            method_status = "pickup"
-            method_label = "Pickup"
-        else:
-            method_status = "unclear"
-            method_label = "Method still unclear"
+        method_status, method_label = self._classify_handoff_method(order)
 
         contact_name = customer_summary.name
-        primary_contact = customer_summary.email or customer_summary.phone or "No customer contact details on file"
+        primary_contact = (
+            customer_summary.email
+            or customer_summary.phone
+            or "No customer contact details on file"
+        )
         secondary_contact = None
         if customer_summary.email and customer_summary.phone:
             secondary_contact = customer_summary.phone
 
         destination_from_contact = _compact_contact_address(order.customer)
         if method_status == "delivery":
-            destination_label = destination_from_contact or "Delivery destination still missing"
+            destination_label = (
+                destination_from_contact or "Delivery destination still missing"
+            )
             destination_detail = (
                 "Use the saved delivery address for this handoff."
                 if destination_from_contact
@@ -1227,17 +1611,15 @@ class OrderService:
             destination_detail = "Pickup flow is expected for this order."
         else:
             destination_label = "Method not confirmed"
-            destination_detail = "Pickup vs delivery is still not explicit on this order."
+            destination_detail = (
+                "Pickup vs delivery is still not explicit on this order."
+            )
 
-        missing_basics: list[str] = []
-        if method_status == "unclear":
-            missing_basics.append("Confirm whether this order is pickup or delivery.")
-        if not customer_summary.email and not customer_summary.phone:
-            missing_basics.append("Add at least one customer contact method before handoff.")
-        if method_status == "delivery" and not destination_from_contact:
-            missing_basics.append("Add the delivery destination before this order leaves the kitchen.")
-        if method_status == "pickup" and not customer_summary.phone and not customer_summary.email:
-            missing_basics.append("Confirm who is collecting the pickup order.")
+        missing_basics = self._build_handoff_missing_basics(
+            customer_summary=customer_summary,
+            method_status=method_status,
+            destination_from_contact=destination_from_contact,
+        )
 
         if missing_basics:
             readiness_note = "Handoff is not ready yet — key basics are still missing."
@@ -1262,13 +1644,15 @@ class OrderService:
             )
         else:
             next_step = "Lock the handoff basics first"
-            next_step_detail = missing_basics[0] if missing_basics else ops_summary.ops_attention
+            next_step_detail = (
+                missing_basics[0] if missing_basics else ops_summary.ops_attention
+            )
 
         return OrderHandoffFocusSummary(
             handoff_time_label=(
-                "Due today — " + _format_datetime_label(order.due_date)
+                "Due today — " + _format_datetime_label(order.due_date, clock)
                 if queue_summary.is_due_today
-                else _format_datetime_label(order.due_date)
+                else _format_datetime_label(order.due_date, clock)
             ),
             method_status=method_status,
             method_label=method_label,
@@ -1283,9 +1667,45 @@ class OrderService:
             next_step_detail=next_step_detail,
         )
 
+    def _classify_handoff_method(self, order: Order) -> tuple[str, str]:
+        method_raw = (order.delivery_method or "").strip().lower()
+        if "deliver" in method_raw:
+            return "delivery", "Delivery"
+        if "pickup" in method_raw or "pick up" in method_raw:
+            return "pickup", "Pickup"
+        return "unclear", "Method still unclear"
+
+    def _build_handoff_missing_basics(
+        self,
+        *,
+        customer_summary: OrderCustomerSummary,
+        method_status: str,
+        destination_from_contact: Optional[str],
+    ) -> list[str]:
+        missing_basics: list[str] = []
+        if method_status == "unclear":
+            missing_basics.append("Confirm whether this order is pickup or delivery.")
+        if not customer_summary.email and not customer_summary.phone:
+            missing_basics.append(
+                "Add at least one customer contact method before handoff."
+            )
+        if method_status == "delivery" and not destination_from_contact:
+            missing_basics.append(
+                "Add the delivery destination before this order leaves the kitchen."
+            )
+        if (
+            method_status == "pickup"
+            and not customer_summary.phone
+            and not customer_summary.email
+        ):
+            missing_basics.append("Confirm who is collecting the pickup order.")
+        return missing_basics
+
     def _build_item_scan_summary(self, order: Order) -> tuple[str, str, int, list[str]]:
         item_count = sum(max(item.quantity, 0) for item in order.items)
-        primary_names = [item.name.strip() for item in order.items if item.name and item.name.strip()]
+        primary_names = [
+            item.name.strip() for item in order.items if item.name and item.name.strip()
+        ]
 
         if primary_names:
             if len(primary_names) == 1:
@@ -1293,7 +1713,9 @@ class OrderService:
             elif len(primary_names) == 2:
                 contents_summary = f"{primary_names[0]} + {primary_names[1]}"
             else:
-                contents_summary = f"{primary_names[0]} + {len(primary_names) - 1} more item(s)"
+                contents_summary = (
+                    f"{primary_names[0]} + {len(primary_names) - 1} more item(s)"
+                )
         else:
             contents_summary = "Line items still missing"
 
@@ -1306,13 +1728,13 @@ class OrderService:
 
         return contents_summary, item_count_label, item_count, primary_names
 
-    def _build_production_focus_summary(
+    def _build_production_gaps(
         self,
         order: Order,
-        queue_summary: OrderQueueSummary,
-        handoff_focus_summary: OrderHandoffFocusSummary,
-    ) -> OrderProductionFocusSummary:
-        contents_summary, item_count_label, item_count, primary_names = self._build_item_scan_summary(order)
+        *,
+        item_count: int,
+        primary_names: list[str],
+    ) -> tuple[list[str], list[str]]:
         missing_basics: list[str] = []
         clarification_flags: list[str] = []
 
@@ -1342,45 +1764,101 @@ class OrderService:
             "treats",
         }
         has_only_generic_names = bool(primary_names) and all(
-            name.lower() in generic_names or len(name.split()) <= 2 for name in primary_names
+            name.lower() in generic_names or len(name.split()) <= 2
+            for name in primary_names
         )
 
         if not order.items:
-            missing_basics.append("No usable item summary yet — add at least one line item before baking.")
+            missing_basics.append(
+                "No usable item summary yet — add at least one line item before baking."
+            )
         elif not primary_names:
-            missing_basics.append("Item names are blank — add a usable item summary before baking.")
+            missing_basics.append(
+                "Item names are blank — add a usable item summary before baking."
+            )
+
+        if order.items and item_count <= 0:
+            missing_basics.append(
+                "Quantity/count cue is missing — capture how many items need to be made."
+            )
+
+        if not order.delivery_method:
+            missing_basics.append(
+                "Handoff method is missing — confirm pickup vs delivery before prep starts."
+            )
+
+        if (
+            order.items
+            and item_count > 0
+            and has_only_generic_names
+            and not has_detail_signal
+        ):
+            clarification_flags.append(
+                "Production details are thin — confirm flavor, theme, message, or design notes before baking."
+            )
+        elif (
+            order.items
+            and item_count > 0
+            and not has_detail_signal
+            and len(primary_names) <= 1
+        ):
+            clarification_flags.append(
+                "Order details look light — confirm the key production notes before baking."
+            )
 
-        if order.items and item_count <= 0:
-            missing_basics.append("Quantity/count cue is missing — capture how many items need to be made.")
+        return missing_basics, clarification_flags
 
-        if not order.delivery_method:
-            missing_basics.append("Handoff method is missing — confirm pickup vs delivery before prep starts.")
+    def _classify_production_readiness(
+        self,
+        missing_basics: list[str],
+        clarification_flags: list[str],
+    ) -> str:
+        if missing_basics:
+            return "Missing basics"
+        if clarification_flags:
+            return "Needs clarification"
+        return "Ready to make"
 
-        if order.items and item_count > 0 and has_only_generic_names and not has_detail_signal:
-            clarification_flags.append("Production details are thin — confirm flavor, theme, message, or design notes before baking.")
-        elif order.items and item_count > 0 and not has_detail_signal and len(primary_names) <= 1:
-            clarification_flags.append("Order details look light — confirm the key production notes before baking.")
+    def _build_production_focus_summary(
+        self,
+        order: Order,
+        queue_summary: OrderQueueSummary,
+        handoff_focus_summary: OrderHandoffFocusSummary,
+    ) -> OrderProductionFocusSummary:
+        contents_summary, item_count_label, item_count, primary_names = (
+            self._build_item_scan_summary(order)
+        )
+        missing_basics, clarification_flags = self._build_production_gaps(
+            order,
+            item_count=item_count,
+            primary_names=primary_names,
+        )
 
-        combined_gaps = (missing_basics + [flag for flag in clarification_flags if flag not in missing_basics])[:4]
+        combined_gaps = (
+            missing_basics
+            + [flag for flag in clarification_flags if flag not in missing_basics]
+        )[:4]
 
-        if missing_basics:
-            readiness_label = "Missing basics"
+        readiness_label = self._classify_production_readiness(
+            missing_basics, clarification_flags
+        )
+        if readiness_label == "Missing basics":
             attention_note = missing_basics[0]
             next_step = "Lock the missing production basics"
             next_step_detail = missing_basics[0]
-        elif clarification_flags:
-            readiness_label = "Needs clarification"
+        elif readiness_label == "Needs clarification":
             attention_note = clarification_flags[0]
             next_step = "Confirm production details"
             next_step_detail = clarification_flags[0]
         else:
-            readiness_label = "Ready to make"
             if queue_summary.is_due_today:
                 attention_note = "Production basics look clear from the current order record for today’s work."
             elif queue_summary.is_overdue:
                 attention_note = "Production basics look clear, but timing should be rechecked because the order is overdue."
             else:
-                attention_note = "Production basics look clear from the current order record."
+                attention_note = (
+                    "Production basics look clear from the current order record."
+                )
             next_step = "Proceed with production prep"
             next_step_detail = (
                 "Use the handoff panel to recheck the final timing and release details."
@@ -1398,6 +1876,19 @@ class OrderService:
             next_step_detail=next_step_detail,
         )
 
+    def _classify_contact_readiness(
+        self, customer_summary: OrderCustomerSummary
+    ) -> str:
+        has_name = bool(customer_summary.name and customer_summary.name.strip())
+        contact_path_count = int(
+            bool(customer_summary.email and str(customer_summary.email).strip())
+        ) + int(bool(customer_summary.phone and customer_summary.phone.strip()))
+        if has_name and contact_path_count >= 2:
+            return "Ready to contact"
+        if has_name and contact_path_count == 1:
+            return "Limited contact info"
+        return "Missing contact basics"
+
     def _build_contact_focus_summary(
         self,
         order: Order,
@@ -1419,7 +1910,9 @@ class OrderService:
         )
 
         if has_email and has_phone:
-            best_contact_methods_summary = f"Email: {customer_summary.email} • Phone: {customer_summary.phone}"
+            best_contact_methods_summary = (
+                f"Email: {customer_summary.email} • Phone: {customer_summary.phone}"
+            )
         elif has_email:
             best_contact_methods_summary = f"Email only: {customer_summary.email}"
         elif has_phone:
@@ -1429,17 +1922,25 @@ class OrderService:
 
         missing_basics: list[str] = []
         if not has_name:
-            missing_basics.append("Customer name is missing — confirm who this order belongs to before follow-up.")
+            missing_basics.append(
+                "Customer name is missing — confirm who this order belongs to before follow-up."
+            )
         if not has_phone:
-            missing_basics.append("No phone number on file — live follow-up may be slower if questions come up.")
+            missing_basics.append(
+                "No phone number on file — live follow-up may be slower if questions come up."
+            )
         if not has_email:
-            missing_basics.append("No email on file — written follow-up and invoice delivery backup are limited.")
+            missing_basics.append(
+                "No email on file — written follow-up and invoice delivery backup are limited."
+            )
         if contact_path_count == 1 and follow_up_pressure:
-            missing_basics.append("Only one direct contact path is on file — follow-up fallback is thin if that method fails.")
+            missing_basics.append(
+                "Only one direct contact path is on file — follow-up fallback is thin if that method fails."
+            )
         missing_basics = missing_basics[:4]
 
-        if has_name and contact_path_count >= 2:
-            readiness_label = "Ready to contact"
+        readiness_label = self._classify_contact_readiness(customer_summary)
+        if readiness_label == "Ready to contact":
             attention_note = (
                 "Two direct contact paths are on file for quick follow-up today."
                 if follow_up_pressure
@@ -1447,11 +1948,8 @@ class OrderService:
             )
             next_step = "Use the saved contact details"
             next_step_detail = "Reach out using the current phone/email on file if clarification, payment, or handoff follow-up is needed."
-        elif has_name and contact_path_count == 1:
-            readiness_label = "Limited contact info"
-            attention_note = (
-                "Only one direct contact method is on file, so follow-up is possible but not resilient."
-            )
+        elif readiness_label == "Limited contact info":
+            attention_note = "Only one direct contact method is on file, so follow-up is possible but not resilient."
             if has_phone:
                 next_step = "Add an email backup if you talk to the customer"
                 next_step_detail = "Phone follow-up is possible now, but capturing an email would make future clarification and invoice follow-up safer."
@@ -1459,8 +1957,11 @@ class OrderService:
                 next_step = "Add a phone backup if you reach the customer"
                 next_step_detail = "Email follow-up is possible now, but capturing a phone number would make urgent same-day follow-up safer."
         else:
-            readiness_label = "Missing contact basics"
-            attention_note = missing_basics[0] if missing_basics else "Key contact basics are missing from this order record."
+            attention_note = (
+                missing_basics[0]
+                if missing_basics
+                else "Key contact basics are missing from this order record."
+            )
             if not has_name:
                 next_step = "Confirm the customer identity first"
                 next_step_detail = "Lock the customer name plus at least one direct contact method before treating follow-up as reliable."
@@ -1472,7 +1973,9 @@ class OrderService:
                 next_step_detail = "Urgent questions are harder to resolve without a callable number on the order."
             else:
                 next_step = "Add an email backup"
-                next_step_detail = "Written follow-up is thin until an email is captured on the order."
+                next_step_detail = (
+                    "Written follow-up is thin until an email is captured on the order."
+                )
 
         return OrderContactFocusSummary(
             customer_display_name=display_name,
@@ -1484,7 +1987,9 @@ class OrderService:
             next_step_detail=next_step_detail,
         )
 
-    def _build_queue_next_step_preview(self, *, next_step: str, reason_summary: str) -> str:
+    def _build_queue_next_step_preview(
+        self, *, next_step: str, reason_summary: str
+    ) -> str:
         normalized_reason = reason_summary.strip().rstrip(".").lower()
         compact_next_step = {
             "Share or archive the invoice record": "Share invoice record",
@@ -1514,16 +2019,27 @@ class OrderService:
             "Keep the order on track": "Keep on track",
         }.get(next_step, next_step)
 
-        if normalized_reason == "production details need clarification" and compact_next_step == "Confirm production basics":
+        if (
+            normalized_reason == "production details need clarification"
+            and compact_next_step == "Confirm production basics"
+        ):
             compact_next_step = "Clarify production basics"
-        elif normalized_reason.startswith("production details are thin") and compact_next_step == "Confirm production basics":
+        elif (
+            normalized_reason.startswith("production details are thin")
+            and compact_next_step == "Confirm production basics"
+        ):
             compact_next_step = "Clarify production basics"
-        elif normalized_reason == "invoice is still missing basics for today" and compact_next_step in {"Finish invoice", "Complete invoice details"}:
+        elif (
+            normalized_reason == "invoice is still missing basics for today"
+            and compact_next_step in {"Finish invoice", "Complete invoice details"}
+        ):
             compact_next_step = "Finish invoice"
 
         return f"Next: {compact_next_step[:1].lower() + compact_next_step[1:]}"
 
-    def _build_queue_reason_preview(self, *, readiness_label: str, reason_summary: str) -> str:
+    def _build_queue_reason_preview(
+        self, *, readiness_label: str, reason_summary: str
+    ) -> str:
         normalized_reason = reason_summary.strip().rstrip(".")
 
         if normalized_reason.startswith("Deposit is still open "):
@@ -1548,12 +2064,16 @@ class OrderService:
         prefix = "Blocked" if readiness_label == "Blocked for today" else "Attention"
         return f"{prefix}: {compact_reason}"
 
-    def _build_queue_payment_trust_preview(self, *, payment_focus_summary: OrderPaymentFocusSummary) -> Optional[str]:
+    def _build_queue_payment_trust_preview(
+        self, *, payment_focus_summary: OrderPaymentFocusSummary
+    ) -> Optional[str]:
         if payment_focus_summary.trust_state != "legacy_limited":
             return None
         return "Payment trust: legacy-limited"
 
-    def _build_review_payment_trust_preview(self, *, payment_focus_summary: OrderPaymentFocusSummary) -> Optional[str]:
+    def _build_review_payment_trust_preview(
+        self, *, payment_focus_summary: OrderPaymentFocusSummary
+    ) -> Optional[str]:
         if payment_focus_summary.trust_state != "legacy_limited":
             return None
         return "Payment trust: legacy-limited"
@@ -1581,7 +2101,10 @@ class OrderService:
         follow_up_categories = {"payment", "contact"}
         if primary_category == "handoff" and "confirm" in next_step.lower():
             follow_up_categories.add("handoff")
-        if primary_category not in follow_up_categories and next_step not in follow_up_next_steps:
+        if (
+            primary_category not in follow_up_categories
+            and next_step not in follow_up_next_steps
+        ):
             return None
 
         has_email = bool(customer_summary.email and customer_summary.email.strip())
@@ -1627,7 +2150,9 @@ class OrderService:
         if payment_focus_summary.collection_stage == "deposit":
             return f"Collect: ${payment_focus_summary.amount_owed_now:.2f} deposit"
         if payment_focus_summary.collection_stage == "balance":
-            return f"Collect: ${payment_focus_summary.amount_owed_now:.2f} final balance"
+            return (
+                f"Collect: ${payment_focus_summary.amount_owed_now:.2f} final balance"
+            )
         if payment_focus_summary.collection_stage == "settled":
             return "Paid in full"
         if next_step == "Review deposit follow-up":
@@ -1653,8 +2178,12 @@ class OrderService:
             "Proceed with production prep",
         }
         next_step_lower = next_step.lower()
-        is_production_related = primary_category == "production" or next_step in production_related_next_steps or any(
-            token in next_step_lower for token in ["production", "baking", "make"]
+        is_production_related = (
+            primary_category == "production"
+            or next_step in production_related_next_steps
+            or any(
+                token in next_step_lower for token in ["production", "baking", "make"]
+            )
         )
         if not is_production_related:
             return None
@@ -1666,21 +2195,40 @@ class OrderService:
         if production_focus_summary.readiness_label == "Needs clarification":
             if "flavor" in attention_note:
                 return "Production: flavor needs confirmation"
-            if "theme" in attention_note or "design" in attention_note or "message" in attention_note:
+            if (
+                "theme" in attention_note
+                or "design" in attention_note
+                or "message" in attention_note
+            ):
                 return "Production: design notes need confirmation"
-            if "details are thin" in attention_note or "details look light" in attention_note:
+            if (
+                "details are thin" in attention_note
+                or "details look light" in attention_note
+            ):
                 return "Production: quantity/details need review"
             return "Production: details need confirmation"
 
         if production_focus_summary.missing_basics:
             top_missing = production_focus_summary.missing_basics[0]
-            if top_missing == "No usable item summary yet — add at least one line item before baking.":
+            if (
+                top_missing
+                == "No usable item summary yet — add at least one line item before baking."
+            ):
                 return "Production: item summary needs review"
-            if top_missing == "Item names are blank — add a usable item summary before baking.":
+            if (
+                top_missing
+                == "Item names are blank — add a usable item summary before baking."
+            ):
                 return "Production: item summary needs review"
-            if top_missing == "Quantity/count cue is missing — capture how many items need to be made.":
+            if (
+                top_missing
+                == "Quantity/count cue is missing — capture how many items need to be made."
+            ):
                 return "Production: quantity/details need review"
-            if top_missing == "Handoff method is missing — confirm pickup vs delivery before prep starts.":
+            if (
+                top_missing
+                == "Handoff method is missing — confirm pickup vs delivery before prep starts."
+            ):
                 return "Production: handoff method needs confirmation"
             return f"Production: {top_missing[:1].lower() + top_missing[1:]}"
 
@@ -1705,7 +2253,11 @@ class OrderService:
             "Share or archive the invoice record",
         }
         next_step_lower = next_step.lower()
-        is_invoice_related = primary_category == "invoice" or next_step in invoice_related_next_steps or "invoice" in next_step_lower
+        is_invoice_related = (
+            primary_category == "invoice"
+            or next_step in invoice_related_next_steps
+            or "invoice" in next_step_lower
+        )
         if not is_invoice_related:
             return None
 
@@ -1714,7 +2266,9 @@ class OrderService:
         if invoice_focus_summary.status_label == "ready_and_paid":
             return "Invoice: ready and paid"
 
-        blocker_text = " ".join(invoice_focus_summary.blockers + invoice_focus_summary.missing_basics).lower()
+        blocker_text = " ".join(
+            invoice_focus_summary.blockers + invoice_focus_summary.missing_basics
+        ).lower()
         if "customer name or email" in blocker_text or "contact method" in blocker_text:
             return "Invoice: customer contact needs review"
         if "line items" in blocker_text:
@@ -1741,8 +2295,12 @@ class OrderService:
             "Confirm pickup handoff details",
         }
         next_step_lower = next_step.lower()
-        is_handoff_related = primary_category == "handoff" or next_step in handoff_related_next_steps or any(
-            token in next_step_lower for token in ["handoff", "pickup", "delivery"]
+        is_handoff_related = (
+            primary_category == "handoff"
+            or next_step in handoff_related_next_steps
+            or any(
+                token in next_step_lower for token in ["handoff", "pickup", "delivery"]
+            )
         )
         if not is_handoff_related:
             return None
@@ -1751,9 +2309,15 @@ class OrderService:
             top_missing = handoff_focus_summary.missing_basics[0]
             if top_missing == "Confirm whether this order is pickup or delivery.":
                 return "Handoff: method needs confirmation"
-            if top_missing == "Add the delivery destination before this order leaves the kitchen.":
+            if (
+                top_missing
+                == "Add the delivery destination before this order leaves the kitchen."
+            ):
                 return "Handoff: delivery address needs confirmation"
-            if "pickup order" in top_missing.lower() or "collecting the pickup order" in top_missing.lower():
+            if (
+                "pickup order" in top_missing.lower()
+                or "collecting the pickup order" in top_missing.lower()
+            ):
                 return "Handoff: pickup contact needs confirmation"
             if "customer contact method" in top_missing.lower():
                 if handoff_focus_summary.method_status == "pickup":
@@ -1765,7 +2329,10 @@ class OrderService:
 
         if handoff_focus_summary.method_status == "pickup":
             handoff_time_label = handoff_focus_summary.handoff_time_label
-            if handoff_time_label.startswith("Due today — ") and " at " in handoff_time_label:
+            if (
+                handoff_time_label.startswith("Due today — ")
+                and " at " in handoff_time_label
+            ):
                 time_part = handoff_time_label.split(" at ", 1)[1]
                 return f"Handoff: pickup today at {time_part}"
             if handoff_time_label.startswith("Due today — "):
@@ -1774,10 +2341,16 @@ class OrderService:
 
         if handoff_focus_summary.method_status == "delivery":
             if handoff_focus_summary.handoff_time_label.startswith("Due today — "):
-                if handoff_focus_summary.destination_label == "Delivery destination still missing":
+                if (
+                    handoff_focus_summary.destination_label
+                    == "Delivery destination still missing"
+                ):
                     return "Handoff: delivery today — address needs confirmation"
                 return "Handoff: delivery today — address confirmed"
-            if handoff_focus_summary.destination_label == "Delivery destination still missing":
+            if (
+                handoff_focus_summary.destination_label
+                == "Delivery destination still missing"
+            ):
                 return "Handoff: delivery — address needs confirmation"
             return "Handoff: delivery — address confirmed"
 
@@ -1812,7 +2385,10 @@ class OrderService:
             return "Invoice: customer identity needs review"
         if "line items" in blockers_text:
             return "Invoice: item totals need review"
-        if "payment due date" in missing_basics_text or "order due date" in blockers_text:
+        if (
+            "payment due date" in missing_basics_text
+            or "order due date" in blockers_text
+        ):
             return "Invoice: due date needs review"
         if invoice_focus_summary.status_label == "ready_and_paid":
             return "Invoice: ready to share"
@@ -1849,12 +2425,22 @@ class OrderService:
             return None
 
         next_step_lower = next_step.lower()
-        if not any(token in next_step_lower for token in ("review", "confirm", "clarify", "recheck")):
+        if not any(
+            token in next_step_lower
+            for token in ("review", "confirm", "clarify", "recheck")
+        ):
             return None
 
-        top_missing = review_focus_summary.missing_basics[0] if review_focus_summary.missing_basics else ""
+        top_missing = (
+            review_focus_summary.missing_basics[0]
+            if review_focus_summary.missing_basics
+            else ""
+        )
         top_missing_lower = top_missing.lower()
-        if "line items" in top_missing_lower or "pickup or delivery" in top_missing_lower:
+        if (
+            "line items" in top_missing_lower
+            or "pickup or delivery" in top_missing_lower
+        ):
             return "Review: order basics need confirmation"
         if "customer contact method" in top_missing_lower:
             return "Review: customer contact basics need review"
@@ -1867,11 +2453,80 @@ class OrderService:
             return f"Review: {item_summary}"
 
         risk_note = review_focus_summary.risk_note.strip()
-        if risk_note and risk_note != "Core order basics look present from the current record.":
+        if (
+            risk_note
+            and risk_note != "Core order basics look present from the current record."
+        ):
             return f"Review: {risk_note[:1].lower() + risk_note[1:]}"
 
         return "Review: order basics need confirmation"
 
+    def _classify_day_running_readiness(
+        self,
+        *,
+        order: Order,
+        queue_summary: OrderQueueSummary,
+        invoice_summary: OrderInvoiceSummary,
+        payment_summary: OrderPaymentSummary,
+        production_readiness_label: str,
+        has_handoff_gaps: bool,
+        contact_readiness_label: str,
+        clock: OrderClock,
+    ) -> str:
+        """Return the day-running readiness label without building any of its copy.
+
+        Mirrors the concern checks in ``_build_day_running_focus_summary``: any
+        concern makes the order need attention, and the blocking ones push it
+        to blocked.
+        """
+        today = clock.today
+        is_due_now = queue_summary.is_due_today or queue_summary.is_overdue
+        has_concern = False
+        is_blocked = False
+
+        if not invoice_summary.is_ready:
+            has_concern = is_blocked = True
+
+        if (
+            payment_summary.deposit_outstanding > 0
+            and order.deposit_due_date is not None
+        ):
+            has_concern = True
+            is_blocked = is_blocked or order.deposit_due_date <= today
+        else:
+            balance_due_amount = round(
+                max(
+                    payment_summary.amount_due - payment_summary.deposit_outstanding,
+                    0.0,
+                ),
+                2,
+            )
+            if balance_due_amount > 0 and order.balance_due_date is not None:
+                if order.balance_due_date <= today:
+                    has_concern = is_blocked = True
+                elif is_due_now:
+                    has_concern = True
+
+        if production_readiness_label == "Missing basics":
+            has_concern = is_blocked = True
+        elif production_readiness_label == "Needs clarification":
+            has_concern = True
+
+        if has_handoff_gaps and is_due_now:
+            has_concern = is_blocked = True
+
+        if contact_readiness_label == "Missing contact basics":
+            has_concern = True
+            is_blocked = is_blocked or is_due_now
+        elif contact_readiness_label == "Limited contact info" and is_due_now:
+            has_concern = True
+
+        if is_blocked:
+            return "Blocked for today"
+        if has_concern:
+            return "Needs attention today"
+        return "Ready for today"
+
     def _build_day_running_focus_summary(
         self,
         *,
@@ -1886,6 +2541,7 @@ class OrderService:
         customer_summary: OrderCustomerSummary,
         invoice_focus_summary: OrderInvoiceFocusSummary,
         review_focus_summary: OrderReviewFocusSummary,
+        clock: OrderClock,
     ) -> OrderDayRunningFocusSummary:
         concerns: list[tuple[str, str, str, str]] = []
 
@@ -1895,12 +2551,19 @@ class OrderService:
                     "invoice",
                     "Invoice is still missing basics for today.",
                     "Complete invoice basics",
-                    invoice_summary.missing_fields[0].replace("_", " ") if invoice_summary.missing_fields else "invoice basics missing",
+                    (
+                        invoice_summary.missing_fields[0].replace("_", " ")
+                        if invoice_summary.missing_fields
+                        else "invoice basics missing"
+                    ),
                 )
             )
 
-        if payment_summary.deposit_outstanding > 0 and order.deposit_due_date is not None:
-            if order.deposit_due_date <= _utcnow().date():
+        if (
+            payment_summary.deposit_outstanding > 0
+            and order.deposit_due_date is not None
+        ):
+            if order.deposit_due_date <= clock.today:
                 concerns.append(
                     (
                         "payment",
@@ -1919,9 +2582,15 @@ class OrderService:
                     )
                 )
         else:
-            balance_due_amount = round(max(payment_summary.amount_due - payment_summary.deposit_outstanding, 0.0), 2)
+            balance_due_amount = round(
+                max(
+                    payment_summary.amount_due - payment_summary.deposit_outstanding,
+                    0.0,
+                ),
+                2,
+            )
             if balance_due_amount > 0 and order.balance_due_date is not None:
-                if order.balance_due_date <= _utcnow().date():
+                if order.balance_due_date <= clock.today:
                     concerns.append(
                         (
                             "payment",
@@ -1959,10 +2628,14 @@ class OrderService:
                 )
             )
 
-        if handoff_focus_summary.missing_basics and (queue_summary.is_due_today or queue_summary.is_overdue):
+        if handoff_focus_summary.missing_basics and (
+            queue_summary.is_due_today or queue_summary.is_overdue
+        ):
             handoff_reason = handoff_focus_summary.missing_basics[0]
             if handoff_reason == "Confirm whether this order is pickup or delivery.":
-                handoff_reason = "Confirm pickup vs delivery so today’s release plan is clear."
+                handoff_reason = (
+                    "Confirm pickup vs delivery so today’s release plan is clear."
+                )
             concerns.append(
                 (
                     "handoff",
@@ -1981,9 +2654,8 @@ class OrderService:
                     "contact basics missing",
                 )
             )
-        elif (
-            contact_focus_summary.readiness_label == "Limited contact info"
-            and (queue_summary.is_due_today or queue_summary.is_overdue)
+        elif contact_focus_summary.readiness_label == "Limited contact info" and (
+            queue_summary.is_due_today or queue_summary.is_overdue
         ):
             concerns.append(
                 (
@@ -2003,42 +2675,39 @@ class OrderService:
         }
         concerns.sort(key=lambda item: priority.get(item[0], 99))
 
-        blocked_categories = set()
-        if not invoice_summary.is_ready:
-            blocked_categories.add("invoice")
-        if any(
-            category == "payment" and label in {"deposit overdue", "final balance overdue"}
-            for category, _reason, _next, label in concerns
-        ):
-            blocked_categories.add("payment")
-        if production_focus_summary.readiness_label == "Missing basics":
-            blocked_categories.add("production")
-        if handoff_focus_summary.missing_basics and (queue_summary.is_due_today or queue_summary.is_overdue):
-            blocked_categories.add("handoff")
-        if contact_focus_summary.readiness_label == "Missing contact basics" and (queue_summary.is_due_today or queue_summary.is_overdue):
-            blocked_categories.add("contact")
+        readiness_label = self._classify_day_running_readiness(
+            order=order,
+            queue_summary=queue_summary,
+            invoice_summary=invoice_summary,
+            payment_summary=payment_summary,
+            production_readiness_label=production_focus_summary.readiness_label,
+            has_handoff_gaps=bool(handoff_focus_summary.missing_basics),
+            contact_readiness_label=contact_focus_summary.readiness_label,
+            clock=clock,
+        )
 
-        supporting_items = [reason for _category, reason, _next_step, _label in concerns[1:4]]
+        supporting_items = [
+            reason for _category, reason, _next_step, _label in concerns[1:4]
+        ]
 
-        if blocked_categories and concerns:
-            primary_category, reason_summary, next_step, primary_label = concerns[0]
-            readiness_label = "Blocked for today"
-        elif concerns:
+        if concerns:
             primary_category, reason_summary, next_step, primary_label = concerns[0]
-            readiness_label = "Needs attention today"
         else:
             primary_category = "none"
             primary_label = "No obvious blocker"
             if queue_summary.is_due_today:
-                reason_summary = "No obvious blocker stands out from the current record for today."
+                reason_summary = (
+                    "No obvious blocker stands out from the current record for today."
+                )
                 next_step = "Proceed with today’s order plan"
             elif queue_summary.is_overdue:
                 reason_summary = "No obvious blocker stands out, but timing should be rechecked because the order is overdue."
                 next_step = "Recheck timing and proceed"
             else:
-                reason_summary = "No obvious blocker stands out from the current record for today."
+                reason_summary = (
+                    "No obvious blocker stands out from the current record for today."
+                )
                 next_step = "Keep the order on track"
-            readiness_label = "Ready for today"
 
         queue_reason_preview: Optional[str]
         queue_next_step_preview: Optional[str]
@@ -2138,17 +2807,21 @@ class OrderService:
         handoff_focus_summary: OrderHandoffFocusSummary,
         payment_focus_summary: OrderPaymentFocusSummary,
         ops_summary: OrderOpsSummary,
+        *,
+        clock: OrderClock,
     ) -> OrderReviewFocusSummary:
         customer_name = customer_summary.name or "Customer name still missing"
 
         if queue_summary.is_due_today:
-            due_label = f"Due today — {_format_datetime_label(order.due_date)}"
+            due_label = f"Due today — {_format_datetime_label(order.due_date, clock)}"
         elif queue_summary.is_overdue:
-            due_label = f"Overdue — {_format_datetime_label(order.due_date)}"
+            due_label = f"Overdue — {_format_datetime_label(order.due_date, clock)}"
         else:
-            due_label = _format_datetime_label(order.due_date)
+            due_label = _format_datetime_label(order.due_date, clock)
 
-        item_summary, item_count_label, item_count, _primary_names = self._build_item_scan_summary(order)
+        item_summary, item_count_label, item_count, _primary_names = (
+            self._build_item_scan_summary(order)
+        )
 
         if payment_summary.amount_due <= 0:
             payment_confidence = "Payment looks settled."
@@ -2188,7 +2861,9 @@ class OrderService:
         missing_basics = missing_basics[:4]
 
         if risk_summary.reasons:
-            risk_note = " ".join(_humanize_reason(reason) for reason in risk_summary.reasons)
+            risk_note = " ".join(
+                _humanize_reason(reason) for reason in risk_summary.reasons
+            )
         elif missing_basics:
             risk_note = missing_basics[0]
         else:
@@ -2220,6 +2895,8 @@ class OrderService:
         queue_summary: OrderQueueSummary,
         invoice_summary: OrderInvoiceSummary,
         risk_summary: OrderRiskSummary,
+        *,
+        clock: OrderClock,
     ) -> OrderOpsSummary:
         def format_due(value: Optional[date]) -> str:
             return _format_bakery_date_only(value) if value else "not scheduled"
@@ -2239,10 +2916,14 @@ class OrderService:
                 ops_attention=ops_attention,
                 primary_cta_label=primary_cta_label,
                 primary_cta_panel=primary_cta_panel,
-                primary_cta_path=primary_cta_path or f"/orders/{order.id}?panel={primary_cta_panel}",
+                primary_cta_path=primary_cta_path
+                or f"/orders/{order.id}?panel={primary_cta_panel}",
             )
 
-        balance_due_amount = round(max(payment_summary.amount_due - payment_summary.deposit_outstanding, 0.0), 2)
+        balance_due_amount = round(
+            max(payment_summary.amount_due - payment_summary.deposit_outstanding, 0.0),
+            2,
+        )
 
         if not invoice_summary.is_ready:
             return build_summary(
@@ -2253,8 +2934,11 @@ class OrderService:
                 primary_cta_panel="invoice",
             )
 
-        if payment_summary.deposit_outstanding > 0 and order.deposit_due_date is not None:
-            if order.deposit_due_date <= _utcnow().date():
+        if (
+            payment_summary.deposit_outstanding > 0
+            and order.deposit_due_date is not None
+        ):
+            if order.deposit_due_date <= clock.today:
                 return build_summary(
                     action_class="payment_now",
                     next_action="Collect overdue deposit",
@@ -2277,7 +2961,7 @@ class OrderService:
             )
 
         if balance_due_amount > 0 and order.balance_due_date is not None:
-            if order.balance_due_date <= _utcnow().date():
+            if order.balance_due_date <= clock.today:
                 return build_summary(
                     action_class="payment_now",
                     next_action="Collect overdue balance",
@@ -2334,223 +3018,319 @@ class OrderService:
             primary_cta_panel="review",
         )
 
-    def _build_order_reads(self, orders: Iterable[Order]) -> list[OrderRead]:
+    def _build_order_reads(
+        self,
+        orders: Iterable[Order],
+        *,
+        fields: Optional[Collection[str]] = None,
+        clock: Optional[OrderClock] = None,
+    ) -> list[OrderRead]:
+        """Build read models for ``orders``.
+
+        With ``fields`` set the models are partial: only those fields are set
+        (serialize with ``exclude_unset``), and summaries no requested field
+        depends on are never built. Every model is evaluated at one ``clock``,
+        captured here unless the caller already holds the request's.
+        """
         order_list = list(orders)
-        related_by_key = self._build_related_orders_map(order_list)
+        clock = clock or OrderClock.capture()
+        self._preload_order_relations(order_list)
+        wanted = ORDER_READ_FIELDS if fields is None else fields
+        history_summaries = (
+            self._build_customer_history_summaries(order_list)
+            if "customer_history_summary" in wanted
+            else {}
+        )
+        recent_orders = (
+            self._build_recent_customer_orders_map(order_list)
+            if "recent_customer_orders" in wanted
+            else {}
+        )
+        if fields is None:
+            return [
+                self._to_order_read(
+                    order,
+                    clock=clock,
+                    customer_history_summary=history_summaries[order.id],
+                    recent_customer_orders=recent_orders[order.id],
+                )
+                for order in order_list
+            ]
+        fields_set = set(fields)
         return [
-            self._to_order_read(
-                order,
-                related_orders=related_by_key.get(self._primary_history_key(order) or "", []),
+            OrderRead.model_construct(
+                _fields_set=fields_set,
+                **_OrderReadParts(
+                    self,
+                    order,
+                    clock=clock,
+                    customer_history_summary=history_summaries.get(order.id),
+                    recent_customer_orders=recent_orders.get(order.id),
+                ).project(fields),
             )
             for order in order_list
         ]
 
+    def _preload_order_relations(self, orders: list[Order]) -> None:
+        """Load items and linked contacts for ``orders`` with one query each.
+
+        Both relationships are lazy on ``Order``, so a page of N orders would
+        otherwise issue up to 2N SELECTs while the read models are built.
+        """
+        missing_items = [
+            order for order in orders if "items" in sa_inspect(order).unloaded
+        ]
+        if missing_items:
+            items_by_order: dict[UUID, list[OrderItem]] = defaultdict(list)
+            item_rows = self.session.exec(
+                select(OrderItem).where(
+                    OrderItem.order_id.in_([order.id for order in missing_items])
+                )
+            ).all()
+            for item in item_rows:
+                items_by_order[item.order_id].append(item)
+            for order in missing_items:
+                set_committed_value(order, "items", items_by_order.get(order.id, []))
+
+        missing_customers = [
+            order
+            for order in orders
+            if order.customer_contact_id is not None
+            and "customer" in sa_inspect(order).unloaded
+        ]
+        if missing_customers:
+            contact_ids = {order.customer_contact_id for order in missing_customers}
+            contacts = {
+                contact.id: contact
+                for contact in self.session.exec(
+                    select(Contact).where(Contact.id.in_(contact_ids))
+                ).all()
+            }
+            for order in missing_customers:
+                set_committed_value(
+                    order, "customer", contacts.get(order.customer_contact_id)
+                )
+
     def _to_order_read(
         self,
         order: Order,
         *,
-        related_orders: Optional[list[Order]] = None,
+        clock: OrderClock,
+        customer_history_summary: Optional[OrderCustomerHistorySummary] = None,
+        recent_customer_orders: Optional[list[OrderRecentCustomerOrder]] = None,
     ) -> OrderRead:
-        customer_name = order.customer_name or (_build_contact_name(order.customer) if order.customer else None)
-        customer_email = order.customer_email or (order.customer.email if order.customer else None)
-        customer_phone = order.customer_phone or (order.customer.phone if order.customer else None)
-        related_order_list = related_orders
-        if related_order_list is None:
-            related_order_list = self._build_related_orders_map([order]).get(
-                self._primary_history_key(order) or "",
-                [],
-            )
-        payment_summary = self._build_payment_summary(order)
-        queue_summary = self._build_queue_summary(order)
-        invoice_summary = self._build_invoice_summary(order)
-        customer_summary = OrderCustomerSummary(
-            contact_id=order.customer_contact_id,
-            name=customer_name,
-            email=customer_email,
-            phone=customer_phone,
-            is_linked_contact=order.customer_contact_id is not None,
-        )
-        invoice_focus_summary = self._build_invoice_focus_summary(
+        parts = _OrderReadParts(
+            self,
             order,
-            customer_summary,
-            payment_summary,
-            invoice_summary,
+            clock=clock,
+            customer_history_summary=customer_history_summary,
+            recent_customer_orders=recent_customer_orders,
         )
-        risk_summary = self._build_risk_summary(order, payment_summary, queue_summary)
-        ops_summary = self._build_ops_summary(
-            order,
-            payment_summary,
-            queue_summary,
-            invoice_summary,
-            risk_summary,
+        return OrderRead(**parts.project(ORDER_READ_FIELDS))
+
+
+# Per-builder timings for /metrics; a no-op outside HTTP requests.
+instrument_builders(OrderService)
+
+
+class _OrderReadParts:
+    """The fields of one order's ``OrderRead``, each built on first access.
+
+    Summaries depend on each other, so resolving a projection only runs the
+    builders its fields actually reach.
+    """
+
+    _CUSTOMER_FIELDS = {
+        "customer_name": "name",
+        "customer_email": "email",
+        "customer_phone": "phone",
+    }
+    _IMPORT_METADATA_FIELDS = ("is_imported", "legacy_status_raw", "import_source")
+    _REVIEW_TRIAGE_FIELDS = (
+        "review_reasons",
+        "primary_review_reason",
+        "review_next_check",
+    )
+    _IMPORT_PRIORITY_FIELDS = ("imported_priority_rank", "imported_priority_label")
+
+    def __init__(
+        self,
+        service: OrderService,
+        order: Order,
+        *,
+        clock: OrderClock,
+        customer_history_summary: Optional[OrderCustomerHistorySummary] = None,
+        recent_customer_orders: Optional[list[OrderRecentCustomerOrder]] = None,
+    ):
+        self.service = service
+        self.order = order
+        self.clock = clock
+        if customer_history_summary is not None:
+            self.customer_history_summary = customer_history_summary
+        if recent_customer_orders is not None:
+            self.recent_customer_orders = recent_customer_orders
+
+    def project(self, fields: Iterable[str]) -> dict:
+        return {field: self.value(field) for field in fields}
+
+    def value(self, field: str):
+        if field in self._CUSTOMER_FIELDS:
+            return getattr(self.customer_summary, self._CUSTOMER_FIELDS[field])
+        if field in self._IMPORT_METADATA_FIELDS:
+            return self.import_metadata[self._IMPORT_METADATA_FIELDS.index(field)]
+        if field in self._REVIEW_TRIAGE_FIELDS:
+            return self.review_triage[self._REVIEW_TRIAGE_FIELDS.index(field)]
+        if field in self._IMPORT_PRIORITY_FIELDS:
+            return self.import_priority[self._IMPORT_PRIORITY_FIELDS.index(field)]
+        if field == "items":
+            return list(self.order.items)
+        if field.endswith("_summary") or field == "recent_customer_orders":
+            return getattr(self, field)
+        return getattr(self.order, field)
+
+    @cached_property
+    def customer_summary(self) -> OrderCustomerSummary:
+        return self.service._build_customer_summary(self.order)
+
+    @cached_property
+    def customer_history_summary(self) -> OrderCustomerHistorySummary:
+        return self.service._build_customer_history_summary(self.order)
+
+    @cached_property
+    def recent_customer_orders(self) -> list[OrderRecentCustomerOrder]:
+        return self.service._build_recent_customer_orders_map([self.order])[
+            self.order.id
+        ]
+
+    @cached_property
+    def payment_summary(self) -> OrderPaymentSummary:
+        return self.service._build_payment_summary(self.order)
+
+    @cached_property
+    def queue_summary(self) -> OrderQueueSummary:
+        return self.service._build_queue_summary(self.order, clock=self.clock)
+
+    @cached_property
+    def invoice_summary(self) -> OrderInvoiceSummary:
+        return self.service._build_invoice_summary(self.order)
+
+    @cached_property
+    def invoice_focus_summary(self) -> OrderInvoiceFocusSummary:
+        return self.service._build_invoice_focus_summary(
+            self.order,
+            self.customer_summary,
+            self.payment_summary,
+            self.invoice_summary,
+            clock=self.clock,
         )
-        is_imported, legacy_status_raw, import_source = self._derive_import_metadata(order)
-        payment_focus_summary = self._build_payment_focus_summary(
-            order,
-            payment_summary,
-            queue_summary,
-            risk_summary,
-            ops_summary,
-            is_imported=is_imported,
+
+    @cached_property
+    def risk_summary(self) -> OrderRiskSummary:
+        return self.service._build_risk_summary(
+            self.order, self.payment_summary, self.queue_summary, clock=self.clock
         )
-        review_reasons, primary_review_reason, review_next_check = self._build_import_review_triage(
-            is_imported=is_imported,
-            customer_summary=customer_summary,
-            invoice_summary=invoice_summary,
-            risk_summary=risk_summary,
+
+    @cached_property
+    def ops_summary(self) -> OrderOpsSummary:
+        return self.service._build_ops_summary(
+            self.order,
+            self.payment_summary,
+            self.queue_summary,
+            self.invoice_summary,
+            self.risk_summary,
+            clock=self.clock,
         )
-        handoff_focus_summary = self._build_handoff_focus_summary(
-            order,
-            customer_summary,
-            queue_summary,
-            ops_summary,
+
+    @cached_property
+    def import_metadata(self) -> tuple[bool, Optional[str], Optional[str]]:
+        return self.service._derive_import_metadata(self.order)
+
+    @cached_property
+    def payment_focus_summary(self) -> OrderPaymentFocusSummary:
+        return self.service._build_payment_focus_summary(
+            self.order,
+            self.payment_summary,
+            self.queue_summary,
+            self.risk_summary,
+            self.ops_summary,
+            is_imported=self.import_metadata[0],
+            clock=self.clock,
         )
-        review_focus_summary = self._build_review_focus_summary(
-            order,
-            customer_summary,
-            payment_summary,
-            invoice_summary,
-            queue_summary,
-            risk_summary,
-            handoff_focus_summary,
-            payment_focus_summary,
-            ops_summary,
+
+    @cached_property
+    def review_triage(self):
+        return self.service._build_import_review_triage(
+            is_imported=self.import_metadata[0],
+            customer_summary=self.customer_summary,
+            invoice_summary=self.invoice_summary,
+            risk_summary=self.risk_summary,
         )
-        production_focus_summary = self._build_production_focus_summary(
-            order,
-            queue_summary,
-            handoff_focus_summary,
+
+    @cached_property
+    def handoff_focus_summary(self) -> OrderHandoffFocusSummary:
+        return self.service._build_handoff_focus_summary(
+            self.order,
+            self.customer_summary,
+            self.queue_summary,
+            self.ops_summary,
+            clock=self.clock,
         )
-        contact_focus_summary = self._build_contact_focus_summary(
-            order,
-            customer_summary,
-            queue_summary,
-            risk_summary,
-            ops_summary,
+
+    @cached_property
+    def review_focus_summary(self) -> OrderReviewFocusSummary:
+        return self.service._build_review_focus_summary(
+            self.order,
+            self.customer_summary,
+            self.payment_summary,
+            self.invoice_summary,
+            self.queue_summary,
+            self.risk_summary,
+            self.handoff_focus_summary,
+            self.payment_focus_summary,
+            self.ops_summary,
+            clock=self.clock,
         )
-        day_running_focus_summary = self._build_day_running_focus_summary(
-            order=order,
-            queue_summary=queue_summary,
-            invoice_summary=invoice_summary,
-            payment_summary=payment_summary,
-            payment_focus_summary=payment_focus_summary,
-            handoff_focus_summary=handoff_focus_summary,
-            production_focus_summary=production_focus_summary,
-            contact_focus_summary=contact_focus_summary,
-            customer_summary=customer_summary,
-            invoice_focus_summary=invoice_focus_summary,
-            review_focus_summary=review_focus_summary,
+
+    @cached_property
+    def production_focus_summary(self) -> OrderProductionFocusSummary:
+        return self.service._build_production_focus_summary(
+            self.order,
+            self.queue_summary,
+            self.handoff_focus_summary,
         )
-        priority_probe = OrderRead(
-            id=order.id,
-            user_id=order.user_id,
-            customer_contact_id=order.customer_contact_id,
-            customer_name=customer_name,
-            customer_email=customer_email,
-            customer_phone=customer_phone,
-            due_date=order.due_date,
-            delivery_method=order.delivery_method,
-            notes_to_customer=order.notes_to_customer,
-            internal_notes=order.internal_notes,
-            deposit_amount=order.deposit_amount,
-            deposit_due_date=order.deposit_due_date,
-            balance_due_date=order.balance_due_date,
-            order_number=order.order_number,
-            status=order.status,
-            payment_status=order.payment_status,
-            order_date=order.order_date,
-            subtotal=order.subtotal,
-            tax=order.tax,
-            total_amount=order.total_amount,
-            balance_due=order.balance_due,
-            items=list(order.items),
-            created_at=order.created_at,
-            updated_at=order.updated_at,
-            stripe_payment_intent_id=order.stripe_payment_intent_id,
-            customer_summary=customer_summary,
-            payment_summary=payment_summary,
-            invoice_summary=invoice_summary,
-            queue_summary=queue_summary,
-            customer_history_summary=self._build_customer_history_summary_from_related(
-                order,
-                related_order_list,
-            ),
-            recent_customer_orders=self._build_recent_customer_orders(
-                order,
-                related_order_list,
-            ),
-            risk_summary=risk_summary,
-            payment_focus_summary=payment_focus_summary,
-            handoff_focus_summary=handoff_focus_summary,
-            review_focus_summary=review_focus_summary,
-            production_focus_summary=production_focus_summary,
-            contact_focus_summary=contact_focus_summary,
-            day_running_focus_summary=day_running_focus_summary,
-            invoice_focus_summary=invoice_focus_summary,
-            ops_summary=ops_summary,
-            is_imported=is_imported,
-            legacy_status_raw=legacy_status_raw,
-            import_source=import_source,
-            review_reasons=review_reasons,
-            primary_review_reason=primary_review_reason,
-            review_next_check=review_next_check,
-        )
-        imported_priority_rank, imported_priority_label = self._build_import_priority(priority_probe)
-        return OrderRead(
-            id=order.id,
-            user_id=order.user_id,
-            customer_contact_id=order.customer_contact_id,
-            customer_name=customer_name,
-            customer_email=customer_email,
-            customer_phone=customer_phone,
-            due_date=order.due_date,
-            delivery_method=order.delivery_method,
-            notes_to_customer=order.notes_to_customer,
-            internal_notes=order.internal_notes,
-            deposit_amount=order.deposit_amount,
-            deposit_due_date=order.deposit_due_date,
-            balance_due_date=order.balance_due_date,
-            order_number=order.order_number,
-            status=order.status,
-            payment_status=order.payment_status,
-            order_date=order.order_date,
-            subtotal=order.subtotal,
-            tax=order.tax,
-            total_amount=order.total_amount,
-            balance_due=order.balance_due,
-            items=list(order.items),
-            created_at=order.created_at,
-            updated_at=order.updated_at,
-            stripe_payment_intent_id=order.stripe_payment_intent_id,
-            customer_summary=customer_summary,
-            payment_summary=payment_summary,
-            invoice_summary=invoice_summary,
-            queue_summary=queue_summary,
-            customer_history_summary=self._build_customer_history_summary_from_related(
-                order,
-                related_order_list,
-            ),
-            recent_customer_orders=self._build_recent_customer_orders(
-                order,
-                related_order_list,
-            ),
-            risk_summary=risk_summary,
-            payment_focus_summary=payment_focus_summary,
-            review_focus_summary=review_focus_summary,
-            production_focus_summary=production_focus_summary,
-            contact_focus_summary=contact_focus_summary,
-            day_running_focus_summary=day_running_focus_summary,
-            invoice_focus_summary=invoice_focus_summary,
-            ops_summary=ops_summary,
-            is_imported=is_imported,
-            legacy_status_raw=legacy_status_raw,
-            import_source=import_source,
-            review_reasons=review_reasons,
-            primary_review_reason=primary_review_reason,
-            review_next_check=review_next_check,
-            handoff_focus_summary=handoff_focus_summary,
-            imported_priority_rank=imported_priority_rank,
-            imported_priority_label=imported_priority_label,
+
+    @cached_property
+    def contact_focus_summary(self) -> OrderContactFocusSummary:
+        return self.service._build_contact_focus_summary(
+            self.order,
+            self.customer_summary,
+            self.queue_summary,
+            self.risk_summary,
+            self.ops_summary,
+        )
+
+    @cached_property
+    def day_running_focus_summary(self) -> OrderDayRunningFocusSummary:
+        return self.service._build_day_running_focus_summary(
+            order=self.order,
+            queue_summary=self.queue_summary,
+            invoice_summary=self.invoice_summary,
+            payment_summary=self.payment_summary,
+            payment_focus_summary=self.payment_focus_summary,
+            handoff_focus_summary=self.handoff_focus_summary,
+            production_focus_summary=self.production_focus_summary,
+            contact_focus_summary=self.contact_focus_summary,
+            customer_summary=self.customer_summary,
+            invoice_focus_summary=self.invoice_focus_summary,
+            review_focus_summary=self.review_focus_summary,
+            clock=self.clock,
+        )
+
+    @cached_property
+    def import_priority(self) -> tuple[int, Optional[str]]:
+        return self.service._build_import_priority(
+            is_imported=self.import_metadata[0],
+            review_reasons=self.review_triage[0],
         )
 
 
@@ -2558,7 +3338,9 @@ class QuoteService:
     def __init__(self, session: Optional[Session] = None):
         self.session = session
 
-    async def create_quote(self, *, quote_in: QuoteCreate, current_user: User) -> QuoteRead:
+    async def create_quote(
+        self, *, quote_in: QuoteCreate, current_user: User
+    ) -> QuoteRead:
         quote = Quote(
             user_id=current_user.id,
             quote_number=self._generate_quote_number(),
@@ -2593,10 +3375,49 @@ class QuoteService:
         statement = select(Quote).where(Quote.user_id == current_user.id)
         if status is not None:
             statement = statement.where(Quote.status == status)
-        statement = statement.order_by(Quote.quote_date.desc()).offset(skip).limit(limit)
+        statement = (
+            statement.order_by(Quote.quote_date.desc())
+            .offset(skip)
+            .limit(limit)
+            .options(selectinload(Quote.items))
+        )
         quotes = self.session.exec(statement).all()
         return [QuoteRead.model_validate(quote) for quote in quotes]
 
+    async def get_quote_page_by_user(
+        self,
+        *,
+        current_user: User,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        status: Optional[QuoteStatus] = None,
+    ) -> CursorPage[QuoteRead]:
+        keyset = [
+            KeysetColumn(Quote.quote_date, descending=True),
+            KeysetColumn(Quote.id, descending=True),
+        ]
+        statement = select(Quote).where(Quote.user_id == current_user.id)
+        if status is not None:
+            statement = statement.where(Quote.status == status)
+        if cursor:
+            values = decode_cursor(cursor, ordering="quotes", key_count=len(keyset))
+            statement = statement.where(keyset_predicate(keyset, values))
+        statement = (
+            statement.order_by(*(key.order_by for key in keyset))
+            .limit(limit + 1)
+            .options(selectinload(Quote.items))
+        )
+        quotes = list(self.session.exec(statement).all())
+
+        next_cursor = None
+        if len(quotes) > limit:
+            quotes = quotes[:limit]
+            next_cursor = encode_keyset_cursor("quotes", keyset, quotes[-1])
+        return CursorPage(
+            items=[QuoteRead.model_validate(quote) for quote in quotes],
+            next_cursor=next_cursor,
+        )
+
     async def get_quote_by_id(
         self, *, quote_id: UUID, current_user: User
     ) -> Optional[QuoteRead]:
@@ -0,0 +1,128 @@
+"""Bakery-midnight rollover for the persisted order triage columns.
+
+Urgency, action class, readiness and review reasons depend on "today", so
+stored triage goes stale when the day turns over. This job refreshes the
+whole book in bulk overnight, and once at startup when the day's run has not
+happened yet (after a deploy, a restart or a missed midnight); reads then
+find nothing stale beyond the orders edited since.
+
+Every worker process runs the loop, but only the one that claims the day in
+``scheduled_job_run`` does the refresh. The refresh commits in batches; if it
+fails, the claim is released and the loop retries.
+"""
+
+import asyncio
+import logging
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Callable, Optional
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import Session
+
+from app.models.scheduled_job_run import ScheduledJobRun
+from app.services.order_service import BAKERY_TIMEZONE, OrderClock, OrderService
+
+logger = logging.getLogger(__name__)
+
+ORDER_TRIAGE_ROLLOVER_JOB = "order_triage_rollover"
+# A failed rollover gives its claim back and is tried again after this long.
+ROLLOVER_RETRY_DELAY_SECONDS = 300.0
+
+
+def next_rollover_at(
+    now: datetime, bakery_timezone: ZoneInfo = BAKERY_TIMEZONE
+) -> datetime:
+    """Return the next bakery-local midnight after ``now`` as a UTC datetime."""
+    local_now = now.astimezone(bakery_timezone)
+    next_midnight = datetime.combine(
+        local_now.date() + timedelta(days=1),
+        time.min,
+        tzinfo=bakery_timezone,
+    )
+    return next_midnight.astimezone(timezone.utc)
+
+
+def run_order_triage_rollover(
+    session: Session, clock: Optional[OrderClock] = None
+) -> int:
+    """Refresh every order whose triage was computed for another day."""
+    return OrderService(session=session).refresh_order_triage(clock=clock)
+
+
+def claim_daily_job(session: Session, name: str, run_on: date) -> bool:
+    """Claim job ``name`` for ``run_on``; False when a worker already has it.
+
+    One atomic upsert: it inserts the row or moves ``run_on`` forward, and
+    touches nothing when the day is already claimed.
+    """
+    dialect = session.get_bind().dialect.name
+    if dialect not in ("sqlite", "postgresql"):
+        raise NotImplementedError(f"claim_daily_job does not support {dialect}")
+    dialect_insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+    table = ScheduledJobRun.__table__
+    statement = dialect_insert(table).values(
+        name=name, run_on=run_on, claimed_at=datetime.now(timezone.utc)
+    )
+    statement = statement.on_conflict_do_update(
+        index_elements=[table.c.name],
+        set_={
+            "run_on": statement.excluded.run_on,
+            "claimed_at": statement.excluded.claimed_at,
+        },
+        where=table.c.run_on < statement.excluded.run_on,
+    )
+    claimed = session.execute(statement).rowcount == 1
+    session.commit()
+    return claimed
+
+
+def release_daily_job(session: Session, name: str, run_on: date) -> None:
+    """Give back the claim on ``run_on`` so the next attempt can take it."""
+    session.execute(
+        update(ScheduledJobRun)
+        .where(ScheduledJobRun.name == name, ScheduledJobRun.run_on == run_on)
+        .values(run_on=run_on - timedelta(days=1))
+    )
+    session.commit()
+
+
+async def order_triage_rollover_loop(
+    session_factory: Callable[[], Session],
+    *,
+    clock: Optional[Callable[[], datetime]] = None,
+    retry_delay: float = ROLLOVER_RETRY_DELAY_SECONDS,
+) -> None:
+    now = clock or (lambda: datetime.now(timezone.utc))
+    # Catch up first; the claim fails if today's run already happened.
+    delay = 0.0
+    while True:
+        await asyncio.sleep(max(delay, 0.0))
+        try:
+            refreshed = await asyncio.to_thread(_run_with_new_session, session_factory)
+        except Exception:
+            logger.exception(
+                "Order triage rollover failed; retrying in %s seconds", retry_delay
+            )
+            delay = retry_delay
+            continue
+        if refreshed is None:
+            logger.info("Order triage rollover already claimed by another worker")
+        else:
+            logger.info("Order triage rollover refreshed %s order(s)", refreshed)
+        delay = (next_rollover_at(now()) - now()).total_seconds()
+
+
+def _run_with_new_session(session_factory: Callable[[], Session]) -> Optional[int]:
+    with session_factory() as session:
+        clock = OrderClock.capture()
+        if not claim_daily_job(session, ORDER_TRIAGE_ROLLOVER_JOB, clock.today):
+            return None
+        try:
+            return run_order_triage_rollover(session, clock)
+        except Exception:
+            # Batches already committed stay current; the rest waits for a retry.
+            session.rollback()
+            release_daily_job(session, ORDER_TRIAGE_ROLLOVER_JOB, clock.today)
+            raise
@@ -1,6 +1,6 @@
 from typing import Optional
 from uuid import UUID
-from sqlmodel import Session, select
+from sqlmodel import Session
 
 from app.models.pricing_config import (
     PricingConfiguration,
@@ -8,26 +8,26 @@ from app.models.pricing_config import (
     PricingConfigurationUpdate,
 )
 from app.models.user import User  # For type hinting current_user
+from app.repositories.cached import cached_repository
 from app.repositories.sqlite_adapter import SQLiteRepository
 
 
 class PricingService:
     def __init__(self, session: Session):
-        self.pricing_config_repo = SQLiteRepository(model=PricingConfiguration)  # type: ignore
+        self.pricing_config_repo = cached_repository(
+            SQLiteRepository(model=PricingConfiguration, session=session),  # type: ignore
+            ttl_seconds=300,
+        )
         self.session = session
 
     async def get_pricing_configuration(
         self, *, current_user: User
     ) -> Optional[PricingConfiguration]:
         """Retrieve the pricing configuration for the current user."""
-        # Assuming user_id is the filter key for the repository
-        # config = await self.pricing_config_repo.get_by_attribute(attribute_name="user_id", attribute_value=current_user.id)
-        # Direct query for unique constraint on user_id:
-        statement = select(PricingConfiguration).where(
-            PricingConfiguration.user_id == current_user.id
+        # user_id is unique, so this is one cached row per baker.
+        return await self.pricing_config_repo.get_by_attribute(
+            attribute_name="user_id", attribute_value=current_user.id
         )
-        config = self.session.exec(statement).first()
-        return config
 
     async def create_or_update_pricing_configuration(
         self, *, config_in: PricingConfigurationUpdate, current_user: User
@@ -29,6 +29,7 @@ from app.models.recipe import (
 )
 from app.models.ingredient import Ingredient
 from app.models.user import User  # For type hinting current_user
+from app.repositories.cached import cached_repository
 from app.repositories.sqlite_adapter import (
     SQLiteRepository,
 )  # Or a generic repository factory
@@ -36,9 +37,13 @@ from app.repositories.sqlite_adapter import (
 
 class RecipeService:
     def __init__(self, session: Session):
-        self.recipe_repo = SQLiteRepository(model=Recipe)  # type: ignore
-        self.ingredient_repo = SQLiteRepository(model=Ingredient)  # type: ignore
-        self.recipe_ingredient_link_repo = SQLiteRepository(model=RecipeIngredientLink)  # type: ignore
+        self.recipe_repo = SQLiteRepository(model=Recipe, session=session)  # type: ignore
+        # Cost calculation looks up every ingredient of the recipe.
+        self.ingredient_repo = cached_repository(
+            SQLiteRepository(model=Ingredient, session=session),  # type: ignore
+            ttl_seconds=300,
+        )
+        self.recipe_ingredient_link_repo = SQLiteRepository(model=RecipeIngredientLink, session=session)  # type: ignore
         self.session = session
 
     async def _calculate_recipe_cost(
@@ -26,6 +26,7 @@ from app.models.order import (
     OrderItemCreate,
     OrderStatus as AppOrderStatus,
 )  # Main app order status
+from app.repositories.cached import cached_repository
 from app.repositories.sqlite_adapter import SQLiteRepository
 from app.services.order_service import (
     OrderService,
@@ -36,7 +37,11 @@ from app.core.config import settings
 
 class ShopService:
     def __init__(self, session: Session):
-        self.shop_config_repo = SQLiteRepository(model=ShopConfiguration)  # type: ignore
+        # The public storefront looks its shop up by slug on every request.
+        self.shop_config_repo = cached_repository(
+            SQLiteRepository(model=ShopConfiguration, session=session),  # type: ignore
+            ttl_seconds=60,
+        )
         self.session = session
         self.order_service = OrderService(
             session=session
@@ -111,11 +116,9 @@ class ShopService:
     async def get_shop_configuration_by_slug(
         self, *, shop_slug: str
     ) -> Optional[ShopConfiguration]:
-        statement = select(ShopConfiguration).where(
-            ShopConfiguration.shop_slug == shop_slug
+        return await self.shop_config_repo.get_by_attribute(
+            attribute_name="shop_slug", attribute_value=shop_slug
         )
-        shop_config = self.session.exec(statement).first()
-        return shop_config
 
     async def update_shop_configuration(
         self,
@@ -166,6 +169,7 @@ class ShopService:
 
         self.session.add(db_shop_config)
         self.session.commit()
+        self.shop_config_repo.invalidate()
         self.session.refresh(db_shop_config)
         return db_shop_config
 
@@ -177,6 +181,7 @@ class ShopService:
             return None
         self.session.delete(db_shop_config)
         self.session.commit()
+        self.shop_config_repo.invalidate()
         return db_shop_config  # Return the deleted object, or just a success message
 
     async def get_public_shop_view(self, *, shop_slug: str) -> Optional[PublicShopView]:
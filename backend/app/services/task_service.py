@@ -1,4 +1,4 @@
-from typing import List, Optional, Dict
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 from datetime import datetime, date, timedelta
 from sqlmodel import Session, select
@@ -6,6 +6,7 @@ from sqlmodel import Session, select
 from app.models.task import Task, TaskCreate, TaskUpdate, TaskStatus
 from app.models.user import User
 from app.models.order import Order, OrderStatus  # For linking tasks to orders
+from app.repositories.cursor import CursorPage
 from app.repositories.sqlite_adapter import SQLiteRepository
 from app.services.email_service import (
     EmailService,
@@ -15,7 +16,7 @@ from app.core.config import settings
 
 class TaskService:
     def __init__(self, session: Session):
-        self.task_repo = SQLiteRepository(model=Task)  # type: ignore
+        self.task_repo = SQLiteRepository(model=Task, session=session)  # type: ignore
         self.session = session
         self.email_service = EmailService()  # Instantiate EmailService
 
@@ -46,6 +47,45 @@ class TaskService:
         skip: int = 0,
         limit: int = 100,
     ) -> List[Task]:
+        filters = self._list_filters(
+            current_user, status, priority, due_date_start, due_date_end, order_id
+        )
+        tasks = await self.task_repo.get_multi(
+            filters=filters,
+            skip=skip,
+            limit=limit,
+            sort_by="due_date",  # Sort by due date by default
+        )
+        return tasks
+
+    async def get_task_page_by_user(
+        self,
+        *,
+        current_user: User,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[int] = None,
+        due_date_start: Optional[datetime] = None,
+        due_date_end: Optional[datetime] = None,
+        order_id: Optional[UUID] = None,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+    ) -> CursorPage[Task]:
+        filters = self._list_filters(
+            current_user, status, priority, due_date_start, due_date_end, order_id
+        )
+        return await self.task_repo.get_page(
+            filters=filters, cursor=cursor, limit=limit, sort_by="due_date"
+        )
+
+    @staticmethod
+    def _list_filters(
+        current_user: User,
+        status: Optional[TaskStatus],
+        priority: Optional[int],
+        due_date_start: Optional[datetime],
+        due_date_end: Optional[datetime],
+        order_id: Optional[UUID],
+    ) -> Dict[str, Any]:
         filters: Dict[str, Any] = {"user_id": current_user.id}
         if status:
             filters["status"] = status
@@ -57,14 +97,7 @@ class TaskService:
             filters["due_date__gte"] = due_date_start
         if due_date_end:
             filters["due_date__lte"] = due_date_end
-
-        tasks = await self.task_repo.get_multi(
-            filters=filters,
-            skip=skip,
-            limit=limit,
-            sort_by="due_date",  # Sort by due date by default
-        )
-        return tasks
+        return filters
 
     async def update_task(
         self, *, task_id: UUID, task_in: TaskUpdate, current_user: User
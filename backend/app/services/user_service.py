@@ -4,8 +4,10 @@ from uuid import UUID
 from sqlmodel import Session, select
 from sqlalchemy.orm import selectinload
 
-from app.models.user import User, UserCreate
-from app.auth.security import get_password_hash, verify_password
+from app.core.config import settings
+from app.models.user import User, UserCreate, UserUpdate
+from app.auth.security import password_hasher
+from app.repositories.cached import cached_repository
 from app.repositories.sqlite_adapter import (
     SQLiteRepository,
 )  # Or a generic repository factory
@@ -15,7 +17,12 @@ class UserService:
     def __init__(self, session: Session):
         # In a more complex setup, you might inject a repository factory
         # or specific repositories. For now, directly using SQLiteRepository.
-        self.user_repo = SQLiteRepository(model=User)  # type: ignore
+        self.user_repo = SQLiteRepository(model=User, session=session)  # type: ignore
+        # Auth resolves the token's user on every request; keep those rows
+        # briefly so a deactivation still takes effect within seconds.
+        self.principal_repo = cached_repository(
+            self.user_repo, ttl_seconds=settings.AUTH_PRINCIPAL_CACHE_SECONDS
+        )
         self.session = (
             session  # Pass session to repo methods if they don_t manage their own
         )
@@ -29,12 +36,38 @@ class UserService:
         return user
 
     async def get_user_by_id(self, user_id: UUID) -> Optional[User]:
-        statement = select(User).where(User.id == user_id).options(selectinload(User.recipes))
+        statement = (
+            select(User).where(User.id == user_id).options(selectinload(User.recipes))
+        )
         user = self.session.exec(statement).first()
         return user
 
+    async def get_principal(self, user_id: UUID) -> Optional[User]:
+        """The user behind an access token, without relationships.
+
+        Served from the reference cache; ``recipes`` and friends still
+        lazy-load if a caller touches them.
+        """
+        return await self.principal_repo.get(id=user_id)
+
+    async def update_user(self, user: User, user_in: UserUpdate) -> User:
+        update_data = user_in.model_dump(exclude_unset=True)
+        password = update_data.pop("password", None)
+        if password:
+            update_data["hashed_password"] = await password_hasher.hash(password)
+        for field, value in update_data.items():
+            setattr(user, field, value)
+        self.session.add(user)
+        self.session.commit()
+        self.principal_repo.invalidate()
+        self.session.refresh(user)
+        return user
+
+    async def deactivate_user(self, user: User) -> User:
+        return await self.update_user(user, UserUpdate(is_active=False))
+
     async def create_user(self, user_create: UserCreate) -> User:
-        hashed_password = get_password_hash(user_create.password)
+        hashed_password = await password_hasher.hash(user_create.password)
         # Create a dictionary for user creation, excluding the plain password
         user_data = user_create.model_dump(exclude={"password"})
         db_user = User(**user_data, hashed_password=hashed_password)
@@ -48,8 +81,18 @@ class UserService:
         user = await self.get_user_by_email(email=email)
         if not user:
             return None
-        if not verify_password(password, user.hashed_password):
+        verified, new_hash = await password_hasher.verify_and_update(
+            password, user.hashed_password
+        )
+        if not verified:
             return None
+        if new_hash:
+            # Stored with an older work factor; upgrade while we have the password.
+            user.hashed_password = new_hash
+            self.session.add(user)
+            self.session.commit()
+            self.principal_repo.invalidate()
+            self.session.refresh(user)
         return user
 
     # Placeholder for email verification logic
@@ -66,9 +109,6 @@ class UserService:
     async def verify_user_email(self, user_id: UUID) -> Optional[User]:
         user = await self.get_user_by_id(user_id=user_id)
         if user and not user.is_active:  # Or a specific `is_verified` field
-            user.is_active = True  # Activate user upon email verification
-            self.session.add(user)
-            self.session.commit()
-            self.session.refresh(user)
-            return user
+            # Activate user upon email verification
+            return await self.update_user(user, UserUpdate(is_active=True))
         return None
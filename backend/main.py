@@ -1,10 +1,17 @@
-from fastapi import FastAPI
+import asyncio
+
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from sqlmodel import SQLModel
+from sqlmodel import SQLModel, Session
 from contextlib import asynccontextmanager
 from app.core.config import settings
+from app.api.metrics import MetricsMiddleware, router as metrics_router
 from app.api.v1.api import api_router as api_v1_router
+from app.auth.security import PasswordHasherBusy
+from app.repositories.cursor import NEXT_CURSOR_HEADER, InvalidCursorError
 from app.repositories.sqlite_adapter import engine, ensure_sqlite_order_schema
+from app.services.order_triage_rollover import order_triage_rollover_loop
 from app.models import __all__ as all_models
 from seed import seed_data
 
@@ -18,8 +25,15 @@ async def lifespan(app: FastAPI):
     create_db_and_tables()
     print("Database tables created (if they didn't exist).")
     await seed_data()
+    rollover_task = None
+    if settings.ORDER_TRIAGE_ROLLOVER_ENABLED:
+        rollover_task = asyncio.create_task(
+            order_triage_rollover_loop(lambda: Session(engine))
+        )
     yield
     # Shutdown code here, if any
+    if rollover_task is not None:
+        rollover_task.cancel()
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -33,8 +47,25 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["POST", "GET", "PUT", "DELETE"],
     allow_headers=["Content-Type", "Authorization"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(metrics_router)
+
+@app.exception_handler(InvalidCursorError)
+async def invalid_cursor_handler(request: Request, exc: InvalidCursorError):
+    return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content={"detail": str(exc)})
+
+@app.exception_handler(PasswordHasherBusy)
+async def password_hasher_busy_handler(request: Request, exc: PasswordHasherBusy):
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": str(exc)},
+        headers={"Retry-After": "1"},
+    )
+
 app.include_router(api_v1_router, prefix=settings.API_V1_STR)
 
 @app.get("/health", tags=["Health"])
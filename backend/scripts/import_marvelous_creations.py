@@ -13,13 +13,41 @@ from sqlmodel import SQLModel, Session, select
 from app.models import __all__ as _models  # noqa: F401
 from app.models.user import User
 from app.repositories.sqlite_adapter import engine, ensure_sqlite_order_schema
-from app.services.marvelous_importer import MarvelousCreationsImporter
+from app.services.marvelous_importer import (
+    DEFAULT_IMPORT_CHUNK_SIZE,
+    MarvelousCreationsImporter,
+)
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser(description="Import Marvelous Creations XLSX data into BakeMate.")
-    parser.add_argument("workbook", help="Path to the Marvelous Creations XLSX workbook")
-    parser.add_argument("--user-email", required=True, help="BakeMate user email that should own imported records")
+    parser = argparse.ArgumentParser(
+        description="Import Marvelous Creations XLSX data into BakeMate."
+    )
+    parser.add_argument(
+        "workbook", help="Path to the Marvelous Creations XLSX workbook"
+    )
+    parser.add_argument(
+        "--user-email",
+        required=True,
+        help="BakeMate user email that should own imported records",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_IMPORT_CHUNK_SIZE,
+        help="Rows per committed chunk; a re-run of the same workbook resumes after the last one",
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Ignore the progress of earlier runs of this workbook and compare every row again",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="Processes that parse rows while this one writes them; 0 parses in this process",
+    )
     args = parser.parse_args()
 
     workbook_path = Path(args.workbook).expanduser().resolve()
@@ -34,17 +62,29 @@ def main() -> int:
         if user is None:
             raise SystemExit(f"No BakeMate user found for email: {args.user_email}")
 
-        importer = MarvelousCreationsImporter(session=session, current_user=user)
-        result = importer.import_workbook(workbook_path)
+        importer = MarvelousCreationsImporter(
+            session=session,
+            current_user=user,
+            chunk_size=args.chunk_size,
+            workers=args.workers,
+        )
+        result = importer.import_workbook(workbook_path, restart=args.restart)
 
     print("Marvelous Creations import complete")
     print(f"  contacts_created: {result.counts.contacts_created}")
     print(f"  contacts_matched: {result.counts.contacts_matched}")
     print(f"  orders_created: {result.counts.orders_created}")
+    print(f"  orders_updated: {result.counts.orders_updated}")
+    print(f"  orders_unchanged: {result.counts.orders_unchanged}")
     print(f"  orders_skipped_as_quotes: {result.counts.orders_skipped_as_quotes}")
     print(f"  expenses_created: {result.counts.expenses_created}")
+    print(f"  expenses_updated: {result.counts.expenses_updated}")
+    print(f"  expenses_unchanged: {result.counts.expenses_unchanged}")
     print(f"  mileage_created: {result.counts.mileage_created}")
+    print(f"  mileage_updated: {result.counts.mileage_updated}")
+    print(f"  mileage_unchanged: {result.counts.mileage_unchanged}")
     print(f"  skipped_empty_rows: {result.counts.skipped_empty_rows}")
+    print(f"  rows_already_imported: {result.counts.rows_already_imported}")
     if result.warnings.items:
         print("Warnings:")
         for warning in result.warnings.items:
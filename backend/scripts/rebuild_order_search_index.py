@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from sqlmodel import SQLModel
+
+from app.models import __all__ as _models  # noqa: F401
+from app.models.order_search import (
+    create_order_search_index,
+    rebuild_order_search_index,
+)
+from app.repositories.sqlite_adapter import engine, ensure_sqlite_order_schema
+
+
+def main() -> int:
+    argparse.ArgumentParser(
+        description="Rebuild the SQLite full-text index used by order search and typeahead."
+    ).parse_args()
+
+    SQLModel.metadata.create_all(engine)
+    ensure_sqlite_order_schema(engine)
+
+    with engine.begin() as connection:
+        if not create_order_search_index(connection):
+            raise SystemExit("Order search index is not available for this database.")
+        rebuild_order_search_index(connection)
+
+    print("Order search index rebuilt")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -14,6 +14,16 @@ warnings.filterwarnings(
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_reference_cache():
+    """Keep cached reference rows from leaking between tests."""
+    from app.repositories.cached import reference_cache
+
+    reference_cache.clear()
+    yield
+    reference_cache.clear()
+
+
 @pytest.fixture
 async def async_client():
     """Create an async client for testing."""
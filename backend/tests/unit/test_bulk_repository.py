@@ -0,0 +1,202 @@
+import asyncio
+from datetime import datetime, timezone
+from typing import Optional
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import UniqueConstraint, event
+from sqlmodel import Field, Session, SQLModel, create_engine, select
+
+from app.models.order import Order
+from app.repositories.airtable_adapter import AirtableRepository
+from app.repositories.sqlite_adapter import SQLiteRepository
+
+
+class BulkItem(SQLModel, table=True):
+    __tablename__ = "bulk_item"
+    __table_args__ = (UniqueConstraint("user_id", "sku"),)
+
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    user_id: UUID
+    sku: str
+    name: str
+    price: float = 0
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+def test_sqlite_bulk_operations_batch_statements(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'bulk.db'}")
+    SQLModel.metadata.create_all(engine, tables=[BulkItem.__table__])
+    statements = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, params, context, executemany: statements.append(
+            (statement.split()[0], executemany)
+        ),
+    )
+    user_id = uuid4()
+
+    with Session(engine) as session:
+        repo = SQLiteRepository(BulkItem, session=session)
+        created = asyncio.run(
+            repo.bulk_create(
+                objs_in=[
+                    {"user_id": user_id, "sku": f"SKU-{index}", "name": f"Cake {index}"}
+                    for index in range(5)
+                ]
+            )
+        )
+        assert [item.sku for item in created] == [f"SKU-{index}" for index in range(5)]
+        assert statements.count(("INSERT", True)) == 1
+
+        cached = session.get(BulkItem, created[0].id)
+        statements.clear()
+        assert (
+            asyncio.run(
+                repo.bulk_update(
+                    updates=[
+                        {"id": item.id, "price": 10.0 + index}
+                        for index, item in enumerate(created)
+                    ]
+                )
+            )
+            == 5
+        )
+        assert statements == [("UPDATE", True)]
+        assert cached.price == 10.0
+
+        original_created_at = created[1].created_at
+        written = asyncio.run(
+            repo.bulk_upsert(
+                objs_in=[
+                    {
+                        "user_id": user_id,
+                        "sku": "SKU-1",
+                        "name": "Renamed",
+                        "price": 99.0,
+                    },
+                    {"user_id": user_id, "sku": "SKU-9", "name": "New cake"},
+                ],
+                key_fields=["user_id", "sku"],
+            )
+        )
+        assert written == 2
+        rows = {item.sku: item for item in session.exec(select(BulkItem)).all()}
+        assert len(rows) == 6
+        assert rows["SKU-1"].id == created[1].id
+        assert (rows["SKU-1"].name, rows["SKU-1"].price) == ("Renamed", 99.0)
+        assert rows["SKU-1"].created_at.replace(
+            tzinfo=None
+        ) == original_created_at.replace(tzinfo=None)
+
+        assert (
+            asyncio.run(repo.bulk_delete(ids=[created[0].id, created[2].id, uuid4()]))
+            == 2
+        )
+        assert session.get(BulkItem, created[0].id) is None
+        assert len(session.exec(select(BulkItem)).all()) == 4
+
+    with pytest.raises(ValueError, match="ORM write hooks"):
+        asyncio.run(SQLiteRepository(Order).bulk_delete(ids=[uuid4()]))
+
+
+class AirtableItem(SQLModel):
+    airtable_record_id: Optional[str] = None
+    name: str
+
+
+def test_airtable_bulk_operations_send_ten_records_per_call(monkeypatch):
+    repo = AirtableRepository(AirtableItem, table_name="Items")
+    calls = []
+
+    class FakeResponse:
+        def __init__(self, payload):
+            self.payload = payload
+
+        def json(self):
+            return self.payload
+
+    async def fake_request(method, url, **kwargs):
+        calls.append((method, kwargs))
+        if method == "DELETE":
+            return FakeResponse(
+                {
+                    "records": [
+                        {"id": rid, "deleted": True} for _, rid in kwargs["params"]
+                    ]
+                }
+            )
+        records = kwargs["json"]["records"]
+        return FakeResponse(
+            {
+                "records": [
+                    {
+                        "id": record.get("id", f"rec{index}"),
+                        "createdTime": "2026-01-01T00:00:00.000Z",
+                        "fields": record["fields"],
+                    }
+                    for index, record in enumerate(records)
+                ]
+            }
+        )
+
+    monkeypatch.setattr(repo, "_request", fake_request)
+
+    objs_in = [{"id": f"local{i}", "name": f"Cake {i}"} for i in range(23)]
+    created = asyncio.run(repo.bulk_create(objs_in=objs_in))
+    assert len(created) == 23
+    # The caller's dicts are copied, not stripped in place.
+    assert objs_in[0] == {"id": "local0", "name": "Cake 0"}
+    assert calls[0][1]["json"]["records"][0] == {"fields": {"name": "Cake 0"}}
+    assert [len(kwargs["json"]["records"]) for _, kwargs in calls] == [10, 10, 3]
+
+    calls.clear()
+    assert (
+        asyncio.run(repo.bulk_upsert(objs_in=[{"name": "Cake 1"}], key_fields=["name"]))
+        == 1
+    )
+    assert calls[0][0] == "PATCH"
+    assert calls[0][1]["json"]["performUpsert"] == {"fieldsToMergeOn": ["name"]}
+
+    calls.clear()
+    assert (
+        asyncio.run(
+            repo.bulk_update(
+                updates=[{"id": f"rec{i}", "name": "Sold out"} for i in range(12)]
+            )
+        )
+        == 12
+    )
+    assert calls[0][1]["json"]["records"][0] == {
+        "id": "rec0",
+        "fields": {"name": "Sold out"},
+    }
+
+    calls.clear()
+    assert asyncio.run(repo.bulk_delete(ids=[f"rec{i}" for i in range(12)])) == 12
+    assert [len(kwargs["params"]) for _, kwargs in calls] == [10, 2]
+
+
+def test_airtable_reads_share_one_escaped_filter_formula(monkeypatch):
+    repo = AirtableRepository(AirtableItem, table_name="Items")
+    formulas = []
+
+    class FakeResponse:
+        def json(self):
+            return {"records": []}
+
+    async def fake_request(method, url, **kwargs):
+        formulas.append(kwargs["params"]["filterByFormula"])
+        return FakeResponse()
+
+    monkeypatch.setattr(repo, "_request", fake_request)
+    asyncio.run(repo.get_multi(filters={"name": "Baker's \\ dozen", "size": 12}))
+    asyncio.run(repo.get_by_attribute(attribute_name="name", attribute_value="Baker's"))
+    asyncio.run(repo.get_page(filters={"name": "Baker's"}))
+
+    assert formulas == [
+        "AND({name}='Baker\\'s \\\\ dozen', {size}=12)",
+        "AND({name}='Baker\\'s')",
+        "AND({name}='Baker\\'s')",
+    ]
@@ -0,0 +1,180 @@
+import asyncio
+from uuid import UUID, uuid4
+
+from sqlalchemy import JSON, event
+from sqlmodel import Field, Session, SQLModel, create_engine
+
+from app.models.cache_version import CacheVersion
+from app.repositories.cached import (
+    CachedRepository,
+    CachePolicy,
+    CacheVersions,
+    ReferenceCache,
+)
+from app.repositories.sqlite_adapter import SQLiteRepository
+
+
+class CachedShop(SQLModel, table=True):
+    __tablename__ = "cached_shop"
+
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    slug: str = Field(unique=True)
+    name: str
+    products: list = Field(default_factory=list, sa_type=JSON)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'cache.db'}")
+    SQLModel.metadata.create_all(
+        engine, tables=[CachedShop.__table__, CacheVersion.__table__]
+    )
+    selects = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statement.startswith("SELECT")
+        and "cached_shop" in statement
+        and selects.append(statement),
+    )
+    return engine, selects
+
+
+def test_cached_repository_reads_through_and_invalidates_on_write(tmp_path):
+    engine, selects = make_engine(tmp_path)
+    clock = FakeClock()
+    cache = ReferenceCache(clock=clock)
+    policy = CachePolicy(ttl_seconds=60, max_entries=2)
+    with Session(engine) as session:
+        shops = [
+            CachedShop(slug=f"shop-{index}", name=f"Shop {index}", products=["cake"])
+            for index in range(3)
+        ]
+        session.add_all(shops)
+        session.commit()
+        shop_ids = [shop.id for shop in shops]
+    selects.clear()
+
+    def repo(session):
+        return CachedRepository(
+            SQLiteRepository(CachedShop, session=session), policy=policy, cache=cache
+        )
+
+    with Session(engine) as session:
+        first = asyncio.run(
+            repo(session).get_by_attribute(
+                attribute_name="slug", attribute_value="shop-0"
+            )
+        )
+        first.products.append("mutated by request one")
+    assert len(selects) == 1
+
+    with Session(engine) as session:
+        cached = asyncio.run(
+            repo(session).get_by_attribute(
+                attribute_name="slug", attribute_value="shop-0"
+            )
+        )
+        assert len(selects) == 1
+        assert cached in session
+        assert cached.products == ["cake"]
+        assert session.get(CachedShop, shop_ids[0]) is cached
+
+        # Writes through the wrapper drop the namespace.
+        asyncio.run(repo(session).update(db_obj=cached, obj_in={"name": "Renamed"}))
+    with Session(engine) as session:
+        reloaded = asyncio.run(repo(session).get(id=shop_ids[0]))
+        assert reloaded.name == "Renamed"
+        # update() refreshes the row, then the reload misses the cache.
+        assert len(selects) == 3
+
+        # LRU keeps two entries per namespace; TTL expires the rest.
+        for shop_id in shop_ids[1:]:
+            asyncio.run(repo(session).get(id=shop_id))
+        assert len(selects) == 5
+        session.expunge_all()
+        asyncio.run(repo(session).get(id=shop_ids[0]))
+        assert len(selects) == 6
+        session.expunge_all()
+        clock.now += 61
+        asyncio.run(repo(session).get(id=shop_ids[2]))
+        assert len(selects) == 7
+        assert asyncio.run(repo(session).get(id=uuid4())) is None
+
+
+def test_version_counter_keeps_worker_caches_coherent(tmp_path):
+    engine, selects = make_engine(tmp_path)
+    with Session(engine) as session:
+        shop = CachedShop(slug="bakery", name="Old name")
+        session.add(shop)
+        session.commit()
+        shop_id = shop.id
+    selects.clear()
+
+    # Two workers: their own caches, one shared database.
+    worker_a = ReferenceCache(versions=CacheVersions(engine, check_interval=0))
+    worker_b = ReferenceCache(versions=CacheVersions(engine, check_interval=0))
+
+    def read(cache):
+        with Session(engine) as session:
+            repo = CachedRepository(
+                SQLiteRepository(CachedShop, session=session), cache=cache
+            )
+            return asyncio.run(repo.get(id=shop_id)).name
+
+    assert read(worker_a) == "Old name"
+    assert read(worker_a) == "Old name"
+    assert len(selects) == 1
+
+    with Session(engine) as session:
+        repo = CachedRepository(
+            SQLiteRepository(CachedShop, session=session), cache=worker_b
+        )
+        db_shop = session.get(CachedShop, shop_id)
+        asyncio.run(repo.update(db_obj=db_shop, obj_in={"name": "New name"}))
+
+    assert read(worker_a) == "New name"
+    with Session(engine) as session:
+        assert session.get(CacheVersion, "CachedShop").version == 1
+
+
+def test_stock_helper_invalidates_cached_ingredients(tmp_path, monkeypatch):
+    import app.repositories.cached as cached_module
+    import app.services.ingredient_service as ingredient_service_module
+    from app.models.ingredient import Ingredient
+    from app.models.user import User
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'ingredients.db'}")
+    SQLModel.metadata.create_all(engine)
+    cache = ReferenceCache()
+    monkeypatch.setattr(cached_module, "reference_cache", cache)
+    monkeypatch.setattr(ingredient_service_module, "reference_cache", cache)
+    with Session(engine) as session:
+        user = User(email="stock@example.com", hashed_password="not-used")
+        session.add(user)
+        session.commit()
+        ingredient = Ingredient(
+            user_id=user.id, name="Flour", unit="g", cost=0.01, quantity_on_hand=10
+        )
+        session.add(ingredient)
+        session.commit()
+        ingredient_id = ingredient.id
+
+    def cached_stock():
+        with Session(engine) as session:
+            service = ingredient_service_module.IngredientService(session=session)
+            return asyncio.run(
+                service.ingredient_repo.get(id=ingredient_id)
+            ).stock_quantity
+
+    assert cached_stock() == 10
+    with Session(engine) as session:
+        ingredient_service_module.update_ingredient_stock(ingredient_id, 5, session)
+    assert cached_stock() == 15
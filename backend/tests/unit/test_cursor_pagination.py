@@ -0,0 +1,209 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+import app.services.order_service as order_service_module
+from app.models.order import Order, OrderStatus, Quote
+from app.models.task import Task
+from app.models.user import User
+from app.repositories.cursor import InvalidCursorError, encode_cursor
+from app.repositories.sqlite_adapter import SQLiteRepository
+from app.services.order_service import OrderService, QuoteService
+
+NOW = datetime(2026, 3, 19, 13, 0, tzinfo=timezone.utc)
+
+
+def _new_engine():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    return engine
+
+
+def _new_user(session: Session, email: str) -> User:
+    current_user = User(
+        id=uuid4(),
+        email=email,
+        hashed_password="not-used",
+        is_active=True,
+        is_superuser=False,
+    )
+    session.add(current_user)
+    session.commit()
+    return current_user
+
+
+def _walk(fetch_page) -> list:
+    items, cursor, seen_cursors = [], None, set()
+    while True:
+        page = asyncio.run(fetch_page(cursor))
+        items.extend(page.items)
+        if page.next_cursor is None:
+            return items
+        assert page.next_cursor not in seen_cursors
+        seen_cursors.add(page.next_cursor)
+        cursor = page.next_cursor
+
+
+def test_repository_pages_cover_nullable_sort_keys_without_gaps():
+    engine = _new_engine()
+    with Session(engine) as session:
+        user_id = _new_user(session, "cursor-tasks@example.com").id
+        for index in range(17):
+            session.add(
+                Task(
+                    user_id=user_id,
+                    title=f"Task {index:02d}",
+                    # Shared and missing due dates exercise the id tiebreak.
+                    due_date=(
+                        None if index % 4 == 0 else NOW + timedelta(days=index % 3)
+                    ),
+                )
+            )
+        session.add(Task(user_id=uuid4(), title="Someone else's", due_date=NOW))
+        session.commit()
+
+    with patch("app.repositories.sqlite_adapter.engine", engine):
+        repo = SQLiteRepository(Task)
+        filters = {"user_id": user_id}
+        for sort_desc in (False, True):
+            walked = _walk(
+                lambda cursor: repo.get_page(
+                    filters=filters,
+                    cursor=cursor,
+                    limit=4,
+                    sort_by="due_date",
+                    sort_desc=sort_desc,
+                )
+            )
+            dated = sorted(
+                (task for task in walked if task.due_date is not None),
+                key=lambda task: (task.due_date, task.id),
+                reverse=sort_desc,
+            )
+            undated = sorted(
+                (task for task in walked if task.due_date is None),
+                key=lambda task: task.id,
+                reverse=sort_desc,
+            )
+            assert [task.id for task in walked] == [task.id for task in dated + undated]
+            assert len(walked) == 17
+
+        first = asyncio.run(repo.get_page(filters=filters, limit=4, sort_by="due_date"))
+        # A task inserted before the cursor does not shift the next page.
+        with Session(engine) as session:
+            session.add(
+                Task(
+                    user_id=user_id,
+                    title="Late arrival",
+                    due_date=NOW - timedelta(days=9),
+                )
+            )
+            session.commit()
+        resumed = asyncio.run(
+            repo.get_page(
+                filters=filters, cursor=first.next_cursor, limit=20, sort_by="due_date"
+            )
+        )
+        assert len(resumed.items) == 13
+        assert "Late arrival" not in {task.title for task in resumed.items}
+
+        with pytest.raises(InvalidCursorError):
+            asyncio.run(
+                repo.get_page(
+                    filters=filters, cursor=first.next_cursor, sort_by="title"
+                )
+            )
+        with pytest.raises(InvalidCursorError):
+            asyncio.run(
+                repo.get_page(
+                    filters=filters, cursor="not a cursor", sort_by="due_date"
+                )
+            )
+
+
+def test_order_and_quote_pages_match_offset_ordering(monkeypatch):
+    monkeypatch.setattr(order_service_module, "_utcnow", lambda: NOW)
+    engine = _new_engine()
+    with Session(engine) as session:
+        current_user = _new_user(session, "cursor-orders@example.com")
+        statuses = [
+            OrderStatus.CONFIRMED,
+            OrderStatus.COMPLETED,
+            OrderStatus.IN_PROGRESS,
+        ]
+        for index in range(23):
+            session.add(
+                Order(
+                    user_id=current_user.id,
+                    order_number=f"ORD-CURSOR-{index:03d}",
+                    customer_name=f"Customer {index % 5}",
+                    due_date=NOW + timedelta(days=index % 4),
+                    order_date=NOW - timedelta(days=index % 6),
+                    status=statuses[index % len(statuses)],
+                    internal_notes="Legacy OrderStatusId: 2" if index % 2 else None,
+                )
+            )
+        for index in range(7):
+            session.add(
+                Quote(
+                    user_id=current_user.id,
+                    quote_number=f"Q-CURSOR-{index:03d}",
+                    quote_date=NOW - timedelta(days=index % 3),
+                )
+            )
+        session.commit()
+
+        service = OrderService(session=session)
+        for filters in ({}, {"imported_only": True}, {"open_only": True}):
+            expected = asyncio.run(
+                service.get_orders_by_user(
+                    current_user=current_user, limit=1000, **filters
+                )
+            )
+            walked = _walk(
+                lambda cursor: service.get_order_page_by_user(
+                    current_user=current_user, cursor=cursor, limit=5, **filters
+                )
+            )
+            assert [order.id for order in walked] == [
+                order.id for order in expected
+            ], filters
+
+        first = asyncio.run(
+            service.get_order_page_by_user(current_user=current_user, limit=5)
+        )
+        with pytest.raises(InvalidCursorError):
+            asyncio.run(
+                service.get_order_page_by_user(
+                    current_user=current_user,
+                    cursor=first.next_cursor,
+                    imported_only=True,
+                )
+            )
+        with pytest.raises(InvalidCursorError):
+            asyncio.run(
+                service.get_order_page_by_user(
+                    current_user=current_user,
+                    cursor=encode_cursor("orders:default", [1]),
+                )
+            )
+
+        quote_service = QuoteService(session=session)
+        walked_quotes = _walk(
+            lambda cursor: quote_service.get_quote_page_by_user(
+                current_user=current_user, cursor=cursor, limit=3
+            )
+        )
+        assert len(walked_quotes) == 7
+        assert [quote.quote_date for quote in walked_quotes] == sorted(
+            (quote.quote_date for quote in walked_quotes), reverse=True
+        )
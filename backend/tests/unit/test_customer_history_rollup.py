@@ -0,0 +1,276 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from sqlalchemy import text
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
+
+import app.services.order_service as order_service_module
+from app.models.contact import Contact
+from app.models.order import CustomerHistoryRollup, Order, OrderStatus
+from app.models.user import User
+from app.repositories.sqlite_adapter import ensure_sqlite_order_schema
+from app.services.order_service import RECENT_CUSTOMER_HISTORY_LIMIT, OrderService
+
+NOW = datetime(2026, 3, 19, 13, 0, tzinfo=timezone.utc)
+
+
+def _new_engine():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    return engine
+
+
+def _seed_orders(session: Session, current_user: User) -> None:
+    contact = Contact(
+        user_id=current_user.id, first_name="Linked", email="linked@example.com"
+    )
+    session.add(contact)
+    session.flush()
+
+    identities = [
+        {"customer_contact_id": contact.id},
+        {"customer_email": "jamie@example.com"},
+        {"customer_email": " Jamie@Example.com "},
+        {"customer_phone": "555-0100"},
+        {"customer_name": "Walk-in only"},
+    ]
+    statuses = [OrderStatus.CONFIRMED, OrderStatus.COMPLETED, OrderStatus.CANCELLED]
+    for index in range(45):
+        session.add(
+            Order(
+                user_id=current_user.id,
+                order_number=f"ORD-HISTORY-{index:03d}",
+                order_date=NOW - timedelta(days=index % 9),
+                due_date=NOW + timedelta(days=index % 4),
+                status=statuses[index % len(statuses)],
+                total_amount=20.0 + index,
+                **identities[index % len(identities)],
+            )
+        )
+    session.commit()
+
+
+def _reference_history(orders: list[Order], order: Order):
+    if not order.history_key:
+        return (
+            1,
+            0,
+            int(order.status not in {OrderStatus.COMPLETED, OrderStatus.CANCELLED}),
+            None,
+            [],
+        )
+    related = [
+        candidate for candidate in orders if candidate.history_key == order.history_key
+    ]
+    siblings = [candidate for candidate in related if candidate.id != order.id]
+    last_order_date = max(
+        (
+            candidate.order_date
+            for candidate in siblings
+            if candidate.order_date <= order.order_date
+        ),
+        default=None,
+    )
+    recent = sorted(
+        siblings,
+        key=lambda candidate: (
+            candidate.order_date,
+            candidate.created_at,
+            candidate.id,
+        ),
+        reverse=True,
+    )[:RECENT_CUSTOMER_HISTORY_LIMIT]
+    return (
+        len(related),
+        sum(1 for candidate in related if candidate.status == OrderStatus.COMPLETED),
+        sum(
+            1
+            for candidate in related
+            if candidate.status not in {OrderStatus.COMPLETED, OrderStatus.CANCELLED}
+        ),
+        last_order_date,
+        [candidate.id for candidate in recent],
+    )
+
+
+def _assert_history_matches_reference(session: Session, current_user: User) -> None:
+    service = OrderService(session=session)
+    orders = session.exec(select(Order).where(Order.user_id == current_user.id)).all()
+    order_reads = asyncio.run(
+        service.get_orders_by_user(current_user=current_user, limit=1000)
+    )
+    orders_by_id = {order.id: order for order in orders}
+    assert len(order_reads) == len(orders)
+    for order_read in order_reads:
+        summary = order_read.customer_history_summary
+        assert (
+            summary.total_orders,
+            summary.completed_orders,
+            summary.active_orders,
+            summary.last_order_date,
+            [recent.id for recent in order_read.recent_customer_orders],
+        ) == _reference_history(
+            orders, orders_by_id[order_read.id]
+        ), order_read.order_number
+
+
+def test_history_keys_are_normalized_and_rollups_match_orders(monkeypatch):
+    monkeypatch.setattr(order_service_module, "_utcnow", lambda: NOW)
+    engine = _new_engine()
+
+    with Session(engine) as session:
+        current_user = User(
+            id=uuid4(),
+            email="history@example.com",
+            hashed_password="not-used",
+            is_active=True,
+            is_superuser=False,
+        )
+        session.add(current_user)
+        _seed_orders(session, current_user)
+
+        keys = set(session.exec(select(Order.history_key)).all())
+        assert "email:jamie@example.com" in keys
+        assert "phone:555-0100" in keys
+        assert None in keys
+
+        rollups = {
+            rollup.history_key: rollup
+            for rollup in session.exec(select(CustomerHistoryRollup)).all()
+        }
+        assert rollups["email:jamie@example.com"].total_orders == 18
+        _assert_history_matches_reference(session, current_user)
+
+        moved = session.exec(
+            select(Order).where(Order.history_key == "phone:555-0100").limit(1)
+        ).one()
+        moved.customer_email = "JAMIE@example.com"
+        moved.status = OrderStatus.COMPLETED
+        session.add(moved)
+        removed = session.exec(
+            select(Order).where(Order.history_key == "email:jamie@example.com").limit(1)
+        ).one()
+        session.delete(removed)
+        session.commit()
+
+        session.refresh(rollups["email:jamie@example.com"])
+        session.refresh(rollups["phone:555-0100"])
+        assert rollups["email:jamie@example.com"].total_orders == 18
+        assert rollups["phone:555-0100"].total_orders == 8
+        _assert_history_matches_reference(session, current_user)
+
+
+def test_ensure_sqlite_order_schema_backfills_history_keys_and_rollups():
+    engine = _new_engine()
+
+    with Session(engine) as session:
+        current_user = User(
+            id=uuid4(),
+            email="history-backfill@example.com",
+            hashed_password="not-used",
+            is_active=True,
+            is_superuser=False,
+        )
+        session.add(current_user)
+        _seed_orders(session, current_user)
+        expected_keys = dict(session.exec(select(Order.id, Order.history_key)).all())
+        expected_previous_dates = dict(
+            session.exec(select(Order.id, Order.previous_order_date)).all()
+        )
+        expected_rollups = {
+            rollup.history_key: (
+                rollup.total_orders,
+                rollup.completed_orders,
+                rollup.active_orders,
+            )
+            for rollup in session.exec(select(CustomerHistoryRollup)).all()
+        }
+
+    with engine.begin() as connection:
+        connection.execute(text("DROP INDEX ix_order_history_key"))
+        connection.execute(text('ALTER TABLE "order" DROP COLUMN history_key'))
+        connection.execute(text('ALTER TABLE "order" DROP COLUMN previous_order_date'))
+        connection.execute(text("DROP TABLE customer_history_rollup"))
+
+    ensure_sqlite_order_schema(engine)
+
+    with Session(engine) as session:
+        assert (
+            dict(session.exec(select(Order.id, Order.history_key)).all())
+            == expected_keys
+        )
+        assert (
+            dict(session.exec(select(Order.id, Order.previous_order_date)).all())
+            == expected_previous_dates
+        )
+        assert {
+            rollup.history_key: (
+                rollup.total_orders,
+                rollup.completed_orders,
+                rollup.active_orders,
+            )
+            for rollup in session.exec(select(CustomerHistoryRollup)).all()
+        } == expected_rollups
+
+
+def test_previous_order_dates_follow_sibling_changes_without_touching_updated_at():
+    engine = _new_engine()
+
+    with Session(engine) as session:
+        current_user = User(
+            id=uuid4(),
+            email="history-previous@example.com",
+            hashed_password="not-used",
+            is_active=True,
+            is_superuser=False,
+        )
+        session.add(current_user)
+        orders = [
+            Order(
+                user_id=current_user.id,
+                order_number=f"ORD-PREVIOUS-{index}",
+                order_date=NOW - timedelta(days=days_ago),
+                due_date=NOW,
+                customer_email="repeat@example.com",
+            )
+            for index, days_ago in enumerate((4, 2, 0))
+        ]
+        session.add_all(orders)
+        session.commit()
+
+        def previous_dates():
+            return [
+                session.exec(
+                    select(Order.previous_order_date).where(Order.id == order.id)
+                ).one()
+                for order in orders
+            ]
+
+        assert previous_dates() == [
+            None,
+            NOW - timedelta(days=4),
+            NOW - timedelta(days=2),
+        ]
+
+        oldest_updated_at = session.exec(
+            select(Order.updated_at).where(Order.id == orders[0].id)
+        ).one()
+        orders[1].order_date = NOW - timedelta(days=6)
+        session.add(orders[1])
+        session.commit()
+
+        assert previous_dates() == [
+            NOW - timedelta(days=6),
+            None,
+            NOW - timedelta(days=4),
+        ]
+        assert (
+            session.exec(select(Order.updated_at).where(Order.id == orders[0].id)).one()
+            == oldest_updated_at
+        )
@@ -0,0 +1,84 @@
+import asyncio
+import threading
+import time
+
+import httpx
+from fastapi import APIRouter, FastAPI
+
+from app.api.routing import DatabaseRoute, offload_endpoint
+from app.repositories import db_threads
+
+
+def make_app():
+    router = APIRouter(route_class=DatabaseRoute)
+
+    @router.get("/slow")
+    async def slow_report(seconds: float = 0.3):
+        # Stands in for a synchronous Session.exec inside an async endpoint.
+        time.sleep(seconds)
+        return {"thread": threading.get_ident()}
+
+    @router.get("/fast")
+    async def fast_lookup():
+        return {"thread": threading.get_ident()}
+
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    return app
+
+
+def test_slow_endpoint_does_not_block_other_requests():
+    app = make_app()
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            slow = asyncio.create_task(client.get("/api/slow", params={"seconds": 0.5}))
+            await asyncio.sleep(0.05)
+            started = time.perf_counter()
+            fast = await client.get("/api/fast")
+            fast_elapsed = time.perf_counter() - started
+            slow_response = await slow
+            return fast, fast_elapsed, slow_response
+
+    fast, fast_elapsed, slow_response = asyncio.run(scenario())
+
+    assert fast.status_code == 200
+    assert slow_response.status_code == 200
+    assert fast_elapsed < 0.3
+    assert slow_response.json()["thread"] != threading.get_ident()
+
+
+def test_db_threads_are_bounded_and_endpoints_wrapped_once(monkeypatch):
+    monkeypatch.setattr(db_threads.settings, "DB_THREAD_POOL_SIZE", 2)
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def query():
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+
+    async def scenario():
+        await asyncio.gather(*(db_threads.run_db(query) for _ in range(6)))
+
+    asyncio.run(scenario())
+    assert peak == 2
+
+    async def endpoint(value: int = 1):
+        return value
+
+    def sync_endpoint():
+        return None
+
+    wrapped = offload_endpoint(endpoint)
+    assert offload_endpoint(wrapped) is wrapped
+    assert offload_endpoint(sync_endpoint) is sync_endpoint
+    assert asyncio.run(wrapped(value=3)) == 3
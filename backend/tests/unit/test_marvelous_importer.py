@@ -3,7 +3,7 @@ from pathlib import Path
 import subprocess
 import sys
 
-from sqlmodel import SQLModel, Session, create_engine, select
+from sqlmodel import SQLModel, Session, create_engine, delete, select
 
 from app.models.contact import Contact
 from app.models.expense import Expense
@@ -82,35 +82,44 @@ def test_parse_order_items_supports_legacy_product_item_keys():
 
 
 def test_infer_payment_status_uses_explicit_balance_math_and_payment_notes():
-    assert infer_payment_status(
-        row={},
-        total_amount=200.0,
-        deposit_amount=50.0,
-        amount_paid=0.0,
-        balance_due=150.0,
-        has_explicit_amount_paid=False,
-        has_explicit_balance_due=True,
-    ) == PaymentStatus.DEPOSIT_PAID
-
-    assert infer_payment_status(
-        row={"Notes": "Customer is fully paid and ready for pickup"},
-        total_amount=200.0,
-        deposit_amount=50.0,
-        amount_paid=0.0,
-        balance_due=200.0,
-        has_explicit_amount_paid=False,
-        has_explicit_balance_due=False,
-    ) == PaymentStatus.PAID_IN_FULL
-
-    assert infer_payment_status(
-        row={"JobSheetNotes": "Deposit paid via cash app"},
-        total_amount=200.0,
-        deposit_amount=50.0,
-        amount_paid=0.0,
-        balance_due=200.0,
-        has_explicit_amount_paid=False,
-        has_explicit_balance_due=False,
-    ) == PaymentStatus.DEPOSIT_PAID
+    assert (
+        infer_payment_status(
+            row={},
+            total_amount=200.0,
+            deposit_amount=50.0,
+            amount_paid=0.0,
+            balance_due=150.0,
+            has_explicit_amount_paid=False,
+            has_explicit_balance_due=True,
+        )
+        == PaymentStatus.DEPOSIT_PAID
+    )
+
+    assert (
+        infer_payment_status(
+            row={"Notes": "Customer is fully paid and ready for pickup"},
+            total_amount=200.0,
+            deposit_amount=50.0,
+            amount_paid=0.0,
+            balance_due=200.0,
+            has_explicit_amount_paid=False,
+            has_explicit_balance_due=False,
+        )
+        == PaymentStatus.PAID_IN_FULL
+    )
+
+    assert (
+        infer_payment_status(
+            row={"JobSheetNotes": "Deposit paid via cash app"},
+            total_amount=200.0,
+            deposit_amount=50.0,
+            amount_paid=0.0,
+            balance_due=200.0,
+            has_explicit_amount_paid=False,
+            has_explicit_balance_due=False,
+        )
+        == PaymentStatus.DEPOSIT_PAID
+    )
 
 
 def test_importer_imports_contacts_orders_expenses_and_mileage():
@@ -204,6 +213,8 @@ def test_importer_imports_contacts_orders_expenses_and_mileage():
         assert order.balance_due == 84.6
         assert "Legacy OrderStatusId: 7" in (order.internal_notes or "")
         assert "Legacy bakemate_status: confirmed" in (order.internal_notes or "")
+        # Triage is stored by the import, not left for the first read.
+        assert order.triage_as_of is not None
 
         order_items = session.exec(select(OrderItem)).all()
         assert len(order_items) == 2
@@ -269,7 +280,9 @@ def test_importer_uses_balance_due_clues_when_amount_paid_is_blank():
             expenses_rows=[],
             mileage_rows=[],
         )
-        order = session.exec(select(Order).where(Order.order_number == "MC-1002B")).one()
+        order = session.exec(
+            select(Order).where(Order.order_number == "MC-1002B")
+        ).one()
         assert order.payment_status == PaymentStatus.DEPOSIT_PAID
         assert order.status == OrderStatus.IN_PROGRESS
         assert "Legacy DepositAmount: 50" in (order.internal_notes or "")
@@ -326,7 +339,9 @@ def test_importer_maps_legacy_numeric_status_2_to_confirmed_for_non_quotes():
             expenses_rows=[],
             mileage_rows=[],
         )
-        order = session.exec(select(Order).where(Order.order_number == "MC-1003A")).one()
+        order = session.exec(
+            select(Order).where(Order.order_number == "MC-1003A")
+        ).one()
         assert order.status == OrderStatus.CONFIRMED
         assert order.payment_status == PaymentStatus.UNPAID
         assert "Legacy OrderStatusId: 2.0" in (order.internal_notes or "")
@@ -365,11 +380,15 @@ def test_importer_uses_due_date_and_payment_for_legacy_numeric_statuses():
             expenses_rows=[],
             mileage_rows=[],
         )
-        completed = session.exec(select(Order).where(Order.order_number == "MC-1004")).one()
+        completed = session.exec(
+            select(Order).where(Order.order_number == "MC-1004")
+        ).one()
         assert completed.status == OrderStatus.COMPLETED
         assert completed.payment_status == PaymentStatus.PAID_IN_FULL
 
-        in_progress = session.exec(select(Order).where(Order.order_number == "MC-1005")).one()
+        in_progress = session.exec(
+            select(Order).where(Order.order_number == "MC-1005")
+        ).one()
         assert in_progress.status == OrderStatus.IN_PROGRESS
         assert in_progress.payment_status == PaymentStatus.UNPAID
 
@@ -419,21 +438,33 @@ def test_importer_refines_past_due_ambiguous_legacy_statuses_without_touching_ra
             mileage_rows=[],
         )
 
-        completed = session.exec(select(Order).where(Order.order_number == "MC-1005A")).one()
+        completed = session.exec(
+            select(Order).where(Order.order_number == "MC-1005A")
+        ).one()
         assert completed.status == OrderStatus.COMPLETED
         assert completed.payment_status == PaymentStatus.PAID_IN_FULL
         assert "Legacy OrderStatusId: 2.0" in (completed.internal_notes or "")
         assert "Legacy legacy_status_raw: 2.0" in (completed.internal_notes or "")
         assert "Legacy bakemate_status: completed" in (completed.internal_notes or "")
 
-        historical_in_progress = session.exec(select(Order).where(Order.order_number == "MC-1005B")).one()
+        historical_in_progress = session.exec(
+            select(Order).where(Order.order_number == "MC-1005B")
+        ).one()
         assert historical_in_progress.status == OrderStatus.IN_PROGRESS
         assert historical_in_progress.payment_status == PaymentStatus.DEPOSIT_PAID
-        assert "Legacy OrderStatusId: 0.0" in (historical_in_progress.internal_notes or "")
-        assert "Legacy legacy_status_raw: 0.0" in (historical_in_progress.internal_notes or "")
-        assert "Legacy bakemate_status: in_progress" in (historical_in_progress.internal_notes or "")
+        assert "Legacy OrderStatusId: 0.0" in (
+            historical_in_progress.internal_notes or ""
+        )
+        assert "Legacy legacy_status_raw: 0.0" in (
+            historical_in_progress.internal_notes or ""
+        )
+        assert "Legacy bakemate_status: in_progress" in (
+            historical_in_progress.internal_notes or ""
+        )
 
-        future_confirmed = session.exec(select(Order).where(Order.order_number == "MC-1005C")).one()
+        future_confirmed = session.exec(
+            select(Order).where(Order.order_number == "MC-1005C")
+        ).one()
         assert future_confirmed.status == OrderStatus.CONFIRMED
         assert future_confirmed.payment_status == PaymentStatus.DEPOSIT_PAID
 
@@ -486,21 +517,39 @@ def test_importer_marks_very_old_ambiguous_zero_balance_legacy_rows_as_completed
             mileage_rows=[],
         )
 
-        historical_zero_total = session.exec(select(Order).where(Order.order_number == "MC-1005D")).one()
+        historical_zero_total = session.exec(
+            select(Order).where(Order.order_number == "MC-1005D")
+        ).one()
         assert historical_zero_total.status == OrderStatus.COMPLETED
         assert historical_zero_total.payment_status == PaymentStatus.UNPAID
-        assert "Legacy OrderStatusId: 2.0" in (historical_zero_total.internal_notes or "")
-        assert "Legacy legacy_status_raw: 2.0" in (historical_zero_total.internal_notes or "")
-        assert "Legacy bakemate_status: completed" in (historical_zero_total.internal_notes or "")
+        assert "Legacy OrderStatusId: 2.0" in (
+            historical_zero_total.internal_notes or ""
+        )
+        assert "Legacy legacy_status_raw: 2.0" in (
+            historical_zero_total.internal_notes or ""
+        )
+        assert "Legacy bakemate_status: completed" in (
+            historical_zero_total.internal_notes or ""
+        )
 
-        historical_negative_total = session.exec(select(Order).where(Order.order_number == "MC-1005E")).one()
+        historical_negative_total = session.exec(
+            select(Order).where(Order.order_number == "MC-1005E")
+        ).one()
         assert historical_negative_total.status == OrderStatus.COMPLETED
         assert historical_negative_total.payment_status == PaymentStatus.UNPAID
-        assert "Legacy OrderStatusId: 0.0" in (historical_negative_total.internal_notes or "")
-        assert "Legacy legacy_status_raw: 0.0" in (historical_negative_total.internal_notes or "")
-        assert "Legacy bakemate_status: completed" in (historical_negative_total.internal_notes or "")
+        assert "Legacy OrderStatusId: 0.0" in (
+            historical_negative_total.internal_notes or ""
+        )
+        assert "Legacy legacy_status_raw: 0.0" in (
+            historical_negative_total.internal_notes or ""
+        )
+        assert "Legacy bakemate_status: completed" in (
+            historical_negative_total.internal_notes or ""
+        )
 
-        recent_zero_total = session.exec(select(Order).where(Order.order_number == "MC-1005F")).one()
+        recent_zero_total = session.exec(
+            select(Order).where(Order.order_number == "MC-1005F")
+        ).one()
         assert recent_zero_total.status == OrderStatus.CONFIRMED
         assert recent_zero_total.payment_status == PaymentStatus.UNPAID
 
@@ -544,19 +593,26 @@ def test_importer_marks_only_ancient_ambiguous_unpaid_rows_as_completed():
             mileage_rows=[],
         )
 
-        ancient_unpaid = session.exec(select(Order).where(Order.order_number == "MC-1005G")).one()
+        ancient_unpaid = session.exec(
+            select(Order).where(Order.order_number == "MC-1005G")
+        ).one()
         assert ancient_unpaid.status == OrderStatus.COMPLETED
         assert ancient_unpaid.payment_status == PaymentStatus.UNPAID
         assert "Legacy OrderStatusId: 2.0" in (ancient_unpaid.internal_notes or "")
         assert "Legacy legacy_status_raw: 2.0" in (ancient_unpaid.internal_notes or "")
-        assert "Legacy bakemate_status: completed" in (ancient_unpaid.internal_notes or "")
+        assert "Legacy bakemate_status: completed" in (
+            ancient_unpaid.internal_notes or ""
+        )
 
-        not_ancient_unpaid = session.exec(select(Order).where(Order.order_number == "MC-1005H")).one()
+        not_ancient_unpaid = session.exec(
+            select(Order).where(Order.order_number == "MC-1005H")
+        ).one()
         assert not_ancient_unpaid.status == OrderStatus.CONFIRMED
         assert not_ancient_unpaid.payment_status == PaymentStatus.UNPAID
         assert "Legacy OrderStatusId: 0.0" in (not_ancient_unpaid.internal_notes or "")
-        assert "Legacy legacy_status_raw: 0.0" in (not_ancient_unpaid.internal_notes or "")
-
+        assert "Legacy legacy_status_raw: 0.0" in (
+            not_ancient_unpaid.internal_notes or ""
+        )
 
 
 def test_importer_infers_delivery_method_from_delivery_fees_and_notes():
@@ -590,10 +646,14 @@ def test_importer_infers_delivery_method_from_delivery_fees_and_notes():
             expenses_rows=[],
             mileage_rows=[],
         )
-        delivery_order = session.exec(select(Order).where(Order.order_number == "MC-1006")).one()
+        delivery_order = session.exec(
+            select(Order).where(Order.order_number == "MC-1006")
+        ).one()
         assert delivery_order.delivery_method == "delivery"
 
-        pickup_order = session.exec(select(Order).where(Order.order_number == "MC-1007")).one()
+        pickup_order = session.exec(
+            select(Order).where(Order.order_number == "MC-1007")
+        ).one()
         assert pickup_order.delivery_method == "pickup"
 
 
@@ -630,11 +690,15 @@ def test_importer_uses_payment_note_clues_when_numeric_fields_are_blank():
             expenses_rows=[],
             mileage_rows=[],
         )
-        deposit_paid = session.exec(select(Order).where(Order.order_number == "MC-1007B")).one()
+        deposit_paid = session.exec(
+            select(Order).where(Order.order_number == "MC-1007B")
+        ).one()
         assert deposit_paid.payment_status == PaymentStatus.DEPOSIT_PAID
         assert deposit_paid.status == OrderStatus.IN_PROGRESS
 
-        paid_in_full = session.exec(select(Order).where(Order.order_number == "MC-1007C")).one()
+        paid_in_full = session.exec(
+            select(Order).where(Order.order_number == "MC-1007C")
+        ).one()
         assert paid_in_full.payment_status == PaymentStatus.PAID_IN_FULL
         assert paid_in_full.status == OrderStatus.COMPLETED
 
@@ -668,3 +732,514 @@ def test_importer_cli_runs_without_needing_pythonpath():
     )
     assert result.returncode == 0
     assert "Import Marvelous Creations XLSX data into BakeMate." in result.stdout
+
+
+def test_import_workbook_streams_rows_from_a_read_only_workbook(tmp_path):
+    from openpyxl import Workbook
+
+    from app.services.marvelous_importer import load_workbook_rows, open_workbook_sheets
+
+    workbook = Workbook()
+    contacts = workbook.active
+    contacts.title = "Contacts"
+    contacts.append(["FirstName", "LastName", "EmailAddress", None])
+    contacts.append(["Jamie", "Rivera", "jamie@example.com", "ignored"])
+    contacts.append([None, None, None])
+    orders = workbook.create_sheet("Orders")
+    orders.append(["OrderNumber", "OrderDate", "ContactEmail", "Total", "IsQuote"])
+    orders.append(["MC-1", 45292, "jamie@example.com", 40, 0])
+    orders.append(["MC-Q", 45292, "jamie@example.com", 40, 1])
+    workbook.create_sheet("Notes")
+    path = tmp_path / "export.xlsx"
+    workbook.save(path)
+
+    with open_workbook_sheets(path) as sheets:
+        assert set(sheets) == {"Contacts", "Orders", "Notes"}
+        first = next(sheets["Contacts"])
+        assert first == {
+            "FirstName": "Jamie",
+            "LastName": "Rivera",
+            "EmailAddress": "jamie@example.com",
+        }
+        assert list(sheets["Notes"]) == []
+    assert load_workbook_rows(path)["Orders"][0]["OrderNumber"] == "MC-1"
+
+    with make_session() as session:
+        user = make_user(session)
+        result = MarvelousCreationsImporter(session, user).import_workbook(path)
+
+        assert result.counts.contacts_created == 1
+        assert result.counts.skipped_empty_rows == 1
+        assert result.counts.orders_created == 1
+        assert result.counts.orders_skipped_as_quotes == 1
+        assert session.exec(select(Order)).one().order_number == "MC-1"
+
+
+def test_importer_matches_contacts_through_one_preloaded_index():
+    from sqlalchemy import event
+
+    with make_session() as session:
+        user = make_user(session)
+        session.add_all(
+            [
+                Contact(
+                    user_id=user.id,
+                    first_name="Jamie",
+                    last_name="Rivera",
+                    email="jamie@example.com",
+                ),
+                Contact(
+                    user_id=user.id,
+                    first_name="Sam",
+                    last_name="Lee",
+                    phone="(555) 000-1111",
+                ),
+                Contact(user_id=user.id, company_name="Acme Events"),
+            ]
+        )
+        session.commit()
+        contact_selects = []
+        event.listen(
+            session.get_bind(),
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: (
+                contact_selects.append(statement)
+                if statement.lstrip().startswith("SELECT")
+                and "FROM contact" in statement
+                else None
+            ),
+        )
+
+        importer = MarvelousCreationsImporter(session, user)
+        result = importer.import_sheets(
+            contacts_rows=[
+                {"EmailAddress": " JAMIE@example.com "},
+                {"Number": "1-555-000-1111"},
+                {"ContactCompany": "ACME Events"},
+                {
+                    "FirstName": "New",
+                    "LastName": "Customer",
+                    "EmailAddress": "new@example.com",
+                },
+                {"FirstName": "New", "LastName": "Customer"},
+            ],
+            orders_rows=[],
+            expenses_rows=[],
+            mileage_rows=[],
+        )
+
+        assert result.counts.contacts_matched == 4
+        assert result.counts.contacts_created == 1
+        assert len(contact_selects) == 1
+        assert session.exec(
+            select(Contact).where(Contact.email == "new@example.com")
+        ).one()
+
+
+def test_import_workbook_commits_in_chunks_and_resumes_after_a_failure(
+    tmp_path, monkeypatch
+):
+    import pytest
+    from openpyxl import Workbook
+
+    from app.models.import_checkpoint import ImportCheckpoint
+
+    workbook = Workbook()
+    contacts = workbook.active
+    contacts.title = "Contacts"
+    contacts.append(["FirstName", "LastName", "EmailAddress"])
+    contacts.append(["Jamie", "Rivera", "jamie@example.com"])
+    orders = workbook.create_sheet("Orders")
+    orders.append(["OrderNumber", "OrderDate", "ContactEmail", "Total"])
+    for number in range(1, 6):
+        orders.append([f"MC-{number}", 45292, "jamie@example.com", 40])
+    expenses = workbook.create_sheet("Expenses")
+    expenses.append(["ExpenseDate", "Description", "Amount"])
+    expenses.append([45293, "Cake flour", 42.25])
+    path = tmp_path / "export.xlsx"
+    workbook.save(path)
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'import.db'}")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        user_id = make_user(session).id
+
+    original_write_order = MarvelousCreationsImporter._write_order
+
+    def failing_write_order(self, record):
+        if record["order"]["order_number"] == "MC-4":
+            raise RuntimeError("disk full")
+        return original_write_order(self, record)
+
+    monkeypatch.setattr(MarvelousCreationsImporter, "_write_order", failing_write_order)
+    with Session(engine) as session:
+        user = session.get(User, user_id)
+        with pytest.raises(RuntimeError):
+            MarvelousCreationsImporter(session, user, chunk_size=2).import_workbook(
+                path
+            )
+    monkeypatch.undo()
+
+    with Session(engine) as session:
+        # The contact and the first chunk of orders survived; MC-3 was rolled back.
+        assert sorted(session.exec(select(Order.order_number)).all()) == [
+            "MC-1",
+            "MC-2",
+        ]
+        user = session.get(User, user_id)
+        result = MarvelousCreationsImporter(
+            session, user, chunk_size=2
+        ).import_workbook(path)
+        assert result.counts.rows_already_imported == 3
+        assert result.counts.orders_created == 3
+        assert result.counts.expenses_created == 1
+        assert len(session.exec(select(Contact)).all()) == 1
+        assert len(session.exec(select(Order)).all()) == 5
+        assert {
+            c.sheet: c.rows_committed for c in session.exec(select(ImportCheckpoint))
+        } == {
+            "Contacts": 1,
+            "Orders": 5,
+            "Expenses": 1,
+            "Mileage": 0,
+        }
+
+    with Session(engine) as session:
+        user = session.get(User, user_id)
+        result = MarvelousCreationsImporter(session, user).import_workbook(path)
+        assert result.counts.rows_already_imported == 7
+        assert result.counts.orders_created == 0
+        assert result.counts.expenses_created == 0
+
+        result = MarvelousCreationsImporter(session, user).import_workbook(
+            path, restart=True
+        )
+        assert result.counts.rows_already_imported == 0
+        assert result.counts.orders_created == 0
+        assert result.counts.orders_unchanged == 5
+        assert result.counts.expenses_unchanged == 1
+        assert result.warnings.items == []
+
+
+def test_resumed_import_still_skips_duplicates_of_committed_rows(tmp_path, monkeypatch):
+    import pytest
+    from openpyxl import Workbook
+
+    workbook = Workbook()
+    workbook.active.title = "Contacts"
+    orders = workbook.create_sheet("Orders")
+    orders.append(["OrderNumber", "OrderDate", "ContactEmail", "Total"])
+    for number in range(1, 5):
+        orders.append([f"MC-{number}", 45292, "jamie@example.com", 40])
+    orders.append(["MC-1", 45292, "jamie@example.com", 99])
+    path = tmp_path / "export.xlsx"
+    workbook.save(path)
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'import.db'}")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        user_id = make_user(session).id
+
+    original_write_order = MarvelousCreationsImporter._write_order
+
+    def failing_write_order(self, record):
+        if record["order"]["order_number"] == "MC-4":
+            raise RuntimeError("disk full")
+        return original_write_order(self, record)
+
+    monkeypatch.setattr(MarvelousCreationsImporter, "_write_order", failing_write_order)
+    with Session(engine) as session:
+        user = session.get(User, user_id)
+        with pytest.raises(RuntimeError):
+            MarvelousCreationsImporter(session, user, chunk_size=2).import_workbook(
+                path
+            )
+    monkeypatch.undo()
+
+    with Session(engine) as session:
+        user = session.get(User, user_id)
+        result = MarvelousCreationsImporter(
+            session, user, chunk_size=2
+        ).import_workbook(path)
+        # MC-1 was committed before the failure; its repeat is still a duplicate.
+        assert result.counts.rows_already_imported == 2
+        assert result.counts.orders_created == 2
+        assert result.counts.orders_updated == 0
+        assert "Skipped duplicate legacy order_number MC-1." in result.warnings.items
+        assert (
+            session.exec(
+                select(Order.total_amount).where(Order.order_number == "MC-1")
+            ).one()
+            == 40
+        )
+
+
+def test_import_workbook_with_parse_workers_matches_a_serial_import(tmp_path):
+    from tools.benchmarks.fixtures import write_marvelous_workbook
+
+    path = tmp_path / "export.xlsx"
+    write_marvelous_workbook(path, order_count=450, contact_count=40)
+
+    def import_with(workers):
+        engine = create_engine(f"sqlite:///{tmp_path / f'import-{workers}.db'}")
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            user = make_user(session)
+            result = MarvelousCreationsImporter(
+                session, user, chunk_size=100, workers=workers
+            ).import_workbook(path)
+            orders = [
+                (
+                    order.order_number,
+                    order.customer_name,
+                    order.total_amount,
+                    order.status,
+                    len(order.items),
+                )
+                for order in session.exec(select(Order).order_by(Order.order_number))
+            ]
+        engine.dispose()
+        return result, orders
+
+    serial, serial_orders = import_with(0)
+    parallel, parallel_orders = import_with(2)
+
+    assert parallel.counts == serial.counts
+    assert parallel.warnings.items == serial.warnings.items
+    assert parallel_orders == serial_orders
+    assert serial.counts.orders_created > 0
+
+
+def test_reimport_inserts_new_updates_changed_and_skips_unchanged_rows(tmp_path):
+    from openpyxl import Workbook
+
+    def write_export(path, orders_rows, expense_rows, mileage_rows):
+        workbook = Workbook()
+        workbook.active.title = "Contacts"
+        orders = workbook.create_sheet("Orders")
+        orders.append(
+            [
+                "OrderNumber",
+                "OrderDate",
+                "Contact",
+                "ContactEmail",
+                "Total",
+                "ProductItems",
+            ]
+        )
+        for row in orders_rows:
+            orders.append(row)
+        expenses = workbook.create_sheet("Expenses")
+        expenses.append(["ExpenseID", "ExpenseDate", "Description", "Amount", "Vendor"])
+        for row in expense_rows:
+            expenses.append(row)
+        mileage = workbook.create_sheet("Mileage")
+        mileage.append(
+            ["MileageDate", "Distance", "StartLocation", "EndLocation", "Purpose"]
+        )
+        for row in mileage_rows:
+            mileage.append(row)
+        workbook.save(path)
+
+    cake = '[{"name": "Cake", "quantity": 1, "total_price": 40}]'
+    write_export(
+        tmp_path / "monday.xlsx",
+        [
+            ["MC-1", 45292, "Jamie Rivera", "jamie@example.com", 40, cake],
+            ["MC-2", 45293, "Jamie Rivera", "jamie@example.com", 55, cake],
+        ],
+        [
+            ["E-1", 45293, "Cake flour", 42.25, "Depot"],
+            [None, 45294, "Boxes", 12, None],
+        ],
+        [
+            [45293, 12, "Bakery", "Client", "Delivery"],
+            [45293, 12, "Bakery", "Client", "Delivery"],
+        ],
+    )
+    write_export(
+        tmp_path / "tuesday.xlsx",
+        [
+            ["MC-1", 45292, "Jamie Rivera", "jamie@example.com", 40, cake],
+            [
+                "MC-2",
+                45293,
+                "Jamie Rivera",
+                "jamie@example.com",
+                65,
+                '[{"name": "Tiered cake", "total_price": 65}]',
+            ],
+            ["MC-3", 45294, "Jamie Rivera", "jamie@example.com", 20, None],
+        ],
+        [["E-1", 45293, "Cake flour", 44.5, "Depot"], [None, 45294, "Boxes", 12, None]],
+        [
+            [45293, 12, "Bakery", "Client", "Delivery"],
+            [45293, 12, "Bakery", "Client", "Delivery"],
+        ],
+    )
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'import.db'}")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        user = make_user(session)
+        first = MarvelousCreationsImporter(session, user).import_workbook(
+            tmp_path / "monday.xlsx"
+        )
+        assert (
+            first.counts.orders_created,
+            first.counts.expenses_created,
+            first.counts.mileage_created,
+        ) == (2, 2, 2)
+
+        second = MarvelousCreationsImporter(session, user).import_workbook(
+            tmp_path / "tuesday.xlsx"
+        )
+        counts = second.counts
+        assert (
+            counts.orders_created,
+            counts.orders_updated,
+            counts.orders_unchanged,
+        ) == (1, 1, 1)
+        assert (
+            counts.expenses_created,
+            counts.expenses_updated,
+            counts.expenses_unchanged,
+        ) == (0, 1, 1)
+        assert (
+            counts.mileage_created,
+            counts.mileage_updated,
+            counts.mileage_unchanged,
+        ) == (0, 0, 2)
+        assert second.warnings.items == []
+
+        updated = session.exec(select(Order).where(Order.order_number == "MC-2")).one()
+        assert updated.total_amount == 65
+        assert [item.name for item in updated.items] == ["Tiered cake"]
+        assert (
+            len(
+                session.exec(
+                    select(OrderItem).where(OrderItem.order_id == updated.id)
+                ).all()
+            )
+            == 1
+        )
+        assert len(session.exec(select(Order)).all()) == 3
+        assert sorted(expense.amount for expense in session.exec(select(Expense))) == [
+            12,
+            44.5,
+        ]
+        assert len(session.exec(select(MileageLog)).all()) == 2
+
+
+def test_reimport_takes_over_records_imported_before_fingerprints(tmp_path):
+    from openpyxl import Workbook
+
+    from app.models.import_fingerprint import ImportFingerprint
+
+    workbook = Workbook()
+    workbook.active.title = "Contacts"
+    orders = workbook.create_sheet("Orders")
+    orders.append(["OrderNumber", "OrderDate", "ContactEmail", "Total"])
+    orders.append(["MC-1", 45292, "jamie@example.com", 40])
+    orders.append(["MC-9", 45292, "jamie@example.com", 40])
+    expenses = workbook.create_sheet("Expenses")
+    expenses.append(["ExpenseID", "ExpenseDate", "Description", "Amount"])
+    expenses.append(["E-7", 45293, "Cake flour", 42.25])
+    expenses.append([None, 45294, "Piping bags", 9.5])
+    path = tmp_path / "export.xlsx"
+    workbook.save(path)
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'import.db'}")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        user = make_user(session)
+        MarvelousCreationsImporter(session, user).import_workbook(path)
+        # As if imported by a release that did not record fingerprints, next
+        # to an order and an expense the baker entered by hand that match
+        # legacy rows.
+        session.exec(delete(ImportFingerprint))
+        session.exec(delete(Order).where(Order.order_number == "MC-9"))
+        session.exec(delete(Expense).where(Expense.description == "Piping bags"))
+        now = datetime.now(timezone.utc)
+        session.add(
+            Order(user_id=user.id, order_number="MC-9", order_date=now, due_date=now)
+        )
+        session.add(
+            Expense(
+                user_id=user.id,
+                date=date(2024, 1, 3),
+                description="Piping bags",
+                amount=9.5,
+            )
+        )
+        session.commit()
+
+        result = MarvelousCreationsImporter(session, user).import_workbook(
+            path, restart=True
+        )
+
+        assert result.counts.orders_unchanged == 1
+        assert result.counts.orders_created == 0
+        # Only the expense whose notes carry its ExpenseID is taken over.
+        assert result.counts.expenses_unchanged == 1
+        assert result.counts.expenses_created == 1
+        assert "Skipped duplicate legacy order_number MC-9." in result.warnings.items
+        assert len(session.exec(select(Order)).all()) == 2
+        assert len(session.exec(select(Expense)).all()) == 3
+        assert {
+            entry.record_key for entry in session.exec(select(ImportFingerprint))
+        } == {
+            "MC-1",
+            "id:E-7",
+            "2024-01-03|Piping bags|9.50",
+        }
+
+
+def test_first_sync_keeps_edits_to_orders_imported_before_fingerprints(tmp_path):
+    from openpyxl import Workbook
+
+    from app.models.import_fingerprint import ImportFingerprint
+
+    def save_workbook(total):
+        workbook = Workbook()
+        workbook.active.title = "Contacts"
+        orders = workbook.create_sheet("Orders")
+        orders.append(["OrderNumber", "OrderDate", "ContactEmail", "Total"])
+        orders.append(["MC-1", 45292, "jamie@example.com", total])
+        path = tmp_path / "export.xlsx"
+        workbook.save(path)
+        return path
+
+    path = save_workbook(40)
+    engine = create_engine(f"sqlite:///{tmp_path / 'import.db'}")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        user = make_user(session)
+        MarvelousCreationsImporter(session, user).import_workbook(path)
+        session.exec(delete(ImportFingerprint))
+        order = session.exec(select(Order)).one()
+        order.customer_name = "Jamie (edited)"
+        order.notes_to_customer = "Collect from the side door."
+        session.add(order)
+        session.commit()
+
+        result = MarvelousCreationsImporter(session, user).import_workbook(
+            path, restart=True
+        )
+
+        assert result.counts.orders_unchanged == 1
+        assert result.counts.orders_updated == 0
+        session.refresh(order)
+        assert order.customer_name == "Jamie (edited)"
+        assert order.notes_to_customer == "Collect from the side door."
+        assert session.exec(select(ImportFingerprint)).one().record_id == order.id
+
+        # Once adopted, a row that changes in the export updates the order.
+        path = save_workbook(55)
+        result = MarvelousCreationsImporter(session, user).import_workbook(
+            path, restart=True
+        )
+
+        assert result.counts.orders_updated == 1
+        session.refresh(order)
+        assert order.total_amount == 55
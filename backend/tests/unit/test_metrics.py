@@ -0,0 +1,141 @@
+import asyncio
+
+import httpx
+from fastapi import APIRouter, FastAPI
+from sqlalchemy import text
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, create_engine
+
+from app.api.metrics import MetricsMiddleware, router as metrics_router
+from app.api.routing import DatabaseRoute
+from app.core import metrics
+
+
+def make_app(engine):
+    router = APIRouter(route_class=DatabaseRoute)
+
+    class Builder:
+        def _build_widget_summary(self):
+            return "widget"
+
+    metrics.instrument_builders(Builder)
+
+    @router.get("/widgets/{widget_id}")
+    async def read_widget(widget_id: int):
+        # Runs on a database thread, like every DatabaseRoute endpoint.
+        with Session(engine) as session:
+            session.exec(text("SELECT 1"))
+            session.exec(text("SELECT 2"))
+        Builder()._build_widget_summary()
+        return {"id": widget_id}
+
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(metrics_router)
+    app.include_router(router, prefix="/api")
+    return app
+
+
+def test_requests_are_recorded_per_route_template_with_sql_and_builder_work():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    app = make_app(engine)
+    route = "/api/widgets/{widget_id}"
+    before_requests = metrics.http_requests_total.value(
+        method="GET", route=route, status="200"
+    )
+    before_missing = metrics.http_requests_total.value(
+        method="GET", route="unmatched", status="404"
+    )
+    before_queries = metrics.db_queries_per_request.count(method="GET", route=route)
+    before_builds = metrics.order_builder_calls_total.value(builder="widget_summary")
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            for widget_id in (1, 2, 3):
+                (await client.get(f"/api/widgets/{widget_id}")).raise_for_status()
+            assert (await client.get("/nope/123")).status_code == 404
+            return await client.get("/metrics")
+
+    response = asyncio.run(scenario())
+
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert (
+        metrics.http_requests_total.value(method="GET", route=route, status="200")
+        == before_requests + 3
+    )
+    assert (
+        metrics.http_requests_total.value(method="GET", route="unmatched", status="404")
+        == before_missing + 1
+    )
+    assert (
+        metrics.db_queries_per_request.count(method="GET", route=route)
+        == before_queries + 3
+    )
+    assert (
+        metrics.order_builder_calls_total.value(builder="widget_summary")
+        == before_builds + 3
+    )
+    body = response.text
+    assert "# TYPE bakemate_http_request_duration_seconds histogram" in body
+    assert (
+        'bakemate_db_queries_per_request_bucket{method="GET",route="/api/widgets/{widget_id}",le="2"}'
+        in body
+    )
+    assert (
+        'bakemate_http_request_duration_seconds_count{method="GET",route="/api/widgets/{widget_id}"}'
+        in body
+    )
+    assert "bakemate_http_requests_in_progress 1" in body  # the /metrics request itself
+
+
+def test_nested_router_routes_are_labelled_with_their_full_template():
+    orders = APIRouter()
+
+    @orders.get("/orders/{order_id}")
+    async def read_order(order_id: int):
+        return {"id": order_id}
+
+    v1 = APIRouter()
+    v1.include_router(orders, prefix="/v1")
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(v1, prefix="/api")
+    route = "/api/v1/orders/{order_id}"
+    before = metrics.http_requests_total.value(method="GET", route=route, status="200")
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            (await client.get("/api/v1/orders/7")).raise_for_status()
+
+    asyncio.run(scenario())
+
+    assert (
+        metrics.http_requests_total.value(method="GET", route=route, status="200")
+        == before + 1
+    )
+
+
+def test_histogram_renders_cumulative_buckets():
+    histogram = metrics.Histogram(
+        "example_seconds", "Example.", ("kind",), buckets=(0.1, 1.0)
+    )
+    for value in (0.05, 0.5, 0.7, 3.0):
+        histogram.observe(value, kind="a")
+
+    assert histogram.render() == [
+        "# HELP example_seconds Example.",
+        "# TYPE example_seconds histogram",
+        'example_seconds_bucket{kind="a",le="0.1"} 1',
+        'example_seconds_bucket{kind="a",le="1"} 3',
+        'example_seconds_bucket{kind="a",le="+Inf"} 4',
+        'example_seconds_sum{kind="a"} 4.25',
+        'example_seconds_count{kind="a"} 4',
+    ]
@@ -0,0 +1,118 @@
+import asyncio
+from datetime import date, datetime, timedelta, timezone
+from itertools import count
+from uuid import uuid4
+
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
+
+import app.services.order_service as order_service_module
+from app.models.order import Order, OrderStatus
+from app.models.user import User
+from app.services.order_service import OrderClock, OrderService
+
+# One second before bakery (Eastern daylight) midnight.
+BEFORE_MIDNIGHT = datetime(2026, 3, 20, 3, 59, 59, tzinfo=timezone.utc)
+BAKERY_TODAY = date(2026, 3, 19)
+
+
+def _session_with_orders() -> tuple[Session, User]:
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    session = Session(engine)
+    current_user = User(
+        id=uuid4(),
+        email="order-clock@example.com",
+        hashed_password="not-used",
+        is_active=True,
+        is_superuser=False,
+    )
+    session.add(current_user)
+    for index in range(6):
+        session.add(
+            Order(
+                user_id=current_user.id,
+                order_number=f"ORD-CLOCK-{index:03d}",
+                customer_name="Clock Customer",
+                due_date=datetime(2026, 3, 20, 16, 0, tzinfo=timezone.utc)
+                + timedelta(days=index - 1),
+                deposit_due_date=BAKERY_TODAY,
+                status=OrderStatus.CONFIRMED,
+                total_amount=60.0,
+                deposit_amount=20.0,
+            )
+        )
+    session.commit()
+    return session, current_user
+
+
+def test_one_list_read_sees_a_single_today_across_midnight(monkeypatch):
+    session, current_user = _session_with_orders()
+    ticks = count()
+    # Every call moves the wall clock on a second, so the second call is tomorrow.
+    monkeypatch.setattr(
+        order_service_module,
+        "_utcnow",
+        lambda: BEFORE_MIDNIGHT + timedelta(seconds=next(ticks)),
+    )
+
+    reads = asyncio.run(
+        OrderService(session=session).get_orders_by_user(current_user=current_user)
+    )
+
+    assert next(ticks) == 1
+    assert {order.triage_as_of for order in session.exec(select(Order)).all()} == {
+        BAKERY_TODAY
+    }
+    assert sorted(read.queue_summary.days_until_due for read in reads) == [
+        0,
+        1,
+        2,
+        3,
+        4,
+        5,
+    ]
+    for read in reads:
+        # The deposit falls due "today" in every builder that looks at it.
+        assert read.ops_summary.next_action == "Collect overdue deposit"
+        assert "deposit_overdue" not in read.risk_summary.reasons
+    session.close()
+
+
+def test_injected_clock_drives_the_read_models(monkeypatch):
+    session, current_user = _session_with_orders()
+    monkeypatch.setattr(order_service_module, "_utcnow", lambda: BEFORE_MIDNIGHT)
+    service = OrderService(session=session)
+    later = OrderClock(now=BEFORE_MIDNIGHT + timedelta(days=2, seconds=1))
+
+    reads = asyncio.run(
+        service.get_orders_by_user(current_user=current_user, clock=later)
+    )
+    page = asyncio.run(
+        service.get_order_page_by_user(current_user=current_user, clock=later)
+    )
+
+    assert sorted(read.queue_summary.days_until_due for read in reads) == [
+        -3,
+        -2,
+        -1,
+        0,
+        1,
+        2,
+    ]
+    assert [read.id for read in page.items] == [read.id for read in reads]
+    assert {order.triage_as_of for order in session.exec(select(Order)).all()} == {
+        later.today
+    }
+    assert all("deposit_overdue" in read.risk_summary.reasons for read in reads)
+    session.close()
+
+
+def test_today_is_the_bakery_date_not_the_utc_date():
+    # 9pm Eastern on the 19th is already the 20th in UTC.
+    evening = OrderClock(now=datetime(2026, 3, 20, 1, 0, tzinfo=timezone.utc))
+    assert evening.today == BAKERY_TODAY
@@ -0,0 +1,189 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from sqlalchemy import text
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from app.models.order import LEGACY_IMPORT_SOURCE, Order, backfill_order_import_metadata
+from app.models.user import User
+from app.repositories.sqlite_adapter import ensure_sqlite_order_schema
+from app.services.marvelous_importer import MarvelousCreationsImporter
+from app.services.order_query_planner import OrderListFilters, OrderQueryPlanner
+
+NOW = datetime(2026, 3, 19, 13, 0, tzinfo=timezone.utc)
+
+
+def _new_engine():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    return engine
+
+
+def _new_user(session: Session) -> User:
+    current_user = User(
+        id=uuid4(),
+        email="import-metadata@example.com",
+        hashed_password="not-used",
+        is_active=True,
+        is_superuser=False,
+    )
+    session.add(current_user)
+    session.commit()
+    return current_user
+
+
+def _import_columns(session: Session) -> dict:
+    return {
+        order_number: (is_imported, legacy_status_raw, import_source)
+        for order_number, is_imported, legacy_status_raw, import_source in session.exec(
+            select(
+                Order.order_number,
+                Order.is_imported,
+                Order.legacy_status_raw,
+                Order.import_source,
+            )
+        ).all()
+    }
+
+
+def test_importer_and_note_writers_persist_import_columns():
+    engine = _new_engine()
+    with Session(engine) as session:
+        current_user = _new_user(session)
+        MarvelousCreationsImporter(session, current_user).import_sheets(
+            contacts_rows=[],
+            orders_rows=[
+                {
+                    "OrderNumber": "MC-2001",
+                    "OrderDate": NOW - timedelta(days=3),
+                    "DueDate": NOW + timedelta(days=3),
+                    "Contact": "Imported Customer",
+                    "IsQuote": 0,
+                    "Subtotal": 50,
+                    "Total": 50,
+                    "OrderStatusId": 8,
+                }
+            ],
+            expenses_rows=[],
+            mileage_rows=[],
+        )
+        session.add(
+            Order(
+                user_id=current_user.id,
+                order_number="ORD-NOTES",
+                due_date=NOW,
+                internal_notes="Called ahead.\nLegacy OrderStatusId: 2",
+            )
+        )
+        session.add(
+            Order(
+                user_id=current_user.id,
+                order_number="ORD-NATIVE",
+                due_date=NOW,
+                internal_notes="Legacy cake, no metadata here",
+            )
+        )
+        session.commit()
+
+        assert _import_columns(session) == {
+            "MC-2001": (True, "8", LEGACY_IMPORT_SOURCE),
+            "ORD-NOTES": (True, "2", LEGACY_IMPORT_SOURCE),
+            "ORD-NATIVE": (False, None, None),
+        }
+
+        # Edits that keep the Legacy lines keep the order imported.
+        imported = session.exec(
+            select(Order).where(Order.order_number == "MC-2001")
+        ).one()
+        imported.internal_notes = f"Called back.\n{imported.internal_notes}"
+        session.commit()
+        assert _import_columns(session)["MC-2001"] == (True, "8", LEGACY_IMPORT_SOURCE)
+
+        plan = OrderQueryPlanner(user_id=current_user.id).plan(
+            OrderListFilters(imported_only=True)
+        )
+        compiled = str(plan.statement.compile(compile_kwargs={"literal_binds": True}))
+        assert "is_imported" in compiled
+        assert "LIKE" not in compiled.upper()
+        assert {order.order_number for order in session.exec(plan.statement).all()} == {
+            "ORD-NOTES",
+            "MC-2001",
+        }
+
+
+def test_removing_legacy_note_lines_clears_import_columns():
+    engine = _new_engine()
+    with Session(engine) as session:
+        current_user = _new_user(session)
+        order = Order(
+            user_id=current_user.id,
+            order_number="ORD-UNIMPORT",
+            due_date=NOW,
+            internal_notes="Called ahead.\nLegacy OrderStatusId: 2",
+        )
+        session.add(order)
+        session.commit()
+        assert _import_columns(session)["ORD-UNIMPORT"] == (
+            True,
+            "2",
+            LEGACY_IMPORT_SOURCE,
+        )
+
+        order.internal_notes = "Called ahead.\nLegacy OrderStatusId: 5"
+        session.commit()
+        assert _import_columns(session)["ORD-UNIMPORT"] == (
+            True,
+            "5",
+            LEGACY_IMPORT_SOURCE,
+        )
+
+        order.internal_notes = "Called ahead."
+        session.commit()
+        assert _import_columns(session)["ORD-UNIMPORT"] == (False, None, None)
+
+
+def test_backfill_marks_existing_legacy_rows_in_chunks():
+    engine = _new_engine()
+    with Session(engine) as session:
+        current_user = _new_user(session)
+        for index in range(11):
+            session.add(
+                Order(
+                    user_id=current_user.id,
+                    order_number=f"ORD-BACKFILL-{index:03d}",
+                    due_date=NOW,
+                    internal_notes=(
+                        f"Legacy OrderStatusId: {index}" if index % 2 else None
+                    ),
+                )
+            )
+        session.commit()
+        expected = _import_columns(session)
+
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                'UPDATE "order" SET is_imported = 0, legacy_status_raw = NULL, import_source = NULL'
+            )
+        )
+        assert backfill_order_import_metadata(connection, chunk_size=2) == 5
+        # A second pass finds nothing left to do.
+        assert backfill_order_import_metadata(connection, chunk_size=2) == 0
+    with Session(engine) as session:
+        assert _import_columns(session) == expected
+
+    with engine.begin() as connection:
+        connection.execute(text("DROP INDEX ix_order_is_imported"))
+        connection.execute(text("DROP INDEX ix_order_import_source"))
+        for column in ("is_imported", "legacy_status_raw", "import_source"):
+            connection.execute(text(f'ALTER TABLE "order" DROP COLUMN {column}'))
+
+    ensure_sqlite_order_schema(engine)
+
+    with Session(engine) as session:
+        assert _import_columns(session) == expected
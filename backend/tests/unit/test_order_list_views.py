@@ -0,0 +1,122 @@
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+import app.services.order_service as order_service_module
+from app.api.v1.endpoints.orders import read_orders
+from app.models.order import ORDER_LIST_VIEW_FIELDS, Order, OrderListView, OrderStatus
+from app.models.user import User
+from app.services.order_service import OrderService, resolve_order_list_fields
+
+NOW = datetime(2026, 3, 19, 13, 0, tzinfo=timezone.utc)
+
+
+def _session_with_orders() -> tuple[Session, User]:
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    session = Session(engine)
+    current_user = User(
+        id=uuid4(),
+        email="list-views@example.com",
+        hashed_password="not-used",
+        is_active=True,
+        is_superuser=False,
+    )
+    session.add(current_user)
+    for index in range(12):
+        session.add(
+            Order(
+                user_id=current_user.id,
+                order_number=f"ORD-VIEW-{index:03d}",
+                customer_name=f"Customer {index % 3}",
+                customer_email=f"customer{index % 3}@example.com",
+                due_date=NOW + timedelta(days=index % 4 - 1),
+                status=OrderStatus.CONFIRMED if index % 2 else OrderStatus.IN_PROGRESS,
+                total_amount=40.0 + index,
+                deposit_amount=10.0,
+                internal_notes="Legacy OrderStatusId: 2" if index % 3 == 0 else None,
+            )
+        )
+    session.commit()
+    return session, current_user
+
+
+def _fail(*args, **kwargs):
+    raise AssertionError("builder outside the requested view was called")
+
+
+@pytest.mark.parametrize("view", [OrderListView.COMPACT, OrderListView.QUEUE])
+def test_list_views_project_full_reads_and_skip_unrequested_builders(monkeypatch, view):
+    monkeypatch.setattr(order_service_module, "_utcnow", lambda: NOW)
+    session, current_user = _session_with_orders()
+    service = OrderService(session=session)
+    full_reads = asyncio.run(service.get_orders_by_user(current_user=current_user))
+
+    skipped = ["_build_customer_history_summaries", "_build_recent_customer_orders_map"]
+    if view == OrderListView.COMPACT:
+        skipped += ["_build_day_running_focus_summary", "_build_ops_summary"]
+    for builder in skipped:
+        monkeypatch.setattr(service, builder, _fail)
+
+    rows = asyncio.run(
+        service.get_orders_by_user(
+            current_user=current_user, fields=resolve_order_list_fields(view)
+        )
+    )
+    assert [row.id for row in rows] == [order_read.id for order_read in full_reads]
+    for row, order_read in zip(rows, full_reads):
+        projected = row.model_dump(mode="json", exclude_unset=True)
+        assert set(projected) == ORDER_LIST_VIEW_FIELDS[view]
+        assert projected == order_read.model_dump(mode="json", include=set(projected))
+    session.close()
+
+
+def test_fields_projection_through_the_endpoint():
+    assert resolve_order_list_fields(OrderListView.FULL) is None
+    assert resolve_order_list_fields(fields="order_number, risk_summary") == {
+        "id",
+        "order_number",
+        "risk_summary",
+    }
+    with pytest.raises(ValueError):
+        resolve_order_list_fields(fields="order_number,not_a_field")
+
+    session, current_user = _session_with_orders()
+    response = asyncio.run(
+        read_orders(
+            session=session,
+            skip=0,
+            limit=5,
+            status_filter=None,
+            fields="order_number,queue_summary",
+            current_user=current_user,
+        )
+    )
+    rows = json.loads(response.body)
+    assert len(rows) == 5
+    assert set(rows[0]) == {"id", "order_number", "queue_summary"}
+    assert "days_until_due" in rows[0]["queue_summary"]
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(
+            read_orders(
+                session=session,
+                skip=0,
+                limit=5,
+                status_filter=None,
+                fields="nope",
+                current_user=current_user,
+            )
+        )
+    assert exc_info.value.status_code == 400
+    session.close()
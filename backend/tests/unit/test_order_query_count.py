@@ -0,0 +1,156 @@
+import asyncio
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
+
+import app.services.order_service as order_service_module
+from app.models.contact import Contact
+from app.models.order import (
+    Order,
+    OrderItem,
+    OrderStatus,
+    Quote,
+    QuoteItem,
+    QuoteStatus,
+)
+from app.models.user import User
+from app.services.order_service import OrderService, QuoteService
+
+NOW = datetime(2026, 3, 19, 13, 0, tzinfo=timezone.utc)
+
+
+@contextmanager
+def _count_queries(engine):
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def _seed(engine, order_count: int) -> UUID:
+    with Session(engine) as session:
+        current_user = User(
+            id=uuid4(),
+            email=f"query-count-{order_count}@example.com",
+            hashed_password="not-used",
+            is_active=True,
+            is_superuser=False,
+        )
+        session.add(current_user)
+        for index in range(order_count):
+            contact = Contact(
+                user_id=current_user.id,
+                first_name=f"Customer{index}",
+                email=f"customer{index}@example.com",
+            )
+            session.add(contact)
+            session.flush()
+            order = Order(
+                user_id=current_user.id,
+                customer_contact_id=contact.id,
+                order_number=f"ORD-QUERIES-{order_count}-{index:03d}",
+                due_date=NOW + timedelta(days=index),
+                delivery_method="pickup",
+                total_amount=50.0,
+                subtotal=50.0,
+                status=OrderStatus.CONFIRMED,
+            )
+            session.add(order)
+            for item_index in range(2):
+                session.add(
+                    OrderItem(
+                        order_id=order.id,
+                        name=f"Cake {item_index}",
+                        quantity=1,
+                        unit_price=25.0,
+                        total_price=25.0,
+                    )
+                )
+            quote = Quote(
+                user_id=current_user.id,
+                quote_number=f"Q-QUERIES-{order_count}-{index:03d}",
+                status=QuoteStatus.SENT,
+            )
+            session.add(quote)
+            session.add(
+                QuoteItem(
+                    quote_id=quote.id,
+                    name="Cupcakes",
+                    quantity=12,
+                    unit_price=3.0,
+                    total_price=36.0,
+                )
+            )
+        session.commit()
+        OrderService(session=session).refresh_order_triage()
+        return current_user.id
+
+
+def _new_engine():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    return engine
+
+
+def _list_query_count(order_count: int, **filters) -> int:
+    engine = _new_engine()
+    user_id = _seed(engine, order_count)
+    with Session(engine) as session:
+        current_user = session.get(User, user_id)
+        service = OrderService(session=session)
+        with _count_queries(engine) as statements:
+            order_reads = asyncio.run(
+                service.get_orders_by_user(
+                    current_user=current_user, limit=100, **filters
+                )
+            )
+        assert all(len(order_read.items) == 2 for order_read in order_reads)
+        assert all(order_read.customer_summary.name for order_read in order_reads)
+    return len(statements)
+
+
+def test_order_list_query_count_does_not_grow_with_page_size(monkeypatch):
+    monkeypatch.setattr(order_service_module, "_utcnow", lambda: NOW)
+
+    assert _list_query_count(2) == _list_query_count(20)
+    assert _list_query_count(20) <= 6
+
+
+def test_order_detail_and_quote_paths_use_constant_queries(monkeypatch):
+    monkeypatch.setattr(order_service_module, "_utcnow", lambda: NOW)
+    engine = _new_engine()
+    user_id = _seed(engine, 10)
+
+    with Session(engine) as session:
+        current_user = session.get(User, user_id)
+        order_id = session.exec(select(Order.id).limit(1)).one()
+        service = OrderService(session=session)
+        with _count_queries(engine) as statements:
+            order_read = asyncio.run(
+                service.get_order_by_id(order_id=order_id, current_user=current_user)
+            )
+        assert len(order_read.items) == 2
+        assert len(statements) <= 5
+
+        quote_service = QuoteService(session=session)
+        with _count_queries(engine) as statements:
+            quotes = asyncio.run(
+                quote_service.get_quotes_by_user(current_user=current_user)
+            )
+        assert len(quotes) == 10
+        assert all(len(quote.items) == 1 for quote in quotes)
+        assert len(statements) == 2
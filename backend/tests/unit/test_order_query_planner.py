@@ -0,0 +1,272 @@
+import asyncio
+from datetime import date, datetime, timedelta, timezone
+from itertools import product
+from uuid import uuid4
+
+import app.services.order_service as order_service_module
+from app.models.contact import Contact
+from app.models.order import (
+    ImportedOrderReviewReason,
+    Order,
+    OrderDayRunningTriageFilter,
+    OrderItem,
+    OrderStatus,
+    PaymentStatus,
+)
+from app.models.user import User
+from app.services.order_query_planner import OrderListFilters, OrderQueryPlanner
+from app.services.order_service import OrderService
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, Session, create_engine, select
+
+NOW = datetime(2026, 3, 19, 13, 0, tzinfo=timezone.utc)
+LEGACY_NOTES = "Imported row\nLegacy OrderStatusId: 2\nLegacy legacy_status_raw: 2"
+
+
+def _seed_orders(session: Session, current_user: User) -> None:
+    contact = Contact(
+        user_id=current_user.id,
+        first_name="Linked",
+        last_name="Customer",
+        email="linked@example.com",
+        phone="555-000-9999",
+    )
+    session.add(contact)
+    session.flush()
+
+    due_offsets = [-2, 0, 1, 3, 9]
+    statuses = [OrderStatus.CONFIRMED, OrderStatus.COMPLETED, OrderStatus.INQUIRY]
+    payments = [
+        PaymentStatus.UNPAID,
+        PaymentStatus.DEPOSIT_PAID,
+        PaymentStatus.PAID_IN_FULL,
+    ]
+    shapes = ["complete", "linked", "missing_contact", "no_total"]
+    for index, (offset, status, payment, shape, imported) in enumerate(
+        product(due_offsets, statuses, payments, shapes, [True, False])
+    ):
+        order = Order(
+            user_id=current_user.id,
+            order_number=f"ORD-PLAN-{index:04d}",
+            due_date=NOW + timedelta(days=offset, hours=index % 7),
+            order_date=NOW - timedelta(days=index % 11),
+            delivery_method="pickup",
+            total_amount=0.0 if shape == "no_total" else 80.0,
+            subtotal=80.0,
+            deposit_amount=40.0 if index % 2 else None,
+            deposit_due_date=date(2026, 3, 18) if index % 3 == 0 else None,
+            balance_due_date=date(2026, 3, 19) if index % 4 == 0 else None,
+            status=status,
+            payment_status=payment,
+            internal_notes=(
+                f"{LEGACY_NOTES}\nrow {index}" if imported else f"Native row {index}"
+            ),
+        )
+        if shape in {"complete", "no_total"}:
+            order.customer_name = f"Customer {index}"
+            order.customer_email = f"customer{index}@example.com"
+            order.customer_phone = "555-000-1111"
+        elif shape == "linked":
+            order.customer_contact_id = contact.id
+        else:
+            order.customer_name = f"Customer {index}"
+        session.add(order)
+        if index % 5:
+            session.add(
+                OrderItem(
+                    order_id=order.id,
+                    name="Cake",
+                    description="Vanilla cake with buttercream",
+                    quantity=1,
+                    unit_price=80.0,
+                    total_price=80.0,
+                )
+            )
+    session.commit()
+
+
+def _reference_ids(service: OrderService, order_reads, **filters):
+    if filters.get("open_only"):
+        order_reads = [
+            order_read
+            for order_read in order_reads
+            if order_read.status not in {OrderStatus.COMPLETED, OrderStatus.CANCELLED}
+        ]
+    if filters.get("imported_only"):
+        order_reads = [
+            order_read for order_read in order_reads if order_read.is_imported
+        ]
+    if filters.get("needs_review") is not None:
+        order_reads = [
+            order_read
+            for order_read in order_reads
+            if service._order_needs_review(order_read) is filters["needs_review"]
+        ]
+    if filters.get("review_reason") is not None:
+        order_reads = [
+            order_read
+            for order_read in order_reads
+            if filters["review_reason"] in order_read.review_reasons
+        ]
+    if filters.get("action_class") is not None:
+        order_reads = [
+            order_read
+            for order_read in order_reads
+            if order_read.ops_summary.action_class == filters["action_class"]
+        ]
+    if filters.get("urgency") is not None:
+        order_reads = [
+            order_read
+            for order_read in order_reads
+            if order_read.queue_summary.urgency_label == filters["urgency"]
+        ]
+    return {order_read.id for order_read in order_reads}
+
+
+def test_order_query_planner_matches_python_filters(monkeypatch):
+    monkeypatch.setattr(order_service_module, "_utcnow", lambda: NOW)
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        current_user = User(
+            id=uuid4(),
+            email="planner@example.com",
+            hashed_password="not-used",
+            is_active=True,
+            is_superuser=False,
+        )
+        session.add(current_user)
+        _seed_orders(session, current_user)
+        service = OrderService(session=session)
+        all_reads = service._build_order_reads(
+            session.exec(select(Order).where(Order.user_id == current_user.id)).all()
+        )
+
+        filter_cases = [
+            {},
+            {"open_only": True},
+            {"imported_only": True},
+            {"needs_review": True},
+            {"needs_review": False},
+            {"imported_only": True, "needs_review": True},
+            *(
+                {"urgency": urgency}
+                for urgency in ["Urgent", "Today", "Next up", "Watch", "Later"]
+            ),
+            *(
+                {"action_class": action_class}
+                for action_class in [
+                    "invoice_blocked",
+                    "payment_now",
+                    "handoff_today",
+                    "watch",
+                ]
+            ),
+            *({"review_reason": reason} for reason in ImportedOrderReviewReason),
+            {"open_only": True, "urgency": "Urgent", "needs_review": True},
+        ]
+        for filters in filter_cases:
+            planned = asyncio.run(
+                service.get_orders_by_user(
+                    current_user=current_user, limit=100_000, **filters
+                )
+            )
+            assert {order_read.id for order_read in planned} == _reference_ids(
+                service, all_reads, **filters
+            ), filters
+
+
+def test_order_query_planner_paginates_in_sql_and_after_read_filters(monkeypatch):
+    monkeypatch.setattr(order_service_module, "_utcnow", lambda: NOW)
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        current_user = User(
+            id=uuid4(),
+            email="planner-pages@example.com",
+            hashed_password="not-used",
+            is_active=True,
+            is_superuser=False,
+        )
+        session.add(current_user)
+        _seed_orders(session, current_user)
+        service = OrderService(session=session)
+
+        for filters in [
+            {},
+            {"imported_only": True},
+            {"day_running": OrderDayRunningTriageFilter.NEEDS_ATTENTION},
+        ]:
+            full = asyncio.run(
+                service.get_orders_by_user(
+                    current_user=current_user, limit=100_000, **filters
+                )
+            )
+            assert full, filters
+            pages = []
+            for skip in range(0, len(full), 40):
+                pages.extend(
+                    asyncio.run(
+                        service.get_orders_by_user(
+                            current_user=current_user, skip=skip, limit=40, **filters
+                        )
+                    )
+                )
+            assert [order_read.id for order_read in pages] == [
+                order_read.id for order_read in full
+            ], filters
+
+
+def test_review_reason_filter_matches_whole_entries_only():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        current_user = User(
+            id=uuid4(),
+            email="planner-reasons@example.com",
+            hashed_password="not-used",
+            is_active=True,
+            is_superuser=False,
+        )
+        session.add(current_user)
+        stored_reasons = {
+            "ORD-REASON-LAST": "invoice_missing_fields,unlinked_contact",
+            "ORD-REASON-FIRST": "unlinked_contact",
+            # "_" must not act as a wildcard, nor a longer entry as a match.
+            "ORD-REASON-WILDCARD": "unlinked-contact",
+            "ORD-REASON-LONGER": "unlinked_contact_extra",
+        }
+        for order_number, reasons in stored_reasons.items():
+            session.add(
+                Order(
+                    user_id=current_user.id,
+                    order_number=order_number,
+                    due_date=NOW,
+                    internal_notes=LEGACY_NOTES,
+                    triage_review_reasons=reasons,
+                )
+            )
+        session.commit()
+
+        plan = OrderQueryPlanner(user_id=current_user.id).plan(
+            OrderListFilters(review_reason=ImportedOrderReviewReason.UNLINKED_CONTACT)
+        )
+        assert {order.order_number for order in session.exec(plan.statement)} == {
+            "ORD-REASON-LAST",
+            "ORD-REASON-FIRST",
+        }
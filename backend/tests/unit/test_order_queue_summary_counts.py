@@ -0,0 +1,185 @@
+import asyncio
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+from itertools import product
+from uuid import uuid4
+
+import app.services.order_service as order_service_module
+from app.models.contact import Contact
+from app.models.order import (
+    ImportedOrderReviewReason,
+    Order,
+    OrderItem,
+    OrderStatus,
+    PaymentStatus,
+)
+from app.models.user import User
+from app.services.order_service import OrderService
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, Session, create_engine, select
+
+NOW = datetime(2026, 3, 19, 13, 0, tzinfo=timezone.utc)
+
+
+def _seed_orders(session: Session, current_user: User) -> None:
+    contact = Contact(
+        user_id=current_user.id,
+        first_name="Linked",
+        last_name="Customer",
+        phone="555-000-9999",
+    )
+    session.add(contact)
+    session.flush()
+
+    due_offsets = [-1, 0, 2, 8]
+    payments = [
+        PaymentStatus.UNPAID,
+        PaymentStatus.DEPOSIT_PAID,
+        PaymentStatus.PAID_IN_FULL,
+    ]
+    methods = ["pickup", "delivery", None]
+    shapes = ["complete", "linked", "email_only", "no_items"]
+    for index, (offset, payment, method, shape, imported) in enumerate(
+        product(due_offsets, payments, methods, shapes, [True, False])
+    ):
+        order = Order(
+            user_id=current_user.id,
+            order_number=f"ORD-COUNT-{index:04d}",
+            due_date=NOW + timedelta(days=offset, hours=index % 5),
+            delivery_method=method,
+            total_amount=0.0 if shape == "no_items" else 75.0,
+            subtotal=75.0,
+            deposit_amount=30.0 if index % 2 else None,
+            deposit_due_date=date(2026, 3, 18 + index % 3) if index % 3 else None,
+            balance_due_date=date(2026, 3, 19 + index % 2) if index % 4 == 1 else None,
+            status=OrderStatus.CONFIRMED,
+            payment_status=payment,
+            internal_notes="Legacy OrderStatusId: 2" if imported else None,
+        )
+        if shape == "complete":
+            order.customer_name = f"Customer {index}"
+            order.customer_email = f"customer{index}@example.com"
+            order.customer_phone = "555-000-1111"
+        elif shape == "linked":
+            order.customer_contact_id = contact.id
+        elif shape == "email_only":
+            order.customer_name = f"Customer {index}"
+            order.customer_email = f"customer{index}@example.com"
+        session.add(order)
+        if shape != "no_items":
+            session.add(
+                OrderItem(
+                    order_id=order.id,
+                    name="Birthday cake with gold drip" if index % 2 else "Cake",
+                    description=(
+                        "Chocolate sponge, vanilla buttercream" if index % 3 else None
+                    ),
+                    quantity=index % 3,
+                    unit_price=75.0,
+                    total_price=75.0,
+                )
+            )
+    session.commit()
+
+
+def test_queue_summary_counts_match_full_order_reads(monkeypatch):
+    monkeypatch.setattr(order_service_module, "_utcnow", lambda: NOW)
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        current_user = User(
+            id=uuid4(),
+            email="queue-counts@example.com",
+            hashed_password="not-used",
+            is_active=True,
+            is_superuser=False,
+        )
+        session.add(current_user)
+        _seed_orders(session, current_user)
+        service = OrderService(session=session)
+        order_reads = service._build_order_reads(
+            session.exec(select(Order).where(Order.user_id == current_user.id)).all()
+        )
+
+        readiness = Counter(
+            order_read.day_running_focus_summary.readiness_label
+            for order_read in order_reads
+        )
+        assert len(readiness) == 3
+        day_running = asyncio.run(
+            service.get_day_running_queue_summary(current_user=current_user)
+        )
+        assert day_running.all_count == len(order_reads)
+        assert day_running.blocked_count == readiness["Blocked for today"]
+        assert day_running.needs_attention_count == readiness["Needs attention today"]
+        assert day_running.ready_count == readiness["Ready for today"]
+
+        imported_reads = [
+            order_read for order_read in order_reads if order_read.is_imported
+        ]
+        imported = asyncio.run(
+            service.get_imported_order_queue_summary(current_user=current_user)
+        )
+        assert imported.all_imported_count == len(imported_reads)
+        assert imported.needs_review_count == sum(
+            1 for order_read in imported_reads if order_read.review_reasons
+        )
+        assert imported.review_reason_counts == {
+            reason: sum(
+                1
+                for order_read in imported_reads
+                if reason in order_read.review_reasons
+            )
+            for reason in ImportedOrderReviewReason
+        }
+
+
+def test_queue_summary_counts_never_build_order_reads(monkeypatch):
+    monkeypatch.setattr(order_service_module, "_utcnow", lambda: NOW)
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        current_user = User(
+            id=uuid4(),
+            email="queue-counts-lean@example.com",
+            hashed_password="not-used",
+            is_active=True,
+            is_superuser=False,
+        )
+        session.add(current_user)
+        _seed_orders(session, current_user)
+        service = OrderService(session=session)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("queue summary counts should not build read models")
+
+        for builder in [
+            "_to_order_read",
+            "_build_customer_history_summaries",
+            "_build_recent_customer_orders_map",
+            "_build_invoice_focus_summary",
+            "_build_day_running_focus_summary",
+        ]:
+            monkeypatch.setattr(service, builder, fail)
+
+        day_running = asyncio.run(
+            service.get_day_running_queue_summary(
+                current_user=current_user, search="customer"
+            )
+        )
+        imported = asyncio.run(
+            service.get_imported_order_queue_summary(current_user=current_user)
+        )
+
+        assert day_running.all_count > 0
+        assert imported.all_imported_count > 0
@@ -0,0 +1,196 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from sqlalchemy import text
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
+
+import app.services.order_service as order_service_module
+from app.models.order import Order, OrderStatus
+from app.models.order_search import order_search_index_available
+from app.models.user import User
+from app.repositories.sqlite_adapter import ensure_sqlite_order_schema
+from app.services.order_query_planner import OrderListFilters, OrderQueryPlanner
+from app.services.order_service import OrderService
+
+NOW = datetime(2026, 3, 19, 13, 0, tzinfo=timezone.utc)
+SEARCH_TERMS = [
+    "ORD-SEARCH-01",
+    "rivera",
+    "JAMIE@EX",
+    "555-01",
+    "pickup",
+    "gold drip",
+    "legacy",
+    "zz",
+    "no-hit",
+]
+
+
+def _session_with_orders(email: str) -> tuple[Session, User]:
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    session = Session(engine)
+    current_user = User(
+        id=uuid4(),
+        email=email,
+        hashed_password="not-used",
+        is_active=True,
+        is_superuser=False,
+    )
+    session.add(current_user)
+    customers = [
+        ("Jamie Rivera", "jamie@example.com", "555-0100"),
+        ("Pat Lee", None, "555-0199"),
+        ("Zz Top", "zz@example.com", None),
+        (None, "walkin@example.com", None),
+    ]
+    for index in range(40):
+        name, email_value, phone = customers[index % len(customers)]
+        session.add(
+            Order(
+                user_id=current_user.id,
+                order_number=f"ORD-SEARCH-{index:03d}",
+                customer_name=name,
+                customer_email=email_value,
+                customer_phone=phone,
+                due_date=NOW + timedelta(days=index % 6),
+                delivery_method="pickup" if index % 2 else "delivery",
+                notes_to_customer="Gold drip on top" if index % 5 == 0 else None,
+                internal_notes="Legacy OrderStatusId: 2" if index % 3 == 0 else None,
+                status=OrderStatus.CONFIRMED,
+            )
+        )
+    session.commit()
+    return session, current_user
+
+
+def _search_ids(
+    session: Session, current_user: User, term: str, *, search_index: bool
+) -> set:
+    plan = OrderQueryPlanner(user_id=current_user.id, search_index=search_index).plan(
+        OrderListFilters(search=term)
+    )
+    return {order.id for order in session.exec(plan.statement).all()}
+
+
+def test_indexed_search_matches_ilike_and_tracks_writes():
+    session, current_user = _session_with_orders("search-index@example.com")
+    assert order_search_index_available(session.connection())
+
+    for term in SEARCH_TERMS:
+        assert _search_ids(
+            session, current_user, term, search_index=True
+        ) == _search_ids(session, current_user, term, search_index=False), term
+    assert "MATCH" in str(
+        OrderQueryPlanner(user_id=current_user.id, search_index=True)
+        .plan(OrderListFilters(search="rivera"))
+        .statement
+    )
+
+    renamed = session.exec(
+        select(Order).where(Order.order_number == "ORD-SEARCH-000")
+    ).one()
+    renamed.customer_name = "Morgan Quill"
+    session.add(renamed)
+    removed = session.exec(
+        select(Order).where(Order.order_number == "ORD-SEARCH-004")
+    ).one()
+    session.delete(removed)
+    session.commit()
+    # Writes outside the ORM are indexed by the triggers too.
+    session.execute(
+        text(
+            "UPDATE \"order\" SET notes_to_customer = 'Quill pen sketch' "
+            "WHERE order_number = 'ORD-SEARCH-008'"
+        )
+    )
+    session.commit()
+
+    for term in [*SEARCH_TERMS, "quill", "morgan"]:
+        assert _search_ids(
+            session, current_user, term, search_index=True
+        ) == _search_ids(session, current_user, term, search_index=False), term
+    assert len(_search_ids(session, current_user, "quill", search_index=True)) == 2
+    session.close()
+
+
+def test_ensure_sqlite_order_schema_builds_missing_search_index(monkeypatch):
+    monkeypatch.setattr(order_service_module, "_utcnow", lambda: NOW)
+    session, current_user = _session_with_orders("search-rebuild@example.com")
+    engine = session.get_bind()
+    user_id = current_user.id
+    session.close()
+    with engine.begin() as connection:
+        for suffix in ("ai", "ad", "au"):
+            connection.execute(text(f"DROP TRIGGER order_search_{suffix}"))
+        connection.execute(text("DROP TABLE order_search"))
+
+    ensure_sqlite_order_schema(engine)
+
+    with Session(engine) as session:
+        current_user = session.get(User, user_id)
+        found = asyncio.run(
+            OrderService(session=session).get_orders_by_user(
+                current_user=current_user, search="Rivera", limit=100
+            )
+        )
+        assert len(found) == 10
+        assert all(order_read.customer_name == "Jamie Rivera" for order_read in found)
+
+
+def test_order_search_suggestions_match_word_prefixes():
+    session, current_user = _session_with_orders("search-typeahead@example.com")
+    service = OrderService(session=session)
+
+    by_last_name = asyncio.run(
+        service.search_order_suggestions(
+            current_user=current_user, prefix="riv", limit=25
+        )
+    )
+    assert len(by_last_name) == 10
+    assert {suggestion.matched_field for suggestion in by_last_name} == {
+        "customer_name"
+    }
+    assert by_last_name[0].due_date <= by_last_name[-1].due_date
+
+    by_number = asyncio.run(
+        service.search_order_suggestions(
+            current_user=current_user, prefix="ord-search-01", limit=5
+        )
+    )
+    assert [suggestion.order_number for suggestion in by_number] == [
+        "ORD-SEARCH-012",
+        "ORD-SEARCH-018",
+        "ORD-SEARCH-013",
+        "ORD-SEARCH-019",
+        "ORD-SEARCH-014",
+    ]
+    assert {suggestion.matched_field for suggestion in by_number} == {"order_number"}
+
+    # Two characters are below the trigram minimum and use the LIKE fallback.
+    short = asyncio.run(
+        service.search_order_suggestions(
+            current_user=current_user, prefix="zz", limit=25
+        )
+    )
+    assert len(short) == 10
+    # Substrings that do not start a word are not typeahead suggestions.
+    assert (
+        asyncio.run(
+            service.search_order_suggestions(current_user=current_user, prefix="ivera")
+        )
+        == []
+    )
+    assert (
+        asyncio.run(
+            service.search_order_suggestions(current_user=current_user, prefix="100%")
+        )
+        == []
+    )
+    session.close()
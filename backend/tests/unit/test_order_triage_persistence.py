@@ -0,0 +1,345 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from app.models.contact import Contact
+from app.models.order import (
+    Order,
+    OrderCreate,
+    OrderItem,
+    OrderItemCreate,
+    OrderStatus,
+    OrderUpdate,
+    PaymentStatus,
+)
+from app.models.user import User
+import app.services.order_service as order_service_module
+import app.services.order_triage_rollover as rollover_module
+from app.services.order_service import OrderService
+from app.services.order_triage_rollover import (
+    ORDER_TRIAGE_ROLLOVER_JOB,
+    claim_daily_job,
+    next_rollover_at,
+    run_order_triage_rollover,
+)
+
+NOW = datetime(2026, 3, 19, 13, 0, tzinfo=timezone.utc)
+
+
+def _session_with_user(email: str) -> tuple[Session, User]:
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    session = Session(engine)
+    current_user = User(
+        id=uuid4(),
+        email=email,
+        hashed_password="not-used",
+        is_active=True,
+        is_superuser=False,
+    )
+    session.add(current_user)
+    session.commit()
+    session.refresh(current_user)
+    return session, current_user
+
+
+def test_order_writes_store_current_triage(monkeypatch):
+    monkeypatch.setattr(order_service_module, "_utcnow", lambda: NOW)
+    session, current_user = _session_with_user("triage-writes@example.com")
+    service = OrderService(session=session)
+
+    created = asyncio.run(
+        service.create_order(
+            current_user=current_user,
+            order_in=OrderCreate(
+                due_date=datetime(2026, 3, 19, 18, 0, tzinfo=timezone.utc),
+                delivery_method="pickup",
+                customer_name="Jamie Rivera",
+                customer_email="jamie@example.com",
+                customer_phone="555-0100",
+                status=OrderStatus.CONFIRMED,
+                items=[
+                    OrderItemCreate(
+                        name="Celebration Cake",
+                        description="8 inch vanilla with gold drip",
+                        quantity=1,
+                        unit_price=80.0,
+                    )
+                ],
+            ),
+        )
+    )
+
+    order = session.get(Order, created.id)
+    assert order.triage_as_of == NOW.date()
+    assert order.triage_urgency_rank == created.queue_summary.urgency_rank
+    assert order.triage_action_class == created.ops_summary.action_class
+    assert (
+        order.triage_readiness_label
+        == created.day_running_focus_summary.readiness_label
+    )
+    assert order.triage_needs_review is False
+    assert order.triage_review_reasons == ""
+
+    updated = asyncio.run(
+        service.update_order(
+            order_id=created.id,
+            current_user=current_user,
+            order_in=OrderUpdate(
+                payment_status=PaymentStatus.PAID_IN_FULL, delivery_method=None
+            ),
+        )
+    )
+
+    session.refresh(order)
+    assert order.triage_as_of == NOW.date()
+    assert (
+        order.triage_readiness_label
+        == updated.day_running_focus_summary.readiness_label
+    )
+    assert order.triage_readiness_label == "Blocked for today"
+    session.close()
+
+
+def test_stale_triage_is_refreshed_before_filtering(monkeypatch):
+    monkeypatch.setattr(order_service_module, "_utcnow", lambda: NOW)
+    session, current_user = _session_with_user("triage-stale@example.com")
+    order = Order(
+        user_id=current_user.id,
+        order_number="ORD-TRIAGE-STALE",
+        customer_name="Direct Insert",
+        customer_email="direct@example.com",
+        customer_phone="555-0101",
+        due_date=datetime(2026, 3, 19, 18, 0, tzinfo=timezone.utc),
+        delivery_method="pickup",
+        total_amount=40.0,
+        subtotal=40.0,
+        status=OrderStatus.CONFIRMED,
+        payment_status=PaymentStatus.PAID_IN_FULL,
+    )
+    session.add(order)
+    session.add(
+        OrderItem(
+            order_id=order.id,
+            name="Birthday cake with sprinkles",
+            description="Chocolate sponge with vanilla buttercream",
+            quantity=1,
+            unit_price=40.0,
+            total_price=40.0,
+        )
+    )
+    session.commit()
+    assert order.triage_as_of is None
+
+    service = OrderService(session=session)
+    due_today = asyncio.run(
+        service.get_orders_by_user(current_user=current_user, urgency="Today")
+    )
+    assert [order_read.id for order_read in due_today] == [order.id]
+    # The read stored what it computed, so the rollover has nothing left.
+    session.rollback()
+    session.refresh(order)
+    assert order.triage_as_of == NOW.date()
+
+    assert run_order_triage_rollover(session) == 0
+    session.refresh(order)
+    assert order.triage_as_of == NOW.date()
+    assert order.triage_urgency_rank == 1
+
+    next_day = NOW + timedelta(days=1)
+    monkeypatch.setattr(order_service_module, "_utcnow", lambda: next_day)
+    assert run_order_triage_rollover(session) == 1
+    session.refresh(order)
+    assert order.triage_as_of == next_day.date()
+    assert order.triage_urgency_rank == 0
+    assert run_order_triage_rollover(session) == 0
+
+    # Yesterday's open order is overdue once the day rolls over.
+    urgent = asyncio.run(
+        service.get_orders_by_user(current_user=current_user, urgency="Urgent")
+    )
+    assert [order_read.id for order_read in urgent] == [order.id]
+    assert (
+        urgent[0].day_running_focus_summary.readiness_label
+        == order.triage_readiness_label
+    )
+    session.close()
+
+
+def test_item_and_contact_changes_expire_stored_triage(monkeypatch):
+    monkeypatch.setattr(order_service_module, "_utcnow", lambda: NOW)
+    session, current_user = _session_with_user("triage-expire@example.com")
+    contact = Contact(
+        user_id=current_user.id, first_name="Pat", email="pat@example.com"
+    )
+    session.add(contact)
+    session.commit()
+    order = Order(
+        user_id=current_user.id,
+        customer_contact_id=contact.id,
+        order_number="ORD-TRIAGE-EXPIRE",
+        due_date=datetime(2026, 3, 25, 18, 0, tzinfo=timezone.utc),
+        delivery_method="pickup",
+        total_amount=40.0,
+        subtotal=40.0,
+        status=OrderStatus.CONFIRMED,
+    )
+    session.add(order)
+    session.commit()
+
+    service = OrderService(session=session)
+    assert service.refresh_order_triage(user_id=current_user.id) == 1
+    assert service.refresh_order_triage(user_id=current_user.id) == 0
+
+    contact.phone = "555-0102"
+    session.add(contact)
+    session.commit()
+    assert session.get(Order, order.id).triage_as_of is None
+    assert service.refresh_order_triage(user_id=current_user.id) == 1
+
+    session.add(
+        OrderItem(
+            order_id=order.id,
+            name="Cake",
+            quantity=1,
+            unit_price=40.0,
+            total_price=40.0,
+        )
+    )
+    session.commit()
+    assert session.get(Order, order.id).triage_as_of is None
+    assert service.refresh_order_triage(user_id=current_user.id) == 1
+
+    stored = session.exec(select(Order).where(Order.id == order.id)).one()
+    stored.notes_to_customer = "Add a candle"
+    session.add(stored)
+    session.commit()
+    assert session.get(Order, order.id).triage_as_of is None
+    session.close()
+
+
+def test_triage_writes_leave_updated_at_alone(monkeypatch):
+    monkeypatch.setattr(order_service_module, "_utcnow", lambda: NOW)
+    session, current_user = _session_with_user("triage-updated-at@example.com")
+    contact = Contact(
+        user_id=current_user.id, first_name="Sam", email="sam@example.com"
+    )
+    session.add(contact)
+    session.commit()
+    order = Order(
+        user_id=current_user.id,
+        customer_contact_id=contact.id,
+        order_number="ORD-TRIAGE-UPDATED-AT",
+        due_date=datetime(2026, 3, 25, 18, 0, tzinfo=timezone.utc),
+        total_amount=40.0,
+        status=OrderStatus.CONFIRMED,
+    )
+    session.add(order)
+    session.commit()
+
+    def stored_updated_at():
+        return session.exec(select(Order.updated_at).where(Order.id == order.id)).one()
+
+    written_at = stored_updated_at()
+    assert run_order_triage_rollover(session) == 1
+    contact.phone = "555-0103"
+    session.add(contact)
+    session.commit()
+    assert session.get(Order, order.id).triage_as_of is None
+    assert run_order_triage_rollover(session) == 1
+    assert stored_updated_at() == written_at
+    session.close()
+
+
+def test_next_rollover_at_is_bakery_midnight_in_utc():
+    # Eastern daylight time: midnight is 04:00 UTC.
+    assert next_rollover_at(NOW) == datetime(2026, 3, 20, 4, 0, tzinfo=timezone.utc)
+    # Eastern standard time, late evening locally but already the next UTC day.
+    assert next_rollover_at(
+        datetime(2026, 1, 10, 3, 0, tzinfo=timezone.utc)
+    ) == datetime(2026, 1, 10, 5, 0, tzinfo=timezone.utc)
+
+
+def test_only_one_worker_claims_each_days_rollover():
+    session, _current_user = _session_with_user("triage-claim@example.com")
+    today = NOW.date()
+
+    assert claim_daily_job(session, ORDER_TRIAGE_ROLLOVER_JOB, today) is True
+    assert claim_daily_job(session, ORDER_TRIAGE_ROLLOVER_JOB, today) is False
+    assert (
+        claim_daily_job(session, ORDER_TRIAGE_ROLLOVER_JOB, today + timedelta(days=1))
+        is True
+    )
+    assert claim_daily_job(session, "another_job", today) is True
+    session.close()
+
+
+def test_failed_rollover_releases_its_claim(monkeypatch):
+    monkeypatch.setattr(order_service_module, "_utcnow", lambda: NOW)
+    session, _current_user = _session_with_user("triage-release@example.com")
+
+    def failing_rollover(session, clock=None):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(rollover_module, "run_order_triage_rollover", failing_rollover)
+    with pytest.raises(RuntimeError):
+        rollover_module._run_with_new_session(lambda: Session(session.get_bind()))
+
+    assert claim_daily_job(session, ORDER_TRIAGE_ROLLOVER_JOB, NOW.date()) is True
+    session.close()
+
+
+def test_rollover_commits_each_batch(monkeypatch):
+    monkeypatch.setattr(order_service_module, "_utcnow", lambda: NOW)
+    session, current_user = _session_with_user("triage-batches@example.com")
+    for index in range(3):
+        session.add(
+            Order(
+                user_id=current_user.id,
+                order_number=f"ORD-TRIAGE-BATCH-{index}",
+                due_date=datetime(2026, 3, 25, 18, 0, tzinfo=timezone.utc),
+                total_amount=40.0,
+            )
+        )
+    session.commit()
+
+    commits = []
+    event.listen(session, "after_commit", lambda _session: commits.append(1))
+    service = OrderService(session=session)
+    assert service.refresh_order_triage(batch_size=2) == 3
+    assert len(commits) == 2
+    session.close()
+
+
+def test_rollover_loop_catches_up_before_waiting_for_midnight(monkeypatch):
+    runs = []
+    delays = []
+
+    def fake_run(session_factory):
+        runs.append(len(delays))
+        return 0
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+        if len(delays) == 2:
+            raise asyncio.CancelledError
+
+    monkeypatch.setattr(rollover_module, "_run_with_new_session", fake_run)
+    monkeypatch.setattr(rollover_module.asyncio, "sleep", fake_sleep)
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(
+            rollover_module.order_triage_rollover_loop(lambda: None, clock=lambda: NOW)
+        )
+
+    # Ran right away at startup, then slept until bakery midnight.
+    assert runs == [1]
+    assert delays == [0.0, (next_rollover_at(NOW) - NOW).total_seconds()]
@@ -0,0 +1,141 @@
+import asyncio
+import re
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import patch
+from uuid import uuid4
+
+from sqlalchemy import event, inspect, text
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.models.user import User
+from app.repositories.sqlite_adapter import (
+    TENANT_DATE_INDEXES,
+    ensure_sqlite_order_schema,
+)
+from app.services.calendar_service import CalendarService
+from app.services.dashboard_service import DashboardService
+from app.services.expense_service import ExpenseService
+from app.services.mileage_service import MileageService
+from app.services.order_service import OrderService, QuoteService
+from app.services.task_service import TaskService
+
+NOW = datetime(2026, 3, 19, 13, 0, tzinfo=timezone.utc)
+HOT_TABLES = {"order", "quote", "expense", "mileagelog", "task", "calendarevent"}
+TABLE_SCAN = re.compile(r"^SCAN (\w+)$")
+
+
+def _new_engine():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    return engine
+
+
+def _table_scans(connection, statement: str, parameters) -> set[str]:
+    plan = connection.exec_driver_sql(
+        f"EXPLAIN QUERY PLAN {statement}", parameters
+    ).all()
+    return {
+        match.group(1)
+        for row in plan
+        if (match := TABLE_SCAN.match(row[-1])) and match.group(1) in HOT_TABLES
+    }
+
+
+def _run_hot_queries(session: Session, current_user: User) -> None:
+    orders = OrderService(session=session)
+    asyncio.run(orders.get_orders_by_user(current_user=current_user))
+    asyncio.run(orders.get_order_page_by_user(current_user=current_user, cursor=""))
+    quotes = QuoteService(session=session)
+    asyncio.run(quotes.get_quotes_by_user(current_user=current_user))
+    asyncio.run(quotes.get_quote_page_by_user(current_user=current_user))
+    expenses = ExpenseService(session)
+    asyncio.run(
+        expenses.get_expenses_by_user(
+            current_user=current_user,
+            start_date=date(2026, 1, 1),
+            end_date=date(2026, 3, 31),
+        )
+    )
+    asyncio.run(expenses.get_expense_page_by_user(current_user=current_user))
+    mileage = MileageService(session)
+    asyncio.run(
+        mileage.get_mileage_logs_by_user(
+            current_user=current_user, start_date=date(2026, 1, 1)
+        )
+    )
+    asyncio.run(mileage.get_mileage_log_page_by_user(current_user=current_user))
+    tasks = TaskService(session)
+    asyncio.run(tasks.get_tasks_by_user(current_user=current_user, due_date_start=NOW))
+    asyncio.run(tasks.get_task_page_by_user(current_user=current_user))
+    asyncio.run(
+        CalendarService(session).get_calendar_events_by_user(
+            current_user=current_user, start_date=NOW, end_date=NOW + timedelta(days=7)
+        )
+    )
+    dashboard = DashboardService(session)
+    asyncio.run(dashboard.get_summary(current_user=current_user, range="YTD"))
+    asyncio.run(dashboard.get_orders_over_time(current_user=current_user, range="YTD"))
+
+
+def test_hot_tenant_queries_never_scan_their_tables():
+    engine = _new_engine()
+    captured = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    with patch("app.repositories.sqlite_adapter.engine", engine), Session(
+        engine
+    ) as session:
+        current_user = User(
+            id=uuid4(),
+            email="query-plans@example.com",
+            hashed_password="not-used",
+            is_active=True,
+            is_superuser=False,
+        )
+        session.add(current_user)
+        session.commit()
+        captured.clear()
+        _run_hot_queries(session, current_user)
+
+    queried = {
+        table
+        for statement, _parameters in captured
+        for table in HOT_TABLES
+        if f"FROM {table}" in statement.replace('"', "")
+    }
+    assert queried == HOT_TABLES
+    with engine.connect() as connection:
+        scans = {
+            statement: tables
+            for statement, parameters in captured
+            if (tables := _table_scans(connection, statement, parameters))
+        }
+        assert scans == {}
+        # The check itself does flag a query no index serves.
+        assert _table_scans(
+            connection, 'SELECT id FROM "order" WHERE customer_name = ?', ("Jamie",)
+        ) == {"order"}
+
+
+def test_ensure_sqlite_order_schema_adds_missing_tenant_indexes():
+    engine = _new_engine()
+    with engine.begin() as connection:
+        for index in TENANT_DATE_INDEXES:
+            connection.execute(text(f"DROP INDEX {index.name}"))
+
+    ensure_sqlite_order_schema(engine)
+
+    inspector = inspect(engine)
+    for index in TENANT_DATE_INDEXES:
+        assert index.name in {
+            existing["name"] for existing in inspector.get_indexes(index.table.name)
+        }
@@ -20,3 +20,26 @@ def test_ensure_sqlite_order_schema_adds_bm006_columns():
     assert "deposit_due_date" in columns
     assert "balance_due_date" in columns
     assert "stripe_checkout_session_id" in columns
+
+
+def test_ensure_sqlite_order_schema_adds_indexed_triage_columns():
+    engine = create_engine("sqlite://")
+
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                'CREATE TABLE "order" (id VARCHAR PRIMARY KEY, order_number VARCHAR, due_date VARCHAR)'
+            )
+        )
+
+    ensure_sqlite_order_schema(engine)
+
+    inspector = inspect(engine)
+    columns = {column["name"] for column in inspector.get_columns("order")}
+    indexes = {index["name"] for index in inspector.get_indexes("order")}
+    assert {
+        "triage_as_of",
+        "triage_readiness_label",
+        "triage_review_reasons",
+    } <= columns
+    assert {"ix_order_triage_as_of", "ix_order_triage_readiness_label"} <= indexes
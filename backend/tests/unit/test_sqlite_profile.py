@@ -0,0 +1,83 @@
+import sqlite3
+import threading
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from app.repositories.sqlite_profile import (
+    SQLiteProfile,
+    configure_sqlite_engine,
+    is_sqlite_busy_error,
+)
+
+
+def _engine(path, profile: SQLiteProfile):
+    engine = create_engine(
+        f"sqlite:///{path}", connect_args={"check_same_thread": False}
+    )
+    return configure_sqlite_engine(engine, profile)
+
+
+def test_profile_pragmas_are_applied_to_new_connections(tmp_path):
+    profile = SQLiteProfile(
+        busy_timeout_ms=1234, cache_size_kib=4096, mmap_size_bytes=1 << 20
+    )
+    engine = _engine(tmp_path / "tuned.db", profile)
+    with engine.connect() as connection:
+
+        def pragma(name):
+            return connection.execute(text(f"PRAGMA {name}")).scalar()
+
+        assert pragma("journal_mode") == "wal"
+        assert pragma("synchronous") == 1  # NORMAL
+        assert pragma("busy_timeout") == 1234
+        assert pragma("cache_size") == -4096
+        assert pragma("mmap_size") == 1 << 20
+        assert pragma("temp_store") == 2  # MEMORY
+
+    with pytest.raises(ValueError):
+        SQLiteProfile(journal_mode="WAL; DROP TABLE users")
+    with pytest.raises(ValueError):
+        SQLiteProfile(busy_retries=-1)
+
+
+def _hold_write_lock(path, seconds: float) -> threading.Event:
+    locked = threading.Event()
+
+    def hold():
+        blocker = sqlite3.connect(path, isolation_level=None)
+        blocker.execute("BEGIN IMMEDIATE")
+        locked.set()
+        threading.Event().wait(seconds)
+        blocker.execute("COMMIT")
+        blocker.close()
+
+    threading.Thread(target=hold, daemon=True).start()
+    locked.wait()
+    return locked
+
+
+def test_busy_writes_retry_with_backoff_until_the_lock_clears(tmp_path):
+    path = tmp_path / "busy.db"
+    setup = _engine(path, SQLiteProfile())
+    with setup.begin() as connection:
+        connection.execute(text("CREATE TABLE note (body TEXT)"))
+
+    # No busy_timeout, so only the retries can wait out the other writer.
+    patient = _engine(
+        path, SQLiteProfile(busy_timeout_ms=0, busy_retries=6, busy_backoff_ms=40)
+    )
+    _hold_write_lock(path, 0.3)
+    with patient.begin() as connection:
+        connection.execute(text("INSERT INTO note (body) VALUES ('after the lock')"))
+    with patient.connect() as connection:
+        assert connection.execute(text("SELECT count(*) FROM note")).scalar() == 1
+
+    impatient = _engine(path, SQLiteProfile(busy_timeout_ms=0, busy_retries=0))
+    _hold_write_lock(path, 0.3)
+    with pytest.raises(OperationalError) as exc_info:
+        with impatient.begin() as connection:
+            connection.execute(text("INSERT INTO note (body) VALUES ('too soon')"))
+    assert is_sqlite_busy_error(exc_info.value)
+    assert not is_sqlite_busy_error(sqlite3.OperationalError("no such table: note"))
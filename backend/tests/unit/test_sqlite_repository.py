@@ -2,7 +2,9 @@ import asyncio
 from uuid import UUID, uuid4
 from unittest.mock import patch
 
+import pytest
 from datetime import date
+from sqlalchemy import event
 from sqlmodel import Field, SQLModel, create_engine, Session
 
 from app.repositories.sqlite_adapter import SQLiteRepository
@@ -85,3 +87,41 @@ def test_get_multi_filters_and_sorts():
             )
         )
         assert [r.date for r in results] == [date(2025, 1, 1), date(2024, 1, 1)]
+
+
+def test_bound_repository_works_in_the_request_session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'uow.db'}")
+    SQLModel.metadata.create_all(engine)
+    checkouts = []
+    event.listen(engine, "checkout", lambda *_: checkouts.append(1))
+    user_id = uuid4()
+
+    with Session(engine) as session:
+        repo = SQLiteRepository(Item, session=session, autocommit=False)
+        with patch(
+            "app.repositories.sqlite_adapter.jsonable_encoder",
+            lambda x: x.model_dump(),
+        ):
+            created = asyncio.run(
+                repo.create(obj_in=ItemCreate(name="Flour", user_id=user_id))
+            )
+        assert created in session
+        # Flushed but not committed: another session cannot see it yet.
+        with Session(engine) as other:
+            assert other.get(Item, created.id) is None
+        assert asyncio.run(repo.get(id=created.id)) is created
+        asyncio.run(repo.update(db_obj=created, obj_in={"name": "Rye flour"}))
+        item_id = created.id
+        repo.commit()
+        # One connection for the whole unit of work, one for the other session.
+        assert len(checkouts) == 2
+
+    with Session(engine) as session:
+        assert session.get(Item, item_id).name == "Rye flour"
+        autocommitting = SQLiteRepository(Item, session=session)
+        asyncio.run(autocommitting.delete(id=item_id))
+    with Session(engine) as session:
+        assert session.get(Item, item_id) is None
+
+    with pytest.raises(RuntimeError):
+        SQLiteRepository(Item).commit()
@@ -3,7 +3,7 @@ from uuid import uuid4
 
 from sqlmodel import SQLModel, Session, create_engine
 
-from app.models.user import UserCreate
+from app.models.user import User, UserCreate
 from app.services.user_service import UserService
 
 
@@ -59,3 +59,128 @@ def test_send_verification_email(capsys):
     )
     out = capsys.readouterr().out
     assert str(user_id) in out
+
+
+def test_principal_lookup_is_lean_cached_and_invalidated():
+    from sqlalchemy import event, inspect
+
+    service, session = _build_service()
+    user = asyncio.run(
+        service.create_user(UserCreate(email="dana@example.com", password="pw"))
+    )
+    user_id = user.id
+    session.close()
+
+    selects = []
+    event.listen(
+        session.get_bind(),
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: (
+            selects.append(statement)
+            if statement.lstrip().upper().startswith("SELECT")
+            else None
+        ),
+    )
+
+    principal = asyncio.run(service.get_principal(user_id))
+    assert principal.email == "dana@example.com"
+    assert "recipes" in inspect(principal).unloaded
+    assert len(selects) == 1
+
+    # A later request (new session) is answered from the cache.
+    other_session = Session(session.get_bind())
+    again = asyncio.run(UserService(session=other_session).get_principal(user_id))
+    assert again.id == user_id and again in other_session
+    assert len(selects) == 1
+
+    asyncio.run(UserService(session=other_session).deactivate_user(again))
+    fresh = UserService(session=Session(session.get_bind()))
+    assert asyncio.run(fresh.get_principal(user_id)).is_active is False
+
+
+def test_decode_access_token_is_memoized_until_expiry(monkeypatch):
+    from datetime import timedelta
+
+    from app.auth import jwt as auth_jwt
+
+    auth_jwt.clear_decoded_token_cache()
+    calls = []
+    real_decode = auth_jwt.jwt.decode
+    monkeypatch.setattr(
+        auth_jwt.jwt,
+        "decode",
+        lambda *args, **kwargs: calls.append(1) or real_decode(*args, **kwargs),
+    )
+
+    token = auth_jwt.create_access_token(subject="user-1")
+    assert auth_jwt.decode_access_token(token).sub == "user-1"
+    assert auth_jwt.decode_access_token(token).sub == "user-1"
+    assert len(calls) == 1
+
+    assert auth_jwt.decode_access_token("not-a-token") is None
+    assert auth_jwt.decode_access_token("not-a-token") is None
+    assert len(calls) == 3
+
+    expired = auth_jwt.create_access_token(
+        subject="user-1", expires_delta=timedelta(seconds=-1)
+    )
+    assert auth_jwt.decode_access_token(expired) is None
+    auth_jwt.clear_decoded_token_cache()
+
+
+def test_login_upgrades_hash_below_the_configured_work_factor(monkeypatch):
+    from passlib.context import CryptContext
+
+    from app.auth.security import PasswordHasher
+    from app.services import user_service as user_service_module
+
+    old_context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4)
+    context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=5, bcrypt__min_rounds=5)
+    monkeypatch.setattr(
+        user_service_module,
+        "password_hasher",
+        PasswordHasher(context, workers=1, max_pending=2),
+    )
+    service, session = _build_service()
+    user = User(email="erin@example.com", hashed_password=old_context.hash("pw"))
+    session.add(user)
+    session.commit()
+
+    assert asyncio.run(service.authenticate_user("erin@example.com", "wrong")) is None
+    assert user.hashed_password.startswith("$2b$04$")
+
+    assert asyncio.run(service.authenticate_user("erin@example.com", "pw"))
+    assert user.hashed_password.startswith("$2b$05$")
+    assert context.verify("pw", user.hashed_password)
+
+
+def test_password_hasher_rejects_work_beyond_max_pending():
+    import threading
+
+    import pytest
+
+    from app.auth.security import PasswordHasher, PasswordHasherBusy
+
+    release = threading.Event()
+    started = threading.Event()
+
+    class SlowContext:
+        def hash(self, password):
+            started.set()
+            release.wait(5)
+            return f"hashed:{password}"
+
+    hasher = PasswordHasher(SlowContext(), workers=1, max_pending=1)
+
+    async def scenario():
+        first = asyncio.ensure_future(hasher.hash("a"))
+        await asyncio.to_thread(started.wait, 5)
+        with pytest.raises(PasswordHasherBusy):
+            await hasher.hash("b")
+        release.set()
+        assert await first == "hashed:a"
+        # The slot is free again once the first hash finishes.
+        return await hasher.hash("c")
+
+    assert asyncio.run(scenario()) == "hashed:c"
+    hasher.shutdown()
@@ -0,0 +1,4 @@
+"""Repeatable performance benchmarks for the BakeMate backend.
+
+Run a benchmark from ``backend/`` with ``PYTHONPATH=. python -m tools.benchmarks.<name>``.
+"""
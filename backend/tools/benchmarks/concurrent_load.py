@@ -0,0 +1,133 @@
+"""Latency of cheap order requests while heavy order lists run alongside them.
+
+Drives the real orders router over ASGI against a file-backed SQLite database,
+once with endpoints offloaded to the database threads (``DatabaseRoute``) and
+once running inline on the event loop, and reports the latency of the cheap
+``/orders/summary`` requests.
+
+Usage::
+
+    PYTHONPATH=. python -m tools.benchmarks.concurrent_load --orders 5000 --heavy 4 --light 8
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from fastapi import APIRouter, FastAPI
+from fastapi.routing import APIRoute
+from sqlmodel import Session
+
+from app.api.routing import DatabaseRoute
+from app.api.v1.endpoints import orders
+from app.auth.dependencies import get_current_active_user
+from app.repositories.sqlite_adapter import ensure_sqlite_order_schema, get_session
+from app.repositories.sqlite_profile import configure_sqlite_engine
+from tools.benchmarks.fixtures import create_benchmark_engine, seed_orders
+
+HEAVY_PATH = "/orders/?limit=200"
+LIGHT_PATH = "/orders/summary?start=2026-01-01&end=2026-03-31"
+
+
+def build_app(engine, user, *, offload: bool) -> FastAPI:
+    router = APIRouter(route_class=DatabaseRoute if offload else APIRoute)
+    for route in orders.router.routes:
+        router.add_api_route(
+            route.path,
+            getattr(route.endpoint, "__wrapped__", route.endpoint),
+            methods=list(route.methods),
+            response_model=route.response_model,
+            status_code=route.status_code,
+            name=route.name,
+        )
+    app = FastAPI()
+    app.include_router(router, prefix="/orders")
+
+    def session_override():
+        with Session(engine) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = session_override
+    app.dependency_overrides[get_current_active_user] = lambda: user
+    return app
+
+
+async def _client_loop(client, path, deadline, latencies):
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        response = await client.get(path)
+        response.raise_for_status()
+        latencies.append(time.perf_counter() - started)
+
+
+async def measure(app: FastAPI, heavy: int, light: int, seconds: float):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        # Warm up stored triage and the connection pool outside the timings.
+        await client.get(HEAVY_PATH)
+        heavy_latencies: list[float] = []
+        light_latencies: list[float] = []
+        deadline = time.perf_counter() + seconds
+        await asyncio.gather(
+            *(
+                _client_loop(client, HEAVY_PATH, deadline, heavy_latencies)
+                for _ in range(heavy)
+            ),
+            *(
+                _client_loop(client, LIGHT_PATH, deadline, light_latencies)
+                for _ in range(light)
+            ),
+        )
+    return heavy_latencies, light_latencies
+
+
+def _percentile(values: list[float], share: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * share), len(ordered) - 1)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--orders", type=int, default=5_000)
+    parser.add_argument(
+        "--heavy", type=int, default=4, help="Concurrent order list clients"
+    )
+    parser.add_argument(
+        "--light", type=int, default=8, help="Concurrent summary clients"
+    )
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_benchmark_engine(f"sqlite:///{Path(directory) / 'load.db'}")
+        configure_sqlite_engine(engine)
+        ensure_sqlite_order_schema(engine)
+        with Session(engine, expire_on_commit=False) as session:
+            user = seed_orders(session, order_count=args.orders)
+
+        print(
+            f"orders={args.orders} heavy={args.heavy} light={args.light} "
+            f"seconds={args.seconds}"
+        )
+        for offload in (False, True):
+            app = build_app(engine, user, offload=offload)
+            heavy, light = asyncio.run(
+                measure(app, args.heavy, args.light, args.seconds)
+            )
+            label = "offloaded" if offload else "inline"
+            print(
+                f"{label:>9}: summary p50={statistics.median(light) * 1000:.1f}ms "
+                f"p95={_percentile(light, 0.95) * 1000:.1f}ms n={len(light)} | "
+                f"list p50={statistics.median(heavy) * 1000:.1f}ms n={len(heavy)}"
+            )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
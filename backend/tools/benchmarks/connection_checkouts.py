@@ -0,0 +1,159 @@
+"""Count pool checkouts per request for services built on ``SQLiteRepository``.
+
+Each simulated request opens one request session, as ``get_session`` does,
+and runs a recipe create (one ingredient lookup per line) followed by an
+expense update. It runs once with the services' repositories bound to the
+request session and once with unbound repositories that open a session per
+call, which is how they worked before. Cached repositories are measured
+through their inner repository in both runs, since a warm reference cache
+would answer the ingredient lookups without a session either way.
+
+With 12 ingredients: 17 checkouts per request per-call, 4 bound
+(median 19.3ms vs 16.4ms on a local SQLite file).
+
+Usage::
+
+    PYTHONPATH=. python -m tools.benchmarks.connection_checkouts --ingredients 12 --requests 50
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+from uuid import uuid4
+
+from sqlalchemy import event
+from sqlmodel import Session
+
+from app.models.expense import Expense, ExpenseUpdate
+from app.models.ingredient import Ingredient
+from app.models.recipe import RecipeCreate, RecipeIngredientLinkCreate
+from app.models.user import User
+from app.repositories.cached import CachedRepository
+from app.repositories.sqlite_adapter import SQLiteRepository
+from app.services.expense_service import ExpenseService
+from app.services.recipe_service import RecipeService
+from tools.benchmarks.fixtures import create_benchmark_engine
+
+
+def _prepare_repositories(service, engine, *, bound: bool) -> None:
+    for name, value in list(vars(service).items()):
+        if isinstance(value, CachedRepository):
+            # Measure session binding alone: a warm cache would answer the
+            # ingredient lookups either way.
+            value = value.inner
+            setattr(service, name, value)
+        if not bound and isinstance(value, SQLiteRepository):
+            repo = SQLiteRepository(value.model)
+            repo.engine = engine
+            setattr(service, name, repo)
+
+
+def seed(engine, ingredient_count: int):
+    with Session(engine, expire_on_commit=False) as session:
+        user = User(
+            id=uuid4(), email="checkouts@example.com", hashed_password="not-used"
+        )
+        ingredients = [
+            Ingredient(
+                user_id=user.id, name=f"Ingredient {index}", unit="g", cost=0.01 * index
+            )
+            for index in range(ingredient_count)
+        ]
+        expense = Expense(
+            user_id=user.id, date=date(2026, 3, 1), description="Flour", amount=12.5
+        )
+        session.add(user)
+        session.add_all([*ingredients, expense])
+        session.commit()
+        return user, [ingredient.id for ingredient in ingredients], expense.id
+
+
+async def handle_request(
+    session, user, ingredient_ids, expense_id, *, bound: bool, engine
+):
+    recipes = RecipeService(session=session)
+    expenses = ExpenseService(session=session)
+    _prepare_repositories(recipes, engine, bound=bound)
+    _prepare_repositories(expenses, engine, bound=bound)
+    await recipes.create_recipe(
+        recipe_in=RecipeCreate(
+            user_id=user.id,
+            name="Layer cake",
+            steps="Mix, bake, stack.",
+            ingredients=[
+                RecipeIngredientLinkCreate(
+                    ingredient_id=ingredient_id, quantity=100, unit="g"
+                )
+                for ingredient_id in ingredient_ids
+            ],
+        ),
+        current_user=user,
+    )
+    await expenses.update_expense(
+        expense_id=expense_id,
+        expense_in=ExpenseUpdate(description=f"Flour {uuid4().hex[:6]}"),
+        current_user=user,
+    )
+
+
+def run(engine, requests: int, ingredient_count: int, *, bound: bool):
+    user, ingredient_ids, expense_id = seed(engine, ingredient_count)
+    checkouts = []
+    timings = []
+    counter = {"checkouts": 0}
+
+    def count_checkout(*_):
+        counter["checkouts"] += 1
+
+    event.listen(engine, "checkout", count_checkout)
+    try:
+        for _ in range(requests):
+            counter["checkouts"] = 0
+            started = time.perf_counter()
+            with Session(engine) as session:
+                asyncio.run(
+                    handle_request(
+                        session,
+                        user,
+                        ingredient_ids,
+                        expense_id,
+                        bound=bound,
+                        engine=engine,
+                    )
+                )
+            timings.append(time.perf_counter() - started)
+            checkouts.append(counter["checkouts"])
+    finally:
+        event.remove(engine, "checkout", count_checkout)
+    return checkouts, timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ingredients", type=int, default=12)
+    parser.add_argument("--requests", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"ingredients={args.ingredients} requests={args.requests}")
+    for bound in (False, True):
+        with tempfile.TemporaryDirectory() as directory:
+            engine = create_benchmark_engine(
+                f"sqlite:///{Path(directory) / 'checkouts.db'}"
+            )
+            checkouts, timings = run(
+                engine, args.requests, args.ingredients, bound=bound
+            )
+            engine.dispose()
+        label = "bound" if bound else "per-call"
+        print(
+            f"{label:>8}: checkouts/request={statistics.mean(checkouts):.1f} "
+            f"median request={statistics.median(timings) * 1000:.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+"""Shared synthetic data for the benchmarks in this package."""
+
+import random
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, Optional
+from uuid import uuid4
+
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, Session, create_engine
+
+from app.models.contact import Contact
+from app.models.order import Order, OrderItem, OrderStatus, PaymentStatus
+from app.models.user import User
+
+BENCHMARK_NOW = datetime(2026, 3, 19, 13, 0, tzinfo=timezone.utc)
+
+_STATUSES = [
+    OrderStatus.CONFIRMED,
+    OrderStatus.IN_PROGRESS,
+    OrderStatus.READY_FOR_PICKUP,
+    OrderStatus.COMPLETED,
+    OrderStatus.CANCELLED,
+    OrderStatus.INQUIRY,
+]
+_PAYMENT_STATUSES = [
+    PaymentStatus.UNPAID,
+    PaymentStatus.DEPOSIT_PAID,
+    PaymentStatus.PAID_IN_FULL,
+]
+
+
+def create_benchmark_engine(database_url: str = "sqlite://"):
+    connect_args = {"check_same_thread": False}
+    if database_url == "sqlite://":
+        engine = create_engine(
+            database_url, connect_args=connect_args, poolclass=StaticPool
+        )
+    else:
+        engine = create_engine(database_url, connect_args=connect_args)
+    SQLModel.metadata.create_all(engine)
+    return engine
+
+
+def seed_orders(
+    session: Session,
+    *,
+    order_count: int,
+    customer_count: Optional[int] = None,
+    imported_share: float = 0.5,
+    seed: int = 42,
+) -> User:
+    """Create one bakery user with ``order_count`` orders spread across repeat customers.
+
+    The mix covers the branches of the read-model builders: imported and
+    native rows, linked and inline customers, overdue deposits, missing
+    invoice fields and due dates on both sides of ``BENCHMARK_NOW``.
+    """
+    rng = random.Random(seed)
+    user = User(
+        id=uuid4(),
+        email=f"benchmark-{seed}@example.com",
+        hashed_password="not-used",
+        is_active=True,
+        is_superuser=False,
+    )
+    session.add(user)
+
+    customer_total = customer_count or max(order_count // 8, 1)
+    contacts = [
+        Contact(
+            user_id=user.id,
+            first_name=f"Customer{index}",
+            last_name="Benchmark",
+            email=f"customer{index}@example.com",
+            phone=f"555-{index:07d}",
+        )
+        for index in range(customer_total)
+    ]
+    session.add_all(contacts)
+    session.flush()
+
+    for index in range(order_count):
+        contact = contacts[rng.randrange(customer_total)]
+        total_amount = rng.choice([0.0, 45.0, 80.0, 120.0, 350.0])
+        is_imported = rng.random() < imported_share
+        is_linked = rng.random() < 0.6
+        order = Order(
+            user_id=user.id,
+            order_number=f"BENCH-{seed}-{index:06d}",
+            customer_contact_id=contact.id if is_linked else None,
+            customer_name=(
+                None if is_linked else f"{contact.first_name} {contact.last_name}"
+            ),
+            customer_email=None if is_linked or rng.random() < 0.2 else contact.email,
+            customer_phone=None if is_linked or rng.random() < 0.3 else contact.phone,
+            due_date=BENCHMARK_NOW
+            + timedelta(days=rng.randint(-120, 45), hours=rng.randint(0, 10)),
+            order_date=BENCHMARK_NOW - timedelta(days=rng.randint(0, 400)),
+            delivery_method=rng.choice(["pickup", "delivery"]),
+            total_amount=total_amount,
+            subtotal=total_amount,
+            balance_due=total_amount,
+            deposit_amount=round(total_amount / 2, 2) if rng.random() < 0.5 else None,
+            deposit_due_date=(
+                (BENCHMARK_NOW + timedelta(days=rng.randint(-10, 10))).date()
+                if rng.random() < 0.4
+                else None
+            ),
+            balance_due_date=(
+                (BENCHMARK_NOW + timedelta(days=rng.randint(-10, 10))).date()
+                if rng.random() < 0.4
+                else None
+            ),
+            status=rng.choice(_STATUSES),
+            payment_status=rng.choice(_PAYMENT_STATUSES),
+            internal_notes=(
+                (
+                    f"Imported from benchmark\nLegacy OrderStatusId: {rng.randint(1, 6)}\n"
+                    f"Legacy legacy_status_raw: {rng.randint(1, 6)}"
+                )
+                if is_imported
+                else None
+            ),
+        )
+        session.add(order)
+        if total_amount:
+            session.add(
+                OrderItem(
+                    order_id=order.id,
+                    name="Cake",
+                    description="Benchmark cake",
+                    quantity=1,
+                    unit_price=total_amount,
+                    total_price=total_amount,
+                )
+            )
+        if index % 1000 == 999:
+            session.flush()
+    session.commit()
+    return user
+
+
+@contextmanager
+def seeded_session(
+    *,
+    order_count: int,
+    database_url: str = "sqlite://",
+    **seed_options,
+) -> Iterator[tuple[Session, User]]:
+    engine = create_benchmark_engine(database_url)
+    with Session(engine) as session:
+        user = seed_orders(session, order_count=order_count, **seed_options)
+        yield session, user
+    engine.dispose()
+
+
+MARVELOUS_CONTACT_HEADERS = [
+    "ContactID",
+    "FirstName",
+    "LastName",
+    "EmailAddress",
+    "Number",
+    "Address",
+]
+MARVELOUS_ORDER_HEADERS = [
+    "OrderNumber",
+    "OrderDate",
+    "DueDate",
+    "Contact",
+    "ContactEmail",
+    "Number",
+    "EventType",
+    "ThemeDetails",
+    "IsQuote",
+    "OrderStatusId",
+    "ProductItems",
+    "SubTotalAmount",
+    "TaxAmount1",
+    "Total",
+    "DepositAmount",
+    "AmountPaid",
+    "Notes",
+    "JobSheetNotes",
+]
+MARVELOUS_EXPENSE_HEADERS = [
+    "ExpenseDate",
+    "Description",
+    "Amount",
+    "Category",
+    "Vendor",
+]
+MARVELOUS_MILEAGE_HEADERS = [
+    "MileageDate",
+    "Distance",
+    "Purpose",
+    "Rate",
+    "StartLocation",
+    "EndLocation",
+]
+
+
+def write_marvelous_workbook(
+    path,
+    *,
+    order_count: int,
+    contact_count: Optional[int] = None,
+    seed: int = 42,
+) -> None:
+    """Write a Marvelous Creations export with ``order_count`` orders.
+
+    Orders reuse contacts the way repeat customers do, and about one in ten
+    rows is a quote. Expenses and mileage get a row per ten orders.
+    """
+    from openpyxl import Workbook
+
+    rng = random.Random(seed)
+    contact_total = contact_count or max(order_count // 8, 1)
+    workbook = Workbook(write_only=True)
+
+    contacts = workbook.create_sheet("Contacts")
+    contacts.append(MARVELOUS_CONTACT_HEADERS)
+    for index in range(contact_total):
+        contacts.append(
+            [
+                f"C-{index}",
+                f"Customer{index}",
+                "Benchmark",
+                f"customer{index}@example.com",
+                f"555{index:07d}",
+                f"{index} Baker St\nAlbany, NY 12207",
+            ]
+        )
+
+    orders = workbook.create_sheet("Orders")
+    orders.append(MARVELOUS_ORDER_HEADERS)
+    for index in range(order_count):
+        customer = rng.randrange(contact_total)
+        order_serial = 44000 + rng.randint(0, 1500)
+        total = rng.choice([45.0, 80.0, 120.0, 350.0])
+        orders.append(
+            [
+                f"MC-{seed}-{index:07d}",
+                order_serial,
+                order_serial + rng.randint(1, 30),
+                f"Customer{customer} Benchmark",
+                f"customer{customer}@example.com",
+                f"555{customer:07d}",
+                rng.choice(["Birthday Cake", "Wedding", "Cupcakes", "Cookies"]),
+                "Blue ombre with gold leaf " * rng.randint(0, 4),
+                1 if rng.random() < 0.1 else 0,
+                rng.randint(1, 7),
+                f'[{{"ProductType": "Cake", "Quantity": 1, "SellingPrice": {total}}}]',
+                total,
+                round(total * 0.08, 2),
+                round(total * 1.08, 2),
+                round(total / 2, 2),
+                rng.choice([0, round(total / 2, 2), round(total * 1.08, 2)]),
+                "Customer notes " * rng.randint(0, 6),
+                "Use gold board" if rng.random() < 0.3 else None,
+            ]
+        )
+
+    expenses = workbook.create_sheet("Expenses")
+    expenses.append(MARVELOUS_EXPENSE_HEADERS)
+    for index in range(order_count // 10):
+        expenses.append(
+            [
+                44000 + rng.randint(0, 1500),
+                f"Supplies {index}",
+                rng.randint(5, 200),
+                "Ingredients",
+                "Restaurant Depot",
+            ]
+        )
+
+    mileage = workbook.create_sheet("Mileage")
+    mileage.append(MARVELOUS_MILEAGE_HEADERS)
+    for _ in range(order_count // 10):
+        mileage.append(
+            [
+                44000 + rng.randint(0, 1500),
+                rng.randint(1, 40),
+                "Delivery",
+                0.67,
+                "Bakery",
+                "Client",
+            ]
+        )
+
+    workbook.save(str(path))
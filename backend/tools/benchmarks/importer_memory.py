@@ -0,0 +1,107 @@
+"""Peak memory of reading a Marvelous Creations workbook, eager versus streaming.
+
+``eager`` reproduces the loader the importer used to have: the workbook in
+full mode and every sheet materialised as a list of row dicts before the
+import starts. ``streaming`` walks the same rows through
+``open_workbook_sheets``. ``--import`` also runs a whole ``import_workbook``
+into a throwaway SQLite database. Peaks are Python allocations as seen by
+tracemalloc.
+
+Usage::
+
+    PYTHONPATH=. python -m tools.benchmarks.importer_memory --orders 20000
+    PYTHONPATH=. python -m tools.benchmarks.importer_memory --orders 5000 --import
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+from uuid import uuid4
+
+from sqlmodel import Session
+
+from app.models.user import User
+from app.services.marvelous_importer import (
+    MarvelousCreationsImporter,
+    cleaned_string,
+    open_workbook_sheets,
+)
+from tools.benchmarks.fixtures import create_benchmark_engine, write_marvelous_workbook
+
+
+def read_eager(path: Path) -> int:
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(filename=str(path), data_only=True)
+    sheets = {}
+    for sheet_name in workbook.sheetnames:
+        rows = list(workbook[sheet_name].iter_rows(values_only=True))
+        headers = [cleaned_string(cell) or "" for cell in rows[0]] if rows else []
+        sheets[sheet_name] = [
+            {
+                headers[index]: value
+                for index, value in enumerate(raw_row)
+                if index < len(headers) and headers[index]
+            }
+            for raw_row in rows[1:]
+        ]
+    return sum(len(rows) for rows in sheets.values())
+
+
+def read_streaming(path: Path) -> int:
+    with open_workbook_sheets(path) as sheets:
+        return sum(sum(1 for _ in rows) for rows in sheets.values())
+
+
+def import_streaming(path: Path) -> int:
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_benchmark_engine(f"sqlite:///{Path(directory) / 'import.db'}")
+        with Session(engine) as session:
+            user = User(
+                id=uuid4(), email="importer@example.com", hashed_password="not-used"
+            )
+            session.add(user)
+            session.commit()
+            result = MarvelousCreationsImporter(session, user).import_workbook(path)
+        engine.dispose()
+    return result.counts.orders_created
+
+
+def measure(label: str, func: Callable[[Path], int], path: Path) -> None:
+    tracemalloc.start()
+    started = time.perf_counter()
+    rows = func(path)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{label:>10}: peak={peak / 1024 / 1024:.1f}MiB time={elapsed:.1f}s rows={rows}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--orders", type=int, default=20_000)
+    parser.add_argument("--contacts", type=int)
+    parser.add_argument("--import", dest="run_import", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "marvelous.xlsx"
+        write_marvelous_workbook(
+            path, order_count=args.orders, contact_count=args.contacts
+        )
+        print(
+            f"orders={args.orders} workbook={path.stat().st_size / 1024 / 1024:.1f}MiB"
+        )
+        measure("eager", read_eager, path)
+        measure("streaming", read_streaming, path)
+        if args.run_import:
+            measure("import", import_streaming, path)
+
+
+if __name__ == "__main__":
+    main()
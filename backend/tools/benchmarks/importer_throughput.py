@@ -0,0 +1,108 @@
+"""Wall time of a full Marvelous Creations import into a file-backed SQLite database.
+
+``--reimport`` then imports the same export again, the way a nightly sync
+would, and times that pass, which only compares row fingerprints.
+
+Usage::
+
+    PYTHONPATH=. python -m tools.benchmarks.importer_throughput --orders 20000
+    PYTHONPATH=. python -m tools.benchmarks.importer_throughput --orders 5000 --existing-contacts 2000
+    PYTHONPATH=. python -m tools.benchmarks.importer_throughput --orders 20000 --workers 4
+    PYTHONPATH=. python -m tools.benchmarks.importer_throughput --orders 20000 --reimport
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from uuid import uuid4
+
+from sqlmodel import Session
+
+from app.models.contact import Contact
+from app.models.user import User
+from app.services.marvelous_importer import MarvelousCreationsImporter
+from tools.benchmarks.fixtures import create_benchmark_engine, write_marvelous_workbook
+
+
+def run(
+    workbook: Path,
+    database: Path,
+    existing_contacts: int,
+    workers: int = 0,
+    reimport: bool = False,
+):
+    engine = create_benchmark_engine(f"sqlite:///{database}")
+    with Session(engine) as session:
+        user = User(
+            id=uuid4(), email="importer@example.com", hashed_password="not-used"
+        )
+        session.add(user)
+        # Contacts the baker already has that the export does not mention.
+        session.add_all(
+            Contact(
+                user_id=user.id,
+                first_name=f"Existing{index}",
+                email=f"existing{index}@example.com",
+            )
+            for index in range(existing_contacts)
+        )
+        session.commit()
+        started = time.perf_counter()
+        result = MarvelousCreationsImporter(
+            session, user, workers=workers
+        ).import_workbook(workbook)
+        elapsed = time.perf_counter() - started
+        if reimport:
+            started = time.perf_counter()
+            repeat = MarvelousCreationsImporter(
+                session, user, workers=workers
+            ).import_workbook(workbook, restart=True)
+            print(
+                f"re-import: {time.perf_counter() - started:.1f}s "
+                f"orders unchanged={repeat.counts.orders_unchanged} updated={repeat.counts.orders_updated} "
+                f"created={repeat.counts.orders_created}"
+            )
+    engine.dispose()
+    return elapsed, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--orders", type=int, default=20_000)
+    parser.add_argument(
+        "--contacts", type=int, help="Contacts in the export (default orders / 8)"
+    )
+    parser.add_argument("--existing-contacts", type=int, default=0)
+    parser.add_argument(
+        "--workers", type=int, default=0, help="Parse processes (0 parses inline)"
+    )
+    parser.add_argument(
+        "--reimport", action="store_true", help="Also time a second, unchanged import"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        workbook = Path(directory) / "marvelous.xlsx"
+        write_marvelous_workbook(
+            workbook, order_count=args.orders, contact_count=args.contacts
+        )
+        elapsed, result = run(
+            workbook,
+            Path(directory) / "import.db",
+            args.existing_contacts,
+            args.workers,
+            args.reimport,
+        )
+
+    counts = result.counts
+    print(
+        f"orders={args.orders} existing_contacts={args.existing_contacts} workers={args.workers} "
+        f"imported={counts.orders_created} contacts_created={counts.contacts_created} "
+        f"contacts_matched={counts.contacts_matched}"
+    )
+    print(f"import: {elapsed:.1f}s ({counts.orders_created / elapsed:.0f} orders/s)")
+
+
+if __name__ == "__main__":
+    main()
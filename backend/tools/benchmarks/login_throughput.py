@@ -0,0 +1,174 @@
+"""Login throughput, and latency of other requests, during a burst of logins.
+
+Drives the real auth and orders routers over ASGI against a file-backed SQLite
+database. Runs twice: once hashing inline on the database threads (how logins
+ran before ``password_hasher``), once on the bounded hasher pool. Rejected
+logins (503) are counted, not retried.
+
+Usage::
+
+    PYTHONPATH=. python -m tools.benchmarks.login_throughput --logins 16 --light 4
+    PYTHONPATH=. python -m tools.benchmarks.login_throughput --rounds 10 --workers 4 --max-pending 6
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+from uuid import uuid4
+
+import httpx
+from fastapi import FastAPI
+from passlib.context import CryptContext
+from sqlmodel import Session
+
+from app.api.v1.endpoints import auth, orders
+from app.auth.dependencies import get_current_active_user
+from app.auth.security import PasswordHasher, PasswordHasherBusy
+from app.core.config import settings
+from app.models.user import User
+from app.repositories.sqlite_adapter import ensure_sqlite_order_schema, get_session
+from app.repositories.sqlite_profile import configure_sqlite_engine
+from app.services import user_service
+from main import password_hasher_busy_handler
+from tools.benchmarks.fixtures import create_benchmark_engine, seed_orders
+
+PASSWORD = "benchmark-password"
+LIGHT_PATH = "/orders/summary?start=2026-01-01&end=2026-03-31"
+
+
+def build_app(engine, user) -> FastAPI:
+    app = FastAPI()
+    app.include_router(auth.router, prefix="/auth")
+    app.include_router(orders.router, prefix="/orders")
+    app.add_exception_handler(PasswordHasherBusy, password_hasher_busy_handler)
+
+    def session_override():
+        with Session(engine) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = session_override
+    app.dependency_overrides[get_current_active_user] = lambda: user
+    return app
+
+
+def seed_login_users(engine, count: int, hashed_password: str) -> list[str]:
+    emails = [f"login-{index}@example.com" for index in range(count)]
+    with Session(engine) as session:
+        session.add_all(
+            User(id=uuid4(), email=email, hashed_password=hashed_password)
+            for email in emails
+        )
+        session.commit()
+    return emails
+
+
+async def _login_loop(client, email, deadline, latencies, rejected):
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        response = await client.post(
+            "/auth/login/access-token", data={"username": email, "password": PASSWORD}
+        )
+        if response.status_code == 503:
+            rejected.append(1)
+            await asyncio.sleep(float(response.headers.get("Retry-After", "1")) / 10)
+            continue
+        response.raise_for_status()
+        latencies.append(time.perf_counter() - started)
+
+
+async def _light_loop(client, deadline, latencies):
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        response = await client.get(LIGHT_PATH)
+        response.raise_for_status()
+        latencies.append(time.perf_counter() - started)
+
+
+async def measure(app: FastAPI, emails: list[str], light: int, seconds: float):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        await client.get(LIGHT_PATH)
+        logins: list[float] = []
+        rejected: list[int] = []
+        light_latencies: list[float] = []
+        deadline = time.perf_counter() + seconds
+        await asyncio.gather(
+            *(
+                _login_loop(client, email, deadline, logins, rejected)
+                for email in emails
+            ),
+            *(_light_loop(client, deadline, light_latencies) for _ in range(light)),
+        )
+    return logins, rejected, light_latencies
+
+
+def _percentile(values: list[float], share: float) -> float:
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * share), len(ordered) - 1)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--logins", type=int, default=16, help="Concurrent login clients"
+    )
+    parser.add_argument(
+        "--light", type=int, default=4, help="Concurrent summary clients"
+    )
+    parser.add_argument("--orders", type=int, default=2_000)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--rounds", type=int, default=settings.PASSWORD_HASH_ROUNDS)
+    parser.add_argument("--workers", type=int, default=settings.PASSWORD_HASH_WORKERS)
+    parser.add_argument(
+        "--max-pending", type=int, default=settings.PASSWORD_HASH_MAX_PENDING
+    )
+    args = parser.parse_args()
+
+    context = CryptContext(
+        schemes=["bcrypt"], bcrypt__rounds=args.rounds, bcrypt__min_rounds=args.rounds
+    )
+    hashers = {
+        "inline": PasswordHasher(context, workers=0, max_pending=args.logins + 1),
+        "pool": PasswordHasher(
+            context, workers=args.workers, max_pending=args.max_pending
+        ),
+    }
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_benchmark_engine(f"sqlite:///{Path(directory) / 'login.db'}")
+        configure_sqlite_engine(engine)
+        ensure_sqlite_order_schema(engine)
+        with Session(engine, expire_on_commit=False) as session:
+            user = seed_orders(session, order_count=args.orders)
+        emails = seed_login_users(engine, args.logins, context.hash(PASSWORD))
+        app = build_app(engine, user)
+
+        print(
+            f"logins={args.logins} light={args.light} rounds={args.rounds} "
+            f"workers={args.workers} max_pending={args.max_pending} seconds={args.seconds}"
+        )
+        for label, hasher in hashers.items():
+            with patch.object(user_service, "password_hasher", hasher):
+                logins, rejected, light = asyncio.run(
+                    measure(app, emails, args.light, args.seconds)
+                )
+            hasher.shutdown()
+            print(
+                f"{label:>6}: logins/s={len(logins) / args.seconds:.1f} "
+                f"login p50={statistics.median(logins) * 1000 if logins else float('nan'):.0f}ms "
+                f"rejected={len(rejected)} | "
+                f"summary p95={_percentile(light, 0.95) * 1000:.1f}ms n={len(light)}"
+            )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Measure what one request-scoped ``OrderClock`` saves per order read.
+
+Builds full read models twice over the same orders: once with the shared
+clock the services pass around, and once with a clock that re-reads the time
+and re-converts each timestamp on every use, as the summary builders did
+before the clock was threaded through.
+
+Usage::
+
+    PYTHONPATH=. python -m tools.benchmarks.order_clock --orders 10000
+"""
+
+import argparse
+import time
+from datetime import date, datetime, timezone
+
+from sqlmodel import select
+
+from app.models.order import Order
+from app.services.order_service import OrderClock, OrderService
+from tools.benchmarks.fixtures import BENCHMARK_NOW, seeded_session
+
+
+class _PerCallClock(OrderClock):
+    """Pays for ``datetime.now`` and a ZoneInfo conversion on every use."""
+
+    @property
+    def today(self) -> date:
+        datetime.now(timezone.utc)
+        # Stay on the benchmark day so both runs take the same branches.
+        return self.now.date()
+
+    def local(self, value: datetime) -> datetime:
+        aware = (
+            value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+        )
+        return aware.astimezone(self.tz)
+
+
+def _timed(service: OrderService, orders: list[Order], clock: OrderClock) -> float:
+    started = time.perf_counter()
+    service._build_order_reads(orders, clock=clock)
+    return time.perf_counter() - started
+
+
+def run(order_count: int, repeats: int) -> tuple[float, float]:
+    with seeded_session(order_count=order_count) as (session, user):
+        service = OrderService(session=session)
+        orders = session.exec(select(Order).where(Order.user_id == user.id)).all()
+        # Warm the relationship loads so both runs measure the builders alone.
+        service._build_order_reads(orders, clock=OrderClock(now=BENCHMARK_NOW))
+        shared, per_call = [], []
+        # Alternate the two so drift over the run hits both equally.
+        for _ in range(repeats):
+            shared.append(_timed(service, orders, OrderClock(now=BENCHMARK_NOW)))
+            per_call.append(_timed(service, orders, _PerCallClock(now=BENCHMARK_NOW)))
+        return min(shared), min(per_call)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--orders", type=int, default=10_000)
+    parser.add_argument("--repeats", type=int, default=7)
+    args = parser.parse_args()
+
+    shared, per_call = run(args.orders, args.repeats)
+    print(f"orders={args.orders} repeats={args.repeats}")
+    print(f"per-call clock: {per_call / args.orders * 1_000_000:.1f}us per order")
+    print(f"shared clock:   {shared / args.orders * 1_000_000:.1f}us per order")
+    print(
+        f"saved:          {(per_call - shared) / args.orders * 1_000_000:.1f}us per order"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Time order list pages end to end through ``OrderService.get_orders_by_user``.
+
+Usage::
+
+    PYTHONPATH=. python -m tools.benchmarks.order_list_page --orders 10000 --customers 200
+    PYTHONPATH=. python -m tools.benchmarks.order_list_page --view compact --page-size 200
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Optional
+
+from fastapi.encoders import jsonable_encoder
+
+from app.models.order import OrderListView
+from app.services.order_service import (
+    OrderClock,
+    OrderService,
+    resolve_order_list_fields,
+)
+from tools.benchmarks.fixtures import BENCHMARK_NOW, seeded_session
+
+
+def run(
+    order_count: int,
+    customer_count: int,
+    page_size: int,
+    pages: int,
+    search: Optional[str] = None,
+    view: OrderListView = OrderListView.FULL,
+) -> tuple[list[float], int]:
+    clock = OrderClock(now=BENCHMARK_NOW)
+    with seeded_session(order_count=order_count, customer_count=customer_count) as (
+        session,
+        user,
+    ):
+        service = OrderService(session=session)
+        # The first call refreshes stored triage; keep it out of the timings.
+        asyncio.run(
+            service.get_orders_by_user(current_user=user, limit=page_size, clock=clock)
+        )
+        fields = resolve_order_list_fields(view)
+        timings = []
+        payload_bytes = 0
+        for page in range(pages):
+            skip = (page * page_size) % max(order_count - page_size, 1)
+            started = time.perf_counter()
+            rows = asyncio.run(
+                service.get_orders_by_user(
+                    current_user=user,
+                    skip=skip,
+                    limit=page_size,
+                    search=search,
+                    fields=fields,
+                    clock=clock,
+                )
+            )
+            # Serialization is part of what the endpoint pays for each page.
+            payload = json.dumps(jsonable_encoder(rows, exclude_unset=True))
+            timings.append(time.perf_counter() - started)
+            payload_bytes = max(payload_bytes, len(payload))
+        return timings, payload_bytes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--orders", type=int, default=10_000)
+    parser.add_argument("--customers", type=int, default=200)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--search", help="Search text applied to every page")
+    parser.add_argument(
+        "--view",
+        type=OrderListView,
+        choices=list(OrderListView),
+        default=OrderListView.FULL,
+    )
+    args = parser.parse_args()
+
+    timings, payload_bytes = run(
+        args.orders, args.customers, args.page_size, args.pages, args.search, args.view
+    )
+    print(
+        f"orders={args.orders} customers={args.customers} page_size={args.page_size} "
+        f"pages={args.pages} search={args.search!r} view={args.view.value}"
+    )
+    print(f"best page:   {min(timings) * 1000:.1f}ms")
+    print(f"median page: {statistics.median(timings) * 1000:.1f}ms")
+    print(f"page JSON:   {payload_bytes / 1024:.0f}KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Time the order read-model builder on a synthetic order book.
+
+Usage::
+
+    PYTHONPATH=. python -m tools.benchmarks.order_read_builder --orders 10000
+"""
+
+import argparse
+import statistics
+import time
+
+from sqlmodel import select
+
+from app.models.order import Order
+from app.services.order_service import OrderClock, OrderService
+from tools.benchmarks.fixtures import BENCHMARK_NOW, seeded_session
+
+
+def run(order_count: int, repeats: int) -> list[float]:
+    clock = OrderClock(now=BENCHMARK_NOW)
+    with seeded_session(order_count=order_count) as (session, user):
+        service = OrderService(session=session)
+        orders = session.exec(select(Order).where(Order.user_id == user.id)).all()
+        # Warm the relationship loads so every repeat measures the builders alone.
+        service._build_order_reads(orders, clock=clock)
+        timings = []
+        for _ in range(repeats):
+            started = time.perf_counter()
+            service._build_order_reads(orders, clock=clock)
+            timings.append(time.perf_counter() - started)
+        return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--orders", type=int, default=10_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    timings = run(args.orders, args.repeats)
+    best = min(timings)
+    print(f"orders={args.orders} repeats={args.repeats}")
+    print(f"best total:   {best:.3f}s")
+    print(f"median total: {statistics.median(timings):.3f}s")
+    print(f"per order:    {best / args.orders * 1_000_000:.1f}us")
+
+
+if __name__ == "__main__":
+    main()
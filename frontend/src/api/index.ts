@@ -318,6 +318,20 @@ export interface ListOrdersParams {
   day_running?: DayRunningTriageFilter;
   action_class?: string;
   urgency?: string;
+  // compact and queue return a subset of OrderRecord; fields overrides view.
+  view?: 'compact' | 'queue' | 'full';
+  fields?: string;
+}
+
+export interface OrderSearchSuggestion {
+  id: string;
+  order_number: string;
+  customer_name?: string | null;
+  customer_email?: string | null;
+  customer_phone?: string | null;
+  due_date: string;
+  status: string;
+  matched_field: 'order_number' | 'customer_name' | 'customer_email' | 'customer_phone';
 }
 
 export const ordersApi = {
@@ -325,6 +339,13 @@ export const ordersApi = {
     const response = await apiClient.get<OrderRecord[]>('/orders/', { params });
     return response.data;
   },
+  async listPage(params?: Omit<ListOrdersParams, 'skip'>, cursor = '') {
+    const response = await apiClient.get<OrderRecord[]>('/orders/', {
+      params: { ...params, cursor },
+    });
+    const nextCursor: string | undefined = response.headers['x-next-cursor'];
+    return { items: response.data, nextCursor };
+  },
   async getImportedSummary(search?: string) {
     const response = await apiClient.get<ImportedOrderQueueSummary>('/orders/imported/summary', {
       params: {
@@ -339,6 +360,12 @@ export const ordersApi = {
     });
     return response.data;
   },
+  async suggest(q: string, limit?: number) {
+    const response = await apiClient.get<OrderSearchSuggestion[]>('/orders/search/suggestions', {
+      params: { q, limit },
+    });
+    return response.data;
+  },
   async get(orderId: string) {
     const response = await apiClient.get<OrderRecord>(`/orders/${orderId}`);
     return response.data;